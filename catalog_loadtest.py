@@ -0,0 +1,193 @@
+"""
+Load test for catalog_service.py: request latency percentiles (stdlib only).
+
+Each worker thread keeps one HTTP/1.1 keep-alive connection and cycles
+through a mix of endpoints built from the served catalog (/controls/<id>,
+/nist/<control>/requirements, /families/<family>, /gaps). With --revalidate,
+requests send the ETag from a first response as If-None-Match, which measures
+the 304 path that polling clients take. --serve starts the service in this
+process instead of targeting a running one (it then shares the interpreter
+with the workers, so latencies are pessimistic).
+
+Usage:
+    python catalog_loadtest.py http://127.0.0.1:8766 --requests 5000 --concurrency 8
+    python catalog_loadtest.py --serve nerc-oscal.json --revalidate
+"""
+
+import argparse
+import http.client
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+from urllib.parse import quote, urlsplit
+
+from nerc_profile import add_profile_argument, start_profiling
+
+DEFAULT_URL = 'http://127.0.0.1:8766'
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of values (0.0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def _get_json(connection: http.client.HTTPConnection, path: str) -> dict:
+    connection.request('GET', path)
+    response = connection.getresponse()
+    body = response.read()
+    if response.status != 200:
+        raise ValueError(f"GET {path} returned HTTP {response.status}")
+    return json.loads(body)
+
+
+def build_paths(base_url: str) -> List[str]:
+    """Endpoint mix for the served catalog: every control, NIST control and family, plus /gaps."""
+    url = urlsplit(base_url)
+    connection = http.client.HTTPConnection(url.hostname, url.port, timeout=10)
+    try:
+        controls = _get_json(connection, '/controls')['controls']
+    finally:
+        connection.close()
+    paths = [f"/controls/{quote(c['id'])}" for c in controls]
+    paths += [f"/nist/{quote(n)}/requirements" for n in sorted({c['primary'] for c in controls if c['primary']})]
+    paths += [f"/families/{quote(f)}" for f in sorted({c['family'] for c in controls if c['family']})]
+    paths.append('/gaps')
+    return paths
+
+
+def run_load_test(base_url: str, paths: List[str], requests: int = 2000, concurrency: int = 8,
+                  revalidate: bool = False) -> dict:
+    """
+    Issue requests across concurrent keep-alive connections and measure latency.
+
+    Args:
+        base_url: Service URL (http://host:port)
+        paths: Paths cycled through by every worker
+        requests: Total number of requests
+        concurrency: Worker threads (one connection each)
+        revalidate: Send If-None-Match with the ETag from the first response per path
+
+    Returns:
+        Summary: requests, elapsed, rps, statuses, errors and latency
+        percentiles in ms (p50, p90, p99, max)
+    """
+    url = urlsplit(base_url)
+    latencies: List[float] = []
+    statuses: Dict[str, int] = {}
+    errors: List[str] = []
+    lock = threading.Lock()
+    counter = iter(range(requests))  # shared; next() on a range iterator is atomic
+
+    def worker(offset: int):
+        connection = http.client.HTTPConnection(url.hostname, url.port, timeout=10)
+        etags: Dict[str, str] = {}
+        local_latencies = []
+        local_statuses: Dict[str, int] = {}
+        try:
+            for number in counter:
+                path = paths[(number + offset) % len(paths)]
+                headers = {'If-None-Match': etags[path]} if revalidate and path in etags else {}
+                started = time.perf_counter()
+                try:
+                    connection.request('GET', path, headers=headers)
+                    response = connection.getresponse()
+                    response.read()
+                except (OSError, http.client.HTTPException) as e:
+                    connection.close()
+                    with lock:
+                        errors.append(f"{path}: {e}")
+                    continue
+                local_latencies.append(time.perf_counter() - started)
+                local_statuses[str(response.status)] = local_statuses.get(str(response.status), 0) + 1
+                if response.getheader('ETag'):
+                    etags[path] = response.getheader('ETag')
+        finally:
+            connection.close()
+            with lock:
+                latencies.extend(local_latencies)
+                for status, count in local_statuses.items():
+                    statuses[status] = statuses.get(status, 0) + count
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(i * len(paths) // concurrency,)) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    return {
+        'requests': len(latencies),
+        'elapsed': elapsed,
+        'rps': len(latencies) / elapsed if elapsed else 0.0,
+        'statuses': statuses,
+        'errors': errors,
+        'latency_ms': {name: percentile(latencies, pct) * 1000
+                       for name, pct in (('p50', 50), ('p90', 90), ('p99', 99), ('max', 100))},
+    }
+
+
+def print_summary(summary: dict, concurrency: int):
+    """Print the load test summary."""
+    latency = summary['latency_ms']
+    statuses = ', '.join(f"{status}: {count}" for status, count in sorted(summary['statuses'].items()))
+    print(f"[*] {summary['requests']} request(s) in {summary['elapsed']:.2f}s over {concurrency} connection(s) "
+          f"({summary['rps']:.0f} req/s; {statuses})")
+    print(f"[*] Latency: p50 {latency['p50']:.2f} ms, p90 {latency['p90']:.2f} ms, "
+          f"p99 {latency['p99']:.2f} ms, max {latency['max']:.2f} ms")
+    if summary['errors']:
+        print(f"[WARN] {len(summary['errors'])} failed request(s), e.g. {summary['errors'][0]}")
+
+
+def main():
+    """Command-line interface for the catalog service load test."""
+    parser = argparse.ArgumentParser(description='Load test catalog_service.py and report latency percentiles')
+    parser.add_argument('url', nargs='?', default=DEFAULT_URL, help=f'Service URL (default: {DEFAULT_URL})')
+    parser.add_argument('--serve', type=Path, default=None, metavar='CATALOG',
+                        help='Start the service in-process on this catalog instead of using url')
+    parser.add_argument('--requests', type=int, default=2000, help='Total requests (default: 2000)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Concurrent connections (default: 8)')
+    parser.add_argument('--revalidate', action='store_true',
+                        help='Send If-None-Match (measures 304 responses)')
+    parser.add_argument('--json', action='store_true', help='Print the summary as JSON')
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    start_profiling(args.profile)
+
+    server = None
+    try:
+        if args.serve:
+            from catalog_service import CatalogServer, LiveCatalog
+            server = CatalogServer(LiveCatalog(args.serve))
+            server.start_background()
+            args.url = server.base_url
+        paths = build_paths(args.url)
+        summary = run_load_test(args.url, paths, args.requests, args.concurrency, args.revalidate)
+    except (FileNotFoundError, ConnectionError) as e:
+        print(f"[ERR] Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except (json.JSONDecodeError, ValueError) as e:
+        print(f"[ERR] Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if server:
+            server.shutdown()
+            server.server_close()
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_summary(summary, args.concurrency)
+    if summary['errors']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,449 @@
+"""
+Local read-only query service for the NERC CIP OSCAL catalog (stdlib only).
+
+Tools that poll nerc-oscal.json can ask this service instead of re-parsing the
+file. The catalog is loaded once into in-memory indexes (by control id, CIP
+family, NIST control and property) and served as JSON:
+- GET /health                       file, fingerprint, counts, reloads
+- GET /controls?family=&nist=&prop= requirement summaries, filtered
+- GET /controls/<id>                one control (e.g. cip-005-8-r1)
+- GET /families/<family>            requirements of a CIP family (e.g. 005)
+- GET /nist/<control>/requirements  requirements mapped to a NIST control
+- GET /gaps                         requirements without a primary NIST control
+
+Every response carries an ETag derived from the catalog's SHA-256, so clients
+sending If-None-Match get 304 Not Modified until the catalog changes. Encoded
+bodies are cached per index. A watcher thread polls the file's size and mtime
+and, when its content hash changes, builds a new index and swaps it in; a file
+that fails to parse (e.g. caught mid-write) keeps the old index in service.
+
+Usage:
+    python catalog_service.py nerc-oscal.json --port 8766
+    python catalog_loadtest.py http://127.0.0.1:8766
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from nerc_profile import add_profile_argument, start_profiling
+from oscal_to_jama_csv import normalize_control_id
+
+DEFAULT_CATALOG = 'nerc-oscal.json'
+DEFAULT_PORT = 8766
+DEFAULT_POLL_INTERVAL = 1.0
+MAX_CACHED_BODIES = 1024
+FAMILY_PATTERN = re.compile(r'^(?:cip-)?(\d{3})', re.IGNORECASE)
+NIST_PATH_PATTERN = re.compile(r'^/nist/([^/]+)/requirements$')
+
+PRIMARY_PROP = 'NIST-800-53-Primary-Control'
+SECONDARY_PROP = 'NIST-800-53-Secondary-Controls'
+
+
+def normalize_family(family: str) -> str:
+    """Normalize a CIP family ('005', 'CIP-005', 'cip-005-8') to 'CIP-005'; '' if not a family."""
+    match = FAMILY_PATTERN.match(family.strip())
+    return f"CIP-{match.group(1)}" if match else ''
+
+
+def normalize_requirement_id(control_id: str) -> str:
+    """Normalize a requirement id ('CIP-005-8 R1', 'cip-005-8-r1') to the catalog control id."""
+    return '-'.join(control_id.strip().lower().split())
+
+
+class CatalogIndex:
+    """Immutable in-memory indexes over one version of the catalog."""
+
+    def __init__(self, oscal_data: dict, fingerprint: str, source: str = ''):
+        """
+        Index a parsed catalog.
+
+        Args:
+            oscal_data: Parsed OSCAL catalog document
+            fingerprint: SHA-256 of the file the catalog was read from
+            source: Catalog path (for /health)
+
+        Raises:
+            ValueError: If the document is not an OSCAL catalog
+        """
+        catalog = oscal_data.get('catalog') if isinstance(oscal_data, dict) else None
+        if not isinstance(catalog, dict):
+            raise ValueError("Not an OSCAL catalog (missing 'catalog' root)")
+
+        self.fingerprint = fingerprint
+        self.etag = f'"{fingerprint[:32]}"'
+        self.source = source
+        self.loaded = time.time()
+        self.title = catalog.get('metadata', {}).get('title', '')
+
+        self.controls: Dict[str, dict] = {}
+        self.by_family: Dict[str, List[str]] = {}
+        self.by_nist: Dict[str, List[Tuple[str, str]]] = {}
+        self.by_prop: Dict[Tuple[str, str], List[str]] = {}
+        self.gaps: List[str] = []
+        self._bodies: Dict[str, bytes] = {}
+
+        for group in catalog.get('groups', []):
+            for control in group.get('controls', []):
+                self._add(group, control)
+
+    def _add(self, group: dict, control: dict):
+        control_id = control.get('id', '').lower()
+        props = {prop.get('name', ''): prop.get('value', '')
+                 for prop in control.get('props', []) if isinstance(prop, dict)}
+        primary = normalize_control_id(props.get(PRIMARY_PROP, ''))
+        secondary = [normalize_control_id(c) for c in props.get(SECONDARY_PROP, '').split(',') if c.strip()]
+        statement = next((part.get('prose', '') for part in control.get('parts', [])
+                          if part.get('name') == 'statement'), '')
+        family = normalize_family(group.get('id', '') or control_id)
+
+        self.controls[control_id] = {
+            'id': control_id,
+            'class': control.get('class', ''),
+            'title': control.get('title', ''),
+            'group': group.get('id', ''),
+            'family': family,
+            'statement': statement,
+            'props': props,
+            'nist': {'primary': primary, 'secondary': secondary},
+        }
+        if control.get('class') != 'requirement':
+            return
+
+        self.by_family.setdefault(family, []).append(control_id)
+        for name, value in props.items():
+            self.by_prop.setdefault((name, value), []).append(control_id)
+        if primary:
+            self.by_nist.setdefault(primary, []).append((control_id, 'primary'))
+        else:
+            self.gaps.append(control_id)
+        for nist_control in secondary:
+            self.by_nist.setdefault(nist_control, []).append((control_id, 'secondary'))
+
+    @property
+    def requirements(self) -> int:
+        return sum(len(ids) for ids in self.by_family.values())
+
+    def summary(self, control_id: str) -> dict:
+        """Short form of a control for list responses."""
+        control = self.controls[control_id]
+        return {'id': control_id, 'title': control['title'], 'family': control['family'],
+                'primary': control['nist']['primary']}
+
+    def query(self, family: Optional[str] = None, nist: Optional[str] = None,
+              prop: Optional[str] = None) -> List[str]:
+        """
+        Requirement ids matching all given filters, in catalog order.
+
+        Args:
+            family: CIP family ('005', 'CIP-005')
+            nist: NIST control, primary or secondary ('SC-7')
+            prop: Property filter 'name=value' (e.g. 'Implementation-Status=Draft')
+
+        Raises:
+            ValueError: If prop is not 'name=value'
+        """
+        candidates = None
+        if family is not None:
+            candidates = set(self.by_family.get(normalize_family(family), []))
+        if nist is not None:
+            matched = {control_id for control_id, _ in self.by_nist.get(normalize_control_id(nist), [])}
+            candidates = matched if candidates is None else candidates & matched
+        if prop is not None:
+            name, sep, value = prop.partition('=')
+            if not sep:
+                raise ValueError(f"Property filter must be name=value: {prop}")
+            matched = set(self.by_prop.get((name, value), []))
+            candidates = matched if candidates is None else candidates & matched
+        ordered = [control_id for ids in self.by_family.values() for control_id in ids]
+        return ordered if candidates is None else [c for c in ordered if c in candidates]
+
+    def body(self, key: str, build) -> bytes:
+        """Encoded response for key, built once per index (up to MAX_CACHED_BODIES keys)."""
+        body = self._bodies.get(key)
+        if body is None:
+            body = json.dumps(build(), ensure_ascii=False).encode('utf-8')
+            if len(self._bodies) < MAX_CACHED_BODIES:
+                self._bodies[key] = body
+        return body
+
+
+def load_index(catalog_file: Path) -> Tuple[CatalogIndex, Tuple[int, int]]:
+    """
+    Read, hash and index a catalog file.
+
+    Returns:
+        (index, (mtime_ns, size) of the file read)
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If the file is not valid JSON
+        ValueError: If the document is not an OSCAL catalog
+    """
+    catalog_file = Path(catalog_file)
+    if not catalog_file.exists():
+        raise FileNotFoundError(f"Catalog not found: {catalog_file}")
+    stat = catalog_file.stat()
+    data = catalog_file.read_bytes()
+    index = CatalogIndex(json.loads(data), hashlib.sha256(data).hexdigest(), str(catalog_file))
+    return index, (stat.st_mtime_ns, stat.st_size)
+
+
+class LiveCatalog:
+    """The current CatalogIndex for a file, replaced when the file's content changes."""
+
+    def __init__(self, catalog_file: Path, poll_interval: float = DEFAULT_POLL_INTERVAL):
+        """
+        Load the catalog.
+
+        Args:
+            catalog_file: OSCAL catalog JSON
+            poll_interval: Seconds between change checks by the watcher thread
+        """
+        self.catalog_file = Path(catalog_file)
+        self.poll_interval = poll_interval
+        self.index, self._signature = load_index(self.catalog_file)
+        self.reloads = 0
+        self.last_error = ''
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def refresh(self) -> bool:
+        """
+        Reload if the file's content hash changed.
+
+        The hash is only computed when size or mtime changed. A file that
+        cannot be read or parsed leaves the current index in place and is
+        retried on the next call.
+
+        Returns:
+            True if a new index was swapped in
+        """
+        with self._lock:
+            try:
+                stat = self.catalog_file.stat()
+                if (stat.st_mtime_ns, stat.st_size) == self._signature:
+                    return False
+                data = self.catalog_file.read_bytes()
+                fingerprint = hashlib.sha256(data).hexdigest()
+                if fingerprint == self.index.fingerprint:
+                    self._signature = (stat.st_mtime_ns, stat.st_size)
+                    return False
+                index = CatalogIndex(json.loads(data), fingerprint, str(self.catalog_file))
+            except (OSError, ValueError) as e:
+                if str(e) != self.last_error:
+                    print(f"[WARN] Keeping catalog {self.index.fingerprint[:12]}: {e}", file=sys.stderr)
+                self.last_error = str(e)
+                return False
+            self.index = index
+            self._signature = (stat.st_mtime_ns, stat.st_size)
+            self.reloads += 1
+            self.last_error = ''
+            print(f"[*] Reloaded {self.catalog_file} ({index.requirements} requirement(s), "
+                  f"fingerprint {fingerprint[:12]})")
+            return True
+
+    def start_watching(self) -> threading.Thread:
+        """Poll for changes on a daemon thread until stop() is called."""
+        def watch():
+            while not self._stop.wait(self.poll_interval):
+                self.refresh()
+        thread = threading.Thread(target=watch, daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        self._stop.set()
+
+
+class CatalogServer(ThreadingHTTPServer):
+    """Threaded HTTP server answering catalog queries from a LiveCatalog."""
+
+    daemon_threads = True
+
+    def __init__(self, catalog: LiveCatalog, address: Tuple[str, int] = ('127.0.0.1', 0),
+                 verbose: bool = False):
+        """
+        Initialize the server.
+
+        Args:
+            catalog: Live catalog to serve
+            address: (host, port) to bind; port 0 picks a free port
+            verbose: Log every request to stderr
+        """
+        super().__init__(address, CatalogHandler)
+        self.catalog = catalog
+        self.verbose = verbose
+        self.lock = threading.Lock()
+        self.stats = {'requests': 0, 'not_modified': 0}
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start_background(self) -> threading.Thread:
+        """Serve on a daemon thread (for tests and benchmarks)."""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+
+class CatalogHandler(BaseHTTPRequestHandler):
+    """Request handler for the catalog query endpoints."""
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out as separate writes; with Nagle on, keep-alive
+    # clients wait ~40 ms for the delayed ACK on every response
+    disable_nagle_algorithm = True
+    server: CatalogServer
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, body: bytes, etag: Optional[str] = None):
+        self.send_response(status)
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _error(self, status: int, message: str):
+        self._send(status, json.dumps({'error': message}).encode('utf-8'))
+
+    def _not_modified(self, etag: str) -> bool:
+        header = self.headers.get('If-None-Match')
+        if not header:
+            return False
+        tags = [tag.strip() for tag in header.split(',')]
+        return '*' in tags or etag in tags or f"W/{etag}" in tags
+
+    def _cached(self, index: CatalogIndex, key: str, build):
+        if self._not_modified(index.etag):
+            with self.server.lock:
+                self.server.stats['not_modified'] += 1
+            self.send_response(304)
+            self.send_header('ETag', index.etag)
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            return
+        self._send(200, index.body(key, build), index.etag)
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.stats['requests'] += 1
+        url = urlsplit(self.path)
+        path = unquote(url.path).rstrip('/') or '/'
+        # One index per request, even if a reload swaps it meanwhile
+        live = self.server.catalog
+        index = live.index
+
+        if path == '/health':
+            return self._send(200, json.dumps({
+                'file': index.source,
+                'title': index.title,
+                'fingerprint': index.fingerprint,
+                'loaded': index.loaded,
+                'controls': len(index.controls),
+                'requirements': index.requirements,
+                'reloads': live.reloads,
+                'last_error': live.last_error,
+            }).encode('utf-8'))
+
+        if path == '/controls':
+            query = parse_qs(url.query)
+            filters = {name: query[name][0] if name in query else None for name in ('family', 'nist', 'prop')}
+            try:
+                ids = index.query(**filters)
+            except ValueError as e:
+                return self._error(400, str(e))
+            return self._cached(index, f"controls?{sorted(filters.items())}",
+                                lambda: {'count': len(ids), 'controls': [index.summary(c) for c in ids]})
+
+        if path.startswith('/controls/'):
+            control_id = normalize_requirement_id(path[len('/controls/'):])
+            if control_id not in index.controls:
+                return self._error(404, f"Control {control_id} not found")
+            return self._cached(index, f"control:{control_id}", lambda: index.controls[control_id])
+
+        if path.startswith('/families/'):
+            family = normalize_family(path[len('/families/'):])
+            if family not in index.by_family:
+                return self._error(404, f"Family {path[len('/families/'):]} not found")
+            return self._cached(index, f"family:{family}", lambda: {
+                'family': family, 'count': len(index.by_family[family]),
+                'controls': [index.summary(c) for c in index.by_family[family]]})
+
+        match = NIST_PATH_PATTERN.match(path)
+        if match:
+            nist_control = normalize_control_id(match.group(1))
+            return self._cached(index, f"nist:{nist_control}", lambda: {
+                'control': nist_control,
+                'count': len(index.by_nist.get(nist_control, [])),
+                'requirements': [dict(index.summary(c), role=role) for c, role in index.by_nist.get(nist_control, [])]})
+
+        if path == '/gaps':
+            return self._cached(index, 'gaps', lambda: {
+                'count': len(index.gaps), 'requirements': [index.summary(c) for c in index.gaps]})
+
+        self._error(404, f"No route for GET {url.path}")
+
+    def do_HEAD(self):
+        self.do_GET()
+
+
+def main():
+    """Command-line interface for the catalog query service."""
+    parser = argparse.ArgumentParser(description='Local read-only query service for the OSCAL catalog')
+    parser.add_argument('catalog', nargs='?', type=Path, default=Path(DEFAULT_CATALOG),
+                        help=f'OSCAL catalog JSON (default: {DEFAULT_CATALOG})')
+    parser.add_argument('--host', default='127.0.0.1', help='Bind address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Port (default: {DEFAULT_PORT})')
+    parser.add_argument('--poll', type=float, default=DEFAULT_POLL_INTERVAL,
+                        help=f'Seconds between catalog change checks (default: {DEFAULT_POLL_INTERVAL})')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Log every request')
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    start_profiling(args.profile)
+
+    try:
+        catalog = LiveCatalog(args.catalog, args.poll)
+    except FileNotFoundError as e:
+        print(f"[ERR] Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except json.JSONDecodeError as e:
+        print(f"[ERR] Invalid JSON in {args.catalog}: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"[ERR] Validation error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    server = CatalogServer(catalog, (args.host, args.port), args.verbose)
+    catalog.start_watching()
+    print(f"[*] Serving {args.catalog} ({catalog.index.requirements} requirement(s)) on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        catalog.stop()
+        server.server_close()
+        print(f"[*] Served {server.stats['requests']} request(s), {server.stats['not_modified']} not modified; "
+              f"{catalog.reloads} reload(s)")
+
+
+if __name__ == '__main__':
+    main()
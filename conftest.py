@@ -0,0 +1,13 @@
+"""
+Shared pytest configuration for the NERC-CIP OSCAL toolkit test suites.
+"""
+
+
+def pytest_addoption(parser):
+    """Register command-line options used by verify_oscal_compliance.py."""
+    parser.addoption(
+        '--nist-revision',
+        default='rev5',
+        choices=['rev4', 'rev5'],
+        help='NIST SP 800-53 revision to validate control mappings against (default: rev5)'
+    )
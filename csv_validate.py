@@ -0,0 +1,396 @@
+"""
+Streaming, parallel validation of JAMA CSV exports with a complete error report.
+
+The file is split into byte ranges that end on record boundaries (a newline
+outside quotes, found by tracking quote parity, so quoted multi-line
+descriptions are never cut). Each range is validated in a worker process and
+the results are merged into one report listing every problem with its data
+row number, column and rule id. Duplicate JAMA-Requirement-IDs are found
+across ranges by sort-merging the per-range sorted ID lists.
+
+Rules:
+    JAMA001  error    Missing required column
+    JAMA002  error    Empty JAMA-Requirement-ID
+    JAMA003  error    Empty NERC-Requirement-ID
+    JAMA004  warning  JAMA-Requirement-ID not in CIP-XXX-RN[-x] form
+    JAMA005  warning  NERC-Requirement-ID not in CIP-XXX[-V] RN form
+    JAMA006  error    Invalid NIST-Primary-Control
+    JAMA007  error    Invalid entry in NIST-Secondary-Controls
+    JAMA008  error    Duplicate JAMA-Requirement-ID
+    JAMA009  error    Row has a different number of fields than the header
+    JAMA010  error    No data rows
+    JAMA011  error    Empty file or unreadable header
+    JAMA012  error    Invalid UTF-8
+
+Usage:
+    python csv_validate.py nerc-oscal.csv
+    python csv_validate.py huge-export.csv --workers 8 --chunk-size 64M --json report.json
+"""
+
+import argparse
+import csv
+import heapq
+import io
+import json
+import mmap
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from nerc_profile import add_profile_argument, start_profiling
+
+REQUIRED_COLUMNS = [
+    'JAMA-Requirement-ID',
+    'NERC-Requirement-ID',
+    'NIST-Primary-Control',
+    'Title',
+    'Description',
+]
+
+RULES = {
+    'JAMA001': ('error', 'Missing required column'),
+    'JAMA002': ('error', 'Empty JAMA-Requirement-ID'),
+    'JAMA003': ('error', 'Empty NERC-Requirement-ID'),
+    'JAMA004': ('warning', 'JAMA-Requirement-ID not in CIP-XXX-RN[-x] form'),
+    'JAMA005': ('warning', 'NERC-Requirement-ID not in CIP-XXX[-V] RN form'),
+    'JAMA006': ('error', 'Invalid NIST-Primary-Control'),
+    'JAMA007': ('error', 'Invalid entry in NIST-Secondary-Controls'),
+    'JAMA008': ('error', 'Duplicate JAMA-Requirement-ID'),
+    'JAMA009': ('error', 'Row has a different number of fields than the header'),
+    'JAMA010': ('error', 'No data rows'),
+    'JAMA011': ('error', 'Empty file or unreadable header'),
+    'JAMA012': ('error', 'Invalid UTF-8'),
+}
+
+# Same patterns as verify_oscal_compliance.py
+JAMA_ID_PATTERN = re.compile(r'^CIP-\d{3}-R\d+(-[a-z])?$')
+NERC_ID_PATTERN = re.compile(r'^CIP-\d{3}(?:-\d+)? R\d+[a-z]?$')
+NIST_CONTROL_PATTERN = re.compile(r'^[A-Z]{2}-\d{1,2}(\s*\([0-9]+\))?$')
+
+DEFAULT_CHUNK_SIZE = 32 * 1024 * 1024
+DEFAULT_MAX_ERRORS = 10000
+SCAN_BLOCK_SIZE = 1024 * 1024
+
+
+def _issue(rule: str, row: Optional[int], column: Optional[str], message: str) -> dict:
+    return {'rule': rule, 'severity': RULES[rule][0], 'row': row, 'column': column, 'message': message}
+
+
+def _record_end(mm, start: int, quoted: bool = False) -> int:
+    """
+    Offset just past the first record-ending newline at or after start.
+
+    Args:
+        mm: Memory-mapped file
+        start: Offset to search from
+        quoted: Whether start lies inside a quoted field
+
+    Returns:
+        Boundary offset (file size if the file ends first)
+    """
+    size = len(mm)
+    while start < size:
+        newline = mm.find(b'\n', start)
+        if newline < 0:
+            return size
+        if mm[start:newline].count(b'"') % 2:
+            quoted = not quoted
+        if not quoted:
+            return newline + 1
+        start = newline + 1
+    return size
+
+
+def find_chunk_ranges(mm, data_start: int, chunk_size: int) -> List[Tuple[int, int]]:
+    """
+    Split [data_start, EOF) into ranges of about chunk_size ending on record boundaries.
+
+    Quote parity is tracked from data_start (a record boundary) with a
+    sequential count of '"' bytes, which runs at memory speed; doubled quotes
+    inside fields do not change parity.
+    """
+    size = len(mm)
+    ranges = []
+    start = data_start
+    position = data_start
+    quoted = False
+
+    while start < size:
+        target = start + chunk_size
+        if target >= size:
+            ranges.append((start, size))
+            break
+
+        while position < target:
+            block_end = min(target, position + SCAN_BLOCK_SIZE)
+            if mm[position:block_end].count(b'"') % 2:
+                quoted = not quoted
+            position = block_end
+
+        end = _record_end(mm, target, quoted)
+        ranges.append((start, end))
+        start = position = end
+        quoted = False
+
+    return ranges
+
+
+def _check_row(row: List[str], row_number: int, fields: Dict[str, int], width: int,
+               issues: List[dict], counts: Dict[str, int], max_errors: int):
+    """Apply the per-row rules."""
+    def report(rule, column, message):
+        counts[rule] = counts.get(rule, 0) + 1
+        if len(issues) < max_errors:
+            issues.append(_issue(rule, row_number, column, message))
+
+    if len(row) != width:
+        report('JAMA009', None, f"Expected {width} fields, found {len(row)}")
+
+    def value(column):
+        index = fields.get(column)
+        return row[index].strip() if index is not None and index < len(row) else ''
+
+    jama_id = value('JAMA-Requirement-ID')
+    if not jama_id:
+        report('JAMA002', 'JAMA-Requirement-ID', RULES['JAMA002'][1])
+    elif not JAMA_ID_PATTERN.match(jama_id):
+        report('JAMA004', 'JAMA-Requirement-ID', f"'{jama_id}' is not in CIP-XXX-RN[-x] form")
+
+    nerc_id = value('NERC-Requirement-ID')
+    if not nerc_id:
+        report('JAMA003', 'NERC-Requirement-ID', RULES['JAMA003'][1])
+    elif not NERC_ID_PATTERN.match(nerc_id):
+        report('JAMA005', 'NERC-Requirement-ID', f"'{nerc_id}' is not in CIP-XXX[-V] RN form")
+
+    primary = value('NIST-Primary-Control')
+    if primary and not NIST_CONTROL_PATTERN.match(primary):
+        report('JAMA006', 'NIST-Primary-Control', f"'{primary}' is not a NIST control ID (e.g. SC-7)")
+
+    for control in filter(None, (c.strip() for c in value('NIST-Secondary-Controls').split(','))):
+        if not NIST_CONTROL_PATTERN.match(control):
+            report('JAMA007', 'NIST-Secondary-Controls', f"'{control}' is not a NIST control ID (e.g. CA-3)")
+
+    return jama_id
+
+
+def validate_chunk(csv_file: str, start: int, end: int, fieldnames: List[str],
+                   max_errors: int = DEFAULT_MAX_ERRORS) -> dict:
+    """
+    Validate the records in one byte range (runs in a worker process).
+
+    Returns:
+        Dict with rows, issues (chunk-local row numbers), counts by rule and
+        ids (sorted (JAMA-Requirement-ID, local row) pairs)
+    """
+    with open(csv_file, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    counts: Dict[str, int] = {}
+    issues: List[dict] = []
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError as e:
+        counts['JAMA012'] = 1
+        issues.append(_issue('JAMA012', None, None, f"Bytes {start + e.start}-{start + e.end}: {e.reason}"))
+        text = data.decode('utf-8', errors='replace')
+
+    fields = {name: index for index, name in enumerate(fieldnames)}
+    width = len(fieldnames)
+    ids = []
+    rows = 0
+    for row in csv.reader(io.StringIO(text, newline='')):
+        if not row:
+            # csv.DictReader skips blank lines too
+            continue
+        rows += 1
+        jama_id = _check_row(row, rows, fields, width, issues, counts, max_errors)
+        if jama_id:
+            ids.append((jama_id, rows))
+
+    ids.sort()
+    return {'rows': rows, 'issues': issues, 'counts': counts, 'ids': ids}
+
+
+def _validate_chunk_args(args):
+    return validate_chunk(*args)
+
+
+def _read_header(mm) -> Tuple[Optional[List[str]], int]:
+    """Parse the header record; returns (fieldnames or None, data start offset)."""
+    header_end = _record_end(mm, 0)
+    raw = mm[:header_end]
+    try:
+        text = raw.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        return None, header_end
+    record = next(csv.reader(io.StringIO(text, newline='')), None)
+    return (record or None), header_end
+
+
+def validate_csv(csv_file: Path, workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 max_errors: int = DEFAULT_MAX_ERRORS,
+                 required_columns: Optional[List[str]] = None) -> dict:
+    """
+    Validate a JAMA CSV in parallel and return a complete report.
+
+    Args:
+        csv_file: CSV to validate
+        workers: Worker processes (default: CPU count; 1 validates in-process)
+        chunk_size: Target bytes per chunk
+        max_errors: Maximum issues listed in the report (counts stay exact)
+        required_columns: Columns that must be present (default: REQUIRED_COLUMNS)
+
+    Returns:
+        Report dict: file, valid, rows, chunks, errors, warnings, counts
+        (by rule), issues (sorted by row), truncated, elapsed
+
+    Raises:
+        FileNotFoundError: If the CSV doesn't exist
+    """
+    csv_file = Path(csv_file)
+    if not csv_file.exists():
+        raise FileNotFoundError(f"CSV file not found: {csv_file}")
+    required_columns = REQUIRED_COLUMNS if required_columns is None else required_columns
+
+    started = time.perf_counter()
+    report = {'file': str(csv_file), 'rows': 0, 'chunks': 0, 'counts': {}, 'issues': [],
+              'truncated': False}
+
+    def finish():
+        report['errors'] = sum(n for rule, n in report['counts'].items() if RULES[rule][0] == 'error')
+        report['warnings'] = sum(n for rule, n in report['counts'].items() if RULES[rule][0] == 'warning')
+        report['valid'] = report['errors'] == 0
+        report['issues'].sort(key=lambda issue: (issue['row'] or 0, issue['rule']))
+        report['truncated'] = sum(report['counts'].values()) > len(report['issues'])
+        report['elapsed'] = time.perf_counter() - started
+        return report
+
+    def add(issue):
+        report['counts'][issue['rule']] = report['counts'].get(issue['rule'], 0) + 1
+        if len(report['issues']) < max_errors:
+            report['issues'].append(issue)
+
+    if csv_file.stat().st_size == 0:
+        add(_issue('JAMA011', None, None, 'CSV file is empty'))
+        return finish()
+
+    with open(csv_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        fieldnames, data_start = _read_header(mm)
+        if not fieldnames:
+            add(_issue('JAMA011', None, None, 'CSV header is missing or not UTF-8'))
+            return finish()
+        ranges = find_chunk_ranges(mm, data_start, max(1, chunk_size))
+
+    for column in required_columns:
+        if column not in fieldnames:
+            add(_issue('JAMA001', None, column, f"Missing required column: {column}"))
+
+    report['chunks'] = len(ranges)
+    tasks = [(str(csv_file), start, end, fieldnames, max_errors) for start, end in ranges]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) <= 1:
+        results = [_validate_chunk_args(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            results = list(pool.map(_validate_chunk_args, tasks))
+
+    # Convert chunk-local row numbers to file-wide data row numbers
+    id_lists = []
+    offset = 0
+    for result in results:
+        for rule, count in result['counts'].items():
+            report['counts'][rule] = report['counts'].get(rule, 0) + count
+        for issue in result['issues']:
+            if issue['row'] is not None:
+                issue['row'] += offset
+            if len(report['issues']) < max_errors:
+                report['issues'].append(issue)
+        id_lists.append([(jama_id, row + offset) for jama_id, row in result['ids']])
+        offset += result['rows']
+    report['rows'] = offset
+
+    # Sort-merge the per-chunk sorted ID lists; equal neighbours are duplicates
+    previous_id, first_row = None, None
+    for jama_id, row in heapq.merge(*id_lists):
+        if jama_id == previous_id:
+            add(_issue('JAMA008', row, 'JAMA-Requirement-ID',
+                       f"Duplicate JAMA-Requirement-ID '{jama_id}' (first seen in row {first_row})"))
+        else:
+            previous_id, first_row = jama_id, row
+
+    if report['rows'] == 0:
+        add(_issue('JAMA010', None, None, 'CSV file has no data rows'))
+
+    return finish()
+
+
+def print_report(report: dict, limit: int = 50):
+    """Print a report in the repo's [OK]/[ERR]/[WARN] style."""
+    for issue in report['issues'][:limit]:
+        tag = '[ERR]' if issue['severity'] == 'error' else '[WARN]'
+        where = f"Row {issue['row']}" if issue['row'] is not None else 'File'
+        column = f" [{issue['column']}]" if issue['column'] else ''
+        print(f"{tag} {issue['rule']} {where}{column}: {issue['message']}")
+
+    shown = min(limit, len(report['issues']))
+    total = sum(report['counts'].values())
+    if total > shown:
+        print(f"   ... {total - shown} more issue(s); by rule: "
+              + ', '.join(f"{rule}={count}" for rule, count in sorted(report['counts'].items())))
+
+    summary = (f"({report['rows']} rows, {report['chunks']} chunk(s), {report['errors']} error(s), "
+               f"{report['warnings']} warning(s), {report['elapsed']:.2f}s)")
+    if report['valid']:
+        print(f"[OK] CSV validation passed {summary}")
+    else:
+        print(f"[ERR] CSV validation failed {summary}")
+
+
+def main():
+    """Command-line interface for the parallel CSV validator."""
+    from jama_shards import parse_size
+
+    parser = argparse.ArgumentParser(
+        description='Validate a JAMA CSV export in parallel and report every problem',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s nerc-oscal.csv
+  %(prog)s huge-export.csv --workers 8 --chunk-size 64M --json report.json
+        """
+    )
+    parser.add_argument('csv_file', type=Path, help='JAMA CSV to validate')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--chunk-size', default='32M', help='Target bytes per chunk (default: 32M)')
+    parser.add_argument('--max-errors', type=int, default=DEFAULT_MAX_ERRORS,
+                        help=f'Issues kept in the report (default: {DEFAULT_MAX_ERRORS}); counts stay exact')
+    parser.add_argument('--show', type=int, default=50, help='Issues printed (default: 50)')
+    parser.add_argument('--json', type=Path, default=None, help='Write the full report as JSON')
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    start_profiling(args.profile)
+
+    try:
+        report = validate_csv(args.csv_file, args.workers, parse_size(args.chunk_size), args.max_errors)
+    except FileNotFoundError as e:
+        print(f"[ERR] Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"[ERR] Validation error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print_report(report, args.show)
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+        print(f"[*] Report written to {args.json}")
+    if not report['valid']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,54 +1,82 @@
 import pdfplumber
 import os
+import time
 from pathlib import Path
 
+from nerc_metrics import count, observe, stage
+
+def extract_pdf_document(pdf_file):
+    """
+    Extracts one PDF as a "--- START DOCUMENT:" ... "--- END DOCUMENT:" section.
+    """
+    text_content = f"--- START DOCUMENT: {pdf_file.name} ---\n"
+
+    with pdfplumber.open(pdf_file) as pdf:
+        for page in pdf.pages:
+            started = time.perf_counter()
+            # Extract text, preserving layout as best as possible
+            text = page.extract_text(x_tolerance=2, y_tolerance=2)
+            observe('nerc_pdf_page_seconds', time.perf_counter() - started, operation='extract_text')
+            count('nerc_pages_total', operation='extract_text')
+            if text:
+                text_content += text + "\n"
+
+    text_content += f"--- END DOCUMENT: {pdf_file.name} ---\n\n"
+    return text_content
+
+def iter_pdf_documents(pdf_dir):
+    """
+    Yields (pdf_file, document_text) for every PDF in a directory, skipping unreadable files.
+    """
+    files = list(Path(pdf_dir).glob('*.pdf'))
+    print(f"Found {len(files)} PDF files in {pdf_dir}")
+
+    for pdf_file in files:
+        print(f"Processing: {pdf_file.name}...")
+        try:
+            document = extract_pdf_document(pdf_file)
+        except Exception as e:
+            count('nerc_pdf_documents_total', operation='extract_text', status='error')
+            print(f"❌ Error processing {pdf_file.name}: {e}")
+            continue
+        count('nerc_pdf_documents_total', operation='extract_text', status='ok')
+        yield pdf_file, document
+
 def extract_text_from_pdfs(pdf_dir, output_dir):
     """
     Iterates through all PDFs in a directory, extracts text, 
     and saves raw text files for AI processing.
     """
-    pdf_path = Path(pdf_dir)
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
     
     combined_text = ""
-    
-    files = list(pdf_path.glob('*.pdf'))
-    print(f"Found {len(files)} PDF files in {pdf_dir}")
+    documents = 0
 
-    for pdf_file in files:
-        print(f"Processing: {pdf_file.name}...")
-        text_content = f"--- START DOCUMENT: {pdf_file.name} ---\n"
-        
-        try:
-            with pdfplumber.open(pdf_file) as pdf:
-                for page in pdf.pages:
-                    # Extract text, preserving layout as best as possible
-                    text = page.extract_text(x_tolerance=2, y_tolerance=2)
-                    if text:
-                        text_content += text + "\n"
-            
-            text_content += f"--- END DOCUMENT: {pdf_file.name} ---\n\n"
-            
+    with stage('extract') as fields:
+        for pdf_file, text_content in iter_pdf_documents(pdf_dir):
+            documents += 1
             # Save individual text file (good for debugging or granular processing)
             txt_filename = pdf_file.stem + ".txt"
             with open(output_path / txt_filename, 'w', encoding='utf-8') as f:
                 f.write(text_content)
-                
+
             combined_text += text_content
-            
-        except Exception as e:
-            print(f"❌ Error processing {pdf_file.name}: {e}")
 
-    # Save the mega-file
-    with open("nerc_all_combined.txt", 'w', encoding='utf-8') as f:
-        f.write(combined_text)
+        # Save the mega-file
+        with open("nerc_all_combined.txt", 'w', encoding='utf-8') as f:
+            f.write(combined_text)
+        fields['documents'] = documents
     
-    print(f"\n✅ Success! Extracted text from {len(files)} documents.")
+    print(f"\n✅ Success! Extracted text from {documents} documents.")
     print(f"1. Individual text files saved in: {output_dir}/")
     print(f"2. Combined master file saved as: nerc_all_combined.txt")
 
 if __name__ == "__main__":
+    import sys
+    from nerc_profile import profile_from_argv, start_profiling
+    start_profiling(profile_from_argv(sys.argv))
+
     # CONFIGURATION
     # Create a folder named 'nerc_pdfs' and put your 40 files there
     PDF_SOURCE_DIR = "NERC-CIP" 
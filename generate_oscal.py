@@ -3,6 +3,8 @@ import json
 import uuid
 from datetime import datetime
 
+from nerc_metrics import count, stage
+
 # CONFIGURATION
 INPUT_FILE = "nerc_all_combined.txt"
 OUTPUT_FILE = "nerc-oscal.json"
@@ -142,56 +144,91 @@ def parse_requirements_state_machine(req_block):
 
     return requirements
 
+def parse_standard_document(doc):
+    """
+    Parses one "--- START DOCUMENT:" section into a standard dict (or None).
+    """
+    # 1. Identify CIP Number
+    match = re.search(r"(CIP-\d{3}-\d+[a-z]?)", doc)
+    if not match:
+        return None
+
+    full_cip_id = match.group(1)
+    cip_family = full_cip_id.split('-')[1]
+    version_str = full_cip_id.split('-')[2]
+    version_num = float(re.sub(r'[a-zA-Z]', '', version_str))
+
+    # 2. Metadata
+    title_match = re.search(r"Title:\s*(.+)", doc)
+    title = title_match.group(1).strip() if title_match else "Unknown Title"
+
+    purpose_match = re.search(r"Purpose:\s*(.+?)(?=\n\s*4\.)", doc, re.DOTALL)
+    purpose = purpose_match.group(1).replace('\n', ' ').strip() if purpose_match else "No purpose defined."
+    purpose = re.sub(r"Page \d+ of \d+", "", purpose)
+
+    # 3. Extract Requirement Block
+    # Grab text between "B. Requirements" and "C. Compliance" (or VSL table)
+    req_section_match = re.search(
+        r"B\.\s*Requirements and Measures(.*?)(?=C\.\s*Compliance|Violation Severity Levels)", 
+        doc, 
+        re.DOTALL
+    )
+    
+    reqs = []
+    if req_section_match:
+        raw_req_block = req_section_match.group(1)
+        # Clean page numbers BEFORE processing logic
+        clean_block = re.sub(r"Page \d+ of \d+", "", raw_req_block)
+        reqs = parse_requirements_state_machine(clean_block)
+
+    return {
+        "id": full_cip_id,
+        "family": cip_family,
+        "version": version_num,
+        "original_version_string": version_str,
+        "title": title,
+        "purpose": purpose,
+        "requirements": reqs
+    }
+
+def parse_all_standard_versions(text):
+    """
+    Parses every document in the combined text, keeping all versions of each standard.
+    """
+    standards = []
+    for doc in text.split("--- START DOCUMENT:"):
+        if not doc.strip(): continue
+        standard_obj = parse_standard_document(doc)
+        if standard_obj:
+            standards.append(standard_obj)
+    return standards
+
 def parse_nerc_standards(text):
+    with stage('parse_standards') as fields:
+        standards = _parse_nerc_standards(text)
+        requirements = sum(len(std['requirements']) for std in standards.values())
+        count('nerc_standards_total', len(standards))
+        count('nerc_requirements_total', requirements, stage='parse_standards')
+        fields.update(standards=len(standards), requirements=requirements)
+    return standards
+
+def _parse_nerc_standards(text):
     raw_docs = text.split("--- START DOCUMENT:")
     standards = {}
 
     print(f"[*] Analyzing {len(raw_docs)} documents...")
+    count('nerc_documents_total', sum(1 for doc in raw_docs if doc.strip()))
 
     for doc in raw_docs:
         if not doc.strip(): continue
 
-        # 1. Identify CIP Number
-        match = re.search(r"(CIP-\d{3}-\d+[a-z]?)", doc)
-        if not match: continue
-        
-        full_cip_id = match.group(1)
-        cip_family = full_cip_id.split('-')[1]
-        version_str = full_cip_id.split('-')[2]
-        version_num = float(re.sub(r'[a-zA-Z]', '', version_str))
-
-        # 2. Metadata
-        title_match = re.search(r"Title:\s*(.+)", doc)
-        title = title_match.group(1).strip() if title_match else "Unknown Title"
-
-        purpose_match = re.search(r"Purpose:\s*(.+?)(?=\n\s*4\.)", doc, re.DOTALL)
-        purpose = purpose_match.group(1).replace('\n', ' ').strip() if purpose_match else "No purpose defined."
-        purpose = re.sub(r"Page \d+ of \d+", "", purpose)
-
-        # 3. Extract Requirement Block
-        # Grab text between "B. Requirements" and "C. Compliance" (or VSL table)
-        req_section_match = re.search(
-            r"B\.\s*Requirements and Measures(.*?)(?=C\.\s*Compliance|Violation Severity Levels)", 
-            doc, 
-            re.DOTALL
-        )
-        
-        reqs = []
-        if req_section_match:
-            raw_req_block = req_section_match.group(1)
-            # Clean page numbers BEFORE processing logic
-            clean_block = re.sub(r"Page \d+ of \d+", "", raw_req_block)
-            reqs = parse_requirements_state_machine(clean_block)
-
-        standard_obj = {
-            "id": full_cip_id,
-            "family": cip_family,
-            "version": version_num,
-            "original_version_string": version_str,
-            "title": title,
-            "purpose": purpose,
-            "requirements": reqs
-        }
+        standard_obj = parse_standard_document(doc)
+        if not standard_obj: continue
+
+        full_cip_id = standard_obj['id']
+        cip_family = standard_obj['family']
+        version_num = standard_obj['version']
+        version_str = standard_obj['original_version_string']
 
         # 4. Deduplication
         if cip_family in standards:
@@ -204,8 +241,88 @@ def parse_nerc_standards(text):
 
     return standards
 
-def generate_oscal_catalog(standards):
-    catalog = {
+def build_catalog_group(std, unmapped_requirements, nist_map=None):
+    """
+    Builds the OSCAL group for one standard; unmapped requirements are appended to the list.
+    nist_map defaults to NERC_NIST_MAP (nerc_store.py passes the mappings stored in SQLite).
+    """
+    if nist_map is None:
+        nist_map = NERC_NIST_MAP
+    group = {
+        "id": std['id'].lower(),
+        "class": "standard",
+        "title": f"{std['id']} - {std['title']}",
+        "controls": [
+            {
+                "id": f"{std['id'].lower()}-purpose",
+                "class": "purpose",
+                "title": "Purpose",
+                "parts": [{"id": f"{std['id'].lower()}-purpose-smt", "name": "statement", "prose": std['purpose']}]
+            }
+        ]
+    }
+
+    for req in std['requirements']:
+        # Build base props (label, status and the IDs JAMA import keys on)
+        props = [
+            {"name": "label", "value": req['id']},
+            {"name": "status", "value": "active"},
+            {"name": "NERC-Requirement-ID", "value": f"{std['id']} {req['id']}"},
+            {"name": "JAMA-Requirement-ID", "value": f"{std['id'].rsplit('-', 1)[0]}-{req['id']}"}
+        ]
+
+        # Lookup NIST mappings
+        lookup_key = f"{std['id'].upper()}:{req['id']}"
+        if lookup_key in nist_map:
+            mapping = nist_map[lookup_key]
+            if mapping['primary']:
+                props.append({
+                    "name": "NIST-800-53-Primary-Control",
+                    "value": mapping['primary']
+                })
+            if mapping['secondary']:
+                props.append({
+                    "name": "NIST-800-53-Secondary-Controls",
+                    "value": mapping['secondary']
+                })
+        else:
+            # Gap detected: requirement has no NIST mapping
+            unmapped_requirements.append({
+                "requirement_key": lookup_key,
+                "description": req['text'][:80]  # First 80 chars for context
+            })
+            print(f"[!] GAP: {lookup_key} has no NIST mapping in NERC_NIST_MAP")
+
+        group['controls'].append({
+            "id": f"{std['id'].lower()}-{req['id'].lower()}",
+            "class": "requirement",
+            "title": f"{std['id']} {req['id']}",
+            "parts": [{"id": f"{std['id'].lower()}-{req['id'].lower()}-smt", "name": "statement", "prose": req['text']}],
+            "props": props
+        })
+
+    return group
+
+def iter_catalog_groups(standards, unmapped_requirements=None, nist_map=None):
+    """
+    Yields catalog groups one standard at a time (sorted by CIP family).
+    """
+    if unmapped_requirements is None:
+        unmapped_requirements = []
+    for family in sorted(standards.keys()):
+        yield build_catalog_group(standards[family], unmapped_requirements, nist_map)
+
+def report_mapping_gaps(unmapped_requirements):
+    count('nerc_mapping_gaps_total', len(unmapped_requirements))
+    # Print gap analysis summary
+    if unmapped_requirements:
+        print(f"\n[!] GAP ANALYSIS: {len(unmapped_requirements)} unmapped requirement(s) found:")
+        for item in unmapped_requirements:
+            print(f"    - {item['requirement_key']}: {item['description']}...")
+        print("    Run 'python mapping_suggest.py' for candidate NIST controls.")
+
+def new_catalog_document(groups=None):
+    return {
         "catalog": {
             "uuid": str(uuid.uuid4()),
             "metadata": {
@@ -215,78 +332,24 @@ def generate_oscal_catalog(standards):
                 "oscal-version": "1.0.0",
                 "notes": "Generated with NovaKit v3 State Machine Logic."
             },
-            "groups": []
+            "groups": list(groups or [])
         }
     }
 
-    gap_count = 0
-    unmapped_requirements = []
-
-    for family in sorted(standards.keys()):
-        std = standards[family]
-        group = {
-            "id": std['id'].lower(),
-            "class": "standard",
-            "title": f"{std['id']} - {std['title']}",
-            "controls": [
-                {
-                    "id": f"{std['id'].lower()}-purpose",
-                    "class": "purpose",
-                    "title": "Purpose",
-                    "parts": [{"id": f"{std['id'].lower()}-purpose-smt", "name": "statement", "prose": std['purpose']}]
-                }
-            ]
-        }
-
-        for req in std['requirements']:
-            # Build base props (label and status)
-            props = [
-                {"name": "label", "value": req['id']},
-                {"name": "status", "value": "active"}
-            ]
-
-            # Lookup NIST mappings
-            lookup_key = f"{std['id'].upper()}:{req['id']}"
-            if lookup_key in NERC_NIST_MAP:
-                mapping = NERC_NIST_MAP[lookup_key]
-                if mapping['primary']:
-                    props.append({
-                        "name": "NIST-800-53-Primary-Control",
-                        "value": mapping['primary']
-                    })
-                if mapping['secondary']:
-                    props.append({
-                        "name": "NIST-800-53-Secondary-Controls",
-                        "value": mapping['secondary']
-                    })
-            else:
-                # Gap detected: requirement has no NIST mapping
-                gap_count += 1
-                unmapped_requirements.append({
-                    "requirement_key": lookup_key,
-                    "description": req['text'][:80]  # First 80 chars for context
-                })
-                print(f"[!] GAP: {lookup_key} has no NIST mapping in NERC_NIST_MAP")
-
-            group['controls'].append({
-                "id": f"{std['id'].lower()}-{req['id'].lower()}",
-                "class": "requirement",
-                "title": f"{std['id']} {req['id']}",
-                "parts": [{"id": f"{std['id'].lower()}-{req['id'].lower()}-smt", "name": "statement", "prose": req['text']}],
-                "props": props
-            })
-
-        catalog['catalog']['groups'].append(group)
-
-    # Print gap analysis summary
-    if gap_count > 0:
-        print(f"\n[!] GAP ANALYSIS: {gap_count} unmapped requirement(s) found:")
-        for item in unmapped_requirements:
-            print(f"    - {item['requirement_key']}: {item['description']}...")
-
+def generate_oscal_catalog(standards, nist_map=None):
+    with stage('generate_catalog') as fields:
+        unmapped_requirements = []
+        catalog = new_catalog_document(iter_catalog_groups(standards, unmapped_requirements, nist_map))
+        report_mapping_gaps(unmapped_requirements)
+        requirements = sum(len(std['requirements']) for std in standards.values())
+        count('nerc_requirements_total', requirements, stage='generate_catalog')
+        fields.update(requirements=requirements, gaps=len(unmapped_requirements))
     return catalog
 
 if __name__ == "__main__":
+    import sys
+    from nerc_profile import profile_from_argv, start_profiling
+    start_profiling(profile_from_argv(sys.argv))
     print("[*] Phase 3.5 (State Machine): Generating OSCAL...")
     try:
         with open(INPUT_FILE, 'r', encoding='utf-8') as f:
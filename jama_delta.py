@@ -0,0 +1,217 @@
+"""
+Delta JAMA export: emit only rows added, changed or removed since the last sync.
+
+A manifest next to the delta CSV records a content hash per requirement
+(keyed by JAMA-Requirement-ID). Each run hashes the freshly built rows,
+compares them with the manifest and writes only the differences, with an
+Operation column telling the JAMA import job what to do:
+- ADD: requirement not in the previous export
+- UPDATE: requirement content changed
+- DELETE: requirement no longer present (only the ID columns are filled)
+
+The manifest is replaced only after the delta CSV has been written, so a
+failed run can simply be repeated. It also records the exported columns: a run
+with a different layout (--format, --nist-catalog) would change every hash,
+so it is refused until the baseline is rebuilt (a fresh --manifest path, or
+delete the old manifest).
+
+Usage:
+    python oscal_to_jama_csv.py nerc-oscal.json --delta
+    python oscal_to_jama_csv.py nerc-oscal.json --delta --manifest jama-sync.manifest.json
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from oscal_stream import iter_oscal_components
+from oscal_to_jama_csv import _open_nist_catalog, build_jama_row, get_csv_columns, write_jama_rows
+
+MANIFEST_VERSION = 1
+MANIFEST_SUFFIX = '.manifest.json'
+
+OPERATION_COLUMN = 'Operation'
+OP_ADD = 'ADD'
+OP_UPDATE = 'UPDATE'
+OP_DELETE = 'DELETE'
+
+KEY_COLUMN = 'JAMA-Requirement-ID'
+# Regenerated on every export for catalog input, so never part of the hash
+VOLATILE_COLUMNS = frozenset({'Component-UUID'})
+
+
+def default_manifest_path(output_csv: Path) -> Path:
+    """Manifest path used when none is given (e.g. matrix.csv -> matrix.manifest.json)."""
+    output_csv = Path(output_csv)
+    return output_csv.with_name(output_csv.stem + MANIFEST_SUFFIX)
+
+
+def row_hash(row: Dict[str, str], fieldnames: List[str]) -> str:
+    """
+    Hash the exported content of a row.
+
+    Args:
+        row: CSV row dictionary
+        fieldnames: Column order (volatile columns are ignored)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    values = [[name, row.get(name, '')] for name in fieldnames if name not in VOLATILE_COLUMNS]
+    return hashlib.sha256(json.dumps(values, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def load_manifest(manifest_file: Path, fieldnames: Optional[List[str]] = None) -> Dict[str, dict]:
+    """
+    Load the per-requirement hashes from the previous sync.
+
+    Args:
+        manifest_file: Manifest path
+        fieldnames: Columns of the current export; if given, they must match
+            the columns the manifest's hashes were computed over
+
+    Returns:
+        Requirement ID -> {'hash', 'nerc_id'}; empty if there is no manifest yet
+
+    Raises:
+        ValueError: If the manifest is from an unsupported version or was
+            written for other columns
+    """
+    manifest_file = Path(manifest_file)
+    if not manifest_file.exists():
+        return {}
+
+    with open(manifest_file, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    if manifest.get('version') != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported delta manifest version in {manifest_file}: {manifest.get('version')}")
+    if fieldnames is not None and manifest.get('columns') != list(fieldnames):
+        # Every hash would differ, turning the whole matrix into UPDATE rows
+        raise ValueError(f"Delta manifest {manifest_file} was written for columns {manifest.get('columns')}, "
+                         f"but this export has {list(fieldnames)} (--format or --nist-catalog changed). "
+                         f"Rebuild the baseline: delete the manifest or pass a new --manifest path")
+    return manifest.get('rows', {})
+
+
+def save_manifest(manifest_file: Path, entries: Dict[str, dict], fieldnames: List[str]):
+    """Atomically replace the manifest with the current export's hashes."""
+    manifest_file = Path(manifest_file)
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'columns': fieldnames,
+        'rows': entries,
+    }
+    tmp_file = manifest_file.with_name(manifest_file.name + '.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_file, manifest_file)
+
+
+def compute_delta(rows: Iterable[Dict[str, str]], previous: Dict[str, dict],
+                  fieldnames: List[str]) -> Tuple[List[Dict[str, str]], Dict[str, dict], Dict[str, int]]:
+    """
+    Compare freshly built rows with the previous manifest.
+
+    Args:
+        rows: Current export rows
+        previous: Manifest entries from load_manifest
+        fieldnames: Column order used for hashing and DELETE rows
+
+    Returns:
+        Tuple of (delta rows with an Operation column, new manifest entries,
+        summary counts by operation plus 'unchanged')
+
+    Raises:
+        ValueError: If a row has no requirement ID or an ID appears twice
+    """
+    delta = []
+    entries: Dict[str, dict] = {}
+    summary = {OP_ADD: 0, OP_UPDATE: 0, OP_DELETE: 0, 'unchanged': 0}
+
+    for row in rows:
+        key = row.get(KEY_COLUMN, '').strip()
+        if not key:
+            raise ValueError(f"Row for {row.get('NERC-Requirement-ID') or row.get('Title')!r} "
+                             f"has no {KEY_COLUMN}; delta export needs a stable key")
+        if key in entries:
+            raise ValueError(f"Duplicate {KEY_COLUMN} in export: {key}")
+
+        digest = row_hash(row, fieldnames)
+        entries[key] = {'hash': digest, 'nerc_id': row.get('NERC-Requirement-ID', '')}
+
+        old = previous.get(key)
+        if old is None:
+            operation = OP_ADD
+        elif old['hash'] != digest:
+            operation = OP_UPDATE
+        else:
+            summary['unchanged'] += 1
+            continue
+
+        summary[operation] += 1
+        delta.append(dict(row, **{OPERATION_COLUMN: operation}))
+
+    for key in sorted(previous.keys() - entries.keys()):
+        summary[OP_DELETE] += 1
+        removed = {name: '' for name in fieldnames}
+        removed.update({
+            OPERATION_COLUMN: OP_DELETE,
+            KEY_COLUMN: key,
+            'NERC-Requirement-ID': previous[key].get('nerc_id', ''),
+        })
+        delta.append(removed)
+
+    return delta, entries, summary
+
+
+def delta_oscal_to_jama_csv(oscal_file: Path, output_csv: Optional[Path] = None,
+                            manifest_file: Optional[Path] = None,
+                            format_type: str = 'standard',
+                            nist_catalog_file: Optional[Path] = None) -> Dict[str, int]:
+    """
+    Export only the rows that changed since the manifest was last written.
+
+    Args:
+        oscal_file: Path to input OSCAL JSON file
+        output_csv: Delta CSV path (if None, derives from oscal_file)
+        manifest_file: Manifest path (default: <output_csv stem>.manifest.json)
+        format_type: CSV format ('standard' or 'detailed')
+        nist_catalog_file: Optional official NIST OSCAL catalog for statement text
+
+    Returns:
+        Summary counts by operation plus 'unchanged'
+
+    Raises:
+        FileNotFoundError: If the OSCAL file doesn't exist
+        ValueError: If there is nothing to export, requirement IDs are not
+            unique or the manifest was written for a different column layout
+    """
+    if output_csv is None:
+        output_csv = Path(oscal_file).with_suffix('.csv')
+    if manifest_file is None:
+        manifest_file = default_manifest_path(output_csv)
+
+    nist_catalog = _open_nist_catalog(nist_catalog_file)
+    fieldnames = get_csv_columns(format_type, nist_catalog is not None)
+    rows = (build_jama_row(component, format_type, nist_catalog)
+            for component in iter_oscal_components(oscal_file))
+
+    previous = load_manifest(manifest_file, fieldnames)
+    delta, entries, summary = compute_delta(rows, previous, fieldnames)
+    if not entries:
+        raise ValueError("OSCAL JSON has no requirements/components to export")
+
+    write_jama_rows(delta, output_csv, [OPERATION_COLUMN] + fieldnames)
+    save_manifest(manifest_file, entries, fieldnames)
+
+    if delta:
+        print(f"[OK] Exported {len(delta)} changed row(s) to {output_csv} "
+              f"({summary[OP_ADD]} added, {summary[OP_UPDATE]} updated, "
+              f"{summary[OP_DELETE]} deleted, {summary['unchanged']} unchanged)")
+    else:
+        print(f"[OK] No changes since last sync ({summary['unchanged']} unchanged); "
+              f"wrote header-only {output_csv}")
+    return summary
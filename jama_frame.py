@@ -0,0 +1,199 @@
+"""
+Columnar JAMA export: OSCAL components -> pandas DataFrame -> CSV/Parquet/XLSX.
+
+The row-oriented exporter (oscal_to_jama_csv.build_jama_row) builds one dict
+per component. Here the component properties are gathered into column lists
+in a single pass; control ID normalization, defaults and NIST statement
+lookups are then applied once per column. The same frame can be written to
+several targets, so one run feeds JAMA (CSV), the BI warehouse (Parquet) and
+auditors (XLSX) without reparsing the OSCAL file.
+
+Parquet needs pyarrow (or fastparquet) and XLSX needs openpyxl; both are
+optional and only imported by pandas when that target is written.
+
+Usage:
+    from jama_frame import export_oscal_frame
+    export_oscal_frame(Path('nerc-oscal.json'), [Path('matrix.csv'), Path('matrix.parquet')])
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from oscal_to_jama_csv import (
+    STATEMENT_COLUMN,
+    _extract_components_from_oscal,
+    _open_nist_catalog,
+    get_csv_columns,
+    load_oscal_json,
+)
+
+# Output targets and their file suffixes
+EXPORT_TARGETS = {
+    'csv': '.csv',
+    'parquet': '.parquet',
+    'xlsx': '.xlsx',
+}
+
+# Component property name -> output column
+PROPERTY_COLUMNS = {
+    'JAMA-Requirement-ID': 'JAMA-Requirement-ID',
+    'NERC-Requirement-ID': 'NERC-Requirement-ID',
+    'NIST-800-53-Primary-Control': 'NIST-Primary-Control',
+    'NIST-800-53-Secondary-Controls': 'NIST-Secondary-Controls',
+    'Implementation-Status': 'Implementation-Status',
+}
+
+# Defaults for columns whose property/field is absent (matches build_jama_row)
+COLUMN_DEFAULTS = {
+    'JAMA-Requirement-ID': '',
+    'NERC-Requirement-ID': '',
+    'NIST-Primary-Control': '',
+    'NIST-Secondary-Controls': '',
+    'Title': '',
+    'Description': '',
+    'Implementation-Status': 'Draft',
+    'Component-UUID': '',
+    'Component-Type': 'software',
+}
+
+XLSX_SHEET_NAME = 'JAMA Traceability'
+
+
+def _collect_columns(components: Iterable[dict], detailed: bool) -> Dict[str, list]:
+    """Gather component fields into per-column lists (None where absent)."""
+    columns: Dict[str, list] = {name: [] for name in PROPERTY_COLUMNS.values()}
+    columns.update({'Title': [], 'Description': []})
+    if detailed:
+        columns.update({'Component-UUID': [], 'Component-Type': [], 'Control-Count': []})
+
+    for component in components:
+        # Last occurrence of a property wins, as in extract_component_properties
+        values = {}
+        for prop in component.get('properties', []):
+            if isinstance(prop, dict) and prop.get('name', '') in PROPERTY_COLUMNS:
+                values[PROPERTY_COLUMNS[prop['name']]] = prop.get('value', '')
+        for column in PROPERTY_COLUMNS.values():
+            columns[column].append(values.get(column))
+
+        columns['Title'].append(component.get('title'))
+        columns['Description'].append(component.get('description'))
+        if detailed:
+            columns['Component-UUID'].append(component.get('uuid'))
+            columns['Component-Type'].append(component.get('type'))
+            columns['Control-Count'].append(len(component.get('control-implementations', [])))
+
+    return columns
+
+
+def components_to_frame(components: Iterable[dict], format_type: str = 'standard',
+                        nist_catalog=None) -> pd.DataFrame:
+    """
+    Build the JAMA traceability frame from OSCAL components.
+
+    Args:
+        components: OSCAL components (or catalog controls converted to them)
+        format_type: Column layout ('standard' or 'detailed')
+        nist_catalog: Optional opened nist_catalog.NISTCatalog for statement text
+
+    Returns:
+        DataFrame with the same columns and values as the CSV exporter's rows
+    """
+    columns = _collect_columns(components, format_type == 'detailed')
+    frame = pd.DataFrame(columns, dtype=object)
+
+    for column, default in COLUMN_DEFAULTS.items():
+        if column in frame:
+            frame[column] = frame[column].fillna(default)
+
+    frame['NIST-Primary-Control'] = frame['NIST-Primary-Control'].astype(str).str.strip().str.upper()
+    if 'Control-Count' in frame:
+        frame['Control-Count'] = frame['Control-Count'].astype(str)
+
+    if nist_catalog is not None:
+        # One catalog lookup per distinct control rather than per row
+        primary = frame['NIST-Primary-Control']
+        statements = {control: nist_catalog.get_statement(control) if control else ''
+                      for control in primary.unique()}
+        frame[STATEMENT_COLUMN] = primary.map(statements)
+
+    return frame[get_csv_columns(format_type, nist_catalog is not None)]
+
+
+def target_for_path(output: Path) -> str:
+    """
+    Infer the export target from a file suffix.
+
+    Raises:
+        ValueError: If the suffix is not a supported target
+    """
+    suffix = Path(output).suffix.lower()
+    for target, target_suffix in EXPORT_TARGETS.items():
+        if suffix == target_suffix:
+            return target
+    raise ValueError(f"Unsupported export file type '{suffix}' (expected one of: "
+                     f"{', '.join(EXPORT_TARGETS.values())})")
+
+
+def write_frame(frame: pd.DataFrame, output: Path, target: Optional[str] = None) -> Path:
+    """
+    Write the frame to one target file.
+
+    Args:
+        frame: Frame from components_to_frame
+        output: Output file path
+        target: 'csv', 'parquet' or 'xlsx' (default: inferred from the suffix)
+
+    Returns:
+        Path written
+
+    Raises:
+        ValueError: If the target is unknown
+        ImportError: If the optional engine for Parquet/XLSX is not installed
+    """
+    target = target or target_for_path(output)
+    if target == 'csv':
+        # Same dialect as csv.DictWriter so the file is identical to the row exporter's
+        frame.to_csv(output, index=False, encoding='utf-8', lineterminator='\r\n')
+    elif target == 'parquet':
+        frame.to_parquet(output, index=False)
+    elif target == 'xlsx':
+        frame.to_excel(output, index=False, sheet_name=XLSX_SHEET_NAME)
+    else:
+        raise ValueError(f"Unknown export target: {target}")
+    return Path(output)
+
+
+def export_oscal_frame(oscal_file: Path, outputs: List[Path], format_type: str = 'standard',
+                       nist_catalog_file: Optional[Path] = None) -> pd.DataFrame:
+    """
+    Parse an OSCAL file once and write the JAMA frame to every output.
+
+    Args:
+        oscal_file: Path to input OSCAL JSON file
+        outputs: Output files; each target is inferred from its suffix
+        format_type: Column layout ('standard' or 'detailed')
+        nist_catalog_file: Optional official NIST OSCAL catalog for statement text
+
+    Returns:
+        The exported frame
+
+    Raises:
+        FileNotFoundError: If the OSCAL file doesn't exist
+        ValueError: If there is nothing to export or an output type is unsupported
+    """
+    # Check every target before doing any work
+    targets = [target_for_path(output) for output in outputs]
+
+    components = _extract_components_from_oscal(load_oscal_json(oscal_file))
+    if not components:
+        raise ValueError("OSCAL JSON has no requirements/components to export")
+
+    frame = components_to_frame(components, format_type, _open_nist_catalog(nist_catalog_file))
+
+    for output, target in zip(outputs, targets):
+        write_frame(frame, output, target)
+        print(f"[OK] Successfully exported {len(frame)} components to {output}")
+
+    return frame
@@ -0,0 +1,271 @@
+"""
+Merge Implementation-Status from a JAMA export CSV back into the OSCAL catalog.
+
+Engineers maintain implementation status in JAMA; this importer brings it back
+as an "Implementation-Status" prop on each catalog requirement control (the
+prop oscal_to_jama_csv already exports), closing the round trip.
+
+The catalog is indexed once by JAMA-Requirement-ID, NERC-Requirement-ID and
+control id; the CSV is then streamed row by row with one dictionary lookup
+each, so exports with hundreds of thousands of rows (including rows for other
+projects or item types, which are counted as unmatched) are merged in a
+single linear pass. When several rows set different statuses for the same
+control, the last row wins and the conflict is reported.
+
+Usage:
+    python jama_import.py jama-export.csv
+    python jama_import.py jama-export.csv --oscal nerc-oscal.json --output merged.json
+    python jama_import.py jama-export.csv --dry-run
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from nerc_profile import add_profile_argument, start_profiling
+from oscal_to_jama_csv import load_oscal_json
+
+STATUS_PROP = 'Implementation-Status'
+STATUS_COLUMN = 'Implementation-Status'
+KEY_COLUMNS = ('JAMA-Requirement-ID', 'NERC-Requirement-ID')
+# Props that identify a control in addition to its id
+KEY_PROPS = ('JAMA-Requirement-ID', 'NERC-Requirement-ID')
+
+MAX_REPORTED_UNMATCHED = 20
+
+
+def _normalize_key(value: str) -> str:
+    return ' '.join(value.split()).upper()
+
+
+def _prop_list(item: dict, create: bool = False) -> List[dict]:
+    """Props of a catalog control ('props') or component ('properties')."""
+    name = 'properties' if 'properties' in item and 'props' not in item else 'props'
+    if create:
+        return item.setdefault(name, [])
+    return item.get(name) or []
+
+
+def iter_mergeable_items(oscal_data: dict) -> Iterable[dict]:
+    """Yield catalog requirement controls, or components of a component definition."""
+    comp_def = oscal_data.get('component-definition', {})
+    if comp_def and 'components' in comp_def:
+        yield from comp_def.get('components', [])
+        return
+
+    for group in oscal_data.get('catalog', {}).get('groups', []):
+        for control in group.get('controls', []):
+            if control.get('class') == 'requirement':
+                yield control
+
+
+def build_control_index(oscal_data: dict) -> Dict[str, dict]:
+    """
+    Index catalog controls by every key a JAMA row may carry.
+
+    Args:
+        oscal_data: Parsed OSCAL catalog or component definition
+
+    Returns:
+        Normalized key (JAMA-Requirement-ID, NERC-Requirement-ID or control
+        id, upper-cased) -> control dict (the object inside oscal_data)
+    """
+    index = {}
+    for item in iter_mergeable_items(oscal_data):
+        keys = [item.get('id', ''), item.get('uuid', '')]
+        for prop in _prop_list(item):
+            if isinstance(prop, dict) and prop.get('name') in KEY_PROPS:
+                keys.append(prop.get('value', ''))
+        for key in keys:
+            if key and key.strip():
+                index.setdefault(_normalize_key(key), item)
+    return index
+
+
+def set_status_prop(item: dict, status: str) -> bool:
+    """
+    Set the Implementation-Status prop on a control.
+
+    Returns:
+        True if the value changed
+    """
+    props = _prop_list(item, create=True)
+    for prop in props:
+        if isinstance(prop, dict) and prop.get('name') == STATUS_PROP:
+            if prop.get('value') == status:
+                return False
+            prop['value'] = status
+            return True
+    props.append({'name': STATUS_PROP, 'value': status})
+    return True
+
+
+def merge_jama_statuses(oscal_data: dict, csv_file: Path,
+                        key_columns: Sequence[str] = KEY_COLUMNS,
+                        status_column: str = STATUS_COLUMN) -> dict:
+    """
+    Stream a JAMA export and write its statuses into oscal_data in place.
+
+    Args:
+        oscal_data: Parsed OSCAL catalog or component definition (modified)
+        csv_file: JAMA export CSV
+        key_columns: Columns tried, in order, to find a row's control
+        status_column: Column holding the implementation status
+
+    Returns:
+        Summary with rows, matched, unmatched, blank, conflicts, changed,
+        unchanged and unmatched_keys (first few)
+
+    Raises:
+        FileNotFoundError: If the CSV doesn't exist
+        ValueError: If the CSV lacks the status column or every key column
+    """
+    csv_file = Path(csv_file)
+    if not csv_file.exists():
+        raise FileNotFoundError(f"JAMA export not found: {csv_file}")
+
+    index = build_control_index(oscal_data)
+    summary = {'rows': 0, 'matched': 0, 'unmatched': 0, 'blank': 0, 'conflicts': 0,
+               'changed': 0, 'unchanged': 0, 'unmatched_keys': []}
+    # id(control) -> (control, status); dict order keeps first-seen order
+    updates: Dict[int, tuple] = {}
+
+    with open(csv_file, 'r', newline='', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames or []
+        if status_column not in fieldnames:
+            raise ValueError(f"JAMA export has no '{status_column}' column")
+        columns = [column for column in key_columns if column in fieldnames]
+        if not columns:
+            raise ValueError(f"JAMA export has none of the key columns: {', '.join(key_columns)}")
+
+        for row in reader:
+            summary['rows'] += 1
+            if row.get('Operation', '').upper() == 'DELETE':
+                continue
+            status = (row.get(status_column) or '').strip()
+            if not status:
+                summary['blank'] += 1
+                continue
+
+            item = None
+            for column in columns:
+                value = row.get(column)
+                if value:
+                    item = index.get(_normalize_key(value))
+                    if item is not None:
+                        break
+            if item is None:
+                summary['unmatched'] += 1
+                if len(summary['unmatched_keys']) < MAX_REPORTED_UNMATCHED:
+                    summary['unmatched_keys'].append(next((row[c] for c in columns if row.get(c)), ''))
+                continue
+
+            summary['matched'] += 1
+            previous = updates.get(id(item))
+            if previous is not None and previous[1] != status:
+                summary['conflicts'] += 1
+            updates[id(item)] = (item, status)
+
+    for item, status in updates.values():
+        summary['changed' if set_status_prop(item, status) else 'unchanged'] += 1
+
+    if summary['changed']:
+        metadata = oscal_data.get('catalog', oscal_data.get('component-definition', {})).get('metadata')
+        if isinstance(metadata, dict):
+            metadata['last-modified'] = datetime.now().isoformat()
+
+    return summary
+
+
+def write_oscal_json(oscal_data: dict, output_file: Path):
+    """Write OSCAL JSON atomically (indent=2, as generate_oscal does)."""
+    output_file = Path(output_file)
+    tmp_file = output_file.with_name(output_file.name + '.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(oscal_data, f, indent=2)
+    os.replace(tmp_file, output_file)
+
+
+def import_jama_statuses(csv_file: Path, oscal_file: Path, output_file: Optional[Path] = None,
+                         key_columns: Sequence[str] = KEY_COLUMNS,
+                         status_column: str = STATUS_COLUMN, dry_run: bool = False) -> dict:
+    """
+    Merge a JAMA export into an OSCAL file.
+
+    Args:
+        csv_file: JAMA export CSV
+        oscal_file: OSCAL catalog or component definition to update
+        output_file: Where to write the merged OSCAL (default: overwrite oscal_file)
+        key_columns: Columns tried, in order, to find a row's control
+        status_column: Column holding the implementation status
+        dry_run: Report only; write nothing
+
+    Returns:
+        merge_jama_statuses summary
+    """
+    oscal_data = load_oscal_json(Path(oscal_file))
+    summary = merge_jama_statuses(oscal_data, csv_file, key_columns, status_column)
+    if not dry_run and (summary['changed'] or output_file is not None):
+        write_oscal_json(oscal_data, output_file or oscal_file)
+    return summary
+
+
+def main():
+    """Command-line interface for the JAMA status importer."""
+    parser = argparse.ArgumentParser(
+        description='Merge Implementation-Status from a JAMA export CSV into the OSCAL catalog',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s jama-export.csv
+  %(prog)s jama-export.csv --oscal nerc-oscal.json --output merged.json
+  %(prog)s jama-export.csv --key-column "Global ID" --status-column Status
+  %(prog)s jama-export.csv --dry-run
+        """
+    )
+    parser.add_argument('csv_file', type=Path, help='JAMA export CSV')
+    parser.add_argument('--oscal', type=Path, default=Path('nerc-oscal.json'),
+                        help='OSCAL file to update (default: nerc-oscal.json)')
+    parser.add_argument('-o', '--output', type=Path, default=None,
+                        help='Write merged OSCAL here instead of updating --oscal in place')
+    parser.add_argument('--key-column', action='append', default=None,
+                        help=f"Column(s) matching rows to controls (default: {', '.join(KEY_COLUMNS)})")
+    parser.add_argument('--status-column', default=STATUS_COLUMN,
+                        help=f'Status column (default: {STATUS_COLUMN})')
+    parser.add_argument('--dry-run', action='store_true', help='Report what would change without writing')
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    start_profiling(args.profile)
+
+    try:
+        summary = import_jama_statuses(args.csv_file, args.oscal, args.output,
+                                       args.key_column or KEY_COLUMNS, args.status_column, args.dry_run)
+    except FileNotFoundError as e:
+        print(f"[ERR] Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except json.JSONDecodeError as e:
+        print(f"[ERR] JSON parsing error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"[ERR] Validation error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"[*] {summary['rows']} row(s): {summary['matched']} matched, {summary['unmatched']} unmatched, "
+          f"{summary['blank']} without status")
+    if summary['conflicts']:
+        print(f"[WARN] {summary['conflicts']} conflicting status row(s); last row wins")
+    if summary['unmatched_keys']:
+        print(f"[WARN] Unmatched keys (first {len(summary['unmatched_keys'])}): "
+              f"{', '.join(summary['unmatched_keys'])}")
+    target = 'would change' if args.dry_run else 'changed'
+    print(f"[OK] {summary['changed']} control status(es) {target}, {summary['unchanged']} already current")
+
+
+if __name__ == '__main__':
+    main()
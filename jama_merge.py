@@ -0,0 +1,207 @@
+"""
+Merge several OSCAL catalogs (e.g. base NERC plus regional tailorings) into one JAMA CSV.
+
+Inputs are listed in precedence order: when two inputs export the same
+requirement (same JAMA-Requirement-ID, falling back to NERC-Requirement-ID)
+with different content, the later input wins (last-writer-wins); within one
+input, the later row wins. Rows with identical content hashes are simple
+duplicates and are dropped. A requirement keeps the position where it first
+appeared, so the base catalog's order is preserved and requirements that only
+exist in a tailoring follow it.
+
+Each input is streamed with iter_oscal_components in its own thread and its
+rows are folded into a single index as they are produced; only the unique
+rows (one per requirement key) are kept in memory.
+
+Usage:
+    python oscal_to_jama_csv.py nerc-oscal.json wecc-tailoring.json -o merged.csv
+    python jama_merge.py nerc-oscal.json npcc.json wecc.json --output merged.csv
+"""
+
+import argparse
+import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from jama_delta import row_hash
+from nerc_profile import add_profile_argument, start_profiling
+from oscal_stream import iter_oscal_components
+from oscal_to_jama_csv import _open_nist_catalog, build_jama_row, get_csv_columns, write_jama_rows
+
+KEY_COLUMNS = ('JAMA-Requirement-ID', 'NERC-Requirement-ID')
+DEFAULT_WORKERS = 4
+MAX_REPORTED_OVERRIDES = 20
+
+
+def merge_key(row: Dict[str, str], digest: str) -> str:
+    """Key identifying a requirement across catalogs (content hash when it has no ID)."""
+    for column in KEY_COLUMNS:
+        value = ' '.join(row.get(column, '').split()).upper()
+        if value:
+            return f"{column}:{value}"
+    return f"hash:{digest}"
+
+
+class MergeIndex:
+    """
+    Unique-row index shared by the input threads.
+
+    Entries are key -> [position, precedence, hash, row, distinct
+    hashes], where position is (input index, row number) of the
+    first appearance and precedence is that of the row currently winning.
+    Distinct hashes are only tracked for keys with conflicting content, so
+    the counts do not depend on which thread finishes first.
+    """
+
+    def __init__(self, sources: Sequence[str], fieldnames: List[str]):
+        self.sources = list(sources)
+        self.fieldnames = fieldnames
+        self.entries: Dict[str, list] = {}
+        self.input_rows = [0] * len(self.sources)
+        self._lock = threading.Lock()
+
+    def add(self, source_index: int, row_number: int, row: Dict[str, str]):
+        """Fold one row into the index, applying last-writer-wins precedence."""
+        digest = row_hash(row, self.fieldnames)
+        key = merge_key(row, digest)
+        rank = (source_index, row_number)
+
+        with self._lock:
+            self.input_rows[source_index] += 1
+            entry = self.entries.get(key)
+            if entry is None:
+                self.entries[key] = [rank, rank, digest, row, None]
+                return
+
+            entry[0] = min(entry[0], rank)
+            if entry[4] is not None or digest != entry[2]:
+                if entry[4] is None:
+                    entry[4] = {entry[2]}
+                entry[4].add(digest)
+            if rank > entry[1]:
+                entry[1:4] = [rank, digest, row]
+
+    def _ordered(self) -> List[tuple]:
+        return sorted(self.entries.items(), key=lambda item: item[1][0])
+
+    def rows(self) -> List[Dict[str, str]]:
+        """Winning rows in order of first appearance."""
+        return [entry[3] for _, entry in self._ordered()]
+
+    def summary(self) -> dict:
+        """Per-input row counts, dropped duplicates and overridden requirements."""
+        overridden = [(key, entry) for key, entry in self._ordered() if entry[4] is not None]
+        distinct = sum(len(entry[4] or ()) or 1 for entry in self.entries.values())
+        return {
+            'inputs': dict(zip(self.sources, self.input_rows)),
+            'duplicates': sum(self.input_rows) - distinct,
+            'overrides': sum(len(entry[4]) - 1 for _, entry in overridden),
+            'override_keys': [key.split(':', 1)[1] for key, _ in overridden[:MAX_REPORTED_OVERRIDES]],
+        }
+
+
+def _merge_input(index: MergeIndex, source_index: int, oscal_file: Path, format_type: str, nist_catalog):
+    for row_number, component in enumerate(iter_oscal_components(oscal_file)):
+        index.add(source_index, row_number, build_jama_row(component, format_type, nist_catalog))
+
+
+def merge_oscal_to_jama_csv(oscal_files: Sequence[Path], output_csv: Optional[Path] = None,
+                            format_type: str = 'standard',
+                            nist_catalog_file: Optional[Path] = None,
+                            workers: int = DEFAULT_WORKERS) -> dict:
+    """
+    Stream several OSCAL files concurrently and write one deduplicated JAMA CSV.
+
+    Args:
+        oscal_files: Input OSCAL files, lowest precedence first
+        output_csv: Merged CSV path (default: <first input stem>-merged.csv)
+        format_type: CSV format ('standard' or 'detailed')
+        nist_catalog_file: Optional official NIST OSCAL catalog for statement text
+        workers: Input threads
+
+    Returns:
+        Summary with rows, per-input row counts, duplicates, overrides and
+        override_keys (first few)
+
+    Raises:
+        FileNotFoundError: If an input doesn't exist
+        json.JSONDecodeError: If an input is not valid JSON
+        ValueError: If no inputs are given or they contain nothing to export
+    """
+    oscal_files = [Path(oscal_file) for oscal_file in oscal_files]
+    if not oscal_files:
+        raise ValueError("No OSCAL inputs to merge")
+    for oscal_file in oscal_files:
+        if not oscal_file.exists():
+            raise FileNotFoundError(f"OSCAL file not found: {oscal_file}")
+    if output_csv is None:
+        output_csv = oscal_files[0].with_name(oscal_files[0].stem + '-merged.csv')
+
+    nist_catalog = _open_nist_catalog(nist_catalog_file)
+    fieldnames = get_csv_columns(format_type, nist_catalog is not None)
+    index = MergeIndex([str(oscal_file) for oscal_file in oscal_files], fieldnames)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(oscal_files)))) as pool:
+        futures = [pool.submit(_merge_input, index, source_index, oscal_file, format_type, nist_catalog)
+                   for source_index, oscal_file in enumerate(oscal_files)]
+        for future in futures:
+            future.result()
+
+    if not index.entries:
+        raise ValueError("OSCAL inputs have no requirements/components to export")
+
+    summary = dict(index.summary(), rows=write_jama_rows(index.rows(), output_csv, fieldnames))
+    print(f"[OK] Merged {len(oscal_files)} input(s) into {summary['rows']} row(s) in {output_csv} "
+          f"({summary['duplicates']} duplicate(s) dropped, {summary['overrides']} override(s))")
+    return summary
+
+
+def main():
+    """Command-line interface for the multi-catalog merge export."""
+    parser = argparse.ArgumentParser(
+        description='Merge several OSCAL catalogs into one deduplicated JAMA CSV (later inputs win)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s nerc-oscal.json wecc-tailoring.json
+  %(prog)s nerc-oscal.json npcc.json wecc.json --output merged.csv --format detailed
+        """
+    )
+    parser.add_argument('oscal_files', type=Path, nargs='+', help='OSCAL inputs, lowest precedence first')
+    parser.add_argument('-o', '--output', type=Path, default=None,
+                        help='Merged CSV (default: <first input>-merged.csv)')
+    parser.add_argument('--format', choices=['standard', 'detailed'], default='standard',
+                        help='CSV format: standard (basic fields) or detailed (with metadata)')
+    parser.add_argument('--nist-catalog', type=Path, default=None,
+                        help='Official NIST OSCAL catalog JSON; adds primary control statement text to each row')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Input threads (default: {DEFAULT_WORKERS})')
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    start_profiling(args.profile)
+
+    try:
+        summary = merge_oscal_to_jama_csv(args.oscal_files, args.output, args.format,
+                                          args.nist_catalog, args.workers)
+    except FileNotFoundError as e:
+        print(f"[ERR] Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except json.JSONDecodeError as e:
+        print(f"[ERR] JSON parsing error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"[ERR] Validation error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for source, count in summary['inputs'].items():
+        print(f"[*] {source}: {count} row(s)")
+    if summary['override_keys']:
+        print(f"[WARN] Overridden by later inputs (first {len(summary['override_keys'])}): "
+              f"{', '.join(summary['override_keys'])}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,279 @@
+"""
+Sharded JAMA CSV export for bulk imports.
+
+JAMA's importer struggles with very large CSVs, so the export can be split into
+several complete CSV files (each with its own header):
+- family: one shard per CIP standard family (CIP-002, CIP-003, ...)
+- rows: at most --shard-size data rows per shard
+- bytes: at most --shard-size bytes per shard file (e.g. 10M)
+
+Components are streamed from the OSCAL file and rows are encoded on the main
+thread; each finished shard is handed to a thread pool that hashes and writes
+it while the next shard is being built. A manifest (<stem>.shards.json) lists
+every shard with its row range, size and SHA-256 so import jobs can verify
+and resume.
+
+Usage:
+    python oscal_to_jama_csv.py nerc-oscal.json --shard-by family
+    python oscal_to_jama_csv.py nerc-oscal.json --shard-by rows --shard-size 500
+    python oscal_to_jama_csv.py nerc-oscal.json --shard-by bytes --shard-size 5M
+"""
+
+import csv
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from oscal_stream import iter_oscal_components
+from oscal_to_jama_csv import _open_nist_catalog, build_jama_row, get_csv_columns
+
+MANIFEST_VERSION = 1
+MANIFEST_SUFFIX = '.shards.json'
+
+SHARD_MODES = ('family', 'rows', 'bytes')
+DEFAULT_SHARD_SIZE = {
+    'rows': 5000,
+    'bytes': 10 * 1024 * 1024,
+}
+DEFAULT_WORKERS = 4
+
+SIZE_SUFFIXES = {'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3}
+UNKNOWN_FAMILY = 'other'
+
+
+def parse_size(value: str) -> int:
+    """
+    Parse a shard size such as '500', '64k' or '10M'.
+
+    Raises:
+        ValueError: If the value is not a positive size
+    """
+    text = str(value).strip().lower().rstrip('b')
+    multiplier = 1
+    if text and text[-1] in SIZE_SUFFIXES:
+        multiplier = SIZE_SUFFIXES[text[-1]]
+        text = text[:-1]
+    try:
+        size = int(float(text) * multiplier)
+    except ValueError:
+        raise ValueError(f"Invalid shard size: {value!r}") from None
+    if size <= 0:
+        raise ValueError(f"Shard size must be positive: {value!r}")
+    return size
+
+
+def row_family(row: Dict[str, str]) -> str:
+    """
+    CIP standard family of a row (e.g. 'CIP-005-R1' -> 'cip-005').
+
+    Falls back to NERC-Requirement-ID, then to 'other'.
+    """
+    for column in ('JAMA-Requirement-ID', 'NERC-Requirement-ID'):
+        parts = row.get(column, '').strip().split('-')
+        if len(parts) >= 2 and parts[0] and parts[1]:
+            return f"{parts[0]}-{parts[1].split()[0]}".lower()
+    return UNKNOWN_FAMILY
+
+
+def default_manifest_path(output_csv: Path) -> Path:
+    """Manifest path for a sharded export (e.g. matrix.csv -> matrix.shards.json)."""
+    output_csv = Path(output_csv)
+    return output_csv.with_name(output_csv.stem + MANIFEST_SUFFIX)
+
+
+def _encode_line(values: List[str]) -> str:
+    """Encode one CSV record exactly as csv.DictWriter would."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+
+def _iter_shards(rows: Iterator[Dict[str, str]], fieldnames: List[str], shard_by: str,
+                 shard_size: int, header_bytes: int) -> Iterator[Tuple[Optional[str], List[str]]]:
+    """Group encoded rows into shards; yields (family or None, encoded lines)."""
+    lines: List[str] = []
+    key = None
+    size = header_bytes
+
+    for row in rows:
+        line = _encode_line([row.get(name, '') for name in fieldnames])
+
+        if shard_by == 'family':
+            family = row_family(row)
+            if lines and family != key:
+                yield key, lines
+                lines = []
+            key = family
+        elif shard_by == 'rows':
+            if len(lines) >= shard_size:
+                yield None, lines
+                lines = []
+        else:
+            line_bytes = len(line.encode('utf-8'))
+            # An oversized row still gets a shard of its own
+            if lines and size + line_bytes > shard_size:
+                yield None, lines
+                lines = []
+                size = header_bytes
+            size += line_bytes
+
+        lines.append(line)
+
+    if lines:
+        yield key, lines
+
+
+def _write_shard(path: Path, header: str, lines: List[str]) -> Tuple[int, str]:
+    """Write one shard atomically; returns (bytes, sha256)."""
+    data = (header + ''.join(lines)).encode('utf-8')
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return len(data), hashlib.sha256(data).hexdigest()
+
+
+def _remove_stale_shards(manifest_file: Path, current: List[str]):
+    """Delete shards listed by a previous manifest that this run did not write."""
+    if not manifest_file.exists():
+        return
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return
+    for shard in previous.get('shards', []):
+        name = shard.get('file', '')
+        # Only plain file names next to the manifest are ever ours
+        if name and name not in current and Path(name).name == name:
+            (manifest_file.parent / name).unlink(missing_ok=True)
+
+
+def shard_oscal_to_jama_csv(oscal_file: Path, output_csv: Optional[Path] = None,
+                            shard_by: str = 'rows', shard_size: Optional[int] = None,
+                            format_type: str = 'standard',
+                            nist_catalog_file: Optional[Path] = None,
+                            workers: int = DEFAULT_WORKERS) -> dict:
+    """
+    Export OSCAL to several JAMA CSV shards plus a manifest.
+
+    Shard files are named after output_csv: <stem>-<family>.csv in family
+    mode, <stem>-0001.csv, <stem>-0002.csv, ... otherwise. A family whose
+    rows are not contiguous in the input gets one shard per run of rows.
+
+    Args:
+        oscal_file: Path to input OSCAL JSON file
+        output_csv: Base CSV path (if None, derives from oscal_file)
+        shard_by: 'family', 'rows' or 'bytes'
+        shard_size: Rows or bytes per shard (ignored for family)
+        format_type: CSV format ('standard' or 'detailed')
+        nist_catalog_file: Optional official NIST OSCAL catalog for statement text
+        workers: Shard writer threads
+
+    Returns:
+        Manifest dict (also written to <stem>.shards.json)
+
+    Raises:
+        FileNotFoundError: If the OSCAL file doesn't exist
+        ValueError: If the shard mode/size is invalid or there is nothing to export
+    """
+    if shard_by not in SHARD_MODES:
+        raise ValueError(f"Unknown shard mode: {shard_by} (expected one of: {', '.join(SHARD_MODES)})")
+    if shard_size is None:
+        shard_size = DEFAULT_SHARD_SIZE.get(shard_by, 0)
+    if shard_by != 'family' and shard_size <= 0:
+        raise ValueError(f"Shard size must be positive: {shard_size}")
+
+    oscal_file = Path(oscal_file)
+    output_csv = Path(output_csv) if output_csv is not None else oscal_file.with_suffix('.csv')
+    manifest_file = default_manifest_path(output_csv)
+
+    nist_catalog = _open_nist_catalog(nist_catalog_file)
+    fieldnames = get_csv_columns(format_type, nist_catalog is not None)
+    header = _encode_line(fieldnames)
+    rows = (build_jama_row(component, format_type, nist_catalog)
+            for component in iter_oscal_components(oscal_file))
+
+    shards: List[dict] = []
+    pending: List[Tuple[dict, Future]] = []
+    next_row = 1
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for number, (family, lines) in enumerate(
+                _iter_shards(rows, fieldnames, shard_by, shard_size, len(header.encode('utf-8'))), 1):
+            suffix = family if family is not None else f"{number:04d}"
+            if family is not None and any(s['family'] == family for s in shards):
+                suffix = f"{family}-{number:04d}"
+            path = output_csv.with_name(f"{output_csv.stem}-{suffix}{output_csv.suffix or '.csv'}")
+
+            shard = {
+                'file': path.name,
+                'family': family,
+                'first_row': next_row,
+                'last_row': next_row + len(lines) - 1,
+                'rows': len(lines),
+            }
+            next_row += len(lines)
+            shards.append(shard)
+            pending.append((shard, pool.submit(_write_shard, path, header, lines)))
+
+            # Bound the number of built-but-unwritten shards held in memory
+            while len(pending) > 2 * max(1, workers):
+                done, future = pending.pop(0)
+                done['bytes'], done['sha256'] = future.result()
+
+        for shard, future in pending:
+            shard['bytes'], shard['sha256'] = future.result()
+
+    if not shards:
+        raise ValueError("OSCAL JSON has no requirements/components to export")
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'source': oscal_file.name,
+        'shard_by': shard_by,
+        'shard_size': shard_size if shard_by != 'family' else None,
+        'columns': fieldnames,
+        'total_rows': next_row - 1,
+        'shards': shards,
+    }
+
+    _remove_stale_shards(manifest_file, [s['file'] for s in shards])
+    tmp_file = manifest_file.with_name(manifest_file.name + '.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_file, manifest_file)
+
+    print(f"[OK] Exported {manifest['total_rows']} components to {len(shards)} shard(s); "
+          f"manifest: {manifest_file}")
+    return manifest
+
+
+def verify_shards(manifest_file: Path) -> List[str]:
+    """
+    Check every shard listed in a manifest against its recorded size and hash.
+
+    Args:
+        manifest_file: Path to a <stem>.shards.json manifest
+
+    Returns:
+        List of problems (empty if all shards match)
+    """
+    manifest_file = Path(manifest_file)
+    with open(manifest_file, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    problems = []
+    for shard in manifest.get('shards', []):
+        path = manifest_file.parent / shard['file']
+        if not path.exists():
+            problems.append(f"{shard['file']}: missing")
+            continue
+        data = path.read_bytes()
+        if len(data) != shard['bytes'] or hashlib.sha256(data).hexdigest() != shard['sha256']:
+            problems.append(f"{shard['file']}: content does not match manifest")
+    return problems
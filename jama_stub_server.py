@@ -0,0 +1,260 @@
+"""
+Local stand-in for the JAMA REST API (stdlib only).
+
+Implements the subset of /rest/v1 used by jama_sync.py, backed by an
+in-memory item store, so sync throughput and retry behaviour can be exercised
+without a real JAMA instance:
+- GET    /rest/v1/items?project=<id>&startAt=<n>&maxResults=<n>
+- GET    /rest/v1/items/<id>
+- POST   /rest/v1/items
+- PUT    /rest/v1/items/<id>
+- DELETE /rest/v1/items/<id>
+
+Faults can be injected to test the client: --fail-every N answers every Nth
+write with 503 + Retry-After, --max-rps answers 429 above a request rate, and
+--latency adds per-request server time. Connections are HTTP/1.1 keep-alive.
+
+Usage:
+    python jama_stub_server.py --port 8765
+    python jama_stub_server.py --port 8765 --latency 20 --fail-every 10
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from nerc_profile import add_profile_argument, start_profiling
+
+API_PREFIX = '/rest/v1'
+ITEM_PATH_PATTERN = re.compile(r'^/rest/v1/items/(\d+)$')
+MAX_RESULTS_LIMIT = 50
+
+
+class JamaStubServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the in-memory item store and fault settings."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int] = ('127.0.0.1', 0), latency: float = 0.0,
+                 fail_every: int = 0, max_rps: float = 0.0, verbose: bool = False):
+        """
+        Initialize the stub server.
+
+        Args:
+            address: (host, port) to bind; port 0 picks a free port
+            latency: Seconds of simulated server time per request
+            fail_every: Answer every Nth write with 503 (0 disables)
+            max_rps: Answer 429 when requests in the last second exceed this (0 disables)
+            verbose: Log every request to stderr
+        """
+        super().__init__(address, JamaStubHandler)
+        self.latency = latency
+        self.fail_every = fail_every
+        self.max_rps = max_rps
+        self.verbose = verbose
+
+        self.lock = threading.Lock()
+        self.items = {}
+        self.next_id = 1
+        self.writes = 0
+        self.recent = []
+        self.stats = {'connections': 0, 'requests': 0, 'injected_503': 0, 'injected_429': 0}
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start_background(self) -> threading.Thread:
+        """Serve on a daemon thread (for tests and benchmarks)."""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+    def check_faults(self, is_write: bool) -> Optional[int]:
+        """Return an injected error status for this request, if any."""
+        with self.lock:
+            self.stats['requests'] += 1
+            now = time.monotonic()
+            if self.max_rps:
+                self.recent = [t for t in self.recent if now - t < 1.0]
+                if len(self.recent) >= self.max_rps:
+                    self.stats['injected_429'] += 1
+                    return 429
+                self.recent.append(now)
+            if is_write and self.fail_every:
+                self.writes += 1
+                if self.writes % self.fail_every == 0:
+                    self.stats['injected_503'] += 1
+                    return 503
+        return None
+
+
+class JamaStubHandler(BaseHTTPRequestHandler):
+    """Request handler for the JAMA item endpoints."""
+
+    protocol_version = 'HTTP/1.1'
+    server: JamaStubServer
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.stats['connections'] += 1
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, payload: Optional[dict] = None, headers: Optional[dict] = None):
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if payload is not None:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status: int, message: str, headers: Optional[dict] = None):
+        self._send(status, {'meta': {'status': self.responses.get(status, ('Error',))[0],
+                                     'message': message}}, headers)
+
+    def _read_json(self) -> Optional[dict]:
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return None
+        try:
+            return json.loads(self.rfile.read(length))
+        except json.JSONDecodeError:
+            return None
+
+    def _handle(self, method: str):
+        url = urlsplit(self.path)
+        payload = self._read_json() if method in ('POST', 'PUT') else None
+
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        status = self.server.check_faults(method != 'GET')
+        if status == 429:
+            return self._error(429, 'Rate limit exceeded', {'Retry-After': '1'})
+        if status == 503:
+            return self._error(503, 'Injected failure', {'Retry-After': '0'})
+
+        match = ITEM_PATH_PATTERN.match(url.path)
+        if url.path == f"{API_PREFIX}/items":
+            if method == 'GET':
+                return self._list_items(parse_qs(url.query))
+            if method == 'POST':
+                return self._create_item(payload)
+        elif match:
+            item_id = int(match.group(1))
+            if method == 'GET':
+                return self._get_item(item_id)
+            if method == 'PUT':
+                return self._update_item(item_id, payload)
+            if method == 'DELETE':
+                return self._delete_item(item_id)
+        self._error(404, f"No route for {method} {url.path}")
+
+    def _list_items(self, query: dict):
+        project = query.get('project', [None])[0]
+        start = int(query.get('startAt', ['0'])[0])
+        limit = min(int(query.get('maxResults', ['20'])[0]), MAX_RESULTS_LIMIT)
+        with self.server.lock:
+            items = [item for item in self.server.items.values()
+                     if project is None or str(item['project']) == project]
+        page = items[start:start + limit]
+        self._send(200, {
+            'meta': {'status': 'OK', 'pageInfo': {'startIndex': start, 'resultCount': len(page),
+                                                  'totalResults': len(items)}},
+            'data': page,
+        })
+
+    def _get_item(self, item_id: int):
+        with self.server.lock:
+            item = self.server.items.get(item_id)
+        if item is None:
+            return self._error(404, f"Item {item_id} not found")
+        self._send(200, {'meta': {'status': 'OK'}, 'data': item})
+
+    def _create_item(self, payload: Optional[dict]):
+        if not payload or 'fields' not in payload or 'project' not in payload:
+            return self._error(400, 'Item requires project and fields')
+        with self.server.lock:
+            item_id = self.server.next_id
+            self.server.next_id += 1
+            self.server.items[item_id] = {
+                'id': item_id,
+                'project': payload['project'],
+                'itemType': payload.get('itemType'),
+                'fields': dict(payload['fields']),
+            }
+        self._send(201, {'meta': {'status': 'Created', 'id': item_id,
+                                  'location': f"{self.server.base_url}{API_PREFIX}/items/{item_id}"}})
+
+    def _update_item(self, item_id: int, payload: Optional[dict]):
+        if not payload or 'fields' not in payload:
+            return self._error(400, 'Item requires fields')
+        with self.server.lock:
+            item = self.server.items.get(item_id)
+            if item is not None:
+                item['fields'] = dict(payload['fields'])
+        if item is None:
+            return self._error(404, f"Item {item_id} not found")
+        self._send(200, {'meta': {'status': 'OK'}})
+
+    def _delete_item(self, item_id: int):
+        with self.server.lock:
+            item = self.server.items.pop(item_id, None)
+        if item is None:
+            return self._error(404, f"Item {item_id} not found")
+        self._send(204)
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_PUT(self):
+        self._handle('PUT')
+
+    def do_DELETE(self):
+        self._handle('DELETE')
+
+
+def main():
+    """Command-line interface for the JAMA stub server."""
+    parser = argparse.ArgumentParser(description='Local stand-in for the JAMA REST API')
+    parser.add_argument('--host', default='127.0.0.1', help='Bind address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Port (default: 8765)')
+    parser.add_argument('--latency', type=float, default=0.0, help='Simulated server time per request in ms')
+    parser.add_argument('--fail-every', type=int, default=0, help='Answer every Nth write with 503')
+    parser.add_argument('--max-rps', type=float, default=0.0, help='Answer 429 above this request rate')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Log every request')
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    start_profiling(args.profile)
+
+    server = JamaStubServer((args.host, args.port), args.latency / 1000.0, args.fail_every,
+                            args.max_rps, args.verbose)
+    print(f"[*] JAMA stub server listening on {server.base_url}{API_PREFIX}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"[*] Served {server.stats['requests']} request(s) over "
+              f"{server.stats['connections']} connection(s); {len(server.items)} item(s) stored")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,672 @@
+"""
+Push JAMA traceability rows to a JAMA-compatible REST API.
+
+Replaces the manual CSV import: rows produced by oscal_to_jama_csv (a full
+export, a --delta export with an Operation column, or a --shard-by manifest)
+are upserted as items in a JAMA project, matched on JAMA-Requirement-ID.
+
+The client is asyncio-based and dependency-free:
+- keep-alive HTTP/1.1 connection pool (one connection per concurrent request)
+- configurable concurrency and batch size
+- token-bucket rate limiting
+- retry with exponential backoff and jitter on connection errors, 429 and 5xx,
+  honouring Retry-After; POST (item creation) is not idempotent, so it is only
+  retried when the server cannot have seen it (connection refused) or turned it
+  away (429). Any other failed create is reported, and re-running the sync
+  reconciles it by JAMA-Requirement-ID
+
+Existing items are read once (paged), unchanged items are skipped, and only
+creates/updates/deletes are sent.
+
+JAMA stores custom fields under item-type-specific keys (e.g. 'nerc_id$87'),
+so the CSV column -> item field mapping is configurable per item type with
+--field-map, a JSON (or YAML, with pyyaml) file:
+
+    {
+      "default": {"Title": "name", "Description": "description"},
+      "87": {
+        "JAMA-Requirement-ID": "jama_requirement_id$87",
+        "NERC-Requirement-ID": "nerc_requirement_id$87",
+        "NIST-Primary-Control": "nist_primary$87"
+      }
+    }
+
+The entry for --item-type is layered over "default"; without --field-map the
+built-in ROW_FIELDS names are used (they match jama_stub_server.py). Items are
+matched on the field JAMA-Requirement-ID maps to.
+
+Usage:
+    python jama_stub_server.py --port 8765 &
+    python jama_sync.py nerc-oscal.csv --base-url http://127.0.0.1:8765 --project 1
+    python jama_sync.py weekly-delta.csv --base-url https://jama.example.com --project 42 \\
+        --item-type 87 --field-map jama-fields.json --concurrency 16 --rate 20
+
+Credentials are read from JAMA_TOKEN (bearer) or JAMA_USERNAME/JAMA_PASSWORD (basic).
+"""
+
+import argparse
+import asyncio
+import base64
+import csv
+import json
+import os
+import random
+import ssl
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from nerc_profile import add_profile_argument, start_profiling
+
+API_PREFIX = '/rest/v1'
+PAGE_SIZE = 50  # JAMA's maxResults limit
+
+# CSV column -> JAMA item field, used when no --field-map is given
+ROW_FIELDS = {
+    'Title': 'name',
+    'Description': 'description',
+    'JAMA-Requirement-ID': 'jama_requirement_id',
+    'NERC-Requirement-ID': 'nerc_requirement_id',
+    'NIST-Primary-Control': 'nist_primary_control',
+    'NIST-Secondary-Controls': 'nist_secondary_controls',
+    'Implementation-Status': 'implementation_status',
+}
+KEY_COLUMN = 'JAMA-Requirement-ID'
+DEFAULT_FIELD_MAP_KEY = 'default'
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Methods safe to resend after an ambiguous failure (the server may have applied the first attempt)
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'PUT', 'DELETE'})
+NON_IDEMPOTENT_RETRY_STATUSES = frozenset({429})
+# Non-idempotent requests are not sent on connections idle for longer (servers drop idle keep-alives)
+NON_IDEMPOTENT_MAX_IDLE = 1.0
+MAX_BACKOFF = 30.0
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_RETRIES = 5
+
+
+class JamaAPIError(Exception):
+    """Non-retryable (or retries exhausted) error response from the API."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+
+
+class RequestNotSent(ConnectionError):
+    """The connection failed while the request was being written, so the server cannot have acted on it."""
+
+
+class RateLimiter:
+    """Token bucket allowing `rate` requests per second with bursts up to `burst`."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a request may be sent."""
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class ConnectionPool:
+    """
+    Keep-alive HTTP/1.1 connections to one host.
+
+    At most `size` requests are in flight; idle connections are reused and
+    connections the server closes are replaced transparently. Requests that
+    are unsafe to resend never go out on a connection the server has already
+    closed or that has been idle longer than NON_IDEMPOTENT_MAX_IDLE.
+    """
+
+    def __init__(self, base_url: str, size: int = DEFAULT_CONCURRENCY, timeout: float = 30.0):
+        url = urlsplit(base_url)
+        if url.scheme not in ('http', 'https'):
+            raise ValueError(f"Unsupported URL scheme: {base_url}")
+        self.host = url.hostname or 'localhost'
+        self.port = url.port or (443 if url.scheme == 'https' else 80)
+        self.ssl = ssl.create_default_context() if url.scheme == 'https' else None
+        self.base_path = url.path.rstrip('/')
+        self.timeout = timeout
+        self.opened = 0
+        # (reader, writer, monotonic time the connection became idle)
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter, float]] = []
+        self._slots = asyncio.Semaphore(size)
+
+    async def _open(self):
+        self.opened += 1
+        return await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+
+    async def close(self):
+        """Close all idle connections."""
+        while self._idle:
+            _, writer, _ = self._idle.pop()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    async def request(self, method: str, path: str, body: bytes = b'',
+                      headers: Optional[Dict[str, str]] = None,
+                      retry_stale: bool = True) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Send one request and read the full response.
+
+        Args:
+            retry_stale: Resend once on a new connection if a reused keep-alive
+                connection fails after the request was written (only safe for
+                idempotent requests). Failures while writing are always
+                retried, and without it long-idle connections are not reused.
+
+        Returns:
+            Tuple of (status, lower-cased headers, body)
+
+        Raises:
+            RequestNotSent: If writing the request failed on a new connection
+            OSError, asyncio.TimeoutError, asyncio.IncompleteReadError: On connection failures
+        """
+        async with self._slots:
+            conn = self._checkout(None if retry_stale else NON_IDEMPOTENT_MAX_IDLE)
+            reused = conn is not None
+            conn = conn or await self._open()
+            try:
+                status, response_headers, data, keep_alive = await asyncio.wait_for(
+                    self._exchange(conn, method, path, body, headers or {}), self.timeout)
+            except (ConnectionError, asyncio.IncompleteReadError) as e:
+                conn[1].close()
+                if not reused or not (retry_stale or isinstance(e, RequestNotSent)):
+                    raise
+                # The server closed an idle keep-alive connection; retry once on a new one
+                conn = await self._open()
+                try:
+                    status, response_headers, data, keep_alive = await asyncio.wait_for(
+                        self._exchange(conn, method, path, body, headers or {}), self.timeout)
+                except BaseException:
+                    conn[1].close()
+                    raise
+            except BaseException:
+                conn[1].close()
+                raise
+
+            if keep_alive:
+                self._idle.append((conn[0], conn[1], time.monotonic()))
+            else:
+                conn[1].close()
+            return status, response_headers, data
+
+    def _checkout(self, max_idle: Optional[float]):
+        """Pop a reusable idle connection, closing any the server already closed or idle longer than max_idle."""
+        now = time.monotonic()
+        while self._idle:
+            reader, writer, idle_since = self._idle.pop()
+            if reader.at_eof() or writer.is_closing() or (max_idle is not None and now - idle_since > max_idle):
+                writer.close()
+                continue
+            return reader, writer
+        return None
+
+    async def _exchange(self, conn, method: str, path: str, body: bytes, headers: Dict[str, str]):
+        reader, writer = conn
+        lines = [f"{method} {self.base_path}{path} HTTP/1.1", f"Host: {self.host}:{self.port}",
+                 f"Content-Length: {len(body)}", "Connection: keep-alive"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        try:
+            writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+            await writer.drain()
+        except (ConnectionResetError, BrokenPipeError) as e:
+            # The server never received the whole request, so resending is safe for any method
+            raise RequestNotSent(f"{type(e).__name__} while sending: {e}") from e
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Connection closed before response")
+        version, status = status_line.decode('latin-1').split(' ', 2)[:2]
+
+        response_headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            response_headers[name.strip().lower()] = value.strip()
+
+        keep_alive = (version == 'HTTP/1.1'
+                      and response_headers.get('connection', '').lower() != 'close')
+        if method == 'HEAD' or status in ('204', '304'):
+            data = b''
+        elif response_headers.get('transfer-encoding', '').lower() == 'chunked':
+            data = await self._read_chunked(reader)
+        elif 'content-length' in response_headers:
+            data = await reader.readexactly(int(response_headers['content-length']))
+        else:
+            data = await reader.read()
+            keep_alive = False
+        return int(status), response_headers, data, keep_alive
+
+    @staticmethod
+    async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b';')[0].strip() or b'0', 16)
+            if size == 0:
+                # Trailers end with an empty line
+                while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    pass
+                return b''.join(chunks)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+
+
+class JamaClient:
+    """Async client for the JAMA item endpoints with rate limiting and retries."""
+
+    def __init__(self, base_url: str, project: int, item_type: Optional[int] = None,
+                 token: Optional[str] = None, username: Optional[str] = None,
+                 password: Optional[str] = None, concurrency: int = DEFAULT_CONCURRENCY,
+                 rate: float = 0.0, retries: int = DEFAULT_RETRIES, backoff: float = 0.5,
+                 timeout: float = 30.0, field_map: Optional[Dict[str, str]] = None):
+        """
+        Initialize the client.
+
+        Args:
+            base_url: JAMA base URL (the /rest/v1 prefix is added)
+            project: Project ID items belong to
+            item_type: Item type ID for new items
+            token: Bearer token (takes precedence over username/password)
+            username: Basic-auth user
+            password: Basic-auth password
+            concurrency: Maximum requests in flight (and pooled connections)
+            rate: Maximum requests per second (0 = unlimited)
+            retries: Retries per request on connection errors, 429 and 5xx
+            backoff: Base delay in seconds for exponential backoff
+            timeout: Per-request timeout in seconds
+            field_map: CSV column -> item field (default: ROW_FIELDS); see load_field_map
+        """
+        self.project = project
+        self.item_type = item_type
+        self.field_map = field_map or ROW_FIELDS
+        if KEY_COLUMN not in self.field_map:
+            raise ValueError(f"Field map does not map the {KEY_COLUMN} column")
+        self.key_field = self.field_map[KEY_COLUMN]
+        self.retries = retries
+        self.backoff = backoff
+        self.pool = ConnectionPool(base_url, concurrency, timeout)
+        self.limiter = RateLimiter(rate)
+        self.stats = {'requests': 0, 'retries': 0}
+
+        self.headers = {'Accept': 'application/json', 'Content-Type': 'application/json'}
+        if token:
+            self.headers['Authorization'] = f"Bearer {token}"
+        elif username:
+            credentials = base64.b64encode(f"{username}:{password or ''}".encode('utf-8')).decode('ascii')
+            self.headers['Authorization'] = f"Basic {credentials}"
+
+    async def close(self):
+        await self.pool.close()
+
+    async def call(self, method: str, path: str, payload: Optional[dict] = None) -> dict:
+        """
+        Send a request, retrying transient failures.
+
+        Idempotent methods are retried on connection errors, timeouts, 429 and
+        5xx. Other methods (POST) are retried only on a refused connection, a
+        failure while sending (RequestNotSent) or 429, where the server cannot
+        have applied the request.
+
+        Returns:
+            Decoded JSON response ({} for empty bodies)
+
+        Raises:
+            JamaAPIError: On a non-retryable status or when retries are exhausted
+        """
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        idempotent = method in IDEMPOTENT_METHODS
+        retry_statuses = RETRY_STATUSES if idempotent else NON_IDEMPOTENT_RETRY_STATUSES
+        for attempt in range(self.retries + 1):
+            await self.limiter.acquire()
+            self.stats['requests'] += 1
+            retry_after = None
+            try:
+                status, headers, data = await self.pool.request(method, API_PREFIX + path, body,
+                                                                self.headers, retry_stale=idempotent)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as e:
+                error = JamaAPIError(0, f"{type(e).__name__}: {e}")
+                if not idempotent and not isinstance(e, (ConnectionRefusedError, RequestNotSent)):
+                    raise JamaAPIError(0, f"{type(e).__name__}: {e} ({method} not retried; "
+                                          f"the server may have applied it, re-run the sync to reconcile)")
+            else:
+                if status < 300:
+                    return json.loads(data) if data else {}
+                message = _error_message(data)
+                if status not in retry_statuses:
+                    raise JamaAPIError(status, message)
+                error = JamaAPIError(status, message)
+                retry_after = _parse_retry_after(headers.get('retry-after'))
+
+            if attempt == self.retries:
+                raise error
+            self.stats['retries'] += 1
+            if retry_after is None:
+                retry_after = min(MAX_BACKOFF, self.backoff * 2 ** attempt) * (0.5 + random.random() / 2)
+            await asyncio.sleep(retry_after)
+
+    async def fetch_items(self) -> Dict[str, dict]:
+        """
+        Read all items in the project, keyed by JAMA-Requirement-ID.
+
+        The first page reports the total; remaining pages are fetched
+        concurrently. With an item type set, items of other types are ignored.
+        """
+        def page_path(start):
+            query = urlencode({'project': self.project, 'startAt': start, 'maxResults': PAGE_SIZE})
+            return f"/items?{query}"
+
+        first = await self.call('GET', page_path(0))
+        total = first.get('meta', {}).get('pageInfo', {}).get('totalResults', 0)
+        pages = [first] + await asyncio.gather(*(self.call('GET', page_path(start))
+                                                  for start in range(PAGE_SIZE, total, PAGE_SIZE)))
+
+        items = {}
+        for page in pages:
+            for item in page.get('data', []):
+                if self.item_type is not None and item.get('itemType') not in (None, self.item_type):
+                    continue
+                key = (item.get('fields') or {}).get(self.key_field)
+                if key:
+                    items[key] = item
+        return items
+
+    async def create_item(self, fields: dict) -> int:
+        payload = {'project': self.project, 'fields': fields}
+        if self.item_type is not None:
+            payload['itemType'] = self.item_type
+        response = await self.call('POST', '/items', payload)
+        return response.get('meta', {}).get('id')
+
+    async def update_item(self, item_id: int, fields: dict):
+        await self.call('PUT', f"/items/{item_id}", {'fields': fields})
+
+    async def delete_item(self, item_id: int):
+        await self.call('DELETE', f"/items/{item_id}")
+
+
+def _error_message(data: bytes) -> str:
+    try:
+        return json.loads(data).get('meta', {}).get('message', '') or data.decode('utf-8', 'replace')
+    except (ValueError, AttributeError):
+        return data.decode('utf-8', 'replace')[:200]
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    try:
+        return min(MAX_BACKOFF, max(0.0, float(value))) if value is not None else None
+    except ValueError:
+        return None
+
+
+def row_to_fields(row: Dict[str, str], field_map: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Map a JAMA CSV row to item fields (default mapping: ROW_FIELDS)."""
+    return {field: row.get(column, '') for column, field in (field_map or ROW_FIELDS).items()}
+
+
+def load_field_map(path: Path, item_type: Optional[int] = None) -> Dict[str, str]:
+    """
+    Load the CSV column -> item field mapping for one item type.
+
+    The file maps "default" and/or item type IDs to {column: field} objects;
+    the item type's entry is layered over "default".
+
+    Args:
+        path: Field map file (JSON, or YAML when pyyaml is installed)
+        item_type: Item type ID the rows are synced as
+
+    Returns:
+        CSV column -> item field
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ValueError: If the file is invalid or does not map the key column for the item type
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Field map not found: {path}")
+
+    text = path.read_text(encoding='utf-8')
+    if path.suffix.lower() in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError(f"pyyaml is required to read {path}; use a .json field map instead") from None
+        config = yaml.safe_load(text)
+    else:
+        try:
+            config = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in field map {path}: {e}") from None
+
+    if not isinstance(config, dict):
+        raise ValueError(f"Field map {path} must be an object keyed by item type ID or '{DEFAULT_FIELD_MAP_KEY}'")
+
+    field_map: Dict[str, str] = {}
+    keys = [DEFAULT_FIELD_MAP_KEY] + ([str(item_type)] if item_type is not None else [])
+    for key in keys:
+        entry = config.get(key)
+        if entry is None:
+            continue
+        if not isinstance(entry, dict) or not all(isinstance(field, str) and field for field in entry.values()):
+            raise ValueError(f"Field map {path}: '{key}' must map CSV columns to field names")
+        field_map.update(entry)
+
+    if KEY_COLUMN not in field_map:
+        target = f"item type {item_type}" if item_type is not None else f"'{DEFAULT_FIELD_MAP_KEY}'"
+        raise ValueError(f"Field map {path} does not map the {KEY_COLUMN} column for {target}")
+    return field_map
+
+
+def read_sync_rows(path: Path) -> List[Dict[str, str]]:
+    """
+    Read rows from a JAMA CSV, a delta CSV or a shard manifest (*.shards.json).
+
+    Raises:
+        FileNotFoundError: If the file (or a listed shard) doesn't exist
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Sync input not found: {path}")
+
+    if path.name.endswith('.shards.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            files = [path.parent / shard['file'] for shard in json.load(f).get('shards', [])]
+    else:
+        files = [path]
+
+    rows = []
+    for csv_file in files:
+        with open(csv_file, 'r', newline='', encoding='utf-8') as f:
+            rows.extend(csv.DictReader(f))
+    return rows
+
+
+def _batches(rows: List[dict], size: int) -> Iterable[List[dict]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+async def sync_rows(client: JamaClient, rows: List[Dict[str, str]],
+                    batch_size: int = DEFAULT_BATCH_SIZE, progress: bool = False) -> dict:
+    """
+    Upsert rows into the project and apply DELETE operations.
+
+    Rows are processed in batches; within a batch requests run concurrently,
+    bounded by the client's connection pool.
+
+    Args:
+        client: Open JamaClient
+        rows: CSV rows (an Operation column of DELETE removes the item)
+        batch_size: Rows scheduled at a time
+        progress: Print a line after each batch
+
+    Returns:
+        Summary with created, updated, deleted, unchanged, failed and errors
+    """
+    existing = await client.fetch_items()
+    summary = {'created': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0, 'failed': 0, 'errors': []}
+
+    async def apply(row):
+        key = row.get('JAMA-Requirement-ID', '').strip()
+        if not key:
+            raise ValueError("Row has no JAMA-Requirement-ID")
+        item = existing.get(key)
+
+        if row.get('Operation', '').upper() == 'DELETE':
+            if item is None:
+                return 'unchanged'
+            await client.delete_item(item['id'])
+            return 'deleted'
+
+        fields = row_to_fields(row, client.field_map)
+        if item is None:
+            await client.create_item(fields)
+            return 'created'
+        # Real items carry more fields than the mapped ones; compare and replace only those
+        current = item.get('fields') or {}
+        if all(current.get(field) == value for field, value in fields.items()):
+            return 'unchanged'
+        await client.update_item(item['id'], {**current, **fields})
+        return 'updated'
+
+    done = 0
+    for batch in _batches(rows, max(1, batch_size)):
+        results = await asyncio.gather(*(apply(row) for row in batch), return_exceptions=True)
+        for row, result in zip(batch, results):
+            if isinstance(result, Exception):
+                summary['failed'] += 1
+                summary['errors'].append(f"{row.get('JAMA-Requirement-ID', '?')}: {result}")
+            else:
+                summary[result] += 1
+        done += len(batch)
+        if progress:
+            print(f"   [*] {done}/{len(rows)} rows synced")
+
+    return summary
+
+
+def sync_file(input_file: Path, base_url: str, project: int, item_type: Optional[int] = None,
+              token: Optional[str] = None, username: Optional[str] = None,
+              password: Optional[str] = None, concurrency: int = DEFAULT_CONCURRENCY,
+              batch_size: int = DEFAULT_BATCH_SIZE, rate: float = 0.0,
+              retries: int = DEFAULT_RETRIES, backoff: float = 0.5, timeout: float = 30.0,
+              progress: bool = False, field_map: Optional[Dict[str, str]] = None) -> dict:
+    """
+    Synchronize a JAMA CSV (or shard manifest) with a JAMA project.
+
+    field_map (CSV column -> item field, see load_field_map) defaults to ROW_FIELDS.
+
+    Returns:
+        sync_rows summary plus requests, retries, connections and elapsed seconds
+    """
+    rows = read_sync_rows(input_file)
+
+    async def run():
+        client = JamaClient(base_url, project, item_type, token, username, password,
+                            concurrency, rate, retries, backoff, timeout, field_map)
+        try:
+            summary = await sync_rows(client, rows, batch_size, progress)
+        finally:
+            await client.close()
+        summary.update(client.stats)
+        summary['connections'] = client.pool.opened
+        return summary
+
+    started = time.perf_counter()
+    summary = asyncio.run(run())
+    summary['rows'] = len(rows)
+    summary['elapsed'] = time.perf_counter() - started
+    return summary
+
+
+def main():
+    """Command-line interface for JAMA REST sync."""
+    parser = argparse.ArgumentParser(
+        description='Push JAMA CSV rows to a JAMA-compatible REST API',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s nerc-oscal.csv --base-url http://127.0.0.1:8765 --project 1
+  %(prog)s weekly-delta.csv --base-url https://jama.example.com --project 42 --item-type 87 --field-map jama-fields.json
+  %(prog)s nerc-oscal.shards.json --base-url https://jama.example.com --project 42 --rate 20
+
+Credentials: JAMA_TOKEN, or JAMA_USERNAME and JAMA_PASSWORD
+        """
+    )
+    parser.add_argument('input', type=Path, help='JAMA CSV, delta CSV or *.shards.json manifest')
+    parser.add_argument('--base-url', required=True, help='JAMA base URL (e.g. https://jama.example.com)')
+    parser.add_argument('--project', type=int, required=True, help='JAMA project ID')
+    parser.add_argument('--item-type', type=int, default=None, help='Item type ID for new items')
+    parser.add_argument('--field-map', type=Path, default=None,
+                        help='JSON/YAML file mapping CSV columns to item fields per item type '
+                             '(default: built-in field names)')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'Requests in flight / pooled connections (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f'Rows scheduled per batch (default: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--rate', type=float, default=0.0, help='Maximum requests per second (default: unlimited)')
+    parser.add_argument('--retries', type=int, default=DEFAULT_RETRIES,
+                        help=f'Retries per request on transient errors (default: {DEFAULT_RETRIES})')
+    parser.add_argument('--backoff', type=float, default=0.5,
+                        help='Base delay in seconds for exponential backoff (default: 0.5)')
+    parser.add_argument('--timeout', type=float, default=30.0, help='Per-request timeout in seconds')
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    start_profiling(args.profile)
+
+    try:
+        field_map = load_field_map(args.field_map, args.item_type) if args.field_map else None
+        summary = sync_file(
+            args.input, args.base_url, args.project, args.item_type,
+            token=os.environ.get('JAMA_TOKEN'),
+            username=os.environ.get('JAMA_USERNAME'),
+            password=os.environ.get('JAMA_PASSWORD'),
+            concurrency=args.concurrency, batch_size=args.batch_size, rate=args.rate,
+            retries=args.retries, backoff=args.backoff, timeout=args.timeout, progress=True,
+            field_map=field_map,
+        )
+    except FileNotFoundError as e:
+        print(f"[ERR] Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except (JamaAPIError, ValueError) as e:
+        print(f"[ERR] Sync error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    rate = summary['rows'] / summary['elapsed'] if summary['elapsed'] else 0.0
+    print(f"[OK] {summary['rows']} rows in {summary['elapsed']:.2f}s ({rate:.0f} rows/s): "
+          f"{summary['created']} created, {summary['updated']} updated, {summary['deleted']} deleted, "
+          f"{summary['unchanged']} unchanged, {summary['failed']} failed")
+    print(f"[*] {summary['requests']} request(s), {summary['retries']} retr(y/ies), "
+          f"{summary['connections']} connection(s)")
+    for error in summary['errors'][:20]:
+        print(f"   [ERR] {error}")
+    if summary['failed']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
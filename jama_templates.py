@@ -0,0 +1,404 @@
+"""
+Declarative column-mapping templates for custom JAMA export layouts.
+
+A template is a JSON (or YAML, with pyyaml) file listing output columns and
+where each value comes from:
+
+    {
+      "name": "audit",
+      "columns": [
+        {"column": "Req ID",   "prop": "JAMA-Requirement-ID"},
+        {"column": "Control",  "prop": "NIST-800-53-Primary-Control", "transform": "control_id"},
+        {"column": "Status",   "prop": "Implementation-Status", "default": "Draft"},
+        {"column": "Title",    "field": "title"},
+        {"column": "Standard", "field": "group_id", "transform": "upper"},
+        {"column": "Source",   "value": "NERC CIP"}
+      ]
+    }
+
+Sources: "prop" (component property by name), "field" (component key, or a
+dotted path such as "metadata.owner"), or "value" (constant). "default" is
+used when the prop/field is absent; transforms are listed in TRANSFORMS.
+
+compile_template turns a template into one specialized Python function: the
+source is generated once with every column, prop name and transform inlined as
+a constant, so building a row does no per-row interpretation of the template.
+The built-in 'standard' and 'detailed' templates reproduce
+oscal_to_jama_csv.build_jama_row exactly.
+
+Usage:
+    python oscal_to_jama_csv.py nerc-oscal.json --template audit-layout.json
+    python jama_templates.py bench --rows 100000
+"""
+
+import argparse
+import ast
+import json
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from nerc_profile import add_profile_argument, start_profiling
+from oscal_stream import iter_oscal_components
+from oscal_to_jama_csv import STATEMENT_COLUMN, write_jama_rows
+
+TEMPLATE_SOURCES = ('prop', 'field', 'value')
+
+
+def _join(value) -> str:
+    return ', '.join(str(v) for v in value) if isinstance(value, (list, tuple)) else str(value)
+
+
+# Transform name -> inline expression ('{}' is the input expression). Inlining
+# keeps the compiled builder free of per-value function calls.
+TRANSFORMS = {
+    'str': "('' if (_v := {}) is None else str(_v))",
+    'strip': "str({}).strip()",
+    'upper': "str({}).upper()",
+    'lower': "str({}).lower()",
+    # Same result as oscal_to_jama_csv.normalize_control_id
+    'control_id': "(_v.strip().upper() if (_v := {}) else '')",
+    'count': "str(len({} or ()))",
+    'join': "_join({})",
+}
+# Needs a NIST catalog at compile time (value is a control ID)
+CATALOG_TRANSFORM = 'nist_statement'
+
+_STANDARD_COLUMNS = [
+    {'column': 'JAMA-Requirement-ID', 'prop': 'JAMA-Requirement-ID'},
+    {'column': 'NERC-Requirement-ID', 'prop': 'NERC-Requirement-ID'},
+    {'column': 'NIST-Primary-Control', 'prop': 'NIST-800-53-Primary-Control', 'transform': 'control_id'},
+    {'column': 'NIST-Secondary-Controls', 'prop': 'NIST-800-53-Secondary-Controls'},
+    {'column': 'Title', 'field': 'title'},
+    {'column': 'Description', 'field': 'description'},
+    {'column': 'Implementation-Status', 'prop': 'Implementation-Status', 'default': 'Draft'},
+]
+
+BUILTIN_TEMPLATES = {
+    'standard': {'name': 'standard', 'columns': _STANDARD_COLUMNS},
+    'detailed': {'name': 'detailed', 'columns': _STANDARD_COLUMNS + [
+        {'column': 'Component-UUID', 'field': 'uuid'},
+        {'column': 'Component-Type', 'field': 'type', 'default': 'software'},
+        {'column': 'Control-Count', 'field': 'control-implementations', 'transform': 'count', 'default': []},
+    ]},
+}
+
+STATEMENT_TEMPLATE_COLUMN = {'column': STATEMENT_COLUMN, 'prop': 'NIST-800-53-Primary-Control',
+                             'transform': ['control_id', CATALOG_TRANSFORM]}
+
+
+def load_template(path: Path) -> dict:
+    """
+    Load a template file (JSON, or YAML when pyyaml is installed).
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ValueError: If the file is not a valid template
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Template not found: {path}")
+
+    text = path.read_text(encoding='utf-8')
+    if path.suffix.lower() in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError(f"pyyaml is required to read {path}; use a .json template instead") from None
+        template = yaml.safe_load(text)
+    else:
+        try:
+            template = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in template {path}: {e}") from None
+
+    validate_template(template)
+    template.setdefault('name', path.stem)
+    return template
+
+
+def validate_template(template: dict):
+    """
+    Check a template's structure.
+
+    Raises:
+        ValueError: Describing the first problem found
+    """
+    if not isinstance(template, dict) or not isinstance(template.get('columns'), list) \
+            or not template['columns']:
+        raise ValueError("Template must be an object with a non-empty 'columns' list")
+
+    seen = set()
+    for position, spec in enumerate(template['columns'], 1):
+        if not isinstance(spec, dict) or not isinstance(spec.get('column'), str) or not spec['column']:
+            raise ValueError(f"Template column {position} needs a 'column' name")
+        name = spec['column']
+        if name in seen:
+            raise ValueError(f"Duplicate template column: {name}")
+        seen.add(name)
+
+        sources = [source for source in TEMPLATE_SOURCES if source in spec]
+        if len(sources) != 1:
+            raise ValueError(f"Template column '{name}' needs exactly one of: {', '.join(TEMPLATE_SOURCES)}")
+
+        for transform in _transform_names(spec):
+            if transform not in TRANSFORMS and transform != CATALOG_TRANSFORM:
+                raise ValueError(f"Template column '{name}' uses unknown transform '{transform}' "
+                                 f"(available: {', '.join(sorted(TRANSFORMS) + [CATALOG_TRANSFORM])})")
+
+
+def _transform_names(spec: dict) -> List[str]:
+    transform = spec.get('transform') or []
+    return [transform] if isinstance(transform, str) else list(transform)
+
+
+def template_columns(template: dict) -> List[str]:
+    """Output column names in order."""
+    return [spec['column'] for spec in template['columns']]
+
+
+def _get_path(component: dict, path: tuple, default):
+    """Follow a dotted field path through nested dicts/lists."""
+    value = component
+    for key in path:
+        if isinstance(value, dict):
+            if key not in value:
+                return default
+            value = value[key]
+        elif isinstance(value, list) and key.isdigit() and int(key) < len(value):
+            value = value[int(key)]
+        else:
+            return default
+    return value
+
+
+def compile_template(template: dict, nist_catalog=None) -> Callable[[dict], Dict[str, str]]:
+    """
+    Compile a template into a specialized row-builder function.
+
+    Args:
+        template: Template dict (see module docstring)
+        nist_catalog: Opened nist_catalog.NISTCatalog, required if any column
+            uses the nist_statement transform
+
+    Returns:
+        Function mapping one OSCAL component to a CSV row dict
+
+    Raises:
+        ValueError: If the template is invalid or needs a NIST catalog that wasn't given
+    """
+    validate_template(template)
+
+    namespace = {'_get_path': _get_path, '_join': _join}
+    constants = {}
+
+    def constant(value) -> str:
+        """Inline a literal, or bind any other value into the function's namespace."""
+        text = repr(value)
+        try:
+            if ast.literal_eval(text) == value:
+                return text
+        except (ValueError, SyntaxError):
+            pass
+        name = f"_c{len(constants)}"
+        constants[name] = value
+        return name
+
+    props_needed = set()
+    expressions = []
+    for spec in template['columns']:
+        default = constant(spec.get('default', ''))
+        if 'value' in spec:
+            expression = constant(spec['value'])
+        elif 'prop' in spec:
+            props_needed.add(spec['prop'])
+            expression = f"props.get({constant(spec['prop'])}, {default})"
+        else:
+            path = tuple(spec['field'].split('.'))
+            if len(path) == 1:
+                expression = f"get({constant(path[0])}, {default})"
+            else:
+                expression = f"_get_path(component, {constant(path)}, {default})"
+
+        for transform in _transform_names(spec):
+            if transform == CATALOG_TRANSFORM:
+                if nist_catalog is None:
+                    raise ValueError(f"Template column '{spec['column']}' needs a NIST catalog "
+                                     "(pass --nist-catalog)")
+                statement = constant(nist_catalog.get_statement)
+                expression = f"({statement}(_v) if (_v := {expression}) else '')"
+            else:
+                expression = TRANSFORMS[transform].format(expression)
+
+        expressions.append(f"        {constant(spec['column'])}: {expression},")
+
+    lines = ["def build_row(component):", "    get = component.get"]
+    if props_needed:
+        # Same semantics as extract_component_properties (last occurrence wins),
+        # but only the props the template reads are collected
+        lines += [
+            "    props = {}",
+            "    for prop in get('properties', []):",
+            "        if isinstance(prop, dict):",
+            "            name = prop.get('name', '')",
+            f"            if name in {constant(frozenset(props_needed))}:",
+            "                props[name] = prop.get('value', '')",
+        ]
+    lines += ["    return {", *expressions, "    }"]
+    source = '\n'.join(lines)
+
+    namespace.update(constants)
+    exec(compile(source, f"<jama template {template.get('name', '')}>", 'exec'), namespace)
+    build_row = namespace['build_row']
+    build_row.__doc__ = f"Build a JAMA row for template '{template.get('name', '')}'.\n\n{source}"
+    return build_row
+
+
+def get_template(name_or_path, with_statement: bool = False) -> dict:
+    """
+    Resolve a built-in template name ('standard', 'detailed') or a template file.
+
+    Args:
+        name_or_path: Built-in name or path to a template file
+        with_statement: Append the NIST statement column (as --nist-catalog does)
+    """
+    if str(name_or_path) in BUILTIN_TEMPLATES:
+        template = dict(BUILTIN_TEMPLATES[str(name_or_path)])
+    else:
+        template = load_template(Path(name_or_path))
+    if with_statement and STATEMENT_COLUMN not in template_columns(template):
+        template = dict(template, columns=template['columns'] + [STATEMENT_TEMPLATE_COLUMN])
+    return template
+
+
+def template_oscal_to_jama_csv(oscal_file: Path, output_csv: Optional[Path], template,
+                               nist_catalog_file: Optional[Path] = None) -> int:
+    """
+    Export OSCAL to CSV using a column-mapping template.
+
+    Components are streamed from the OSCAL file and rows are built by the
+    compiled template.
+
+    Args:
+        oscal_file: Path to input OSCAL JSON file
+        output_csv: Path to output CSV file (if None, derives from oscal_file)
+        template: Template dict, built-in name or template file path
+        nist_catalog_file: NIST OSCAL catalog for nist_statement columns
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        ValueError: If the template is invalid or there is nothing to export
+    """
+    if output_csv is None:
+        output_csv = Path(oscal_file).with_suffix('.csv')
+    if not isinstance(template, dict):
+        template = get_template(template)
+
+    nist_catalog = None
+    if nist_catalog_file is not None:
+        from nist_catalog import get_catalog
+        nist_catalog = get_catalog(nist_catalog_file)
+
+    build_row = compile_template(template, nist_catalog)
+    rows = (build_row(component) for component in iter_oscal_components(oscal_file))
+    count = write_jama_rows(rows, output_csv, template_columns(template))
+
+    if count == 0:
+        Path(output_csv).unlink()
+        raise ValueError("OSCAL JSON has no requirements/components to export")
+
+    print(f"[OK] Successfully exported {count} components to {output_csv} "
+          f"(template: {template.get('name', 'custom')})")
+    return count
+
+
+def _bench_components(count: int) -> List[dict]:
+    """Synthetic components shaped like converted catalog controls."""
+    return [
+        {
+            'id': f"cip-{i % 15:03d}-1-r{i % 7}",
+            'title': f"CIP-{i % 15:03d}-1 R{i % 7}",
+            'uuid': str(uuid.uuid4()),
+            'description': 'Each Responsible Entity shall implement one or more documented processes.',
+            'properties': [
+                {'name': 'label', 'value': f"R{i % 7}"},
+                {'name': 'status', 'value': 'active'},
+                {'name': 'NIST-800-53-Primary-Control', 'value': 'sc-7'},
+                {'name': 'NIST-800-53-Secondary-Controls', 'value': 'CA-3, AC-17, SC-8'},
+                {'name': 'NERC-Requirement-ID', 'value': f"CIP-{i % 15:03d}-1 R{i % 7}"},
+                {'name': 'JAMA-Requirement-ID', 'value': f"CIP-{i % 15:03d}-R{i % 7}"},
+            ],
+            'group_id': f"cip-{i % 15:03d}-1",
+        }
+        for i in range(count)
+    ]
+
+
+def benchmark(rows: int = 100_000, repeat: int = 5) -> Dict[str, Dict[str, float]]:
+    """
+    Compare per-row cost of build_jama_row and the compiled built-in templates.
+
+    Returns:
+        {format: {'hand_written': microseconds/row, 'compiled': microseconds/row}}
+    """
+    from oscal_to_jama_csv import build_jama_row
+
+    components = _bench_components(rows)
+    results = {}
+    for format_type in BUILTIN_TEMPLATES:
+        compiled = compile_template(BUILTIN_TEMPLATES[format_type])
+        assert compiled(components[0]) == build_jama_row(components[0], format_type)
+
+        builders = {'hand_written': lambda c, f=format_type: build_jama_row(c, f), 'compiled': compiled}
+        best = dict.fromkeys(builders, float('inf'))
+        # Interleave runs so machine noise affects both builders alike
+        for _ in range(repeat):
+            for label, build in builders.items():
+                started = time.perf_counter()
+                for component in components:
+                    build(component)
+                best[label] = min(best[label], time.perf_counter() - started)
+        results[format_type] = {label: seconds / rows * 1e6 for label, seconds in best.items()}
+    return results
+
+
+def main():
+    """Command-line interface: benchmark and template inspection."""
+    parser = argparse.ArgumentParser(description='JAMA export column-mapping templates')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    bench_parser = subparsers.add_parser('bench', help='Compare compiled templates with build_jama_row')
+    bench_parser.add_argument('--rows', type=int, default=100_000, help='Synthetic rows (default: 100000)')
+    bench_parser.add_argument('--repeat', type=int, default=5, help='Runs per builder; best is reported')
+
+    show_parser = subparsers.add_parser('show', help='Print the generated row builder for a template')
+    show_parser.add_argument('template', help="Template file or built-in name ('standard', 'detailed')")
+
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    start_profiling(args.profile)
+
+    try:
+        if args.command == 'bench':
+            print(f"[*] Building {args.rows} rows per run, best of {args.repeat}")
+            for format_type, timings in benchmark(args.rows, args.repeat).items():
+                speedup = timings['hand_written'] / timings['compiled']
+                print(f"   {format_type:<9} build_jama_row {timings['hand_written']:.2f} us/row   "
+                      f"compiled {timings['compiled']:.2f} us/row   ({speedup:.2f}x)")
+        else:
+            template = get_template(args.template)
+            print(compile_template(template).__doc__)
+    except FileNotFoundError as e:
+        print(f"[ERR] Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"[ERR] Validation error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,278 @@
+"""
+Suggest NIST SP 800-53 controls for unmapped NERC CIP requirements.
+
+When generate_oscal_catalog reports "[!] GAP: ... has no NIST mapping", this
+tool proposes candidate controls. Every NERC requirement (all versions found in
+the combined text) and every NIST control (title, plus statement text when an
+official OSCAL catalog is available) is vectorized into one sparse TF-IDF
+matrix; all requirement-to-control similarities are then computed with a
+single sparse matrix product and the top-k controls are kept per requirement.
+
+Usage:
+    python mapping_suggest.py
+    python mapping_suggest.py --all --top 3
+    python mapping_suggest.py --nist-catalog NIST_SP-800-53_rev5_catalog.json --output suggestions.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from nerc_profile import add_profile_argument, start_profiling
+from nerc_search import tokenize
+
+INPUT_FILE = "nerc_all_combined.txt"
+
+# Rows of the similarity matrix scored per block (bounds dense memory use)
+SIMILARITY_BLOCK_ROWS = 1024
+
+
+def build_tfidf_matrix(texts: List[str], vocabulary: Optional[Dict[str, int]] = None
+                       ) -> Tuple[sparse.csr_matrix, Dict[str, int]]:
+    """
+    Vectorize texts into an L2-normalized sparse TF-IDF matrix.
+
+    Term frequencies are sublinear (1 + log tf) and IDF is smoothed
+    (log((1 + n) / (1 + df)) + 1), computed over the texts given here.
+
+    Args:
+        texts: Documents to vectorize (one row each)
+        vocabulary: Term -> column mapping to extend (default: new vocabulary)
+
+    Returns:
+        Tuple of (CSR matrix of shape (len(texts), len(vocabulary)), vocabulary)
+    """
+    vocabulary = {} if vocabulary is None else vocabulary
+    indptr = [0]
+    indices: List[int] = []
+    counts: List[int] = []
+
+    for text in texts:
+        row: Dict[int, int] = {}
+        for term in tokenize(text):
+            column = vocabulary.setdefault(term, len(vocabulary))
+            row[column] = row.get(column, 0) + 1
+        indices.extend(row.keys())
+        counts.extend(row.values())
+        indptr.append(len(indices))
+
+    matrix = sparse.csr_matrix(
+        (np.asarray(counts, dtype=np.float64), np.asarray(indices, dtype=np.int32), np.asarray(indptr)),
+        shape=(len(texts), len(vocabulary))
+    )
+    matrix.sum_duplicates()
+
+    matrix.data = 1.0 + np.log(matrix.data)
+    document_frequency = np.bincount(matrix.indices, minlength=matrix.shape[1])
+    idf = np.log((1.0 + matrix.shape[0]) / (1.0 + document_frequency)) + 1.0
+    matrix = matrix.multiply(idf).tocsr()
+
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.diags(1.0 / norms).dot(matrix).tocsr(), vocabulary
+
+
+def top_k_similarities(queries: sparse.csr_matrix, candidates: sparse.csr_matrix,
+                       top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the top-k most similar candidate rows for every query row.
+
+    Similarities are cosine scores from one sparse product per block of
+    SIMILARITY_BLOCK_ROWS query rows.
+
+    Args:
+        queries: L2-normalized query matrix (n_queries x n_terms)
+        candidates: L2-normalized candidate matrix (n_candidates x n_terms)
+        top_k: Number of candidates to keep per query
+
+    Returns:
+        Tuple of (indices, scores), each of shape (n_queries, k), best first
+    """
+    top_k = min(top_k, candidates.shape[0])
+    candidates_t = candidates.T.tocsc()
+    all_indices = []
+    all_scores = []
+
+    for start in range(0, queries.shape[0], SIMILARITY_BLOCK_ROWS):
+        block = queries[start:start + SIMILARITY_BLOCK_ROWS].dot(candidates_t).toarray()
+        if top_k < block.shape[1]:
+            part = np.argpartition(-block, top_k - 1, axis=1)[:, :top_k]
+        else:
+            part = np.tile(np.arange(block.shape[1]), (block.shape[0], 1))
+        part_scores = np.take_along_axis(block, part, axis=1)
+        order = np.argsort(-part_scores, axis=1, kind='stable')
+        all_indices.append(np.take_along_axis(part, order, axis=1))
+        all_scores.append(np.take_along_axis(part_scores, order, axis=1))
+
+    if not all_indices:
+        return np.empty((0, top_k), dtype=np.int64), np.empty((0, top_k))
+    return np.vstack(all_indices), np.vstack(all_scores)
+
+
+def requirement_documents(standards: List[dict]) -> List[dict]:
+    """
+    Flatten parsed standards into requirement documents.
+
+    Args:
+        standards: Standards from generate_oscal.parse_all_standard_versions
+            (or the values of parse_nerc_standards)
+
+    Returns:
+        Documents with keys requirement_key (NERC_NIST_MAP format, e.g.
+        'CIP-005-8:R1') and text
+    """
+    return [
+        {'requirement_key': f"{std['id'].upper()}:{req['id']}", 'text': req['text']}
+        for std in standards
+        for req in std['requirements']
+    ]
+
+
+def control_documents(controls: Optional[Dict[str, str]] = None,
+                      nist_catalog_file: Optional[Path] = None) -> List[dict]:
+    """
+    Build NIST control documents from titles and, when available, statements.
+
+    Args:
+        controls: Control ID -> title (default: NIST_SP_800_53_R5_CONTROLS)
+        nist_catalog_file: Official OSCAL catalog used to add statement text
+
+    Returns:
+        Documents with keys control, title and text
+    """
+    if controls is None:
+        from nist_controls import NIST_SP_800_53_R5_CONTROLS
+        controls = NIST_SP_800_53_R5_CONTROLS
+
+    catalog = None
+    if nist_catalog_file is not None:
+        from nist_catalog import get_catalog
+        catalog = get_catalog(nist_catalog_file)
+
+    documents = []
+    for control_id, title in controls.items():
+        text = title
+        if catalog is not None:
+            text = f"{title}\n{catalog.get_statement(control_id)}"
+        documents.append({'control': control_id, 'title': title, 'text': text})
+    return documents
+
+
+def suggest_mappings(requirements: List[dict], controls: List[dict], top_k: int = 5,
+                     min_score: float = 0.0) -> List[dict]:
+    """
+    Rank candidate NIST controls for each requirement by TF-IDF cosine similarity.
+
+    Args:
+        requirements: Requirement documents (see requirement_documents)
+        controls: Control documents (see control_documents)
+        top_k: Candidates per requirement
+        min_score: Drop candidates scoring below this
+
+    Returns:
+        One entry per requirement with keys requirement_key, description and
+        candidates (list of dicts with control, title, score)
+    """
+    if not requirements or not controls:
+        return []
+
+    # Shared vocabulary and IDF over both corpora so scores are comparable
+    matrix, _ = build_tfidf_matrix([r['text'] for r in requirements] + [c['text'] for c in controls])
+    requirement_matrix = matrix[:len(requirements)]
+    control_matrix = matrix[len(requirements):]
+
+    indices, scores = top_k_similarities(requirement_matrix, control_matrix, top_k)
+
+    suggestions = []
+    for row, requirement in enumerate(requirements):
+        candidates = [
+            {
+                'control': controls[col]['control'],
+                'title': controls[col]['title'],
+                'score': round(float(score), 4),
+            }
+            for col, score in zip(indices[row], scores[row])
+            if score > 0 and score >= min_score
+        ]
+        suggestions.append({
+            'requirement_key': requirement['requirement_key'],
+            'description': requirement['text'][:80],
+            'candidates': candidates,
+        })
+    return suggestions
+
+
+def find_gaps(requirements: List[dict], nerc_nist_map: Dict[str, dict]) -> List[dict]:
+    """Keep only requirements without an entry in NERC_NIST_MAP."""
+    return [r for r in requirements if r['requirement_key'] not in nerc_nist_map]
+
+
+def main():
+    """Command-line interface for mapping suggestions."""
+    parser = argparse.ArgumentParser(
+        description='Suggest NIST SP 800-53 controls for unmapped NERC CIP requirements',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s
+  %(prog)s --all --top 3
+  %(prog)s --nist-catalog NIST_SP-800-53_rev5_catalog.json --output suggestions.json
+        """
+    )
+    parser.add_argument('--input', type=Path, default=Path(INPUT_FILE),
+                        help=f'Combined NERC text (default: {INPUT_FILE})')
+    parser.add_argument('--all', action='store_true',
+                        help='Suggest for every requirement, not only unmapped ones')
+    parser.add_argument('--top', type=int, default=5, help='Candidates per requirement (default: 5)')
+    parser.add_argument('--min-score', type=float, default=0.05,
+                        help='Minimum cosine similarity (default: 0.05)')
+    parser.add_argument('--nist-catalog', type=Path, default=None,
+                        help='Official NIST OSCAL catalog JSON; adds control statements to the vectors')
+    parser.add_argument('-o', '--output', type=Path, default=None, help='Write suggestions as JSON')
+
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    start_profiling(args.profile)
+
+    try:
+        from generate_oscal import NERC_NIST_MAP, parse_all_standard_versions
+
+        with open(args.input, 'r', encoding='utf-8') as f:
+            standards = parse_all_standard_versions(f.read())
+
+        requirements = requirement_documents(standards)
+        if not args.all:
+            requirements = find_gaps(requirements, NERC_NIST_MAP)
+
+        started = time.perf_counter()
+        controls = control_documents(nist_catalog_file=args.nist_catalog)
+        suggestions = suggest_mappings(requirements, controls, args.top, args.min_score)
+        elapsed = time.perf_counter() - started
+
+        if args.output:
+            args.output.write_text(json.dumps(suggestions, indent=2))
+            print(f"[OK] Wrote suggestions for {len(suggestions)} requirement(s) to {args.output}")
+        else:
+            for item in suggestions:
+                print(f"[*] {item['requirement_key']}: {item['description']}...")
+                for candidate in item['candidates']:
+                    print(f"      {candidate['score']:.3f}  {candidate['control']:<10} {candidate['title']}")
+
+        print(f"[*] Scored {len(requirements)} requirement(s) x {len(controls)} control(s) in {elapsed:.2f}s")
+
+    except FileNotFoundError as e:
+        print(f"[ERR] Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"[ERR] Validation error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,335 @@
+"""
+Shared instrumentation for the NERC CIP toolkit: stage timers, counters and histograms.
+
+Instrumented code records into one in-process registry:
+
+    with stage('parse_standards') as fields:    # wall + CPU time, ok/error runs
+        ...
+        fields['standards'] = len(standards)    # extra fields for the JSON log
+    count('nerc_requirements_total', 96, stage='parse_standards')
+    observe('nerc_pdf_page_seconds', 0.12, operation='extract_text')
+
+Covered today: extract_nerc_text (per-page text extraction), NERECPDFParser.parse_pdf
+(per-page table extraction), parse_nerc_standards, generate_oscal_catalog,
+oscal_to_jama_csv and every JAMA CSV write (rows).
+
+Nothing is written unless configured, so every entry point can be measured
+without new flags (e.g. from the nightly cron job):
+
+    NERC_METRICS_TEXTFILE_DIR  Directory scraped by the node exporter's textfile
+                               collector; <script>.prom is written there
+                               atomically at exit (series carry a script label)
+    NERC_METRICS_LOG           JSON-lines event log path ('-' for stderr); one
+                               line per finished stage and per log() call
+
+CPU time is process CPU time (time.process_time), so it includes worker
+threads. Work done in child processes (process pools) is only recorded if the
+child returns its registry's export() and the parent merge()s it, as
+nerc_oscal.py does for the stages it runs in parallel; only the main process
+writes the textfile.
+
+Usage:
+    NERC_METRICS_TEXTFILE_DIR=/var/lib/node_exporter/textfile python nerc_pipeline.py NERC-CIP
+    NERC_METRICS_LOG=- python generate_oscal.py
+"""
+
+import atexit
+import json
+import math
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+
+TEXTFILE_DIR_ENV = 'NERC_METRICS_TEXTFILE_DIR'
+LOG_ENV = 'NERC_METRICS_LOG'
+
+# Histogram bucket upper bounds in seconds (+Inf is implicit)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+METRIC_HELP = {
+    'nerc_stage_duration_seconds': ('histogram', 'Wall-clock time per pipeline stage run.'),
+    'nerc_stage_cpu_seconds_total': ('counter', 'Process CPU time spent in pipeline stages.'),
+    'nerc_stage_runs_total': ('counter', 'Pipeline stage runs by outcome.'),
+    'nerc_pdf_page_seconds': ('histogram', 'Time to process one PDF page.'),
+    'nerc_pdf_documents_total': ('counter', 'PDF documents processed by outcome.'),
+    'nerc_pages_total': ('counter', 'PDF pages processed.'),
+    'nerc_tables_total': ('counter', 'Tables extracted from PDF pages.'),
+    'nerc_documents_total': ('counter', 'Documents found in combined NERC text.'),
+    'nerc_standards_total': ('counter', 'Current CIP standards parsed.'),
+    'nerc_requirements_total': ('counter', 'Requirements handled per stage.'),
+    'nerc_mapping_gaps_total': ('counter', 'Requirements without a NIST mapping.'),
+    'nerc_rows_total': ('counter', 'JAMA CSV rows written.'),
+    'nerc_last_run_timestamp_seconds': ('gauge', 'Unix time the metrics were written.'),
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: LabelKey) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels) + '}'
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metrics:
+    """Thread-safe registry of counters, gauges and histograms plus the event log."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.lock = threading.Lock()
+        self.counters: Dict[str, Dict[LabelKey, float]] = {}
+        self.gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self.histograms: Dict[str, Dict[LabelKey, dict]] = {}
+        self.log_stream: Optional[TextIO] = None
+        self.textfile: Optional[Path] = None
+        # Objects with stage_started(name) / stage_finished(name), e.g. nerc_profile.Profiler
+        self.stage_listeners: List = []
+        self._atexit_registered = False
+
+    def reset(self):
+        """Drop all recorded values (configuration is kept)."""
+        with self.lock:
+            self.counters.clear()
+            self.gauges.clear()
+            self.histograms.clear()
+
+    def count(self, name: str, value: float = 1, **labels):
+        """Add value to a counter."""
+        key = _label_key(labels)
+        with self.lock:
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels):
+        """Set a gauge."""
+        with self.lock:
+            self.gauges.setdefault(name, {})[_label_key(labels)] = value
+
+    def observe(self, name: str, value: float, **labels):
+        """Record one observation in a histogram."""
+        key = _label_key(labels)
+        with self.lock:
+            series = self.histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = {'buckets': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    histogram['buckets'][index] += 1
+            histogram['sum'] += value
+            histogram['count'] += 1
+
+    def log(self, event: str, **fields):
+        """Write one JSON-lines event if an event log is configured."""
+        if self.log_stream is None:
+            return
+        line = json.dumps({'ts': round(time.time(), 6), 'event': event, **fields}, default=str)
+        with self.lock:
+            self.log_stream.write(line + '\n')
+            self.log_stream.flush()
+
+    @contextmanager
+    def stage(self, name: str, **labels) -> Iterator[dict]:
+        """
+        Time a stage (wall and CPU) and record its outcome.
+
+        Yields a dict; fields the caller adds to it (e.g. counts) are included
+        in the stage's JSON log event.
+
+        Args:
+            name: Stage name (the 'stage' label)
+            **labels: Extra labels for the stage series
+        """
+        fields: dict = {}
+        status = 'ok'
+        listeners = list(self.stage_listeners)
+        for listener in listeners:
+            listener.stage_started(name)
+        wall_started = time.perf_counter()
+        cpu_started = time.process_time()
+        try:
+            yield fields
+        except BaseException:
+            status = 'error'
+            raise
+        finally:
+            for listener in reversed(listeners):
+                listener.stage_finished(name)
+            wall = time.perf_counter() - wall_started
+            cpu = time.process_time() - cpu_started
+            self.observe('nerc_stage_duration_seconds', wall, stage=name, **labels)
+            self.count('nerc_stage_cpu_seconds_total', cpu, stage=name, **labels)
+            self.count('nerc_stage_runs_total', 1, stage=name, status=status, **labels)
+            self.log('stage', stage=name, status=status, wall_seconds=round(wall, 6),
+                     cpu_seconds=round(cpu, 6), **labels, **fields)
+
+    def snapshot(self) -> dict:
+        """Copy of all series as plain dicts keyed by 'name{labels}'."""
+        with self.lock:
+            return {
+                'counters': {f"{name}{_format_labels(key)}": value
+                             for name, series in self.counters.items() for key, value in series.items()},
+                'gauges': {f"{name}{_format_labels(key)}": value
+                           for name, series in self.gauges.items() for key, value in series.items()},
+                'histograms': {f"{name}{_format_labels(key)}": {'sum': h['sum'], 'count': h['count']}
+                               for name, series in self.histograms.items() for key, h in series.items()},
+            }
+
+    def export(self) -> dict:
+        """
+        Copy of all series with bucket counts, for merge() into another registry.
+
+        Unlike snapshot(), keys stay label tuples and histograms keep their
+        buckets, and the result pickles (e.g. back from a worker process).
+        """
+        with self.lock:
+            return {
+                'buckets': self.buckets,
+                'counters': {name: dict(series) for name, series in self.counters.items()},
+                'gauges': {name: dict(series) for name, series in self.gauges.items()},
+                'histograms': {name: {key: dict(h, buckets=list(h['buckets'])) for key, h in series.items()}
+                               for name, series in self.histograms.items()},
+            }
+
+    def merge(self, exported: dict):
+        """
+        Add the series of another registry's export(): counters and histograms
+        are summed, gauges take the exported value.
+
+        Raises:
+            ValueError: If the histogram buckets differ
+        """
+        if tuple(exported['buckets']) != self.buckets:
+            raise ValueError(f"Cannot merge metrics with buckets {exported['buckets']} into {self.buckets}")
+        with self.lock:
+            for name, series in exported['counters'].items():
+                target = self.counters.setdefault(name, {})
+                for key, value in series.items():
+                    target[key] = target.get(key, 0) + value
+            for name, series in exported['gauges'].items():
+                self.gauges.setdefault(name, {}).update(series)
+            for name, series in exported['histograms'].items():
+                target = self.histograms.setdefault(name, {})
+                for key, histogram in series.items():
+                    current = target.get(key)
+                    if current is None:
+                        current = target[key] = {'buckets': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+                    current['buckets'] = [a + b for a, b in zip(current['buckets'], histogram['buckets'])]
+                    current['sum'] += histogram['sum']
+                    current['count'] += histogram['count']
+
+    def render_prometheus(self, **const_labels) -> str:
+        """
+        Render all series in the Prometheus text exposition format.
+
+        Args:
+            **const_labels: Labels added to every series (e.g. script='nerc_pipeline')
+        """
+        const = _label_key(const_labels)
+        lines = []
+
+        def header(name: str, default_type: str):
+            metric_type, help_text = METRIC_HELP.get(name, (default_type, name))
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+
+        with self.lock:
+            for name in sorted(self.counters):
+                header(name, 'counter')
+                for key, value in sorted(self.counters[name].items()):
+                    lines.append(f"{name}{_format_labels(const + key)} {_format_value(value)}")
+            for name in sorted(self.gauges):
+                header(name, 'gauge')
+                for key, value in sorted(self.gauges[name].items()):
+                    lines.append(f"{name}{_format_labels(const + key)} {_format_value(value)}")
+            for name in sorted(self.histograms):
+                header(name, 'histogram')
+                for key, histogram in sorted(self.histograms[name].items()):
+                    labels = const + key
+                    for bound, observed in zip(self.buckets, histogram['buckets']):
+                        lines.append(f"{name}_bucket{_format_labels(labels + (('le', _format_value(bound)),))} "
+                                     f"{observed}")
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {histogram['count']}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram['sum'])}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {histogram['count']}")
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self, path: Path, **const_labels) -> Path:
+        """
+        Atomically write the Prometheus textfile (the collector must never see a partial file).
+
+        Returns:
+            The path written
+        """
+        path = Path(path)
+        self.set_gauge('nerc_last_run_timestamp_seconds', round(time.time(), 3))
+        tmp_file = path.with_name(path.name + '.tmp')
+        tmp_file.write_text(self.render_prometheus(**const_labels), encoding='utf-8')
+        os.replace(tmp_file, path)
+        return path
+
+    def configure(self, textfile: Optional[Path] = None, log: Optional[str] = None):
+        """
+        Enable outputs: a Prometheus textfile written at exit and/or a JSON-lines event log.
+
+        Args:
+            textfile: Textfile path (written at interpreter exit)
+            log: Event log path, or '-' for stderr
+        """
+        if log:
+            self.log_stream = sys.stderr if log == '-' else open(log, 'a', encoding='utf-8')
+        if textfile:
+            self.textfile = Path(textfile)
+            if not self._atexit_registered:
+                atexit.register(self.flush)
+                self._atexit_registered = True
+
+    def flush(self):
+        """Write the configured textfile (called at exit; not from pool worker processes)."""
+        if self.textfile is None or multiprocessing.parent_process() is not None:
+            return
+        try:
+            self.write_textfile(self.textfile, script=script_name())
+        except OSError as e:
+            print(f"[WARN] Could not write metrics to {self.textfile}: {e}", file=sys.stderr)
+
+
+def script_name() -> str:
+    """Name of the running entry point (e.g. 'nerc_pipeline'), used as the script label."""
+    return Path(sys.argv[0]).stem if sys.argv and sys.argv[0] else 'python'
+
+
+def configure_from_env():
+    """Configure METRICS from NERC_METRICS_TEXTFILE_DIR / NERC_METRICS_LOG."""
+    textfile_dir = os.environ.get(TEXTFILE_DIR_ENV)
+    textfile = Path(textfile_dir) / f"{script_name()}.prom" if textfile_dir else None
+    METRICS.configure(textfile, os.environ.get(LOG_ENV))
+
+
+METRICS = Metrics()
+stage = METRICS.stage
+count = METRICS.count
+observe = METRICS.observe
+set_gauge = METRICS.set_gauge
+log = METRICS.log
+
+configure_from_env()
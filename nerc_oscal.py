@@ -0,0 +1,569 @@
+"""
+Make-style runner for the NERC CIP -> OSCAL -> JAMA toolkit.
+
+The pipeline is a small DAG of stages, each reading and writing artifacts:
+
+    extract   NERC-CIP/*.pdf         -> nerc_all_combined.txt    (extract_nerc_text.py)
+    generate  nerc_all_combined.txt  -> nerc-oscal.json          (generate_oscal.py)
+    export    nerc-oscal.json        -> nerc-oscal.csv           (oscal_to_jama_csv.py)
+    validate  nerc-oscal.json        -> nerc-oscal.validation.json (oscal_validator.py)
+    store     nerc_all_combined.txt  -> nerc-oscal.db            (nerc_store.py)
+
+Before a stage runs, a fingerprint of its inputs (content hashes), its code (the
+hashes of the modules it runs) and its settings is compared with the one
+recorded when its outputs were last built (in .nerc-oscal-state.json in the
+output directory). Stages with an unchanged fingerprint and untouched outputs
+are skipped. Because inputs are hashed by content, a rebuilt artifact that
+comes out identical does not rebuild the stages after it; generate keeps the
+previous catalog's uuid and last-modified stamp when nothing else changed, so
+regenerating the same text leaves nerc-oscal.json byte-identical. Independent
+stages (export, validate and store) run concurrently in a process pool, and a
+failing stage only skips the stages that depend on it.
+
+Usage:
+    python nerc_oscal.py                         # build everything that is out of date
+    python nerc_oscal.py --dry-run               # show what would rebuild and why
+    python nerc_oscal.py export --format detailed
+    python nerc_oscal.py --source nerc_all_combined.txt --out-dir build
+    python nerc_oscal.py validate --force
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import nerc_metrics
+from nerc_profile import add_profile_argument, start_profiling
+
+STATE_FILE = '.nerc-oscal-state.json'
+STATE_VERSION = 1
+DEFAULT_SOURCE = 'NERC-CIP'
+CODE_DIR = Path(__file__).parent
+
+# Default artifact file names (inside --out-dir)
+ARTIFACTS = {
+    'text': 'nerc_all_combined.txt',
+    'oscal': 'nerc-oscal.json',
+    'csv': 'nerc-oscal.csv',
+    'report': 'nerc-oscal.validation.json',
+    'db': 'nerc-oscal.db',
+}
+
+# Stage DAG in dependency order; a stage depends on the stages producing its inputs
+STAGES = {
+    'extract': {
+        'inputs': ['source'],
+        'outputs': ['text'],
+        'code': ['extract_nerc_text.py', 'nerc_pipeline.py'],
+        'settings': [],
+        'description': 'Extract text from the NERC CIP PDFs',
+    },
+    'generate': {
+        'inputs': ['text'],
+        'outputs': ['oscal'],
+        'code': ['generate_oscal.py'],
+        'settings': [],
+        'description': 'Generate the OSCAL catalog',
+    },
+    'export': {
+        'inputs': ['oscal', 'nist_catalog'],
+        'outputs': ['csv'],
+        'code': ['oscal_to_jama_csv.py', 'oscal_stream.py', 'nist_catalog.py'],
+        'settings': ['format'],
+        'description': 'Export the JAMA CSV',
+    },
+    'validate': {
+        'inputs': ['oscal', 'revision_catalog'],
+        'outputs': ['report'],
+        'code': ['oscal_validator.py', 'nist_controls.py', 'nist_catalog.py'],
+        'settings': ['nist_revision'],
+        'description': 'Validate the OSCAL catalog',
+    },
+    'store': {
+        'inputs': ['text'],
+        'outputs': ['db'],
+        'code': ['nerc_store.py', 'generate_oscal.py'],
+        'settings': [],
+        'description': 'Load the SQLite store',
+    },
+}
+
+
+def _tmp_path(output: str) -> Path:
+    output = Path(output)
+    return output.with_name(output.name + '.tmp')
+
+
+def _extract(inputs: Dict[str, str], outputs: Dict[str, str], settings: dict) -> str:
+    from nerc_pipeline import read_source_text
+    text = read_source_text(Path(inputs['source']))
+    tmp_file = _tmp_path(outputs['text'])
+    tmp_file.write_text(text, encoding='utf-8')
+    os.replace(tmp_file, outputs['text'])
+    return f"{text.count('--- START DOCUMENT:')} document(s)"
+
+
+def _without_volatile(document: dict) -> dict:
+    """A catalog minus the fields generate_oscal sets fresh on every run (uuid, last-modified)."""
+    catalog = dict(document.get('catalog', {}))
+    catalog.pop('uuid', None)
+    catalog['metadata'] = {key: value for key, value in catalog.get('metadata', {}).items()
+                           if key != 'last-modified'}
+    return dict(document, catalog=catalog)
+
+
+def _previous_catalog(path: str) -> Optional[dict]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _generate(inputs: Dict[str, str], outputs: Dict[str, str], settings: dict) -> str:
+    from generate_oscal import generate_oscal_catalog, parse_nerc_standards
+    standards = parse_nerc_standards(Path(inputs['text']).read_text(encoding='utf-8'))
+    catalog = generate_oscal_catalog(standards)
+    previous = _previous_catalog(outputs['oscal'])
+    if isinstance(previous, dict) and _without_volatile(previous) == _without_volatile(catalog):
+        # Same content: keep the identity and timestamp so downstream stages stay up to date
+        catalog = previous
+    tmp_file = _tmp_path(outputs['oscal'])
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(catalog, f, indent=2)
+    os.replace(tmp_file, outputs['oscal'])
+    return f"{len(standards)} standard(s)"
+
+
+def _export(inputs: Dict[str, str], outputs: Dict[str, str], settings: dict) -> str:
+    from oscal_to_jama_csv import oscal_to_jama_csv
+    tmp_file = _tmp_path(outputs['csv'])
+    nist_catalog = Path(inputs['nist_catalog']) if inputs.get('nist_catalog') else None
+    with open(tmp_file, 'w', newline='', encoding='utf-8') as f:
+        rows = oscal_to_jama_csv(Path(inputs['oscal']), f, settings['format'], nist_catalog)
+    os.replace(tmp_file, outputs['csv'])
+    return f"{len(rows)} row(s)"
+
+
+def _validate(inputs: Dict[str, str], outputs: Dict[str, str], settings: dict) -> str:
+    from oscal_validator import validate_oscal_file
+    report = validate_oscal_file(Path(inputs['oscal']), settings['nist_revision'])
+    tmp_file = _tmp_path(outputs['report'])
+    tmp_file.write_text(json.dumps(report, indent=2), encoding='utf-8')
+    os.replace(tmp_file, outputs['report'])
+    if not report['valid']:
+        raise ValueError(f"{report['errors']} validation error(s); see {outputs['report']}")
+    return f"{report['components']} component(s), {report['warnings']} warning(s)"
+
+
+def _store(inputs: Dict[str, str], outputs: Dict[str, str], settings: dict) -> str:
+    from contextlib import closing
+    from nerc_store import connect, populate
+    # Loaded in place (one transaction) so recorded statuses are kept
+    with closing(connect(outputs['db'])) as conn:
+        counts = populate(conn, Path(inputs['text']).read_text(encoding='utf-8'))
+    return f"{counts['requirements']} requirement(s), {counts['mappings']} mapping(s)"
+
+
+ACTIONS = {'extract': _extract, 'generate': _generate, 'export': _export, 'validate': _validate,
+           'store': _store}
+
+
+def run_stage(name: str, inputs: Dict[str, str], outputs: Dict[str, str], settings: dict,
+              worker: bool = False) -> dict:
+    """
+    Run one stage's action (in a worker process when running concurrently).
+
+    A worker's metrics would die with its process, so with worker=True the
+    registry is reset first and its export() is returned ('metrics'), or
+    attached to the raised exception as its 'metrics' attribute, for the
+    parent to merge.
+
+    Returns:
+        Dict with the action's one-line summary, elapsed seconds and (worker
+        only) the stage's metrics
+    """
+    if worker:
+        nerc_metrics.METRICS.reset()
+    started = time.perf_counter()
+    try:
+        with nerc_metrics.stage(f"pipeline_{name}"):
+            summary = ACTIONS[name](inputs, outputs, settings)
+    except Exception as e:
+        if worker:
+            e.metrics = nerc_metrics.METRICS.export()
+        raise
+    result = {'summary': summary, 'elapsed': time.perf_counter() - started}
+    if worker:
+        result['metrics'] = nerc_metrics.METRICS.export()
+    return result
+
+
+def _digest(value) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+class Pipeline:
+    """
+    The stage DAG bound to concrete artifact paths and settings.
+
+    Args:
+        source: Directory of NERC CIP PDFs, or an existing combined text file
+            (then there is no extract stage)
+        out_dir: Directory for artifacts and the fingerprint state file
+        format_type: JAMA CSV format ('standard' or 'detailed')
+        nist_catalog_file: Optional official NIST OSCAL catalog for statement text
+        nist_revision: NIST SP 800-53 revision for validation (other than rev5,
+            its official catalog file is an input of validate)
+    """
+
+    def __init__(self, source: Path = Path(DEFAULT_SOURCE), out_dir: Path = Path('.'),
+                 format_type: str = 'standard', nist_catalog_file: Optional[Path] = None,
+                 nist_revision: str = 'rev5'):
+        out_dir = Path(out_dir)
+        self.state_file = out_dir / STATE_FILE
+        self.artifacts = {key: out_dir / name for key, name in ARTIFACTS.items()}
+        self.artifacts['source'] = Path(source)
+        self.artifacts['nist_catalog'] = Path(nist_catalog_file) if nist_catalog_file else None
+        self.artifacts['revision_catalog'] = None
+        if nist_revision != 'rev5':
+            from nist_catalog import NIST_CATALOG_FILES, normalize_revision
+            self.artifacts['revision_catalog'] = NIST_CATALOG_FILES[normalize_revision(nist_revision)]
+        self.stages = dict(STAGES)
+        if Path(source).is_file():
+            # Starting from combined text: it is the source, not a build product
+            del self.stages['extract']
+            self.artifacts['text'] = Path(source)
+        self.settings = {'format': format_type, 'nist_revision': nist_revision}
+        self.state = self._load_state()
+        self._hashes = {}
+
+    # --- DAG -------------------------------------------------------------
+
+    def dependencies(self, name: str) -> List[str]:
+        """Stages producing the given stage's inputs."""
+        inputs = self.stages[name]['inputs']
+        return [other for other, stage in self.stages.items()
+                if other != name and set(stage['outputs']) & set(inputs)]
+
+    def plan(self, targets: Optional[List[str]] = None) -> List[str]:
+        """
+        Stages needed for the targets (default: all), in dependency order.
+
+        Raises:
+            ValueError: If a target is not a stage of this pipeline
+        """
+        targets = targets or list(self.stages)
+        needed = set()
+        pending = list(targets)
+        while pending:
+            name = pending.pop()
+            if name not in self.stages:
+                raise ValueError(f"Unknown stage '{name}' (stages: {', '.join(self.stages)})")
+            if name not in needed:
+                needed.add(name)
+                pending.extend(self.dependencies(name))
+        return [name for name in self.stages if name in needed]
+
+    # --- Fingerprints ----------------------------------------------------
+
+    def hash_path(self, path: Path) -> Optional[str]:
+        """SHA-256 of a file, or of a directory's PDFs (names and contents); None if missing."""
+        path = Path(path)
+        if not path.exists():
+            return None
+        if path.is_dir():
+            return _digest({pdf.name: self.hash_path(pdf) for pdf in sorted(path.glob('*.pdf'))})
+
+        stat = path.stat()
+        key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+        if key not in self._hashes:
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+            self._hashes[key] = digest.hexdigest()
+        return self._hashes[key]
+
+    def fingerprint(self, name: str) -> Dict[str, str]:
+        """
+        Fingerprint a stage from its current inputs, code and settings.
+
+        Returns:
+            Dict of part digests ('inputs', 'code', 'settings') and the combined 'fingerprint'
+
+        Raises:
+            FileNotFoundError: If an input artifact is missing
+        """
+        stage = self.stages[name]
+        inputs = {}
+        for key in stage['inputs']:
+            path = self.artifacts[key]
+            if path is None:
+                continue
+            digest = self.hash_path(path)
+            if digest is None:
+                raise FileNotFoundError(f"Input for stage '{name}' not found: {path}")
+            inputs[key] = digest
+        parts = {
+            'inputs': _digest(inputs),
+            'code': _digest({module: self.hash_path(CODE_DIR / module) for module in stage['code']}),
+            'settings': _digest({key: self.settings[key] for key in stage['settings']}),
+        }
+        parts['fingerprint'] = _digest(parts)
+        return parts
+
+    def stale_reason(self, name: str, force: bool = False,
+                     parts: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """
+        Why a stage must run, or None if its outputs are up to date.
+
+        Args:
+            name: Stage name
+            force: Always rebuild
+            parts: The stage's fingerprint, if already computed
+
+        Raises:
+            FileNotFoundError: If an input artifact is missing
+        """
+        parts = parts or self.fingerprint(name)
+        if force:
+            return 'forced'
+        recorded = self.state['stages'].get(name)
+        if recorded is None:
+            return 'never built'
+        for key in self.stages[name]['outputs']:
+            digest = self.hash_path(self.artifacts[key])
+            if digest is None:
+                return f"{self.artifacts[key]} missing"
+            if digest != recorded['outputs'].get(key):
+                return f"{self.artifacts[key]} modified"
+        changed = [part for part in ('inputs', 'code', 'settings') if parts[part] != recorded.get(part)]
+        if changed:
+            return ', '.join(changed) + ' changed'
+        return None
+
+    # --- State -----------------------------------------------------------
+
+    def _load_state(self) -> dict:
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            state = {}
+        if state.get('version') != STATE_VERSION:
+            state = {'version': STATE_VERSION, 'stages': {}}
+        return state
+
+    def _record(self, name: str, parts: Dict[str, str], elapsed: float):
+        self.state['stages'][name] = dict(
+            parts,
+            outputs={key: self.hash_path(self.artifacts[key]) for key in self.stages[name]['outputs']},
+            elapsed=elapsed,
+        )
+        tmp_file = self.state_file.with_name(self.state_file.name + '.tmp')
+        tmp_file.write_text(json.dumps(self.state, indent=2, sort_keys=True), encoding='utf-8')
+        os.replace(tmp_file, self.state_file)
+
+    # --- Running ---------------------------------------------------------
+
+    def _task(self, name: str) -> tuple:
+        stage = self.stages[name]
+        inputs = {key: str(self.artifacts[key]) if self.artifacts[key] else None for key in stage['inputs']}
+        outputs = {key: str(self.artifacts[key]) for key in stage['outputs']}
+        return name, inputs, outputs, {key: self.settings[key] for key in stage['settings']}
+
+    def dry_run(self, targets: Optional[List[str]] = None, force: bool = False) -> Dict[str, Optional[str]]:
+        """
+        Report what a build would do without running anything.
+
+        Returns:
+            Stage -> rebuild reason, or None if up to date. Stages after one
+            that rebuilds are reported as such, since their inputs are not known yet.
+        """
+        reasons = {}
+        for name in self.plan(targets):
+            upstream = [dep for dep in self.dependencies(name) if reasons.get(dep)]
+            if upstream:
+                reasons[name] = f"after {', '.join(upstream)}"
+            else:
+                reasons[name] = self.stale_reason(name, force)
+        return reasons
+
+    def build(self, targets: Optional[List[str]] = None, force: bool = False, jobs: Optional[int] = None,
+              verbose: bool = True) -> dict:
+        """
+        Bring the targets (default: all stages) up to date.
+
+        A stage is checked as soon as its dependencies finish, so independent
+        stages run concurrently (jobs > 1) in a process pool. A failed stage
+        skips the stages depending on it; the others still run.
+
+        Returns:
+            Summary: stages (name -> 'rebuilt', 'up to date', 'failed' or
+            'skipped'), reasons, errors (name -> message), elapsed
+
+        Raises:
+            FileNotFoundError: If a pipeline input is missing
+        """
+        started = time.perf_counter()
+        order = self.plan(targets)
+        jobs = max(1, jobs or os.cpu_count() or 1)
+        status: Dict[str, str] = {}
+        reasons: Dict[str, str] = {}
+        errors: Dict[str, str] = {}
+        running: Dict[Future, tuple] = {}
+        pool = ProcessPoolExecutor(max_workers=min(jobs, len(order))) if jobs > 1 and len(order) > 1 else None
+
+        def log(message):
+            if verbose:
+                print(message)
+
+        def finish(name, parts, future):
+            try:
+                result = future.result()
+            except Exception as e:
+                if getattr(e, 'metrics', None):
+                    nerc_metrics.METRICS.merge(e.metrics)
+                status[name] = 'failed'
+                errors[name] = str(e)
+                log(f"[ERR] {name} failed: {e}")
+                return
+            if 'metrics' in result:
+                nerc_metrics.METRICS.merge(result['metrics'])
+            self._record(name, parts, result['elapsed'])
+            status[name] = 'rebuilt'
+            log(f"[OK] {name}: {result['summary']} ({result['elapsed']:.2f}s)")
+
+        try:
+            while len(status) < len(order):
+                progressed = False
+                for name in order:
+                    if name in status or any(name == task[0] for task in running.values()):
+                        continue
+                    deps = self.dependencies(name)
+                    if any(status.get(dep) in ('failed', 'skipped') for dep in deps):
+                        status[name] = 'skipped'
+                        progressed = True
+                        continue
+                    if not all(dep in status for dep in deps):
+                        continue
+                    parts = self.fingerprint(name)
+                    reason = self.stale_reason(name, force, parts)
+                    progressed = True
+                    if reason is None:
+                        status[name] = 'up to date'
+                        log(f"[*] {name} is up to date")
+                        continue
+                    reasons[name] = reason
+                    log(f"[*] {name}: {self.stages[name]['description']} ({reason})")
+                    if pool is None:
+                        future = Future()
+                        try:
+                            future.set_result(run_stage(*self._task(name)))
+                        except Exception as e:
+                            future.set_exception(e)
+                        finish(name, parts, future)
+                    else:
+                        running[pool.submit(run_stage, *self._task(name), True)] = (name, parts)
+
+                if running:
+                    done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name, parts = running.pop(future)
+                        finish(name, parts, future)
+                elif not progressed:
+                    # Nothing left that can start (not expected in a DAG); do not spin
+                    for name in order:
+                        status.setdefault(name, 'skipped')
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        return {
+            'stages': {name: status[name] for name in order},
+            'reasons': reasons,
+            'errors': errors,
+            'elapsed': time.perf_counter() - started,
+        }
+
+
+def main():
+    """Command-line interface for the pipeline runner."""
+    parser = argparse.ArgumentParser(
+        description='Build the NERC CIP OSCAL catalog, JAMA CSV and validation report, '
+                    'rebuilding only out-of-date stages',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Stages: extract -> generate -> export, validate; extract -> store
+
+Examples:
+  %(prog)s
+  %(prog)s --dry-run
+  %(prog)s export --format detailed
+  %(prog)s --source nerc_all_combined.txt --out-dir build
+  %(prog)s validate --force
+        """
+    )
+    parser.add_argument('targets', nargs='*', metavar='stage',
+                        help=f"Stages to bring up to date, with their dependencies "
+                             f"(default: all; one of {', '.join(STAGES)})")
+    parser.add_argument('--source', type=Path, default=Path(DEFAULT_SOURCE),
+                        help=f'Directory of NERC CIP PDFs, or a combined text file (default: {DEFAULT_SOURCE})')
+    parser.add_argument('--out-dir', type=Path, default=Path('.'),
+                        help='Directory for artifacts and build state (default: current directory)')
+    parser.add_argument('--format', choices=['standard', 'detailed'], default='standard',
+                        help='JAMA CSV format (default: standard)')
+    parser.add_argument('--nist-catalog', type=Path, default=None,
+                        help='Official NIST OSCAL catalog JSON; adds primary control statement text to each row')
+    parser.add_argument('--nist-revision', choices=['rev4', 'rev5'], default='rev5',
+                        help='NIST SP 800-53 revision for validation (default: rev5)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Stages run concurrently (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='Rebuild the selected stages even if up to date')
+    parser.add_argument('-n', '--dry-run', action='store_true', help='Show what would rebuild and why')
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    if start_profiling(args.profile):
+        # Stages in worker processes would not be profiled
+        args.jobs = 1
+
+    try:
+        args.out_dir.mkdir(parents=True, exist_ok=True)
+        pipeline = Pipeline(args.source, args.out_dir, args.format, args.nist_catalog, args.nist_revision)
+        if args.dry_run:
+            reasons = pipeline.dry_run(args.targets, args.force)
+            for name, reason in reasons.items():
+                if reason:
+                    print(f"[*] {name}: would rebuild ({reason})")
+                else:
+                    print(f"[OK] {name}: up to date")
+            stale = sum(1 for reason in reasons.values() if reason)
+            print(f"[*] Dry run: {stale} stage(s) would rebuild, {len(reasons) - stale} up to date")
+            return
+        summary = pipeline.build(args.targets, args.force, args.jobs)
+    except FileNotFoundError as e:
+        print(f"[ERR] Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"[ERR] Validation error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    counts = {}
+    for result in summary['stages'].values():
+        counts[result] = counts.get(result, 0) + 1
+    details = ', '.join(f"{count} {result}" for result, count in counts.items())
+    if summary['errors']:
+        print(f"[ERR] Build failed: {details} ({summary['elapsed']:.2f}s)")
+        sys.exit(1)
+    print(f"[OK] Build complete: {details} ({summary['elapsed']:.2f}s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -18,10 +18,13 @@ Typical usage:
 
 import re
 import json
+import time
 from typing import List, Dict, Optional, Tuple, Any
 from pathlib import Path
 import pdfplumber
 
+from nerc_metrics import count, observe, stage
+
 
 class NERECPDFParser:
     """Parse NERC-CIP PDF documents and extract requirement tables."""
@@ -65,13 +68,17 @@ class NERECPDFParser:
         self.pdf_filename = pdf_file.name
         requirements = []
 
-        with pdfplumber.open(pdf_path) as pdf:
+        with stage('parse_pdf') as fields, pdfplumber.open(pdf_path) as pdf:
             # Extract tables from all pages
             for page_num, page in enumerate(pdf.pages, 1):
+                started = time.perf_counter()
                 tables = page.extract_tables()
+                observe('nerc_pdf_page_seconds', time.perf_counter() - started, operation='extract_tables')
+                count('nerc_pages_total', operation='extract_tables')
 
                 if not tables:
                     continue
+                count('nerc_tables_total', len(tables))
 
                 # Process each table on this page
                 for table in tables:
@@ -79,6 +86,9 @@ class NERECPDFParser:
                     if parsed_req:
                         requirements.append(parsed_req)
 
+            count('nerc_requirements_total', len(requirements), stage='parse_pdf')
+            fields.update(file=self.pdf_filename, pages=len(pdf.pages), requirements=len(requirements))
+
         self.requirements = requirements
         return requirements
 
@@ -339,6 +349,8 @@ class NERECPDFParser:
 if __name__ == '__main__':
     # Example usage
     import sys
+    from nerc_profile import profile_from_argv, start_profiling
+    start_profiling(profile_from_argv(sys.argv))
 
     if len(sys.argv) > 1:
         pdf_path = sys.argv[1]
@@ -0,0 +1,159 @@
+"""
+End-to-end NERC CIP pipeline: PDFs (or combined text) -> OSCAL catalog -> JAMA CSV.
+
+Runs the same stages as extract_nerc_text.py, generate_oscal.py and
+oscal_to_jama_csv.py, but in one process: extracted text is parsed in memory
+and catalog groups are handed to the JAMA row builder as they are generated,
+so the catalog is never serialized and re-parsed in between. Intermediate
+files (combined text, OSCAL JSON) are written only when requested.
+
+Usage:
+    python nerc_pipeline.py NERC-CIP
+    python nerc_pipeline.py NERC-CIP --output nerc-oscal.csv --oscal-output nerc-oscal.json
+    python nerc_pipeline.py nerc_all_combined.txt --format detailed
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+from generate_oscal import (
+    iter_catalog_groups,
+    new_catalog_document,
+    parse_nerc_standards,
+    report_mapping_gaps,
+)
+from nerc_profile import add_profile_argument, start_profiling
+from oscal_to_jama_csv import catalog_to_jama_csv
+
+DEFAULT_OUTPUT = "nerc-oscal.csv"
+
+
+def read_source_text(source: Path) -> str:
+    """
+    Load combined NERC text from a PDF directory or an existing text file.
+
+    Args:
+        source: Directory of NERC CIP PDFs, or a combined text file such as
+            nerc_all_combined.txt
+
+    Returns:
+        Combined text with "--- START DOCUMENT:" sections
+
+    Raises:
+        FileNotFoundError: If the source doesn't exist
+        ValueError: If a PDF directory contains no readable PDFs
+    """
+    source = Path(source)
+    if not source.exists():
+        raise FileNotFoundError(f"Pipeline source not found: {source}")
+
+    if source.is_dir():
+        # pdfplumber is only needed when starting from PDFs
+        from extract_nerc_text import iter_pdf_documents
+        text = ''.join(document for _, document in iter_pdf_documents(source))
+        if not text:
+            raise ValueError(f"No readable PDFs in {source}")
+        return text
+
+    return source.read_text(encoding='utf-8')
+
+
+def run_pipeline(source: Path, output_csv: Path = Path(DEFAULT_OUTPUT),
+                 format_type: str = 'standard', oscal_output: Optional[Path] = None,
+                 text_output: Optional[Path] = None,
+                 nist_catalog_file: Optional[Path] = None) -> dict:
+    """
+    Run PDF/text -> catalog -> JAMA CSV in one process.
+
+    Args:
+        source: PDF directory or combined text file
+        output_csv: JAMA CSV to write
+        format_type: CSV format ('standard' or 'detailed')
+        oscal_output: Also materialize the OSCAL catalog JSON here
+        text_output: Also save the combined extracted text here
+        nist_catalog_file: Optional official NIST OSCAL catalog for statement text
+
+    Returns:
+        Summary with standards, rows, gaps and per-stage timings (seconds)
+    """
+    timings = {}
+
+    started = time.perf_counter()
+    text = read_source_text(source)
+    if text_output is not None:
+        Path(text_output).write_text(text, encoding='utf-8')
+    timings['extract'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    standards = parse_nerc_standards(text)
+    timings['parse'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    unmapped = []
+    groups = iter_catalog_groups(standards, unmapped)
+    if oscal_output is not None:
+        # Materializing needs the whole catalog; rows are still built from the objects
+        catalog = new_catalog_document(groups)
+        with open(oscal_output, 'w', encoding='utf-8') as f:
+            json.dump(catalog, f, indent=2)
+        groups = catalog
+    rows = catalog_to_jama_csv(groups, output_csv, format_type, nist_catalog_file)
+    report_mapping_gaps(unmapped)
+    timings['catalog_and_csv'] = time.perf_counter() - started
+
+    return {
+        'standards': len(standards),
+        'rows': rows,
+        'gaps': len(unmapped),
+        'timings': timings,
+    }
+
+
+def main():
+    """Command-line interface for the end-to-end pipeline."""
+    parser = argparse.ArgumentParser(
+        description='Run NERC CIP PDFs (or combined text) -> OSCAL catalog -> JAMA CSV in one process',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s NERC-CIP
+  %(prog)s NERC-CIP --output nerc-oscal.csv --oscal-output nerc-oscal.json
+  %(prog)s nerc_all_combined.txt --format detailed
+        """
+    )
+    parser.add_argument('source', type=Path, help='Directory of NERC CIP PDFs, or a combined text file')
+    parser.add_argument('-o', '--output', type=Path, default=Path(DEFAULT_OUTPUT),
+                        help=f'JAMA CSV output (default: {DEFAULT_OUTPUT})')
+    parser.add_argument('--format', choices=['standard', 'detailed'], default='standard',
+                        help='CSV format: standard (basic fields) or detailed (with metadata)')
+    parser.add_argument('--oscal-output', type=Path, default=None,
+                        help='Also write the OSCAL catalog JSON (e.g. nerc-oscal.json)')
+    parser.add_argument('--text-output', type=Path, default=None,
+                        help='Also write the combined extracted text (e.g. nerc_all_combined.txt)')
+    parser.add_argument('--nist-catalog', type=Path, default=None,
+                        help='Official NIST OSCAL catalog JSON; adds primary control statement text to each row')
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    start_profiling(args.profile)
+
+    try:
+        summary = run_pipeline(args.source, args.output, args.format, args.oscal_output,
+                               args.text_output, args.nist_catalog)
+    except FileNotFoundError as e:
+        print(f"[ERR] Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"[ERR] Validation error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    stages = ', '.join(f"{name} {seconds:.2f}s" for name, seconds in summary['timings'].items())
+    print(f"[OK] {summary['standards']} standard(s) -> {summary['rows']} row(s), "
+          f"{summary['gaps']} mapping gap(s) ({stages})")
+
+
+if __name__ == '__main__':
+    main()
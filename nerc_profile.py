@@ -0,0 +1,405 @@
+"""
+Per-stage CPU and memory profiling for the NERC CIP toolkit (--profile).
+
+Every CLI accepts --profile [DIR] (default: profiles/). Scripts without an
+argument parser (extract_nerc_text.py, generate_oscal.py, nerc_pdf_parser.py)
+accept the same flag, and NERC_PROFILE_DIR enables it for any entry point.
+
+The run is split into sessions: one per nerc_metrics stage (parse_pdf,
+parse_standards, generate_catalog, export_csv, ...) and 'main' for everything
+outside a stage. Sessions are exclusive: while a nested stage runs, its parent
+is paused. For each session, DIR receives:
+
+    <script>.<stage>.prof       cProfile stats (pstats, snakeviz)
+    <script>.<stage>.collapsed  sampled stacks, one "a;b;c count" line per stack,
+                                for flamegraph.pl or speedscope
+    <script>.<stage>.txt        top functions by cumulative time, regex and
+                                pdfplumber/pdfminer time by calling function,
+                                peak traced memory and the top-N allocation sites
+
+Repeated runs of a stage (parse_pdf per PDF) accumulate into one session.
+Regex calls are C functions, so the sampled stacks charge them to the Python
+function that made them; the report lists them separately by caller, as it
+does for the pdfplumber/pdfminer calls entered from toolkit code. Profiling
+slows the run down considerably (cProfile and tracemalloc both hook every
+call/allocation), so use the metrics for timings and the profiles for shape.
+
+Usage:
+    python nerc_pipeline.py NERC-CIP --profile
+    python generate_oscal.py --profile /tmp/profiles
+    NERC_PROFILE_DIR=profiles python nerc_oscal.py generate --force
+"""
+
+import atexit
+import contextlib
+import cProfile
+import io
+import os
+import pstats
+import sys
+import sysconfig
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import nerc_metrics
+
+DEFAULT_DIR = 'profiles'
+PROFILE_DIR_ENV = 'NERC_PROFILE_DIR'
+DEFAULT_TOP = 15
+DEFAULT_INTERVAL = 0.005
+MAIN_SESSION = 'main'
+
+_SITE_DIRS = sorted({sysconfig.get_paths()[key] for key in ('purelib', 'platlib')}, key=len, reverse=True)
+_STDLIB_DIR = sysconfig.get_paths()['stdlib']
+
+PstatsKey = Tuple[str, int, str]
+
+# Allocations made by the profiler itself are left out of the reports
+_OWN_FILES = {tracemalloc.__file__, __file__, '<frozen importlib._bootstrap>', '<unknown>'}
+# Frames between instrumented code and the profiler
+_PLUMBING_FILES = {__file__, nerc_metrics.__file__, contextlib.__file__}
+
+
+def _short_path(filename: str) -> str:
+    """Path relative to site-packages or the stdlib, or the file name for toolkit modules."""
+    for base in _SITE_DIRS + [_STDLIB_DIR]:
+        if filename.startswith(base + os.sep):
+            return filename[len(base) + 1:].replace(os.sep, '/')
+    return os.path.basename(filename)
+
+
+def _label(key: PstatsKey) -> str:
+    filename, line, function = key
+    if filename == '~':
+        return function
+    return f"{_short_path(filename)}:{line}({function})"
+
+
+def _is_regex(key: PstatsKey) -> bool:
+    filename, _, function = key
+    if filename == '~':
+        return "'re.Pattern'" in function or "'_sre." in function or function.startswith('<built-in method _sre')
+    return _short_path(filename).startswith('re/')
+
+
+def _is_pdf_library(key: PstatsKey) -> bool:
+    return _short_path(key[0]).startswith(('pdfplumber/', 'pdfminer/', 'pypdfium2/'))
+
+
+# Report sections: time spent in a library, by the function that called into it
+CATEGORIES: Dict[str, Callable[[PstatsKey], bool]] = {
+    'Regex': _is_regex,
+    'pdfplumber/pdfminer': _is_pdf_library,
+}
+
+
+def attribute_calls(stats: pstats.Stats, in_category: Callable[[PstatsKey], bool],
+                    root: str = '(stage)') -> List[Tuple[str, str, int, float]]:
+    """
+    Cumulative time of calls into a category, by calling function.
+
+    Only calls entering the category from outside it are counted, so time
+    is not double-counted through the library's internal calls. cProfile
+    records no caller for calls made by frames that were already running when
+    the session was enabled; those are charged to root.
+
+    Args:
+        stats: Session stats
+        in_category: Predicate on pstats (file, line, function) keys
+        root: Label for calls without a recorded caller
+
+    Returns:
+        (caller, callee, calls, cumulative seconds), slowest first
+    """
+    edges: Dict[Tuple[str, str], List[float]] = {}
+    for callee, (_, total_calls, _, total_cumulative, callers) in stats.stats.items():
+        if not in_category(callee):
+            continue
+        root_calls = total_calls - sum(edge[1] for edge in callers.values())
+        if root_calls > 0:
+            edge = edges.setdefault((root, _label(callee)), [0, 0.0])
+            edge[0] += root_calls
+            edge[1] += max(0.0, total_cumulative - sum(edge[3] for edge in callers.values()))
+        for caller, (_, calls, _, cumulative) in callers.items():
+            # Builtins (len, sorted, ...) calling back into the library stay inside it
+            if in_category(caller) or caller[0] == '~':
+                continue
+            edge = edges.setdefault((_label(caller), _label(callee)), [0, 0.0])
+            edge[0] += calls
+            edge[1] += cumulative
+    return sorted(((caller, callee, int(calls), cumulative) for (caller, callee), (calls, cumulative) in edges.items()),
+                  key=lambda edge: edge[3], reverse=True)
+
+
+class _Session:
+    """Accumulated profile of one stage across its runs."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.profile = cProfile.Profile()
+        self.samples: Counter = Counter()
+        self.allocations: Dict[str, List[int]] = {}
+        self.peak = 0
+        self.runs = 0
+        self.entered_from = ''
+        self.wall = 0.0
+        self._resumed = 0.0
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+
+
+class Profiler:
+    """cProfile, stack sampling and tracemalloc per nerc_metrics stage, for one thread."""
+
+    def __init__(self, directory: Path = Path(DEFAULT_DIR), top: int = DEFAULT_TOP,
+                 interval: float = DEFAULT_INTERVAL, script: Optional[str] = None):
+        """
+        Args:
+            directory: Output directory (created)
+            top: Number of functions and allocation sites in the reports
+            interval: Stack sampling interval in seconds
+            script: Output file prefix (default: the running script's name)
+        """
+        self.directory = Path(directory)
+        self.top = top
+        self.interval = interval
+        self.script = script or nerc_metrics.script_name()
+        self.sessions: Dict[str, _Session] = {}
+        self.stack: List[_Session] = []
+        self.thread_id = threading.get_ident()
+        self._started_tracemalloc = False
+        self._switching = False
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+
+    # Sessions
+
+    def _session(self, name: str) -> _Session:
+        if name not in self.sessions:
+            self.sessions[name] = _Session(name)
+        session = self.sessions[name]
+        if not session.entered_from:
+            # The function whose 'with stage(...)' (or start_profiling call) opened the session
+            frame = sys._getframe(1)
+            while frame is not None and frame.f_code.co_filename in _PLUMBING_FILES:
+                frame = frame.f_back
+            if frame is not None:
+                code = frame.f_code
+                session.entered_from = f"{_short_path(code.co_filename)}:{code.co_firstlineno}({code.co_name})"
+        return session
+
+    def _resume(self, session: _Session):
+        tracemalloc.reset_peak()
+        session._snapshot = tracemalloc.take_snapshot()
+        session._resumed = time.perf_counter()
+        self._switching = False
+        session.profile.enable()
+
+    def _pause(self, session: _Session):
+        session.profile.disable()
+        self._switching = True
+        session.wall += time.perf_counter() - session._resumed
+        session.peak = max(session.peak, tracemalloc.get_traced_memory()[1])
+        snapshot = tracemalloc.take_snapshot()
+        # Filtering the grouped diffs is much cheaper than Snapshot.filter_traces on every trace
+        for diff in snapshot.compare_to(session._snapshot, 'lineno'):
+            frame = diff.traceback[0]
+            if not (diff.size_diff or diff.count_diff) or frame.filename in _OWN_FILES:
+                continue
+            entry = session.allocations.setdefault(f"{_short_path(frame.filename)}:{frame.lineno}", [0, 0])
+            entry[0] += diff.size_diff
+            entry[1] += diff.count_diff
+        session._snapshot = None
+
+    def start(self):
+        """Start the 'main' session, the sampler and stage tracking."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        main = self._session(MAIN_SESSION)
+        main.runs += 1
+        self.stack.append(main)
+        self._resume(main)
+        self._sampler = threading.Thread(target=self._sample, daemon=True)
+        self._sampler.start()
+        nerc_metrics.METRICS.stage_listeners.append(self)
+
+    def stage_started(self, name: str):
+        if threading.get_ident() != self.thread_id or not self.stack:
+            return
+        self._pause(self.stack[-1])
+        session = self._session(name)
+        session.runs += 1
+        self.stack.append(session)
+        self._resume(session)
+
+    def stage_finished(self, name: str):
+        if threading.get_ident() != self.thread_id or len(self.stack) < 2:
+            return
+        self._pause(self.stack.pop())
+        self._resume(self.stack[-1])
+
+    def stop(self) -> List[Path]:
+        """
+        Stop profiling and write the per-stage files.
+
+        Returns:
+            Paths written
+        """
+        if self in nerc_metrics.METRICS.stage_listeners:
+            nerc_metrics.METRICS.stage_listeners.remove(self)
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        while self.stack:
+            self._pause(self.stack.pop())
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        return self.write()
+
+    # Stack sampling
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            if self._switching:
+                continue
+            frame = sys._current_frames().get(self.thread_id)
+            try:
+                session = self.stack[-1]
+            except IndexError:
+                continue
+            frames = []
+            while frame is not None:
+                code = frame.f_code
+                frames.append(f"{_short_path(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            if frames:
+                session.samples[';'.join(reversed(frames))] += 1
+
+    # Output
+
+    def report(self, session: _Session) -> str:
+        """Text report for one session."""
+        out = io.StringIO()
+        out.write(f"Stage: {session.name} ({self.script}, {session.runs} run(s))\n")
+        out.write(f"Wall time (profiled): {session.wall:.3f}s   Peak traced memory: "
+                  f"{session.peak / 1024 / 1024:.1f} MiB   Samples: {sum(session.samples.values())}\n")
+
+        try:
+            stats = pstats.Stats(session.profile, stream=out)
+        except TypeError:
+            out.write("\nNo function calls recorded.\n")
+            stats = None
+        if stats is not None:
+            out.write(f"\nTop {self.top} functions by cumulative time:\n")
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+            for category, in_category in CATEGORIES.items():
+                edges = attribute_calls(stats, in_category, session.entered_from or '(stage)')
+                total = sum(edge[3] for edge in edges)
+                out.write(f"\n{category} time by caller ({total:.3f}s):\n")
+                for caller, callee, calls, cumulative in edges[:self.top]:
+                    out.write(f"  {cumulative:9.3f}s {calls:>9}  {caller} -> {callee}\n")
+                if not edges:
+                    out.write("  (none)\n")
+
+        out.write(f"\nTop {self.top} allocation sites (retained during the stage, excluding nested stages):\n")
+        sites = sorted(session.allocations.items(), key=lambda item: item[1][0], reverse=True)[:self.top]
+        for site, (size, blocks) in sites:
+            out.write(f"  {size / 1024:12.1f} KiB {blocks:>+10} blocks  {site}\n")
+        if not sites:
+            out.write("  (none)\n")
+        return out.getvalue()
+
+    def write(self) -> List[Path]:
+        """Write .prof, .collapsed and .txt files for every session."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        written = []
+        for name, session in self.sessions.items():
+            prefix = self.directory / f"{self.script}.{name}"
+            prof = prefix.with_name(prefix.name + '.prof')
+            try:
+                session.profile.dump_stats(str(prof))
+                written.append(prof)
+            except TypeError:
+                pass  # nothing was recorded
+            collapsed = prefix.with_name(prefix.name + '.collapsed')
+            collapsed.write_text(''.join(f"{stack} {samples}\n" for stack, samples in session.samples.most_common()),
+                                 encoding='utf-8')
+            report = prefix.with_name(prefix.name + '.txt')
+            report.write_text(self.report(session), encoding='utf-8')
+            written += [collapsed, report]
+        return written
+
+
+_PROFILER: Optional[Profiler] = None
+
+
+def start_profiling(directory, top: int = DEFAULT_TOP) -> Optional[Profiler]:
+    """
+    Profile the rest of this run into directory; files are written at exit.
+
+    Args:
+        directory: Output directory, or None/'' to do nothing
+
+    Returns:
+        The active Profiler, or None if profiling is off
+    """
+    global _PROFILER
+    if not directory or _PROFILER is not None:
+        return _PROFILER
+    _PROFILER = Profiler(Path(directory), top)
+    _PROFILER.start()
+    atexit.register(_finish)
+    print(f"[*] Profiling to {_PROFILER.directory}/ (slower than a normal run)", file=sys.stderr)
+    return _PROFILER
+
+
+def _finish():
+    global _PROFILER
+    profiler, _PROFILER = _PROFILER, None
+    if profiler is None:
+        return
+    try:
+        written = profiler.stop()
+    except OSError as e:
+        print(f"[WARN] Could not write profiles to {profiler.directory}: {e}", file=sys.stderr)
+        return
+    stages = ', '.join(sorted(profiler.sessions))
+    print(f"[*] Profile written to {profiler.directory}/ ({len(written)} file(s); stages: {stages})",
+          file=sys.stderr)
+
+
+def add_profile_argument(parser):
+    """Add --profile [DIR] to an argparse parser."""
+    parser.add_argument('--profile', nargs='?', const=DEFAULT_DIR, default=os.environ.get(PROFILE_DIR_ENV),
+                        metavar='DIR',
+                        help=f'Write cProfile, flamegraph stacks and memory reports per stage to DIR '
+                             f'(default: {DEFAULT_DIR}; also ${PROFILE_DIR_ENV})')
+
+
+def profile_from_argv(argv: List[str]) -> Optional[str]:
+    """
+    Remove --profile [DIR] / --profile=DIR from a raw argument list (for scripts without argparse).
+
+    A following argument is taken as DIR unless it starts with '-' or names an
+    existing file.
+
+    Returns:
+        Profile directory, NERC_PROFILE_DIR, or None
+    """
+    directory = os.environ.get(PROFILE_DIR_ENV)
+    for index, arg in enumerate(argv):
+        if arg.startswith('--profile='):
+            del argv[index]
+            return arg.split('=', 1)[1] or DEFAULT_DIR
+        if arg == '--profile':
+            value = argv[index + 1] if index + 1 < len(argv) else None
+            if value is not None and not value.startswith('-') and not Path(value).is_file():
+                del argv[index:index + 2]
+                return value
+            del argv[index]
+            return DEFAULT_DIR
+    return directory
@@ -0,0 +1,530 @@
+"""
+Full-text search over NERC CIP requirements and NIST SP 800-53 controls.
+
+Builds an inverted index with BM25 ranking over:
+- NERC requirement statements (parsed by generate_oscal.parse_nerc_standards,
+  or read from a generated OSCAL catalog such as nerc-oscal.json)
+- NIST SP 800-53 R5 control descriptions (nist_controls)
+
+The index is persisted as JSON, postings and document lengths included, so a
+query loads it without re-tokenizing the corpus. It is updated incrementally:
+each NERC standard (and the NIST catalog) is tracked with a content hash, so
+re-running the build only re-indexes standards whose text changed.
+
+Usage:
+    python nerc_search.py build
+    python nerc_search.py build --input nerc-oscal.json
+    python nerc_search.py query "Interactive Remote Access"
+    python nerc_search.py query patch --kind nist --top 5
+    python nerc_search.py query '"Interactive Remote Access"'    # exact phrase
+
+Library usage:
+    index = SearchIndex.load(Path('nerc-search-index.json'))
+    for hit in index.search('interactive remote access', kind='nerc'):
+        print(hit['id'], hit['score'])
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from nerc_profile import add_profile_argument, start_profiling
+
+INPUT_FILE = "nerc_all_combined.txt"
+INDEX_FILE = "nerc-search-index.json"
+INDEX_FORMAT_VERSION = 2
+
+# Document kinds
+KIND_NERC = 'nerc'
+KIND_NIST = 'nist'
+
+# Standard key under which NIST controls are indexed
+NIST_STANDARD = 'NIST-SP-800-53-R5'
+
+# BM25 parameters (standard Robertson/Sparck Jones defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+STOP_WORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or that the this to was were will with
+""".split())
+
+
+def _stem(token: str) -> str:
+    """Reduce simple English plurals so 'patches' matches 'patch'."""
+    if len(token) <= 3 or token.isdigit():
+        return token
+    if token.endswith('ies') and len(token) > 4:
+        return token[:-3] + 'y'
+    if token.endswith(('ches', 'shes', 'sses', 'xes')):
+        return token[:-2]
+    if token.endswith('s') and not token.endswith(('ss', 'us', 'is')):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into normalized search terms.
+
+    Args:
+        text: Free text (requirement prose, control title, query)
+
+    Returns:
+        Lower-cased, plural-stripped tokens with stop words removed
+    """
+    return [_stem(t) for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOP_WORDS]
+
+
+def _normalize_phrase(text: str) -> str:
+    """Collapse whitespace and case for exact-phrase matching."""
+    return ' '.join(text.lower().split())
+
+
+def _content_hash(documents: List[dict]) -> str:
+    """Hash a standard's documents to detect changes between builds."""
+    digest = hashlib.sha256()
+    for doc in documents:
+        digest.update(json.dumps([doc['id'], doc['text']]).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def documents_from_standards(standards: Dict[str, dict]) -> Dict[str, List[dict]]:
+    """
+    Turn parse_nerc_standards output into search documents grouped by standard.
+
+    Args:
+        standards: Result of generate_oscal.parse_nerc_standards
+
+    Returns:
+        Dictionary mapping standard ID (e.g., 'CIP-005-8') to documents with
+        keys id (e.g., 'CIP-005-8 R1'), kind and text
+    """
+    grouped = {}
+    for std in standards.values():
+        grouped[std['id']] = [
+            {'id': f"{std['id']} {req['id']}", 'kind': KIND_NERC, 'text': req['text']}
+            for req in std['requirements']
+        ]
+    return grouped
+
+
+def documents_from_catalog(catalog_data: dict) -> Dict[str, List[dict]]:
+    """
+    Turn a generated OSCAL catalog (nerc-oscal.json) into search documents.
+
+    Args:
+        catalog_data: Parsed OSCAL catalog
+
+    Returns:
+        Dictionary mapping standard ID to requirement documents
+    """
+    grouped = {}
+    for group in catalog_data.get('catalog', {}).get('groups', []):
+        docs = []
+        for control in group.get('controls', []):
+            if control.get('class') != 'requirement':
+                continue
+            parts = control.get('parts', [])
+            prose = parts[0].get('prose', '') if parts and isinstance(parts[0], dict) else ''
+            docs.append({'id': control.get('title', control.get('id', '')), 'kind': KIND_NERC, 'text': prose})
+        grouped[group.get('id', '').upper()] = docs
+    return grouped
+
+
+def documents_from_nist_controls(controls: Optional[Dict[str, str]] = None) -> List[dict]:
+    """
+    Turn the NIST control catalog into search documents.
+
+    Args:
+        controls: Control ID -> description (default: NIST_SP_800_53_R5_CONTROLS)
+
+    Returns:
+        Documents with keys id (e.g., 'AC-2'), kind and text
+    """
+    if controls is None:
+        from nist_controls import NIST_SP_800_53_R5_CONTROLS
+        controls = NIST_SP_800_53_R5_CONTROLS
+    return [{'id': cid, 'kind': KIND_NIST, 'text': desc} for cid, desc in controls.items()]
+
+
+class SearchIndex:
+    """
+    Inverted index with BM25 scoring and per-standard incremental updates.
+
+    Documents live in numbered slots; postings map each term to {slot: term
+    frequency}. Replacing a standard frees its slots and removes them from the
+    postings of the terms they contained, so the rest of the index is untouched.
+    """
+
+    def __init__(self):
+        self.docs: List[Optional[dict]] = []        # slot -> {id, kind, standard, text, length}
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.standards: Dict[str, dict] = {}        # standard -> {hash, slots}
+        self.total_length = 0
+        self.doc_count = 0
+        self._free_slots: List[int] = []
+
+    def __len__(self) -> int:
+        return self.doc_count
+
+    def _add_document(self, standard: str, doc: dict) -> int:
+        """Index one document and return its slot."""
+        terms = tokenize(doc['text'])
+        slot = self._free_slots.pop() if self._free_slots else len(self.docs)
+        entry = {
+            'id': doc['id'],
+            'kind': doc.get('kind', KIND_NERC),
+            'standard': standard,
+            'text': doc['text'],
+            'length': len(terms),
+        }
+        if slot == len(self.docs):
+            self.docs.append(entry)
+        else:
+            self.docs[slot] = entry
+
+        frequencies: Dict[str, int] = {}
+        for term in terms:
+            frequencies[term] = frequencies.get(term, 0) + 1
+        for term, tf in frequencies.items():
+            self.postings.setdefault(term, {})[slot] = tf
+
+        self.total_length += len(terms)
+        self.doc_count += 1
+        return slot
+
+    def remove_standard(self, standard: str) -> int:
+        """
+        Remove all documents of a standard from the index.
+
+        Args:
+            standard: Standard key (e.g., 'CIP-005-8')
+
+        Returns:
+            Number of documents removed
+        """
+        info = self.standards.pop(standard, None)
+        if not info:
+            return 0
+
+        for slot in info['slots']:
+            entry = self.docs[slot]
+            for term in set(tokenize(entry['text'])):
+                posting = self.postings.get(term)
+                if posting is not None:
+                    posting.pop(slot, None)
+                    if not posting:
+                        del self.postings[term]
+            self.total_length -= entry['length']
+            self.doc_count -= 1
+            self.docs[slot] = None
+            self._free_slots.append(slot)
+
+        return len(info['slots'])
+
+    def update_standard(self, standard: str, documents: List[dict]) -> bool:
+        """
+        Replace a standard's documents if their content changed.
+
+        Args:
+            standard: Standard key (e.g., 'CIP-005-8' or NIST_STANDARD)
+            documents: Documents with keys id, kind, text
+
+        Returns:
+            True if the standard was (re-)indexed, False if it was unchanged
+        """
+        content_hash = _content_hash(documents)
+        current = self.standards.get(standard)
+        if current and current['hash'] == content_hash:
+            return False
+
+        self.remove_standard(standard)
+        slots = [self._add_document(standard, doc) for doc in documents]
+        self.standards[standard] = {'hash': content_hash, 'slots': slots}
+        return True
+
+    def sync(self, grouped_documents: Dict[str, List[dict]], kind: str = KIND_NERC) -> Dict[str, List[str]]:
+        """
+        Bring all standards of one kind in line with a fresh set of documents.
+
+        Standards of that kind missing from grouped_documents (e.g. superseded
+        versions) or left without documents are removed; the others are
+        updated if their content changed.
+
+        Args:
+            grouped_documents: Standard key -> documents
+            kind: Document kind being synchronized
+
+        Returns:
+            Dictionary with 'updated', 'unchanged' and 'removed' standard keys
+        """
+        summary = {'updated': [], 'unchanged': [], 'removed': []}
+        grouped_documents = {standard: documents for standard, documents in grouped_documents.items() if documents}
+
+        for standard in list(self.standards):
+            slots = self.standards[standard]['slots']
+            if standard in grouped_documents:
+                continue
+            # A standard without slots has no kind left to check; it holds nothing either way
+            if not slots or self.docs[slots[0]]['kind'] == kind:
+                self.remove_standard(standard)
+                summary['removed'].append(standard)
+
+        for standard, documents in grouped_documents.items():
+            changed = self.update_standard(standard, documents)
+            summary['updated' if changed else 'unchanged'].append(standard)
+
+        return summary
+
+    def search(self, query: str, kind: Optional[str] = None, top_k: int = 10) -> List[dict]:
+        """
+        Rank documents against a query with BM25.
+
+        A query wrapped in double quotes only matches documents containing the
+        exact phrase (case- and whitespace-insensitive).
+
+        Args:
+            query: Free-text query, or "exact phrase" in double quotes
+            kind: Restrict to 'nerc' or 'nist' documents
+            top_k: Maximum number of hits
+
+        Returns:
+            Hits sorted by descending score, with keys id, kind, standard, score, text
+        """
+        query = query.strip()
+        phrase = None
+        if len(query) > 1 and query.startswith('"') and query.endswith('"'):
+            phrase = _normalize_phrase(query[1:-1])
+
+        terms = set(tokenize(query))
+        if not terms or self.doc_count == 0:
+            return []
+
+        average_length = self.total_length / self.doc_count
+        scores: Dict[int, float] = {}
+
+        for term in terms:
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            df = len(posting)
+            idf = math.log(1 + (self.doc_count - df + 0.5) / (df + 0.5))
+            for slot, tf in posting.items():
+                length = self.docs[slot]['length']
+                norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+                scores[slot] = scores.get(slot, 0.0) + idf * tf * (BM25_K1 + 1) / norm
+
+        hits = []
+        for slot, score in sorted(scores.items(), key=lambda item: (-item[1], item[0])):
+            entry = self.docs[slot]
+            if kind and entry['kind'] != kind:
+                continue
+            if phrase and phrase not in _normalize_phrase(entry['text']):
+                continue
+            hits.append({
+                'id': entry['id'],
+                'kind': entry['kind'],
+                'standard': entry['standard'],
+                'score': round(score, 4),
+                'text': entry['text'],
+            })
+            if len(hits) >= top_k:
+                break
+
+        return hits
+
+    def to_dict(self) -> dict:
+        """
+        Serialize the index, postings included.
+
+        Postings are stored as flat [slot, tf, slot, tf, ...] lists (JSON keys
+        can only be strings); freed slots are stored as null documents.
+        """
+        return {
+            'format': INDEX_FORMAT_VERSION,
+            'docs': self.docs,
+            'postings': {
+                term: [value for slot, tf in posting.items() for value in (slot, tf)]
+                for term, posting in self.postings.items()
+            },
+            'standards': self.standards,
+            'total_length': self.total_length,
+            'doc_count': self.doc_count,
+            'avgdl': self.total_length / self.doc_count if self.doc_count else 0.0,
+        }
+
+    def save(self, index_file: Path):
+        """
+        Write the index to disk.
+
+        Args:
+            index_file: Output JSON path
+        """
+        index_file = Path(index_file)
+        tmp_file = index_file.with_name(index_file.name + '.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, separators=(',', ':'))
+        tmp_file.replace(index_file)
+
+    @classmethod
+    def load(cls, index_file: Path) -> 'SearchIndex':
+        """
+        Load an index written by save().
+
+        Args:
+            index_file: Index JSON path
+
+        Returns:
+            SearchIndex
+
+        Raises:
+            FileNotFoundError: If the index doesn't exist
+            ValueError: If the file has an unsupported format
+        """
+        index_file = Path(index_file)
+        if not index_file.exists():
+            raise FileNotFoundError(f"Search index not found: {index_file} (run: python nerc_search.py build)")
+
+        with open(index_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('format') != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported search index format in {index_file}; rebuild with --rebuild")
+
+        index = cls()
+        index.docs = data['docs']
+        index.postings = {
+            term: dict(zip(flat[::2], flat[1::2])) for term, flat in data['postings'].items()
+        }
+        index.standards = data['standards']
+        index.total_length = data['total_length']
+        index.doc_count = data['doc_count']
+        index._free_slots = [slot for slot, entry in enumerate(index.docs) if entry is None]
+        return index
+
+
+def build_index(standards: Dict[str, dict], index: Optional[SearchIndex] = None,
+                nist_controls: Optional[Dict[str, str]] = None) -> Tuple[SearchIndex, Dict[str, List[str]]]:
+    """
+    Build (or incrementally update) a search index from parsed NERC standards.
+
+    Args:
+        standards: Result of generate_oscal.parse_nerc_standards
+        index: Existing index to update (default: new index)
+        nist_controls: Control ID -> description (default: NIST_SP_800_53_R5_CONTROLS)
+
+    Returns:
+        Tuple of (updated SearchIndex, summary of 'updated', 'unchanged' and
+        'removed' standard keys)
+    """
+    return index_documents(documents_from_standards(standards), index, nist_controls)
+
+
+def index_documents(grouped_documents: Dict[str, List[dict]], index: Optional[SearchIndex] = None,
+                    nist_controls: Optional[Dict[str, str]] = None) -> Tuple[SearchIndex, Dict[str, List[str]]]:
+    """
+    Sync NERC documents grouped by standard (documents_from_standards or
+    documents_from_catalog) plus the NIST controls into an index.
+
+    Returns:
+        Same as build_index
+    """
+    index = index or SearchIndex()
+    summary = index.sync(grouped_documents, kind=KIND_NERC)
+    if index.update_standard(NIST_STANDARD, documents_from_nist_controls(nist_controls)):
+        summary['updated'].append(NIST_STANDARD)
+    else:
+        summary['unchanged'].append(NIST_STANDARD)
+    return index, summary
+
+
+def _snippet(text: str, width: int = 100) -> str:
+    """Shorten text for one-line display."""
+    text = ' '.join(text.split())
+    return text if len(text) <= width else text[:width - 3] + '...'
+
+
+def main():
+    """Command-line interface for building and querying the search index."""
+    parser = argparse.ArgumentParser(
+        description='Full-text search over NERC CIP requirements and NIST SP 800-53 controls',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s build
+  %(prog)s build --input nerc_all_combined.txt --rebuild
+  %(prog)s build --input nerc-oscal.json
+  %(prog)s query "Interactive Remote Access" --kind nerc
+  %(prog)s query patch --kind nist --top 5
+        """
+    )
+    parser.add_argument('--index', type=Path, default=Path(INDEX_FILE),
+                        help=f'Search index path (default: {INDEX_FILE})')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build = subparsers.add_parser('build', help='Build or incrementally update the index')
+    build.add_argument('--input', type=Path, default=Path(INPUT_FILE),
+                       help=f'Combined NERC text, or a generated OSCAL catalog (.json) (default: {INPUT_FILE})')
+    build.add_argument('--rebuild', action='store_true', help='Ignore the existing index')
+
+    query = subparsers.add_parser('query', help='Search the index')
+    query.add_argument('text', help='Query text; wrap in double quotes for an exact phrase')
+    query.add_argument('--kind', choices=[KIND_NERC, KIND_NIST], default=None, help='Restrict results')
+    query.add_argument('--top', type=int, default=10, help='Number of results (default: 10)')
+    query.add_argument('--json', action='store_true', help='Print hits as JSON')
+
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    start_profiling(args.profile)
+
+    try:
+        if args.command == 'build':
+            from generate_oscal import parse_nerc_standards
+
+            index = None
+            if args.index.exists() and not args.rebuild:
+                index = SearchIndex.load(args.index)
+
+            with open(args.input, 'r', encoding='utf-8') as f:
+                if args.input.suffix.lower() == '.json':
+                    documents = documents_from_catalog(json.load(f))
+                else:
+                    documents = documents_from_standards(parse_nerc_standards(f.read()))
+
+            index, summary = index_documents(documents, index)
+            index.save(args.index)
+            print(f"[OK] Indexed {len(index)} documents to {args.index} "
+                  f"({len(summary['updated'])} updated, {len(summary['unchanged'])} unchanged, "
+                  f"{len(summary['removed'])} removed)")
+            return
+
+        index = SearchIndex.load(args.index)
+        started = time.perf_counter()
+        hits = index.search(args.text, kind=args.kind, top_k=args.top)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        if args.json:
+            print(json.dumps(hits, indent=2))
+            return
+
+        for hit in hits:
+            print(f"{hit['score']:8.3f}  {hit['id']:<16} {_snippet(hit['text'])}")
+        print(f"[*] {len(hits)} hit(s) in {elapsed_ms:.3f} ms")
+
+    except FileNotFoundError as e:
+        print(f"[ERR] Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"[ERR] Validation error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,554 @@
+"""
+SQLite store for NERC CIP standards, requirements and NIST mappings.
+
+Instead of re-reading nerc_all_combined.txt, nerc-oscal.json and the
+NERC_NIST_MAP literal for every question, the pipeline loads them once into a
+local SQLite database:
+
+    standards          one row per CIP family, with its current version
+    versions           every parsed version of a standard (title, purpose)
+    requirements       requirement statements per version, in document order
+    requirement_parts  table-row parts (Part, Applicable Systems, Requirements,
+                       Measures) from nerc_pdf_parser.py, when loaded
+    nist_mappings      primary/secondary NIST SP 800-53 controls per requirement
+    statuses           Implementation-Status per requirement (kept across reloads)
+    prose              FTS5 index over purposes, requirement text and parts
+
+Loads run as one transaction with executemany, and lookups are indexed
+(requirements by version, mappings by control), so coverage questions answer
+in milliseconds. The OSCAL catalog (via generate_oscal) and the JAMA CSV can
+be emitted straight from SQL queries.
+
+Usage:
+    python nerc_store.py build
+    python nerc_store.py coverage
+    python nerc_store.py control SC-7
+    python nerc_store.py search "interactive remote access"
+    python nerc_store.py sql "SELECT family, current_version FROM standards"
+    python nerc_store.py export --csv nerc-oscal.csv --oscal nerc-oscal.json
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import time
+import uuid
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from generate_oscal import NERC_NIST_MAP, generate_oscal_catalog, parse_all_standard_versions
+from nerc_profile import add_profile_argument, start_profiling
+
+INPUT_FILE = "nerc_all_combined.txt"
+DB_FILE = "nerc-oscal.db"
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS standards (
+    family TEXT PRIMARY KEY,
+    code TEXT NOT NULL,
+    current_version TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS versions (
+    cip_id TEXT PRIMARY KEY,
+    family TEXT NOT NULL REFERENCES standards(family),
+    version REAL NOT NULL,
+    version_string TEXT NOT NULL,
+    title TEXT NOT NULL,
+    purpose TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS versions_family ON versions(family, version);
+
+CREATE TABLE IF NOT EXISTS requirements (
+    id INTEGER PRIMARY KEY,
+    cip_id TEXT NOT NULL REFERENCES versions(cip_id),
+    position INTEGER NOT NULL,
+    req_id TEXT NOT NULL,
+    text TEXT NOT NULL,
+    UNIQUE (cip_id, position)
+);
+CREATE INDEX IF NOT EXISTS requirements_req ON requirements(cip_id, req_id);
+
+CREATE TABLE IF NOT EXISTS requirement_parts (
+    id INTEGER PRIMARY KEY,
+    cip_id TEXT NOT NULL,
+    req_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    part TEXT NOT NULL,
+    applicable_systems TEXT NOT NULL,
+    requirements TEXT NOT NULL,
+    measures TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS requirement_parts_req ON requirement_parts(cip_id, req_id, position);
+
+CREATE TABLE IF NOT EXISTS nist_mappings (
+    cip_id TEXT NOT NULL,
+    req_id TEXT NOT NULL,
+    role TEXT NOT NULL CHECK (role IN ('primary', 'secondary')),
+    position INTEGER NOT NULL,
+    control TEXT NOT NULL,
+    PRIMARY KEY (cip_id, req_id, role, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS nist_mappings_control ON nist_mappings(control);
+
+CREATE TABLE IF NOT EXISTS statuses (
+    cip_id TEXT NOT NULL,
+    req_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    updated TEXT NOT NULL,
+    PRIMARY KEY (cip_id, req_id)
+) WITHOUT ROWID;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS prose USING fts5(
+    text, kind UNINDEXED, cip_id UNINDEXED, ref UNINDEXED, tokenize = 'porter unicode61'
+);
+"""
+
+# Prose kinds in the FTS index
+PROSE_PURPOSE = 'purpose'
+PROSE_REQUIREMENT = 'requirement'
+PROSE_PART = 'part'
+
+# Requirements of current versions with their mappings and status, in catalog order
+CURRENT_REQUIREMENTS_SQL = """
+SELECT v.cip_id, r.req_id, r.text,
+       (SELECT control FROM nist_mappings m
+         WHERE m.cip_id = r.cip_id AND m.req_id = r.req_id AND m.role = 'primary') AS primary_control,
+       (SELECT group_concat(control, ', ') FROM (
+            SELECT control FROM nist_mappings m
+             WHERE m.cip_id = r.cip_id AND m.req_id = r.req_id AND m.role = 'secondary'
+             ORDER BY m.position)) AS secondary_controls,
+       s.status
+  FROM standards st
+  JOIN versions v ON v.cip_id = st.current_version
+  JOIN requirements r ON r.cip_id = v.cip_id
+  LEFT JOIN statuses s ON s.cip_id = r.cip_id AND s.req_id = r.req_id
+ ORDER BY st.family, r.position
+"""
+
+COVERAGE_SQL = """
+SELECT st.family, v.cip_id,
+       count(r.id) AS requirements,
+       count(r.id) FILTER (WHERE EXISTS (
+           SELECT 1 FROM nist_mappings m
+            WHERE m.cip_id = r.cip_id AND m.req_id = r.req_id AND m.role = 'primary')) AS mapped,
+       count(s.status) FILTER (WHERE s.status = 'Implemented') AS implemented
+  FROM standards st
+  JOIN versions v ON v.cip_id = st.current_version
+  LEFT JOIN requirements r ON r.cip_id = v.cip_id
+  LEFT JOIN statuses s ON s.cip_id = r.cip_id AND s.req_id = r.req_id
+ GROUP BY st.family
+ ORDER BY st.family
+"""
+
+
+def connect(db_file: Union[Path, str] = DB_FILE) -> sqlite3.Connection:
+    """
+    Open (and create or migrate) the store.
+
+    Raises:
+        ValueError: If the database was written by a newer schema version
+    """
+    conn = sqlite3.connect(str(db_file))
+    conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA foreign_keys = ON')
+    conn.execute('PRAGMA journal_mode = WAL')
+    conn.execute('PRAGMA synchronous = NORMAL')
+    version = conn.execute('PRAGMA user_version').fetchone()[0]
+    if version > SCHEMA_VERSION:
+        conn.close()
+        raise ValueError(f"Unsupported store schema version in {db_file}: {version}")
+    if version < SCHEMA_VERSION:
+        with conn:
+            conn.executescript(SCHEMA)
+            conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+    return conn
+
+
+def connect_readonly(db_file: Union[Path, str] = DB_FILE) -> sqlite3.Connection:
+    """
+    Open an existing store read-only, for ad-hoc queries (nothing is created or migrated).
+
+    Raises:
+        FileNotFoundError: If the store doesn't exist
+    """
+    db_file = Path(db_file)
+    if not db_file.exists():
+        raise FileNotFoundError(f"Store not found: {db_file} (run 'nerc_store.py build' first)")
+    conn = sqlite3.connect(f"{db_file.resolve().as_uri()}?mode=ro", uri=True)
+    conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA query_only = ON')
+    return conn
+
+
+def run_sql(conn: sqlite3.Connection, query: str) -> sqlite3.Cursor:
+    """
+    Run one ad-hoc SQL statement (on a connect_readonly() connection).
+
+    Raises:
+        ValueError: On SQL errors, including any attempt to write
+    """
+    try:
+        return conn.execute(query)
+    except sqlite3.Error as e:
+        if 'readonly' in str(e):
+            raise ValueError(f"SQL error: {e} (ad-hoc queries are read-only)")
+        raise ValueError(f"SQL error: {e}")
+
+
+def _split_controls(value: str) -> List[str]:
+    return [control.strip().upper() for control in value.split(',') if control.strip()]
+
+
+def populate(conn: sqlite3.Connection, text: str,
+             nist_map: Optional[Dict[str, dict]] = None) -> Dict[str, int]:
+    """
+    Replace standards, versions, requirements and mappings from combined text.
+
+    Everything is written in one transaction; statuses and table-row parts are
+    kept (they are keyed by CIP id and requirement, not by row id).
+
+    Args:
+        conn: Store connection
+        text: Combined NERC text ("--- START DOCUMENT:" sections)
+        nist_map: Mappings in NERC_NIST_MAP form (default: NERC_NIST_MAP)
+
+    Returns:
+        Row counts: standards, versions, requirements, mappings
+    """
+    if nist_map is None:
+        nist_map = NERC_NIST_MAP
+
+    versions = {}
+    current = {}
+    for std in parse_all_standard_versions(text):
+        # The first parsed copy of a version wins, like parse_nerc_standards
+        versions.setdefault(std['id'], std)
+        best = current.get(std['family'])
+        if best is None or std['version'] > best['version']:
+            current[std['family']] = std
+
+    mappings = []
+    for key, mapping in nist_map.items():
+        cip_id, req_id = key.split(':', 1)
+        if mapping.get('primary'):
+            mappings.append((cip_id, req_id, 'primary', 0, mapping['primary'].strip().upper()))
+        for position, control in enumerate(_split_controls(mapping.get('secondary') or '')):
+            mappings.append((cip_id, req_id, 'secondary', position, control))
+
+    requirements = [(std['id'], position, req['id'], req['text'])
+                    for std in versions.values() for position, req in enumerate(std['requirements'])]
+
+    with conn:
+        conn.execute("DELETE FROM prose WHERE kind IN (?, ?)", (PROSE_PURPOSE, PROSE_REQUIREMENT))
+        conn.execute("DELETE FROM requirements")
+        conn.execute("DELETE FROM versions")
+        conn.execute("DELETE FROM standards")
+        conn.execute("DELETE FROM nist_mappings")
+        conn.executemany("INSERT INTO standards VALUES (?, ?, ?)",
+                         [(family, f"CIP-{family}", std['id']) for family, std in current.items()])
+        conn.executemany("INSERT INTO versions VALUES (?, ?, ?, ?, ?, ?)",
+                         [(std['id'], std['family'], std['version'], std['original_version_string'],
+                           std['title'], std['purpose']) for std in versions.values()])
+        conn.executemany("INSERT INTO requirements (cip_id, position, req_id, text) VALUES (?, ?, ?, ?)",
+                         requirements)
+        conn.executemany("INSERT INTO nist_mappings VALUES (?, ?, ?, ?, ?)", mappings)
+        conn.executemany("INSERT INTO prose (text, kind, cip_id, ref) VALUES (?, ?, ?, ?)",
+                         [(std['purpose'], PROSE_PURPOSE, std['id'], '') for std in versions.values()]
+                         + [(text, PROSE_REQUIREMENT, cip_id, req_id)
+                            for cip_id, _, req_id, text in requirements])
+
+    return {
+        'standards': len(current),
+        'versions': len(versions),
+        'requirements': len(requirements),
+        'mappings': len(mappings),
+    }
+
+
+def load_table_rows(conn: sqlite3.Connection, parsed_requirements: Iterable[dict]) -> int:
+    """
+    Store requirement table rows from nerc_pdf_parser.NERECPDFParser.parse_pdf.
+
+    Existing parts of the same requirements are replaced, in one transaction.
+
+    Args:
+        conn: Store connection
+        parsed_requirements: Dicts with control_id ('CIP-005-7 R1') and table_rows
+
+    Returns:
+        Number of parts stored
+    """
+    parts = []
+    replaced = set()
+    for requirement in parsed_requirements:
+        cip_id, req_id = requirement['control_id'].split()
+        replaced.add((cip_id, req_id))
+        for position, row in enumerate(requirement.get('table_rows', [])):
+            parts.append((cip_id, req_id, position, row.get('part', ''), row.get('applicable_systems', ''),
+                          row.get('requirements', ''), row.get('measures', '')))
+
+    with conn:
+        for cip_id, req_id in replaced:
+            conn.execute("DELETE FROM requirement_parts WHERE cip_id = ? AND req_id = ?", (cip_id, req_id))
+            conn.execute("DELETE FROM prose WHERE kind = ? AND cip_id = ? AND ref LIKE ?",
+                         (PROSE_PART, cip_id, f"{req_id}.%"))
+        conn.executemany("INSERT INTO requirement_parts (cip_id, req_id, position, part, applicable_systems, "
+                         "requirements, measures) VALUES (?, ?, ?, ?, ?, ?, ?)", parts)
+        conn.executemany("INSERT INTO prose (text, kind, cip_id, ref) VALUES (?, ?, ?, ?)",
+                         [(f"{part[5]} {part[6]}".strip(), PROSE_PART, part[0], f"{part[1]}.{part[3]}")
+                          for part in parts])
+    return len(parts)
+
+
+def set_statuses(conn: sqlite3.Connection, statuses: Dict[Tuple[str, str], str]) -> int:
+    """
+    Record Implementation-Status values, e.g. {('CIP-005-8', 'R1'): 'Implemented'}.
+
+    Returns:
+        Number of statuses written
+    """
+    updated = datetime.now().isoformat(timespec='seconds')
+    with conn:
+        conn.executemany("INSERT OR REPLACE INTO statuses VALUES (?, ?, ?, ?)",
+                         [(cip_id, req_id, status, updated) for (cip_id, req_id), status in statuses.items()])
+    return len(statuses)
+
+
+def current_standards(conn: sqlite3.Connection) -> Dict[str, dict]:
+    """Current version of every standard in generate_oscal.parse_nerc_standards form."""
+    standards = {}
+    for row in conn.execute("SELECT v.* FROM standards st JOIN versions v ON v.cip_id = st.current_version"):
+        standards[row['family']] = {
+            'id': row['cip_id'],
+            'family': row['family'],
+            'version': row['version'],
+            'original_version_string': row['version_string'],
+            'title': row['title'],
+            'purpose': row['purpose'],
+            'requirements': [],
+        }
+    by_id = {std['id']: std for std in standards.values()}
+    for row in conn.execute("SELECT r.cip_id, r.req_id, r.text FROM standards st "
+                            "JOIN requirements r ON r.cip_id = st.current_version ORDER BY r.cip_id, r.position"):
+        by_id[row['cip_id']]['requirements'].append({'id': row['req_id'], 'text': row['text']})
+    return standards
+
+
+def nist_map(conn: sqlite3.Connection) -> Dict[str, dict]:
+    """Stored mappings in NERC_NIST_MAP form ('CIP-005-8:R1' -> primary/secondary)."""
+    mapping = {}
+    for row in conn.execute("SELECT * FROM nist_mappings ORDER BY cip_id, req_id, role, position"):
+        entry = mapping.setdefault(f"{row['cip_id']}:{row['req_id']}", {'primary': '', 'secondary': ''})
+        if row['role'] == 'primary':
+            entry['primary'] = row['control']
+        else:
+            entry['secondary'] = f"{entry['secondary']}, {row['control']}" if entry['secondary'] else row['control']
+    return mapping
+
+
+def generate_catalog(conn: sqlite3.Connection) -> dict:
+    """
+    Build the OSCAL catalog from the store with generate_oscal.
+
+    Stored statuses are added as Implementation-Status props.
+    """
+    catalog = generate_oscal_catalog(current_standards(conn), nist_map(conn))
+    statuses = {f"{row['cip_id']}-{row['req_id']}".lower(): row['status']
+                for row in conn.execute("SELECT cip_id, req_id, status FROM statuses")}
+    for group in catalog['catalog']['groups']:
+        for control in group['controls']:
+            if control['id'] in statuses:
+                control['props'].append({'name': 'Implementation-Status', 'value': statuses[control['id']]})
+    return catalog
+
+
+def iter_jama_rows(conn: sqlite3.Connection, format_type: str = 'standard') -> Iterator[Dict[str, str]]:
+    """
+    Yield JAMA CSV rows straight from one SQL query (no catalog is built).
+
+    Rows match what oscal_to_jama_csv exports from generate_catalog(conn).
+
+    Args:
+        conn: Store connection
+        format_type: CSV format ('standard' or 'detailed')
+    """
+    for row in conn.execute(CURRENT_REQUIREMENTS_SQL):
+        jama_row = {
+            'JAMA-Requirement-ID': f"{row['cip_id'].rsplit('-', 1)[0]}-{row['req_id']}",
+            'NERC-Requirement-ID': f"{row['cip_id']} {row['req_id']}",
+            'NIST-Primary-Control': row['primary_control'] or '',
+            'NIST-Secondary-Controls': row['secondary_controls'] or '',
+            'Title': f"{row['cip_id']} {row['req_id']}",
+            'Description': row['text'],
+            'Implementation-Status': row['status'] or 'Draft',
+        }
+        if format_type == 'detailed':
+            jama_row.update({
+                'Component-UUID': str(uuid.uuid4()),
+                'Component-Type': 'software',
+                'Control-Count': '0',
+            })
+        yield jama_row
+
+
+def store_to_jama_csv(conn: sqlite3.Connection, output_csv, format_type: str = 'standard') -> int:
+    """
+    Write the JAMA CSV from the store.
+
+    Args:
+        conn: Store connection
+        output_csv: Output CSV path or text stream
+        format_type: CSV format ('standard' or 'detailed')
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        ValueError: If the store has no requirements
+    """
+    from oscal_to_jama_csv import get_csv_columns, write_jama_rows
+    count = write_jama_rows(iter_jama_rows(conn, format_type), output_csv, get_csv_columns(format_type))
+    if count == 0:
+        raise ValueError("Store has no requirements to export; run 'nerc_store.py build' first")
+    return count
+
+
+def coverage(conn: sqlite3.Connection) -> List[dict]:
+    """Per current standard: requirement count, NIST-mapped and Implemented counts."""
+    return [dict(row) for row in conn.execute(COVERAGE_SQL)]
+
+
+def requirements_for_control(conn: sqlite3.Connection, control: str) -> List[dict]:
+    """Current-version requirements mapped to a NIST control (primary or secondary)."""
+    return [dict(row) for row in conn.execute(
+        "SELECT m.cip_id, m.req_id, m.role FROM nist_mappings m "
+        "JOIN standards st ON st.current_version = m.cip_id "
+        "WHERE m.control = ? ORDER BY m.cip_id, m.req_id", (control.strip().upper(),))]
+
+
+def search(conn: sqlite3.Connection, query: str, kind: Optional[str] = None, limit: int = 10) -> List[dict]:
+    """
+    Full-text search over purposes, requirements and parts (FTS5 query syntax, BM25 ranked).
+
+    Raises:
+        ValueError: If the query is not valid FTS5 syntax
+    """
+    sql = ("SELECT kind, cip_id, ref, snippet(prose, 0, '[', ']', '...', 12) AS snippet, bm25(prose) AS score "
+           "FROM prose WHERE prose MATCH ?")
+    params: list = [query]
+    if kind:
+        sql += " AND kind = ?"
+        params.append(kind)
+    sql += " ORDER BY score LIMIT ?"
+    params.append(limit)
+    try:
+        return [dict(row) for row in conn.execute(sql, params)]
+    except sqlite3.OperationalError as e:
+        raise ValueError(f"Invalid search query '{query}': {e}")
+
+
+def main():
+    """Command-line interface for the SQLite store."""
+    parser = argparse.ArgumentParser(
+        description='Load NERC CIP standards and NIST mappings into SQLite and query them',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s build
+  %(prog)s coverage
+  %(prog)s control SC-7
+  %(prog)s search "interactive remote access"
+  %(prog)s sql "SELECT family, current_version FROM standards"
+  %(prog)s export --csv nerc-oscal.csv --oscal nerc-oscal.json
+        """
+    )
+    parser.add_argument('--db', type=Path, default=Path(DB_FILE), help=f'SQLite store (default: {DB_FILE})')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help='Load combined text and NERC_NIST_MAP into the store')
+    build.add_argument('input', nargs='?', type=Path, default=Path(INPUT_FILE),
+                       help=f'Combined NERC text (default: {INPUT_FILE})')
+    commands.add_parser('coverage', help='NIST mapping and implementation coverage per standard')
+    control = commands.add_parser('control', help='Requirements mapped to a NIST control')
+    control.add_argument('control', help='NIST control, e.g. SC-7')
+    query = commands.add_parser('search', help='Full-text search over requirement prose')
+    query.add_argument('query', help='FTS5 query, e.g. "remote access" or patch*')
+    query.add_argument('--kind', choices=[PROSE_PURPOSE, PROSE_REQUIREMENT, PROSE_PART], default=None)
+    query.add_argument('--top', type=int, default=10, help='Number of results (default: 10)')
+    sql = commands.add_parser('sql', help='Run an ad-hoc read-only SQL query')
+    sql.add_argument('query', help='SQL query')
+    export = commands.add_parser('export', help='Emit the JAMA CSV and/or OSCAL catalog from the store')
+    export.add_argument('--csv', type=Path, default=None, help='JAMA CSV output')
+    export.add_argument('--format', choices=['standard', 'detailed'], default='standard',
+                        help='CSV format (default: standard)')
+    export.add_argument('--oscal', type=Path, default=None, help='OSCAL catalog JSON output')
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    start_profiling(args.profile)
+
+    if args.command == 'export' and not (args.csv or args.oscal):
+        parser.error('export requires --csv and/or --oscal')
+
+    try:
+        if args.command == 'build':
+            if not args.input.exists():
+                raise FileNotFoundError(f"Input file not found: {args.input}")
+            started = time.perf_counter()
+            with closing(connect(args.db)) as conn:
+                counts = populate(conn, args.input.read_text(encoding='utf-8'))
+            print(f"[OK] Loaded {counts['standards']} standard(s), {counts['versions']} version(s), "
+                  f"{counts['requirements']} requirement(s), {counts['mappings']} mapping(s) into {args.db} "
+                  f"({time.perf_counter() - started:.2f}s)")
+            return
+
+        if not args.db.exists():
+            raise FileNotFoundError(f"Store not found: {args.db} (run 'nerc_store.py build' first)")
+        started = time.perf_counter()
+        with closing(connect_readonly(args.db) if args.command == 'sql' else connect(args.db)) as conn:
+            if args.command == 'coverage':
+                rows = coverage(conn)
+                for row in rows:
+                    print(f"{row['cip_id']:<12} {row['mapped']:>3}/{row['requirements']:<3} mapped  "
+                          f"{row['implemented']:>3} implemented")
+                total = sum(row['requirements'] for row in rows)
+                mapped = sum(row['mapped'] for row in rows)
+                print(f"[*] {mapped}/{total} requirement(s) mapped to NIST controls")
+            elif args.command == 'control':
+                rows = requirements_for_control(conn, args.control)
+                for row in rows:
+                    print(f"{row['cip_id']} {row['req_id']} ({row['role']})")
+                print(f"[*] {len(rows)} requirement(s) mapped to {args.control.upper()}")
+            elif args.command == 'search':
+                for hit in search(conn, args.query, args.kind, args.top):
+                    print(f"{hit['score']:7.2f}  {hit['cip_id']} {hit['ref'] or hit['kind']}: {hit['snippet']}")
+            elif args.command == 'sql':
+                cursor = run_sql(conn, args.query)
+                if cursor.description:
+                    print('\t'.join(column[0] for column in cursor.description))
+                    for row in cursor:
+                        print('\t'.join('' if value is None else str(value) for value in row))
+            elif args.command == 'export':
+                if args.oscal:
+                    catalog = generate_catalog(conn)
+                    with open(args.oscal, 'w', encoding='utf-8') as f:
+                        json.dump(catalog, f, indent=2)
+                    print(f"[OK] OSCAL catalog written to {args.oscal}")
+                if args.csv:
+                    count = store_to_jama_csv(conn, args.csv, args.format)
+                    print(f"[OK] Successfully exported {count} components to {args.csv}")
+        print(f"[*] {(time.perf_counter() - started) * 1000:.1f} ms")
+    except FileNotFoundError as e:
+        print(f"[ERR] Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"[ERR] Validation error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
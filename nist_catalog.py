@@ -0,0 +1,1079 @@
+"""
+NIST SP 800-53 OSCAL Catalog Loader.
+
+Reads a locally stored official NIST OSCAL catalog JSON (e.g. the
+NIST_SP-800-53_rev5_catalog.json release from usnistgov/oscal-content) and
+gives lazy, indexed access to full control content: statements, parameters,
+guidance and assessment objectives.
+
+On first use the catalog is parsed once and two sidecar files are written next
+to it:
+- <catalog>.idx: JSON header mapping each control ID to (offset, length)
+- <catalog>.dat: compact JSON records, one per control
+
+Later runs read only the small header, memory-map the record file and decode
+just the controls that are actually looked up. The sidecars are rebuilt
+automatically when the catalog file changes.
+
+Typical usage:
+    catalog = get_catalog()
+    print(catalog.get_statement('AC-2'))
+    control = catalog.get('ac-2.12')
+    print(control['title'], control['params'])
+"""
+
+import json
+import mmap
+import os
+import re
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from nerc_profile import add_profile_argument, start_profiling
+
+# Default location of the official catalog (not shipped; download from
+# https://github.com/usnistgov/oscal-content/tree/main/nist.gov/SP800-53/rev5/json)
+NIST_CATALOG_FILE = Path(__file__).parent / "NIST_SP-800-53_rev5_catalog.json"
+
+INDEX_SUFFIX = ".idx"
+RECORDS_SUFFIX = ".dat"
+# Bump whenever index or store contents change meaning (2: part-anchored crosswalk links)
+INDEX_FORMAT_VERSION = 2
+
+# OSCAL control IDs: 'ac-2', 'ac-2.12'
+OSCAL_ID_PATTERN = re.compile(r'^([a-z]{2})-(\d{1,2})(?:\.(\d{1,2}))?$')
+# Catalog labels: 'AC-2', 'AC-2(12)', 'AC-2 (12)'
+LABEL_ID_PATTERN = re.compile(r'^([A-Z]{2})-(\d{1,2})(?:\s*\((\d{1,2})\))?$')
+# Parameter insertion in prose: '{{ insert: param, ac-01_odp.01 }}'
+PARAM_INSERT_PATTERN = re.compile(r'\{\{\s*insert:\s*param,\s*([^\s}]+)\s*\}\}')
+
+STATEMENT_PART_NAMES = {'statement', 'item'}
+OBJECTIVE_PART_NAMES = {'assessment-objective', 'objective'}
+
+
+def to_control_id(control_id: str) -> str:
+    """
+    Normalize an OSCAL ('ac-2.12') or label ('AC-2 (12)') ID to catalog key format.
+
+    Args:
+        control_id: Control ID in either notation
+
+    Returns:
+        Control ID in label format (e.g., 'AC-2(12)'), or the stripped upper-case
+        input if it matches neither notation
+    """
+    control_id = control_id.strip()
+    match = OSCAL_ID_PATTERN.match(control_id.lower()) or LABEL_ID_PATTERN.match(control_id.upper())
+    if not match:
+        return control_id.upper()
+
+    family, base, enhancement = match.group(1).upper(), int(match.group(2)), match.group(3)
+    if enhancement is None:
+        return f"{family}-{base}"
+    return f"{family}-{base}({int(enhancement)})"
+
+
+def to_oscal_id(control_id: str) -> str:
+    """
+    Convert a control ID to OSCAL notation ('AC-2(12)' -> 'ac-2.12').
+
+    Args:
+        control_id: Control ID in either notation
+
+    Returns:
+        OSCAL control ID
+    """
+    normalized = to_control_id(control_id)
+    match = LABEL_ID_PATTERN.match(normalized)
+    if not match:
+        return normalized.lower()
+
+    family, base, enhancement = match.groups()
+    oscal_id = f"{family.lower()}-{int(base)}"
+    return f"{oscal_id}.{int(enhancement)}" if enhancement else oscal_id
+
+
+def _get_prop(obj: dict, name: str) -> str:
+    """Get the value of the first OSCAL prop with the given name."""
+    for prop in obj.get('props', []) or []:
+        if isinstance(prop, dict) and prop.get('name') == name:
+            return prop.get('value', '')
+    return ''
+
+
+def _param_text(param: dict) -> str:
+    """Render an OSCAL parameter the way NIST publishes it in control text."""
+    select = param.get('select')
+    if select:
+        choices = '; '.join(str(c) for c in select.get('choice', []))
+        how_many = ' (one or more)' if select.get('how-many') == 'one-or-more' else ''
+        return f"[Selection{how_many}: {choices}]"
+
+    label = param.get('label') or param.get('id', '')
+    return f"[Assignment: {label}]"
+
+
+def _render_prose(prose: str, params: Dict[str, dict]) -> str:
+    """Substitute parameter insertions in prose with readable placeholders."""
+    def replace(match: re.Match) -> str:
+        param = params.get(match.group(1))
+        return _param_text(param) if param else f"[Assignment: {match.group(1)}]"
+
+    return PARAM_INSERT_PATTERN.sub(replace, prose)
+
+
+def _render_parts(parts: List[dict], params: Dict[str, dict], names: set) -> List[str]:
+    """Flatten nested parts with matching names into labelled lines of text."""
+    lines = []
+    for part in parts or []:
+        if not isinstance(part, dict) or part.get('name') not in names:
+            continue
+
+        label = _get_prop(part, 'label')
+        prose = _render_prose(part.get('prose', ''), params)
+        text = f"{label} {prose}".strip()
+        if text:
+            lines.append(text)
+        lines.extend(_render_parts(part.get('parts', []), params, names))
+    return lines
+
+
+def _collect_objectives(parts: List[dict], params: Dict[str, dict]) -> List[Dict[str, str]]:
+    """Collect assessment objectives (with their IDs) from a control's parts."""
+    objectives = []
+
+    def walk(items: List[dict], inside: bool):
+        for part in items or []:
+            if not isinstance(part, dict):
+                continue
+            is_objective = inside or part.get('name') in OBJECTIVE_PART_NAMES
+            if is_objective and part.get('prose'):
+                objectives.append({
+                    'id': part.get('id', ''),
+                    'text': _render_prose(part['prose'], params)
+                })
+            walk(part.get('parts', []), is_objective)
+
+    walk(parts, False)
+    return objectives
+
+
+def compact_control(control: dict, family: str, parent: Optional[str] = None) -> dict:
+    """
+    Reduce an official OSCAL control to the compact record stored in the index.
+
+    Args:
+        control: OSCAL control object from the catalog
+        family: Family title (e.g., 'Access Control')
+        parent: Base control ID for enhancements
+
+    Returns:
+        Dictionary with id, oscal_id, title, family, parent, status, statement,
+        guidance, params, objectives and links
+    """
+    params = {p['id']: p for p in control.get('params', []) or [] if isinstance(p, dict) and 'id' in p}
+    parts = control.get('parts', []) or []
+
+    guidance = ''
+    for part in parts:
+        if isinstance(part, dict) and part.get('name') == 'guidance':
+            guidance = part.get('prose', '')
+            break
+
+    return {
+        'id': to_control_id(control.get('id', '')),
+        'oscal_id': control.get('id', ''),
+        'title': control.get('title', ''),
+        'family': family,
+        'parent': parent,
+        'status': _get_prop(control, 'status') or 'active',
+        'statement': '\n'.join(_render_parts(parts, params, STATEMENT_PART_NAMES)),
+        'guidance': guidance,
+        'params': [
+            {
+                'id': p['id'],
+                'label': p.get('label', ''),
+                'text': _param_text(p),
+            }
+            for p in params.values()
+        ],
+        'objectives': _collect_objectives(parts, params),
+        'links': [
+            {'rel': link.get('rel', ''), 'href': link.get('href', '')}
+            for link in control.get('links', []) or []
+            if isinstance(link, dict) and link.get('rel') in ('incorporated-into', 'moved-to')
+        ],
+    }
+
+
+def iter_catalog_controls(catalog_data: dict) -> Iterator[dict]:
+    """
+    Walk an official OSCAL catalog and yield compact control records.
+
+    Enhancements (controls nested under controls) follow their base control.
+
+    Args:
+        catalog_data: Parsed OSCAL catalog JSON
+
+    Yields:
+        Compact control records (see compact_control)
+    """
+    def walk(controls: List[dict], family: str, parent: Optional[str]):
+        for control in controls or []:
+            if not isinstance(control, dict):
+                continue
+            record = compact_control(control, family, parent)
+            yield record
+            yield from walk(control.get('controls', []), family, record['id'])
+
+    catalog = catalog_data.get('catalog', {})
+    for group in catalog.get('groups', []) or []:
+        yield from walk(group.get('controls', []), group.get('title', ''), None)
+
+    # Catalogs without families keep controls at the top level
+    yield from walk(catalog.get('controls', []), '', None)
+
+
+def _source_stamp(catalog_file: Path) -> Dict[str, int]:
+    """Identify a catalog file version by size and modification time."""
+    stat = catalog_file.stat()
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def _load_catalog_json(catalog_file: Path) -> dict:
+    """Load an OSCAL catalog JSON file, checking it has a catalog root."""
+    if not catalog_file.exists():
+        raise FileNotFoundError(f"NIST catalog file not found: {catalog_file}")
+
+    with open(catalog_file, 'r', encoding='utf-8') as f:
+        catalog_data = json.load(f)
+
+    if 'catalog' not in catalog_data:
+        raise ValueError(f"Not an OSCAL catalog (missing 'catalog' root): {catalog_file}")
+    return catalog_data
+
+
+def _catalog_metadata(catalog_data: dict) -> Dict[str, str]:
+    """Pick the catalog metadata fields kept in index headers."""
+    metadata = catalog_data['catalog'].get('metadata', {})
+    return {
+        'title': metadata.get('title', ''),
+        'version': metadata.get('version', ''),
+        'oscal-version': metadata.get('oscal-version', ''),
+    }
+
+
+def _encode_record(record: dict) -> bytes:
+    """Serialize a compact record canonically (identical controls give identical bytes)."""
+    return json.dumps(record, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def _write_index_files(header: dict, index_file: Path, records: List[bytes], records_file: Path):
+    """
+    Write record data and index header atomically.
+
+    Both files are written to temporary names first so a crash never leaves a
+    half-built index behind.
+    """
+    tmp_records = records_file.with_name(records_file.name + '.tmp')
+    with open(tmp_records, 'wb') as f:
+        for data in records:
+            f.write(data + b'\n')
+
+    tmp_index = index_file.with_name(index_file.name + '.tmp')
+    with open(tmp_index, 'w', encoding='utf-8') as f:
+        json.dump(header, f, separators=(',', ':'))
+
+    os.replace(tmp_records, records_file)
+    os.replace(tmp_index, index_file)
+
+
+def _record_offsets(records: List[bytes]) -> List[Tuple[int, int]]:
+    """Compute (offset, length) of each newline-terminated record."""
+    offsets = []
+    offset = 0
+    for data in records:
+        offsets.append((offset, len(data)))
+        offset += len(data) + 1
+    return offsets
+
+
+def build_catalog_index(catalog_file: Path, index_file: Path, records_file: Path) -> dict:
+    """
+    Parse an OSCAL catalog once and write the compact index and record files.
+
+    Args:
+        catalog_file: Path to the official OSCAL catalog JSON
+        index_file: Output path for the JSON index header
+        records_file: Output path for the compact record data
+
+    Returns:
+        The index header that was written
+
+    Raises:
+        FileNotFoundError: If the catalog doesn't exist
+        ValueError: If the file is not an OSCAL catalog
+    """
+    catalog_data = _load_catalog_json(catalog_file)
+
+    ids = []
+    records = []
+    for record in iter_catalog_controls(catalog_data):
+        ids.append(record['id'])
+        records.append(_encode_record(record))
+
+    header = {
+        'format': INDEX_FORMAT_VERSION,
+        'source': _source_stamp(catalog_file),
+        'metadata': _catalog_metadata(catalog_data),
+        'controls': dict(zip(ids, _record_offsets(records))),
+    }
+
+    _write_index_files(header, index_file, records, records_file)
+    return header
+
+
+def _read_index_header(index_file: Path, records_file: Path) -> Optional[dict]:
+    """Read an index header, or None if the index is missing, unreadable or outdated."""
+    if not (index_file.exists() and records_file.exists()):
+        return None
+    try:
+        with open(index_file, 'r', encoding='utf-8') as f:
+            header = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if header.get('format') != INDEX_FORMAT_VERSION:
+        return None
+    return header
+
+
+class _RecordFile:
+    """Memory-mapped compact record file, decoded one record at a time."""
+
+    def __init__(self, records_file: Path):
+        self._fh = open(records_file, 'rb')
+        self._map = None
+        if records_file.stat().st_size > 0:
+            self._map = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def read(self, offset: int, length: int) -> Optional[dict]:
+        """Decode the record at (offset, length)."""
+        if self._map is None:
+            return None
+        return json.loads(self._map[offset:offset + length])
+
+    def close(self):
+        """Release the memory map and file handle."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._fh.close()
+
+
+class _ControlLookup(ABC):
+    """Convenience accessors shared by catalog views (subclasses implement get)."""
+
+    @abstractmethod
+    def get(self, control_id: str) -> Optional[dict]:
+        """Get a control's compact record (None if not found)."""
+
+    def get_title(self, control_id: str) -> str:
+        """Get a control title ('' if not found)."""
+        record = self.get(control_id)
+        return record['title'] if record else ''
+
+    def get_statement(self, control_id: str) -> str:
+        """Get a control's statement text with parameters rendered ('' if not found)."""
+        record = self.get(control_id)
+        return record['statement'] if record else ''
+
+    def get_objectives(self, control_id: str) -> List[Dict[str, str]]:
+        """Get a control's assessment objectives ([] if not found)."""
+        record = self.get(control_id)
+        return record['objectives'] if record else []
+
+    def is_active(self, control_id: str) -> bool:
+        """Check that a control exists and has not been withdrawn."""
+        record = self.get(control_id)
+        return record is not None and record.get('status') != 'withdrawn'
+
+
+class NISTCatalog(_ControlLookup):
+    """
+    Lazily materialized view over an official NIST OSCAL catalog.
+
+    Only the index header is loaded when the catalog is opened; control records
+    are decoded from the memory-mapped record file on first access and cached.
+    """
+
+    def __init__(self, catalog_file: Path = NIST_CATALOG_FILE, index_dir: Optional[Path] = None):
+        """
+        Initialize the catalog view (nothing is read until first access).
+
+        Args:
+            catalog_file: Path to the official OSCAL catalog JSON
+            index_dir: Directory for the sidecar index files (default: next to the catalog)
+        """
+        self.catalog_file = Path(catalog_file)
+        index_dir = Path(index_dir) if index_dir else self.catalog_file.parent
+        self.index_file = index_dir / (self.catalog_file.name + INDEX_SUFFIX)
+        self.records_file = index_dir / (self.catalog_file.name + RECORDS_SUFFIX)
+
+        self._header: Optional[dict] = None
+        self._offsets: Dict[str, List[int]] = {}
+        self._records: Optional[_RecordFile] = None
+        self._cache: Dict[str, dict] = {}
+
+    def open(self) -> 'NISTCatalog':
+        """
+        Load the index header, building the index first if it is missing or stale.
+
+        Returns:
+            self (for chaining)
+
+        Raises:
+            FileNotFoundError: If neither the catalog nor a prebuilt index exists
+        """
+        if self._header is not None:
+            return self
+
+        header = _read_index_header(self.index_file, self.records_file)
+        if header is not None and self.catalog_file.exists() \
+                and header.get('source') != _source_stamp(self.catalog_file):
+            header = None
+        if header is None:
+            header = build_catalog_index(self.catalog_file, self.index_file, self.records_file)
+
+        self._header = header
+        self._offsets = header['controls']
+        self._records = _RecordFile(self.records_file)
+        return self
+
+    def close(self):
+        """Release the memory map and forget cached records."""
+        if self._records is not None:
+            self._records.close()
+            self._records = None
+        self._header = None
+        self._offsets = {}
+        self._cache = {}
+
+    def __enter__(self) -> 'NISTCatalog':
+        return self.open()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def metadata(self) -> dict:
+        """Catalog metadata (title, version, oscal-version)."""
+        return self.open()._header.get('metadata', {})
+
+    def __len__(self) -> int:
+        return len(self.open()._offsets)
+
+    def __contains__(self, control_id: str) -> bool:
+        return to_control_id(control_id) in self.open()._offsets
+
+    def ids(self) -> List[str]:
+        """List all control IDs in catalog order (no records are decoded)."""
+        return list(self.open()._offsets)
+
+    def get(self, control_id: str) -> Optional[dict]:
+        """
+        Get the compact record for a control, decoding it on first access.
+
+        Args:
+            control_id: Control ID ('AC-2(12)' or 'ac-2.12')
+
+        Returns:
+            Control record (see compact_control), or None if not in the catalog
+        """
+        key = to_control_id(control_id)
+        record = self._cache.get(key)
+        if record is not None:
+            return record
+
+        location = self.open()._offsets.get(key)
+        if location is None:
+            return None
+
+        record = self._records.read(*location)
+        if record is not None:
+            self._cache[key] = record
+        return record
+
+    @property
+    def materialized_count(self) -> int:
+        """Number of control records decoded so far."""
+        return len(self._cache)
+
+
+_CATALOGS: Dict[Path, NISTCatalog] = {}
+
+
+def get_catalog(catalog_file: Optional[Path] = None) -> NISTCatalog:
+    """
+    Get a shared, opened NISTCatalog for a catalog file.
+
+    Args:
+        catalog_file: Path to the OSCAL catalog JSON (default: NIST_CATALOG_FILE)
+
+    Returns:
+        Opened NISTCatalog (cached per resolved path)
+    """
+    path = Path(catalog_file or NIST_CATALOG_FILE).resolve()
+    catalog = _CATALOGS.get(path)
+    if catalog is None:
+        catalog = NISTCatalog(path).open()
+        _CATALOGS[path] = catalog
+    return catalog
+
+
+def get_control_statement(control_id: str, catalog_file: Optional[Path] = None) -> str:
+    """
+    Get the statement text of a NIST control from the local OSCAL catalog.
+
+    Args:
+        control_id: Control ID (e.g., 'SC-7')
+        catalog_file: Path to the OSCAL catalog JSON (default: NIST_CATALOG_FILE)
+
+    Returns:
+        Statement text, or empty string if the control is not in the catalog
+    """
+    return get_catalog(catalog_file).get_statement(control_id)
+
+
+# ============================================================================
+# MULTI-REVISION STORE (Rev 4 / Rev 5)
+# ============================================================================
+
+# Official catalogs per revision (not shipped; same source as NIST_CATALOG_FILE)
+NIST_CATALOG_FILES = {
+    'rev4': Path(__file__).parent / "NIST_SP-800-53_rev4_catalog.json",
+    'rev5': NIST_CATALOG_FILE,
+}
+
+STORE_INDEX_FILE = "nist-catalog-store.idx"
+STORE_RECORDS_FILE = "nist-catalog-store.dat"
+
+# Crosswalk statuses
+CROSSWALK_UNCHANGED = 'unchanged'   # same ID, identical content (shared record)
+CROSSWALK_CHANGED = 'changed'       # same ID, revised content
+CROSSWALK_WITHDRAWN = 'withdrawn'   # withdrawn; targets are the controls it moved into
+CROSSWALK_REMOVED = 'removed'       # no counterpart in the target revision
+CROSSWALK_UNKNOWN = 'unknown'       # not in the source revision
+
+
+def normalize_revision(revision: str) -> str:
+    """
+    Normalize a revision name ('4', 'r4', 'Rev4', 'rev4' -> 'rev4').
+
+    Args:
+        revision: Revision name or number
+
+    Returns:
+        Revision key used by the store
+
+    Raises:
+        ValueError: If the revision is not recognized
+    """
+    digits = re.sub(r'^(rev|r)\s*', '', str(revision).strip().lower())
+    key = f"rev{digits}"
+    if key not in NIST_CATALOG_FILES:
+        raise ValueError(f"Unknown NIST SP 800-53 revision: {revision} "
+                         f"(expected one of: {', '.join(NIST_CATALOG_FILES)})")
+    return key
+
+
+def _resolve_successors(control_id: str, records: Dict[str, dict], seen: Optional[set] = None) -> List[str]:
+    """Follow incorporated-into/moved-to links until reaching active controls."""
+    seen = seen if seen is not None else set()
+    if control_id in seen:
+        return []
+    seen.add(control_id)
+
+    record = records.get(control_id)
+    if record is None:
+        return []
+    if record.get('status') != 'withdrawn':
+        return [control_id]
+
+    successors = []
+    for link in record.get('links', []):
+        # Links may point at a part of the successor ('#ac-2_smt.k'); part IDs
+        # are '<control id>_<part>', so the owning control is the prefix
+        target = to_control_id(link.get('href', '').lstrip('#').split('_', 1)[0])
+        for successor in _resolve_successors(target, records, seen):
+            if successor not in successors:
+                successors.append(successor)
+    return successors
+
+
+def build_crosswalk(source: Dict[str, dict], target: Dict[str, dict],
+                    source_blobs: Dict[str, int], target_blobs: Dict[str, int]) -> Dict[str, list]:
+    """
+    Precompute how every control of one revision maps into another.
+
+    Args:
+        source: Source revision records keyed by control ID
+        target: Target revision records keyed by control ID
+        source_blobs: Source control ID -> shared record number
+        target_blobs: Target control ID -> shared record number
+
+    Returns:
+        Dictionary mapping source control ID to [status, [target control IDs]]
+    """
+    crosswalk = {}
+    for control_id in source:
+        target_record = target.get(control_id)
+        if target_record is None:
+            crosswalk[control_id] = [CROSSWALK_REMOVED, []]
+        elif target_record.get('status') == 'withdrawn':
+            crosswalk[control_id] = [CROSSWALK_WITHDRAWN, _resolve_successors(control_id, target)]
+        elif source_blobs[control_id] == target_blobs[control_id]:
+            crosswalk[control_id] = [CROSSWALK_UNCHANGED, [control_id]]
+        else:
+            crosswalk[control_id] = [CROSSWALK_CHANGED, [control_id]]
+    return crosswalk
+
+
+def build_catalog_store(catalog_files: Dict[str, Path], index_file: Path, records_file: Path) -> dict:
+    """
+    Build a revision-aware store where identical controls share one record.
+
+    Records are content-addressed: a control whose compact record is
+    byte-identical across revisions is written once and referenced from each
+    revision's index. Crosswalks are precomputed from every older revision to
+    every newer one.
+
+    Args:
+        catalog_files: Revision key -> official OSCAL catalog JSON
+        index_file: Output path for the JSON store header
+        records_file: Output path for the shared record data
+
+    Returns:
+        The store header that was written
+
+    Raises:
+        FileNotFoundError: If a catalog file doesn't exist
+        ValueError: If a file is not an OSCAL catalog
+    """
+    blob_numbers: Dict[bytes, int] = {}
+    blobs: List[bytes] = []
+    revisions: Dict[str, Dict[str, int]] = {}
+    records: Dict[str, Dict[str, dict]] = {}
+    sources = {}
+    metadata = {}
+
+    for revision in sorted(catalog_files):
+        catalog_file = Path(catalog_files[revision])
+        catalog_data = _load_catalog_json(catalog_file)
+        sources[revision] = _source_stamp(catalog_file)
+        metadata[revision] = _catalog_metadata(catalog_data)
+
+        revisions[revision] = {}
+        records[revision] = {}
+        for record in iter_catalog_controls(catalog_data):
+            data = _encode_record(record)
+            number = blob_numbers.get(data)
+            if number is None:
+                number = blob_numbers[data] = len(blobs)
+                blobs.append(data)
+            revisions[revision][record['id']] = number
+            records[revision][record['id']] = record
+
+    ordered = sorted(revisions)
+    crosswalks = {
+        f"{old}>{new}": build_crosswalk(records[old], records[new], revisions[old], revisions[new])
+        for i, old in enumerate(ordered)
+        for new in ordered[i + 1:]
+    }
+
+    header = {
+        'format': INDEX_FORMAT_VERSION,
+        'sources': sources,
+        'metadata': metadata,
+        'records': _record_offsets(blobs),
+        'revisions': revisions,
+        'crosswalks': crosswalks,
+    }
+
+    _write_index_files(header, index_file, blobs, records_file)
+    return header
+
+
+class CatalogRevision(_ControlLookup):
+    """One revision's view over a CatalogStore (records decoded lazily)."""
+
+    def __init__(self, store: 'CatalogStore', revision: str, controls: Dict[str, int]):
+        self.store = store
+        self.revision = revision
+        self._controls = controls
+
+    def __len__(self) -> int:
+        return len(self._controls)
+
+    def __contains__(self, control_id: str) -> bool:
+        return to_control_id(control_id) in self._controls
+
+    def ids(self) -> List[str]:
+        """List all control IDs of this revision in catalog order."""
+        return list(self._controls)
+
+    def get(self, control_id: str) -> Optional[dict]:
+        """
+        Get the compact record for a control in this revision.
+
+        Args:
+            control_id: Control ID ('AC-2(12)' or 'ac-2.12')
+
+        Returns:
+            Control record, or None if the control is not in this revision
+        """
+        number = self._controls.get(to_control_id(control_id))
+        return None if number is None else self.store.read_record(number)
+
+
+class CatalogStore:
+    """
+    Revision-aware NIST SP 800-53 store with shared records and crosswalks.
+
+    Typical usage:
+        store = get_store()
+        store.revision('rev4').get_title('AC-2')
+        status, targets = store.map_control('AC-2(10)', 'rev4', 'rev5')
+    """
+
+    def __init__(self, catalog_files: Optional[Dict[str, Path]] = None, store_dir: Optional[Path] = None):
+        """
+        Initialize the store (nothing is read until first access).
+
+        Args:
+            catalog_files: Revision key -> catalog JSON (default: NIST_CATALOG_FILES;
+                revisions whose catalog file is missing are left out)
+            store_dir: Directory for the store files (default: this module's directory)
+        """
+        if catalog_files is None:
+            catalog_files = {rev: path for rev, path in NIST_CATALOG_FILES.items() if path.exists()}
+        self.catalog_files = {normalize_revision(rev): Path(path) for rev, path in catalog_files.items()}
+
+        store_dir = Path(store_dir) if store_dir else Path(__file__).parent
+        self.index_file = store_dir / STORE_INDEX_FILE
+        self.records_file = store_dir / STORE_RECORDS_FILE
+
+        self._header: Optional[dict] = None
+        self._records: Optional[_RecordFile] = None
+        self._cache: Dict[int, dict] = {}
+
+    def _header_is_current(self, header: Optional[dict]) -> bool:
+        """Check that a store header covers exactly the configured, unchanged catalogs."""
+        if header is None or header.get('format') != INDEX_FORMAT_VERSION:
+            return False
+        if set(header.get('sources', {})) != set(self.catalog_files):
+            return False
+        return all(
+            not path.exists() or header['sources'][rev] == _source_stamp(path)
+            for rev, path in self.catalog_files.items()
+        )
+
+    def open(self) -> 'CatalogStore':
+        """
+        Load the store header, rebuilding the store if catalogs were added or changed.
+
+        Returns:
+            self (for chaining)
+
+        Raises:
+            FileNotFoundError: If no catalog is configured or a catalog is missing
+        """
+        if self._header is not None:
+            return self
+
+        if not self.catalog_files:
+            raise FileNotFoundError(
+                "No NIST catalog files found. Expected one of: "
+                + ', '.join(str(p) for p in NIST_CATALOG_FILES.values()))
+
+        header = _read_index_header(self.index_file, self.records_file)
+        if not self._header_is_current(header):
+            header = build_catalog_store(self.catalog_files, self.index_file, self.records_file)
+
+        self._header = header
+        self._records = _RecordFile(self.records_file)
+        return self
+
+    def close(self):
+        """Release the memory map and forget cached records."""
+        if self._records is not None:
+            self._records.close()
+            self._records = None
+        self._header = None
+        self._cache = {}
+
+    def __enter__(self) -> 'CatalogStore':
+        return self.open()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def revisions(self) -> List[str]:
+        """Revision keys available in the store."""
+        return sorted(self.open()._header['revisions'])
+
+    @property
+    def shared_record_count(self) -> int:
+        """Number of stored records referenced by more than one revision."""
+        counts: Dict[int, int] = {}
+        for controls in self.open()._header['revisions'].values():
+            for number in set(controls.values()):
+                counts[number] = counts.get(number, 0) + 1
+        return sum(1 for count in counts.values() if count > 1)
+
+    def read_record(self, number: int) -> dict:
+        """Decode a shared record by number (cached across revisions)."""
+        record = self._cache.get(number)
+        if record is None:
+            record = self.open()._records.read(*self._header['records'][number])
+            self._cache[number] = record
+        return record
+
+    def revision(self, revision: str) -> CatalogRevision:
+        """
+        Get one revision's catalog view.
+
+        Args:
+            revision: Revision name (e.g., 'rev4', '5')
+
+        Returns:
+            CatalogRevision
+
+        Raises:
+            KeyError: If the revision's catalog is not in the store
+        """
+        key = normalize_revision(revision)
+        controls = self.open()._header['revisions'].get(key)
+        if controls is None:
+            raise KeyError(f"NIST SP 800-53 {key} catalog not loaded "
+                           f"(expected file: {NIST_CATALOG_FILES[key]})")
+        return CatalogRevision(self, key, controls)
+
+    def crosswalk(self, from_revision: str = 'rev4', to_revision: str = 'rev5') -> Dict[str, list]:
+        """
+        Get the precomputed crosswalk between two revisions.
+
+        Args:
+            from_revision: Older revision
+            to_revision: Newer revision
+
+        Returns:
+            Dictionary mapping source control ID to [status, [target control IDs]]
+
+        Raises:
+            KeyError: If the crosswalk was not built (revision missing or not older -> newer)
+        """
+        key = f"{normalize_revision(from_revision)}>{normalize_revision(to_revision)}"
+        crosswalks = self.open()._header['crosswalks']
+        if key not in crosswalks:
+            raise KeyError(f"No crosswalk {key.replace('>', ' -> ')} in store")
+        return crosswalks[key]
+
+    def map_control(self, control_id: str, from_revision: str = 'rev4',
+                    to_revision: str = 'rev5') -> Tuple[str, List[str]]:
+        """
+        Map a control ID from one revision to another.
+
+        Args:
+            control_id: Control ID in the source revision
+            from_revision: Older revision
+            to_revision: Newer revision
+
+        Returns:
+            Tuple of (crosswalk status, target control IDs)
+        """
+        entry = self.crosswalk(from_revision, to_revision).get(to_control_id(control_id))
+        if entry is None:
+            return CROSSWALK_UNKNOWN, []
+        return entry[0], list(entry[1])
+
+
+_STORE: Optional[CatalogStore] = None
+
+
+def get_store() -> CatalogStore:
+    """Get the shared, opened CatalogStore over NIST_CATALOG_FILES."""
+    global _STORE
+    if _STORE is None:
+        _STORE = CatalogStore().open()
+    return _STORE
+
+
+def validate_control(control_id: str, revision: str = 'rev5') -> bool:
+    """
+    Validate that a control exists (and is not withdrawn) in a catalog revision.
+
+    Args:
+        control_id: Control ID to validate
+        revision: Revision name (e.g., 'rev4', 'rev5')
+
+    Returns:
+        True if the control is active in that revision
+    """
+    return get_store().revision(revision).is_active(control_id)
+
+
+def _split_mapping(mapping: Dict[str, str]) -> List[str]:
+    """List a NERC_NIST_MAP entry's controls, primary first."""
+    controls = [mapping.get('primary', '').strip()]
+    controls += [c.strip() for c in mapping.get('secondary', '').split(',')]
+    return [c for c in controls if c]
+
+
+def validate_nerc_nist_map(nerc_nist_map: Dict[str, Dict[str, str]], revision: str = 'rev5',
+                           store: Optional[CatalogStore] = None) -> List[Dict[str, str]]:
+    """
+    Validate every control referenced by a NERC_NIST_MAP against one revision.
+
+    Args:
+        nerc_nist_map: Mapping in generate_oscal.NERC_NIST_MAP format
+        revision: Revision to validate against
+        store: CatalogStore to use (default: get_store())
+
+    Returns:
+        List of issues with keys requirement_key, control, issue ('missing' or 'withdrawn')
+    """
+    catalog = (store or get_store()).revision(revision)
+    issues = []
+    for requirement_key, mapping in nerc_nist_map.items():
+        for control_id in _split_mapping(mapping):
+            record = catalog.get(control_id)
+            if record is None:
+                issues.append({'requirement_key': requirement_key, 'control': control_id, 'issue': 'missing'})
+            elif record.get('status') == 'withdrawn':
+                issues.append({'requirement_key': requirement_key, 'control': control_id, 'issue': 'withdrawn'})
+    return issues
+
+
+def migrate_nerc_nist_map(nerc_nist_map: Dict[str, Dict[str, str]], from_revision: str = 'rev4',
+                          to_revision: str = 'rev5', store: Optional[CatalogStore] = None
+                          ) -> Tuple[Dict[str, Dict[str, str]], List[Dict]]:
+    """
+    Migrate a NERC_NIST_MAP from one revision to another using the crosswalk.
+
+    Withdrawn controls are replaced by the controls they were incorporated
+    into. If the primary control is replaced by several controls, the first
+    becomes primary and the rest move to the secondary list. Controls without a
+    successor are dropped; controls unknown in the source revision are kept.
+
+    Args:
+        nerc_nist_map: Mapping in generate_oscal.NERC_NIST_MAP format
+        from_revision: Revision the mapping is written against
+        to_revision: Revision to migrate to
+        store: CatalogStore to use (default: get_store())
+
+    Returns:
+        Tuple of (migrated mapping, report of controls that did not map unchanged).
+        Report entries have keys requirement_key, control, status, targets.
+    """
+    store = store or get_store()
+    crosswalk = store.crosswalk(from_revision, to_revision)
+    migrated = {}
+    report = []
+
+    for requirement_key, mapping in nerc_nist_map.items():
+        targets: List[str] = []
+        for control_id in _split_mapping(mapping):
+            entry = crosswalk.get(to_control_id(control_id))
+            status, successors = (entry[0], entry[1]) if entry else (CROSSWALK_UNKNOWN, [control_id])
+
+            if status not in (CROSSWALK_UNCHANGED, CROSSWALK_CHANGED):
+                report.append({'requirement_key': requirement_key, 'control': control_id,
+                               'status': status, 'targets': list(successors)})
+
+            for successor in successors:
+                if successor not in targets:
+                    targets.append(successor)
+
+        migrated[requirement_key] = {
+            'primary': targets[0] if targets else '',
+            'secondary': ', '.join(targets[1:]),
+        }
+
+    return migrated, report
+
+
+def main():
+    """Command-line interface for catalog lookups and Rev4 -> Rev5 migration."""
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(
+        description='Look up NIST SP 800-53 controls and migrate NERC-to-NIST mappings between revisions',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s show AC-2
+  %(prog)s show AC-2 --revision rev4
+  %(prog)s validate --revision rev4
+  %(prog)s migrate --from rev4 --to rev5 --output nerc-nist-map-rev5.json
+        """
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    show = subparsers.add_parser('show', help='Print a control statement')
+    show.add_argument('control_id', help='Control ID (e.g., AC-2 or ac-2.12)')
+    show.add_argument('--revision', default='rev5', help='Catalog revision (default: rev5)')
+
+    validate = subparsers.add_parser('validate', help='Validate NERC_NIST_MAP against a revision')
+    validate.add_argument('--revision', default='rev5', help='Catalog revision (default: rev5)')
+
+    migrate = subparsers.add_parser('migrate', help='Migrate NERC_NIST_MAP between revisions')
+    migrate.add_argument('--from', dest='from_revision', default='rev4', help='Source revision (default: rev4)')
+    migrate.add_argument('--to', dest='to_revision', default='rev5', help='Target revision (default: rev5)')
+    migrate.add_argument('-o', '--output', type=Path, default=None, help='Write migrated mapping JSON here')
+
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    start_profiling(args.profile)
+
+    try:
+        if args.command == 'show':
+            control = get_store().revision(args.revision).get(args.control_id)
+            if control is None:
+                print(f"[ERR] Control not found in {args.revision}: {args.control_id}", file=sys.stderr)
+                sys.exit(1)
+            print(f"{control['id']}: {control['title']} ({control['family']}) [{control['status']}]")
+            print(control['statement'])
+            return
+
+        from generate_oscal import NERC_NIST_MAP
+
+        if args.command == 'validate':
+            issues = validate_nerc_nist_map(NERC_NIST_MAP, args.revision)
+            for issue in issues:
+                print(f"[ERR] {issue['requirement_key']}: {issue['control']} is {issue['issue']} in {args.revision}")
+            if issues:
+                sys.exit(1)
+            print(f"[OK] All NERC_NIST_MAP controls are active in {args.revision}")
+            return
+
+        migrated, report = migrate_nerc_nist_map(NERC_NIST_MAP, args.from_revision, args.to_revision)
+        for item in report:
+            targets = ', '.join(item['targets']) or '(none)'
+            print(f"[WARN] {item['requirement_key']}: {item['control']} {item['status']} -> {targets}")
+        if args.output:
+            args.output.write_text(json.dumps(migrated, indent=2))
+            print(f"[OK] Migrated {len(migrated)} mappings to {args.output}")
+        else:
+            print(json.dumps(migrated, indent=2))
+
+    except (FileNotFoundError, KeyError, ValueError) as e:
+        print(f"[ERR] {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
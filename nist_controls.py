@@ -7,6 +7,10 @@ Used by the OSCAL validator to ensure mapped controls exist in the official cata
 Reference: https://csrc.nist.gov/projects/risk-management/sp800-53-controls/release/
 """
 
+import re
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
 # NIST SP 800-53 R5 Complete Control Catalog
 # Format: {Control-ID: Description}
 NIST_SP_800_53_R5_CONTROLS = {
@@ -890,16 +894,38 @@ NIST_SP_800_53_R5_CONTROLS = {
 }
 
 
-def validate_nist_control(control_id: str) -> bool:
+def _is_rev5(revision: str) -> bool:
+    """
+    Whether a revision name means rev5, the table above ('Rev5', 'r5', '5', ...).
+
+    Raises:
+        ValueError: If the revision is not recognized
+    """
+    if revision == 'rev5':
+        return True
+    from nist_catalog import normalize_revision
+    return normalize_revision(revision) == 'rev5'
+
+
+def validate_nist_control(control_id: str, revision: str = 'rev5') -> bool:
     """
     Validate that a control ID exists in NIST SP 800-53 R5 catalog.
 
     Args:
         control_id: Control ID to validate (e.g., 'SC-7', 'AC-2', 'CA-3')
+        revision: Catalog revision; anything other than 'rev5' is checked against
+            the official OSCAL catalog for that revision (see nist_catalog)
 
     Returns:
         True if control exists, False otherwise
+
+    Raises:
+        ValueError: If the revision is not recognized
     """
+    if not _is_rev5(revision):
+        from nist_catalog import validate_control
+        return validate_control(control_id, revision)
+
     # Normalize to uppercase
     control_id = control_id.strip().upper()
 
@@ -915,16 +941,25 @@ def validate_nist_control(control_id: str) -> bool:
     return False
 
 
-def get_control_description(control_id: str) -> str:
+def get_control_description(control_id: str, revision: str = 'rev5') -> str:
     """
     Get the description of a NIST control.
 
     Args:
         control_id: Control ID to look up
+        revision: Catalog revision; anything other than 'rev5' is looked up in
+            the official OSCAL catalog for that revision (see nist_catalog)
 
     Returns:
         Control description if found, empty string otherwise
+
+    Raises:
+        ValueError: If the revision is not recognized
     """
+    if not _is_rev5(revision):
+        from nist_catalog import get_store
+        return get_store().revision(revision).get_title(control_id)
+
     control_id = control_id.strip().upper()
 
     for control, description in NIST_SP_800_53_R5_CONTROLS.items():
@@ -956,3 +991,327 @@ def get_control_family(control_id: str) -> str:
         return control_id.split('-')[0]
 
     return ""
+
+
+# ============================================================================
+# CONTROL-ENHANCEMENT HIERARCHY
+# ============================================================================
+
+# Base control or enhancement, e.g. 'AC-2', 'AC-2(12)', 'ac-2 (12)'
+CONTROL_ID_PATTERN = re.compile(r'^([A-Z]{2})-(\d{1,2})(?:\s*\((\d{1,2})\))?$')
+
+
+def parse_control_id(control_id: str) -> Optional[Tuple[str, int, Optional[int]]]:
+    """
+    Split a control ID into family, base number and enhancement number.
+
+    Args:
+        control_id: Control ID (e.g., 'AC-2', 'AC-2(12)')
+
+    Returns:
+        Tuple of (family, base_number, enhancement_number or None),
+        or None if the ID is not a well-formed NIST control ID
+    """
+    match = CONTROL_ID_PATTERN.match(control_id.strip().upper())
+    if not match:
+        return None
+
+    enhancement = match.group(3)
+    return match.group(1), int(match.group(2)), int(enhancement) if enhancement else None
+
+
+def normalize_nist_control_id(control_id: str) -> str:
+    """
+    Normalize a control ID to catalog key format ('ac-2 (12)' -> 'AC-2(12)').
+
+    Args:
+        control_id: Control ID in any casing/spacing
+
+    Returns:
+        Normalized control ID, or the stripped upper-case input if it is not well-formed
+    """
+    parsed = parse_control_id(control_id)
+    if parsed is None:
+        return control_id.strip().upper()
+
+    family, base, enhancement = parsed
+    if enhancement is None:
+        return f"{family}-{base}"
+    return f"{family}-{base}({enhancement})"
+
+
+class ControlHierarchy:
+    """
+    Precomputed family -> base control -> enhancement index.
+
+    Controls are laid out in one flat, sorted array: each family occupies a
+    contiguous range, and each base control is immediately followed by its
+    enhancements. Relationships are stored as integer offsets so lookups never
+    scan the catalog:
+
+    - parents[i]: position of the base control for enhancement i (-1 for base controls)
+    - enhancement_ends[i]: for base control i, enhancements occupy [i + 1, enhancement_ends[i])
+    - family_starts[f] / family_ends[f]: position range of family f
+
+    Typical usage:
+        hierarchy = get_control_hierarchy()
+        hierarchy.get_parent('AC-2(12)')        # 'AC-2'
+        hierarchy.get_enhancements('AC-2')      # ['AC-2(1)', ..., 'AC-2(13)']
+    """
+
+    def __init__(self, control_ids: Iterable[str]):
+        """
+        Build the hierarchy from catalog control IDs.
+
+        Args:
+            control_ids: Control IDs (base controls and enhancements); malformed IDs
+                and enhancements whose base control is absent are ignored
+        """
+        bases: Dict[Tuple[str, int], List[int]] = {}
+        family_order: List[str] = []
+        present = set()
+
+        for control_id in control_ids:
+            parsed = parse_control_id(control_id)
+            if parsed is None:
+                continue
+            present.add(normalize_nist_control_id(control_id))
+            family, base, enhancement = parsed
+            if family not in family_order:
+                family_order.append(family)
+            enhancements = bases.setdefault((family, base), [])
+            if enhancement is not None:
+                enhancements.append(enhancement)
+
+        self.control_ids: List[str] = []
+        self.parents = array('i')
+        self.enhancement_ends = array('i')
+        self.families: List[str] = []
+        self.family_starts = array('i')
+        self.family_ends = array('i')
+        self._positions: Dict[str, int] = {}
+        self._family_positions: Dict[str, int] = {}
+
+        for family in family_order:
+            self._family_positions[family] = len(self.families)
+            self.families.append(family)
+            self.family_starts.append(len(self.control_ids))
+
+            for (fam, base) in sorted(k for k in bases if k[0] == family):
+                base_id = f"{fam}-{base}"
+                # Skip enhancements whose base control is not in the catalog
+                if base_id not in present:
+                    continue
+
+                base_pos = self._append(base_id, -1)
+                for enhancement in sorted(set(bases[(fam, base)])):
+                    self._append(f"{base_id}({enhancement})", base_pos)
+                self.enhancement_ends[base_pos] = len(self.control_ids)
+
+            self.family_ends.append(len(self.control_ids))
+
+    def _append(self, control_id: str, parent: int) -> int:
+        """Append a control to the flat arrays and return its position."""
+        position = len(self.control_ids)
+        self.control_ids.append(control_id)
+        self.parents.append(parent)
+        # Enhancements have an empty range; base controls are patched after their enhancements
+        self.enhancement_ends.append(position + 1)
+        self._positions[control_id] = position
+        return position
+
+    def __len__(self) -> int:
+        return len(self.control_ids)
+
+    def __contains__(self, control_id: str) -> bool:
+        return self.position(control_id) is not None
+
+    def position(self, control_id: str) -> Optional[int]:
+        """
+        Get the flat-array position of a control.
+
+        Args:
+            control_id: Control ID (any casing/spacing)
+
+        Returns:
+            Position index, or None if the control is not in the hierarchy
+        """
+        position = self._positions.get(control_id)
+        if position is None:
+            position = self._positions.get(normalize_nist_control_id(control_id))
+        return position
+
+    def is_enhancement(self, control_id: str) -> bool:
+        """Check whether a control is an enhancement of a base control."""
+        position = self.position(control_id)
+        return position is not None and self.parents[position] >= 0
+
+    def get_parent(self, control_id: str) -> Optional[str]:
+        """
+        Get the base control of an enhancement in O(1).
+
+        Args:
+            control_id: Control ID (e.g., 'AC-2(12)')
+
+        Returns:
+            Base control ID (e.g., 'AC-2'), or None for base controls and unknown IDs
+        """
+        position = self.position(control_id)
+        if position is None or self.parents[position] < 0:
+            return None
+        return self.control_ids[self.parents[position]]
+
+    def get_base_control(self, control_id: str) -> Optional[str]:
+        """
+        Get the base control for any control (itself if it is already a base control).
+
+        Args:
+            control_id: Control ID
+
+        Returns:
+            Base control ID, or None if the control is unknown
+        """
+        position = self.position(control_id)
+        if position is None:
+            return None
+        parent = self.parents[position]
+        return self.control_ids[parent if parent >= 0 else position]
+
+    def get_enhancements(self, control_id: str) -> List[str]:
+        """
+        List the enhancements of a base control in O(k).
+
+        Args:
+            control_id: Base control ID (e.g., 'AC-2')
+
+        Returns:
+            Enhancement IDs in numeric order; empty for enhancements and unknown IDs
+        """
+        position = self.position(control_id)
+        if position is None:
+            return []
+        return self.control_ids[position + 1:self.enhancement_ends[position]]
+
+    def get_family_controls(self, family: str, include_enhancements: bool = False) -> List[str]:
+        """
+        List the controls of a family.
+
+        Args:
+            family: Family code (e.g., 'AC')
+            include_enhancements: Include enhancements after each base control
+
+        Returns:
+            Control IDs in catalog order
+        """
+        index = self._family_positions.get(family.strip().upper())
+        if index is None:
+            return []
+
+        start, end = self.family_starts[index], self.family_ends[index]
+        if include_enhancements:
+            return self.control_ids[start:end]
+        return [self.control_ids[i] for i in range(start, end) if self.parents[i] < 0]
+
+    def rollup_coverage(self, mapped_controls: Iterable[str],
+                        credit_enhancements: bool = True) -> Dict[str, Dict]:
+        """
+        Roll mapped controls up to their base controls.
+
+        A base control is 'mapped' when it is mapped directly. When only some of
+        its enhancements are mapped, it is 'credited' (counted as covered) or
+        'flagged' (reported for review) depending on credit_enhancements.
+
+        Args:
+            mapped_controls: Mapped control IDs (base controls and/or enhancements)
+            credit_enhancements: Credit base controls covered only through enhancements
+
+        Returns:
+            Dictionary keyed by base control ID, in catalog order, with keys:
+            - status: 'mapped', 'credited' or 'flagged'
+            - direct: True if the base control itself is mapped
+            - mapped_enhancements: Mapped enhancement IDs
+            - total_enhancements: Number of enhancements in the catalog
+            Unknown control IDs are ignored.
+        """
+        direct = set()
+        enhancements: Dict[int, set] = {}
+
+        for control_id in mapped_controls:
+            position = self.position(control_id)
+            if position is None:
+                continue
+            parent = self.parents[position]
+            if parent < 0:
+                direct.add(position)
+            else:
+                enhancements.setdefault(parent, set()).add(position)
+
+        rollup = {}
+        for position in sorted(direct | set(enhancements)):
+            is_direct = position in direct
+            if is_direct:
+                status = 'mapped'
+            else:
+                status = 'credited' if credit_enhancements else 'flagged'
+
+            rollup[self.control_ids[position]] = {
+                'status': status,
+                'direct': is_direct,
+                'mapped_enhancements': [self.control_ids[i] for i in sorted(enhancements.get(position, ()))],
+                'total_enhancements': self.enhancement_ends[position] - position - 1,
+            }
+
+        return rollup
+
+
+_CONTROL_HIERARCHY: Optional[ControlHierarchy] = None
+
+
+def get_control_hierarchy() -> ControlHierarchy:
+    """Get the (lazily built, then cached) hierarchy over NIST SP 800-53 R5 controls."""
+    global _CONTROL_HIERARCHY
+    if _CONTROL_HIERARCHY is None:
+        _CONTROL_HIERARCHY = ControlHierarchy(NIST_SP_800_53_R5_CONTROLS)
+    return _CONTROL_HIERARCHY
+
+
+def get_parent_control(control_id: str) -> Optional[str]:
+    """
+    Get the base control of an enhancement.
+
+    Args:
+        control_id: Control ID (e.g., 'AC-2(12)')
+
+    Returns:
+        Base control ID (e.g., 'AC-2'), or None for base controls and unknown IDs
+    """
+    return get_control_hierarchy().get_parent(control_id)
+
+
+def get_control_enhancements(control_id: str) -> List[str]:
+    """
+    List the enhancements of a base control.
+
+    Args:
+        control_id: Base control ID (e.g., 'AC-2')
+
+    Returns:
+        Enhancement IDs (e.g., ['AC-2(1)', 'AC-2(2)', ...])
+    """
+    return get_control_hierarchy().get_enhancements(control_id)
+
+
+def rollup_control_coverage(mapped_controls: Iterable[str],
+                            credit_enhancements: bool = True) -> Dict[str, Dict]:
+    """
+    Roll mapped controls up to base-control coverage.
+
+    Args:
+        mapped_controls: Mapped control IDs
+        credit_enhancements: Credit (True) or flag (False) base controls covered
+            only through enhancements
+
+    Returns:
+        Per-base-control coverage (see ControlHierarchy.rollup_coverage)
+    """
+    return get_control_hierarchy().rollup_coverage(mapped_controls, credit_enhancements)
@@ -0,0 +1,232 @@
+"""
+Incremental OSCAL validation for the edit-validate loop.
+
+A cache next to the OSCAL file records, per catalog group (or per component of
+a component definition), a content hash and the rule results for that group:
+check/failure counts and findings. On the next run only groups whose content
+hash or component offset changed are re-checked; the rest are merged from the
+cache. Document-level rules (root, metadata, totals, "nothing to check") are
+always recomputed, so the report is identical to a full validate_oscal() run,
+plus an 'incremental' section listing reused and recomputed groups.
+
+The cache is discarded whenever the validator source, the NIST control data
+(nist_controls.py; for other revisions also nist_catalog.py and the official
+catalog file) or the NIST revision changes, and it is replaced atomically
+whenever a group was recomputed.
+
+Usage:
+    python oscal_validator.py nerc-oscal.json --incremental
+    python oscal_validator.py nerc-oscal.json --cache /tmp/nerc.validation-cache.json
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import nist_controls
+import oscal_validator
+from oscal_validator import (
+    DEFAULT_MAX_FINDINGS,
+    _build_report,
+    _check_component,
+    _check_document,
+    _check_totals,
+    _document_type,
+    _memoized,
+    _Results,
+    get_control_description,
+    iter_group_components,
+    validate_nist_control,
+)
+
+CACHE_VERSION = 1
+CACHE_SUFFIX = '.validation-cache.json'
+
+
+def default_cache_path(oscal_file: Path) -> Path:
+    """Cache path used when none is given (e.g. nerc-oscal.json -> nerc-oscal.validation-cache.json)."""
+    oscal_file = Path(oscal_file)
+    return oscal_file.with_name(oscal_file.stem + CACHE_SUFFIX)
+
+
+def rules_fingerprint(nist_revision: str) -> str:
+    """
+    Hash of everything the rule results depend on; cached results are only valid for the same one.
+
+    That is the validator source, the NIST revision and the NIST control data
+    OSCAL019/OSCAL020 look controls up in: the nist_controls.py table, or for
+    other revisions nist_catalog.py and the official catalog file (identified
+    by size and modification time, as nist_catalog's own index does; hashing
+    it would cost more than the validation being saved).
+
+    Raises:
+        ValueError: If nist_revision is not a known revision
+    """
+    digest = hashlib.sha256()
+    for module in (oscal_validator, nist_controls):
+        digest.update(Path(module.__file__).read_bytes())
+    digest.update(nist_revision.encode('utf-8'))
+    if nist_revision != 'rev5':
+        import nist_catalog
+        digest.update(Path(nist_catalog.__file__).read_bytes())
+        catalog_file = nist_catalog.NIST_CATALOG_FILES[nist_catalog.normalize_revision(nist_revision)]
+        stamp = nist_catalog._source_stamp(catalog_file) if catalog_file.exists() else None
+        digest.update(json.dumps(stamp).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def content_hash(content: dict) -> str:
+    """
+    SHA-256 of a group's pickled content.
+
+    Pickling is about 3x faster than JSON encoding, which would otherwise cost
+    as much as the rule checks. Equal pickles mean equal content; differences
+    in key order or object sharing only cause a needless recompute.
+    """
+    return hashlib.sha256(pickle.dumps(content, protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
+
+
+def iter_units(oscal_data: dict) -> Iterator[Tuple[str, str, dict]]:
+    """
+    Split a document into independently validated units.
+
+    Yields:
+        (key, label, content) per catalog group or component-definition
+        component; key is the unit's location, label its id for reporting
+    """
+    if not isinstance(oscal_data, dict):
+        return
+    document_type, catalog_format = _document_type(oscal_data)
+    if not catalog_format:
+        for index, component in enumerate(oscal_data['component-definition'].get('components') or []):
+            if isinstance(component, dict):
+                key = f"component-definition.components[{index}]"
+                yield key, component.get('id') or component.get('title') or key, component
+        return
+
+    catalog = oscal_data.get('catalog', {})
+    for index, group in enumerate(catalog.get('groups') or [] if isinstance(catalog, dict) else []):
+        if isinstance(group, dict):
+            key = f"catalog.groups[{index}]"
+            yield key, group.get('id') or key, group
+
+
+def _unit_components(key: str, content: dict) -> List[dict]:
+    if key.startswith('catalog.'):
+        return list(iter_group_components(int(key[len('catalog.groups['):-1]), content))
+    return [dict(content, location=key)]
+
+
+def load_cache(cache_file: Path, fingerprint: str) -> Dict[str, dict]:
+    """
+    Load cached unit results.
+
+    Returns:
+        Unit key -> entry; empty if there is no cache, it is unreadable, or it
+        was written by a different validator/NIST revision
+    """
+    cache_file = Path(cache_file)
+    if not cache_file.exists():
+        return {}
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if cache.get('version') != CACHE_VERSION or cache.get('fingerprint') != fingerprint:
+        return {}
+    return cache.get('units', {})
+
+
+def save_cache(cache_file: Path, fingerprint: str, units: Dict[str, dict]):
+    """Atomically replace the cache with the current run's unit results."""
+    cache_file = Path(cache_file)
+    tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+    # json.dumps uses the C encoder; json.dump to a file does not
+    payload = json.dumps({'version': CACHE_VERSION, 'fingerprint': fingerprint, 'units': units},
+                         separators=(',', ':'), ensure_ascii=False)
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        f.write(payload)
+    os.replace(tmp_file, cache_file)
+
+
+def validate_oscal_incremental(oscal_data: dict, cache_file: Path, nist_revision: str = 'rev5',
+                               file: Optional[str] = None, max_findings: int = DEFAULT_MAX_FINDINGS) -> dict:
+    """
+    Validate a parsed OSCAL document, re-checking only changed groups.
+
+    A group's cached results are reused when its content hash and the index
+    of its first component are unchanged (findings embed that index), so
+    inserting a requirement re-checks its group and the groups after it.
+
+    Args:
+        oscal_data: Parsed OSCAL catalog or component definition
+        cache_file: Cache path (created or replaced)
+        nist_revision: NIST SP 800-53 revision for control existence checks
+        file: Source path recorded in the report
+        max_findings: Maximum findings listed (rule counts stay exact)
+
+    Returns:
+        validate_oscal() report plus 'incremental': cache, reused and
+        recomputed (unit labels), hash_elapsed
+    """
+    started = time.perf_counter()
+    fingerprint = rules_fingerprint(nist_revision)
+    cached = load_cache(cache_file, fingerprint)
+
+    results = _Results(max_findings)
+    results.check('OSCAL001', True)
+    _check_document(oscal_data, results)
+    document_type, catalog_format = _document_type(oscal_data)
+    nist_exists = _memoized(validate_nist_control, nist_revision)
+    nist_description = _memoized(get_control_description, nist_revision)
+
+    units = {}
+    reused: List[str] = []
+    recomputed: List[str] = []
+    hash_elapsed = 0.0
+    offset = 0
+    for key, label, content in iter_units(oscal_data):
+        hash_started = time.perf_counter()
+        digest = content_hash(content)
+        hash_elapsed += time.perf_counter() - hash_started
+
+        entry = cached.get(key)
+        if entry and entry['hash'] == digest and entry['offset'] == offset:
+            reused.append(label)
+        else:
+            unit_results = _Results(sys.maxsize)
+            components = _unit_components(key, content)
+            for index, component in enumerate(components, offset):
+                _check_component(index, component, unit_results, nist_exists, nist_description, catalog_format)
+            entry = {
+                'hash': digest,
+                'offset': offset,
+                'components': len(components),
+                'checked': {rule: n for rule, n in unit_results.checked.items() if n},
+                'failed': {rule: n for rule, n in unit_results.failed.items() if n},
+                'findings': unit_results.findings,
+            }
+            recomputed.append(label)
+
+        results.merge(entry['checked'], entry['failed'], entry['findings'])
+        units[key] = entry
+        offset += entry['components']
+
+    _check_totals(offset, results)
+    if recomputed or units.keys() != cached.keys():
+        save_cache(cache_file, fingerprint, units)
+
+    report = _build_report(results, offset, file, document_type, started)
+    report['incremental'] = {
+        'cache': str(cache_file),
+        'reused': reused,
+        'recomputed': recomputed,
+        'hash_elapsed': hash_elapsed,
+    }
+    return report
@@ -0,0 +1,833 @@
+"""
+OSCAL JSON Schema validation with precompiled, disk-cached validators.
+
+Validates catalogs and component definitions against JSON schemas. The
+files in schemas/ are a hand-written subset modelled on the NIST OSCAL v1.1.2
+JSON schemas (required fields, property names and datatype patterns of the
+assemblies this toolkit produces); they have not been checked against the
+official release, so pass the official files with --schema for a conformance
+check. The schema is compiled once into a specialized Python validator: one
+generated function per schema node, with patterns precompiled and property
+dispatch through dictionaries. The generated source is cached next to the
+schema (<schema>.cache) keyed by the SHA-256 of the schema and of this module
+(the compiler), so later runs skip meta-validation and code generation and
+only exec the cached source.
+
+The compiler covers the constructs the official schemas are generated with:
+refs by definition path or by '#<anchor>' $id (e.g.
+'#assembly_oscal-catalog_catalog'), allOf/anyOf/oneOf/not, and the Unicode
+letter/number classes of the datatype patterns, which Python's re lacks and
+which are rewritten (see UNICODE_CLASSES; numbers become decimal digits only).
+Schemas using anything else fall back to jsonschema's Draft 7 validator with
+the same report format.
+
+Large catalogs are split into the document skeleton plus one task per group
+(or per component), and the tasks are validated in a process pool whose
+workers load the cached validator once.
+
+Usage:
+    python oscal_schema.py validate nerc-oscal.json
+    python oscal_schema.py validate big-catalog.json --workers 8 --json schema-report.json
+    python oscal_schema.py bench --groups 50 --controls 200
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from nerc_profile import add_profile_argument, start_profiling
+
+SCHEMA_DIR = Path(__file__).parent / "schemas"
+SCHEMA_FILES = {
+    'catalog': SCHEMA_DIR / "oscal_catalog_schema.json",
+    'component-definition': SCHEMA_DIR / "oscal_component_schema.json",
+}
+# Arrays under the document root that are validated as separate tasks
+SPLIT_KEYS = {
+    'catalog': ('groups', 'controls'),
+    'component-definition': ('components',),
+}
+
+CACHE_SUFFIX = ".cache"
+CACHE_FORMAT_VERSION = 1
+# Cached sources are only valid for the compiler that generated them
+COMPILER_SHA256 = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+DEFAULT_MAX_ERRORS = 1000
+# Below this many controls/components, validation runs in-process
+PARALLEL_MIN_ITEMS = 5000
+
+TYPE_CHECKS = {
+    'object': 'isinstance({0}, dict)',
+    'array': 'isinstance({0}, list)',
+    'string': 'isinstance({0}, str)',
+    'integer': '(isinstance({0}, int) and not isinstance({0}, bool))',
+    'number': '(isinstance({0}, (int, float)) and not isinstance({0}, bool))',
+    'boolean': 'isinstance({0}, bool)',
+    'null': '{0} is None',
+}
+SUPPORTED_KEYWORDS = {
+    '$ref', 'type', 'properties', 'required', 'additionalProperties', 'minProperties', 'maxProperties',
+    'items', 'minItems', 'maxItems', 'pattern', 'minLength', 'maxLength', 'enum', 'const',
+    'allOf', 'anyOf', 'oneOf', 'not',
+}
+# Unicode property classes used by the official OSCAL datatype patterns -> Python re
+UNICODE_CLASSES = {
+    'L': r'[^\W\d_]',
+    'N': r'\d',
+    'Nd': r'\d',
+}
+UNICODE_CLASS_PATTERN = re.compile(r'\\p\{(\w+)\}|\\.|\[|\]', re.DOTALL)
+ANNOTATION_KEYWORDS = {
+    '$schema', '$id', '$comment', 'title', 'description', 'definitions', 'format', 'examples', 'default',
+}
+
+
+class SchemaCompileError(ValueError):
+    """Schema uses a construct the compiler does not support."""
+
+
+def _short(value) -> str:
+    text = json.dumps(value, ensure_ascii=False)
+    return text if len(text) <= 60 else text[:57] + '...'
+
+
+def _pointer(key) -> str:
+    return '/' + str(key).replace('~', '~0').replace('/', '~1')
+
+
+def _python_pattern(pattern: str) -> str:
+    """
+    Rewrite Unicode property classes (UNICODE_CLASSES) outside [...] for Python's re.
+
+    Raises:
+        SchemaCompileError: For other properties or a property inside [...]
+    """
+    if '\\p{' not in pattern:
+        return pattern
+    parts = []
+    in_class = False
+    last = 0
+    for match in UNICODE_CLASS_PATTERN.finditer(pattern):
+        token = match.group(0)
+        if token == '[' and not in_class:
+            in_class = True
+        elif token == ']' and in_class:
+            in_class = False
+        elif match.group(1) is not None:
+            if in_class or match.group(1) not in UNICODE_CLASSES:
+                raise SchemaCompileError(f"Unsupported Unicode class {token} in pattern {pattern!r}")
+            parts += [pattern[last:match.start()], UNICODE_CLASSES[match.group(1)]]
+            last = match.end()
+    return ''.join(parts) + pattern[last:]
+
+
+def _with_python_patterns(node):
+    """Copy of a schema with every rewritable 'pattern' rewritten by _python_pattern."""
+    if isinstance(node, list):
+        return [_with_python_patterns(item) for item in node]
+    if not isinstance(node, dict):
+        return node
+    result = {}
+    for key, value in node.items():
+        if key == 'pattern' and isinstance(value, str):
+            try:
+                value = _python_pattern(value)
+            except SchemaCompileError:
+                pass  # left as is; meta-validation reports it
+        result[key] = _with_python_patterns(value)
+    return result
+
+
+def _anchors(schema: dict) -> Dict[str, str]:
+    """'#<anchor>' $id of each definition -> definition name."""
+    return {node['$id']: name for name, node in schema.get('definitions', {}).items()
+            if isinstance(node, dict) and str(node.get('$id', '')).startswith('#')}
+
+
+def _ref_definition(schema: dict, ref: str, anchors: Optional[Dict[str, str]] = None) -> Optional[str]:
+    """
+    Definition name a $ref points to, or None.
+
+    Handles '#/definitions/<name>' and '#<anchor>' refs, optionally prefixed
+    with the schema's own $id.
+    """
+    base = str(schema.get('$id', '')).split('#', 1)[0]
+    if base and ref.startswith(base + '#'):
+        ref = ref[len(base):]
+    prefix = '#/definitions/'
+    if ref.startswith(prefix):
+        name = ref[len(prefix):].replace('~1', '/').replace('~0', '~')
+        return name if name in schema.get('definitions', {}) else None
+    return (anchors if anchors is not None else _anchors(schema)).get(ref)
+
+
+class _Compiler:
+    """Generate Python source for a JSON Schema (Draft 7 subset)."""
+
+    def __init__(self, schema: dict):
+        self.schema = schema
+        self.definitions = schema.get('definitions', {})
+        self.anchors = _anchors(schema)
+        self.lines: List[str] = []
+        # Dispatch tables reference functions, so they are emitted after all of them
+        self.tables: List[str] = []
+        self.constants: Dict[str, object] = {}
+        self.definition_functions: Dict[str, str] = {}
+        self.count = 0
+
+    def constant(self, value) -> str:
+        name = f"_c{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def compile(self) -> str:
+        for name in self.definitions:
+            self.definition_functions[name] = f"_d{len(self.definition_functions)}"
+        for name, node in self.definitions.items():
+            self.node(node, self.definition_functions[name])
+        root = self.node(self.schema, '_root')
+
+        table = ', '.join(f"{name!r}: {function}" for name, function in self.definition_functions.items())
+        constants = [f"{name} = {self._literal(value)}" for name, value in self.constants.items()]
+        return '\n'.join(constants + [''] + self.lines + self.tables
+                         + [f"ROOT = {root}", f"DEFINITIONS = {{{table}}}", ''])
+
+    @staticmethod
+    def _literal(value) -> str:
+        if isinstance(value, re.Pattern):
+            return f"_re.compile({value.pattern!r})"
+        return repr(value)
+
+    def ref(self, ref: str) -> str:
+        name = _ref_definition(self.schema, ref, self.anchors)
+        if name is None:
+            raise SchemaCompileError(f"Unsupported $ref: {ref}")
+        return self.definition_functions[name]
+
+    def node(self, node, name: Optional[str] = None) -> str:
+        """Emit a function validating one schema node; returns its name."""
+        if node is True or node == {}:
+            return '_accept'
+        if node is False:
+            return '_reject'
+        if not isinstance(node, dict):
+            raise SchemaCompileError(f"Schema node must be an object: {_short(node)}")
+
+        unsupported = set(node) - SUPPORTED_KEYWORDS - ANNOTATION_KEYWORDS
+        if unsupported:
+            raise SchemaCompileError(f"Unsupported keyword(s): {', '.join(sorted(unsupported))}")
+        if '$ref' in node:
+            # Draft 7: siblings of $ref are ignored
+            target = self.ref(node['$ref'])
+            if name is None:
+                return target
+            self.lines += [f"def {name}(data, path, errors):", f"    {target}(data, path, errors)", ""]
+            return name
+
+        if name is None:
+            name = f"_s{self.count}"
+            self.count += 1
+        body: List[str] = []
+        types = node.get('type')
+        types = [types] if isinstance(types, str) else types
+        if types:
+            unknown = [t for t in types if t not in TYPE_CHECKS]
+            if unknown:
+                raise SchemaCompileError(f"Unsupported type(s): {', '.join(unknown)}")
+            check = ' or '.join(TYPE_CHECKS[t].format('data') for t in types)
+            message = repr(f" is not of type {', '.join(repr(t) for t in types)}")
+            body += [f"    if not ({check}):",
+                     f"        errors.append((path, 'type', _short(data) + {message}))",
+                     "        return"]
+
+        if 'enum' in node:
+            values = self.constant(list(node['enum']))
+            body += [f"    if data not in {values}:",
+                     f"        errors.append((path, 'enum', _short(data) + ' is not one of ' + _short({values})))"]
+        if 'const' in node:
+            value = self.constant(node['const'])
+            body += [f"    if data != {value}:",
+                     f"        errors.append((path, 'const', _short({value}) + ' was expected'))"]
+
+        body += self._combinator_checks(node)
+
+        body += self._object_checks(node, types)
+        body += self._array_checks(node, types)
+        body += self._string_checks(node, types)
+
+        self.lines += [f"def {name}(data, path, errors):"] + (body or ["    pass"]) + [""]
+        return name
+
+    def _combinator_checks(self, node: dict) -> List[str]:
+        lines = []
+        for sub in node.get('allOf', []):
+            # Errors of each branch are reported as they are, like jsonschema does
+            check = self.node(sub)
+            if check != '_accept':
+                lines.append(f"    {check}(data, path, errors)")
+        if 'anyOf' in node:
+            checks = ', '.join(self.node(sub) for sub in node['anyOf'])
+            lines += [f"    if not any(_valid(check, data, path) for check in ({checks},)):",
+                      "        errors.append((path, 'anyOf', _short(data) + "
+                      "' is not valid under any of the given schemas'))"]
+        if 'oneOf' in node:
+            checks = ', '.join(self.node(sub) for sub in node['oneOf'])
+            lines += [f"    matched = sum(1 for check in ({checks},) if _valid(check, data, path))",
+                      "    if matched == 0:",
+                      "        errors.append((path, 'oneOf', _short(data) + "
+                      "' is not valid under any of the given schemas'))",
+                      "    elif matched > 1:",
+                      "        errors.append((path, 'oneOf', _short(data) + "
+                      "' is valid under more than one of the given schemas'))"]
+        if 'not' in node:
+            check = self.node(node['not'])
+            lines += [f"    if _valid({check}, data, path):",
+                      f"        errors.append((path, 'not', _short(data) + "
+                      f"{repr(' should not be valid under ' + _short(node['not']))}))"]
+        return lines
+
+    @staticmethod
+    def _guard(types, kind: str, check: str) -> Tuple[str, str]:
+        """Guard keyword checks by instance type unless the type is already fixed."""
+        if types == [kind]:
+            return '', '    '
+        return f"    if {check}:", '        '
+
+    def _object_checks(self, node: dict, types) -> List[str]:
+        if not any(key in node for key in ('properties', 'required', 'additionalProperties',
+                                           'minProperties', 'maxProperties')):
+            return []
+        guard, indent = self._guard(types, 'object', 'isinstance(data, dict)')
+        lines = [guard] if guard else []
+        if 'minProperties' in node:
+            lines += [f"{indent}if len(data) < {int(node['minProperties'])}:",
+                      f"{indent}    errors.append((path, 'minProperties', _short(data) + "
+                      f"' does not have enough properties'))"]
+        if 'maxProperties' in node:
+            lines += [f"{indent}if len(data) > {int(node['maxProperties'])}:",
+                      f"{indent}    errors.append((path, 'maxProperties', _short(data) + ' has too many properties'))"]
+
+        for key in node.get('required', []):
+            lines += [f"{indent}if {key!r} not in data:",
+                      f"{indent}    errors.append((path, 'required', {repr(repr(key) + ' is a required property')}))"]
+
+        properties = {key: (self.node(sub), _pointer(key)) for key, sub in node.get('properties', {}).items()}
+        additional = node.get('additionalProperties', True)
+        extra = None if additional is False else self.node(additional) if additional is not True else '_accept'
+        if properties or extra != '_accept':
+            table = self.constant_table(properties)
+            lines += [f"{indent}for key, value in data.items():",
+                      f"{indent}    entry = {table}.get(key)",
+                      f"{indent}    if entry is not None:",
+                      f"{indent}        entry[0](value, path + entry[1], errors)"]
+            if extra is None:
+                lines += [f"{indent}    else:",
+                          f"{indent}        errors.append((path, 'additionalProperties', "
+                          f"'Additional properties are not allowed (' + repr(key) + ' was unexpected)'))"]
+            elif extra != '_accept':
+                lines += [f"{indent}    else:",
+                          f"{indent}        {extra}(value, path + _pointer(key), errors)"]
+        return lines
+
+    def constant_table(self, properties: Dict[str, Tuple[str, str]]) -> str:
+        name = f"_t{len(self.tables)}"
+        entries = ', '.join(f"{key!r}: ({function}, {segment!r})" for key, (function, segment) in properties.items())
+        self.tables.append(f"{name} = {{{entries}}}")
+        return name
+
+    def _array_checks(self, node: dict, types) -> List[str]:
+        if not any(key in node for key in ('items', 'minItems', 'maxItems')):
+            return []
+        guard, indent = self._guard(types, 'array', 'isinstance(data, list)')
+        lines = [guard] if guard else []
+        if 'minItems' in node:
+            lines += [f"{indent}if len(data) < {int(node['minItems'])}:",
+                      f"{indent}    errors.append((path, 'minItems', _short(data) + "
+                      f"{repr(' is too short (minItems ' + str(node['minItems']) + ')')}))"]
+        if 'maxItems' in node:
+            lines += [f"{indent}if len(data) > {int(node['maxItems'])}:",
+                      f"{indent}    errors.append((path, 'maxItems', _short(data) + "
+                      f"{repr(' is too long (maxItems ' + str(node['maxItems']) + ')')}))"]
+        if 'items' in node:
+            if isinstance(node['items'], list):
+                raise SchemaCompileError("Tuple-form 'items' is not supported")
+            item = self.node(node['items'])
+            if item != '_accept':
+                lines += [f"{indent}for index, item in enumerate(data):",
+                          f"{indent}    {item}(item, path + '/' + str(index), errors)"]
+        return lines
+
+    def _string_checks(self, node: dict, types) -> List[str]:
+        if not any(key in node for key in ('pattern', 'minLength', 'maxLength')):
+            return []
+        guard, indent = self._guard(types, 'string', 'isinstance(data, str)')
+        lines = [guard] if guard else []
+        if 'pattern' in node:
+            pattern = self.constant(re.compile(_python_pattern(node['pattern'])))
+            message = repr(' does not match ' + repr(node['pattern']))
+            lines += [f"{indent}if {pattern}.search(data) is None:",
+                      f"{indent}    errors.append((path, 'pattern', repr(data) + {message}))"]
+        if 'minLength' in node:
+            lines += [f"{indent}if len(data) < {int(node['minLength'])}:",
+                      f"{indent}    errors.append((path, 'minLength', repr(data) + ' is too short'))"]
+        if 'maxLength' in node:
+            lines += [f"{indent}if len(data) > {int(node['maxLength'])}:",
+                      f"{indent}    errors.append((path, 'maxLength', repr(data) + ' is too long'))"]
+        return lines
+
+
+def _accept(data, path, errors):
+    pass
+
+
+def _reject(data, path, errors):
+    errors.append((path, 'false', 'False schema does not allow ' + _short(data)))
+
+
+def _valid(check, data, path) -> bool:
+    """Whether data passes one compiled check (for anyOf/oneOf/not)."""
+    errors: List[tuple] = []
+    check(data, path, errors)
+    return not errors
+
+
+def generate_validator_source(schema: dict) -> str:
+    """
+    Generate Python source for a schema.
+
+    Raises:
+        SchemaCompileError: If the schema uses unsupported keywords
+    """
+    return _Compiler(schema).compile()
+
+
+class CompiledSchema:
+    """A schema compiled to Python functions (generated source kept in .source)."""
+
+    def __init__(self, source: str, origin: str = '<oscal schema>'):
+        self.source = source
+        namespace = {'_re': re, '_short': _short, '_pointer': _pointer, '_accept': _accept, '_reject': _reject,
+                     '_valid': _valid}
+        exec(compile(source, origin, 'exec'), namespace)
+        self._root = namespace['ROOT']
+        self._definitions = namespace['DEFINITIONS']
+
+    def iter_errors(self, instance, definition: Optional[str] = None, path: str = '') -> List[dict]:
+        """Validate instance against the root schema or a named definition."""
+        errors: List[tuple] = []
+        check = self._definitions[definition] if definition else self._root
+        check(instance, path, errors)
+        return [{'path': p or '/', 'keyword': k, 'message': m} for p, k, m in errors]
+
+
+class JSONSchemaFallback:
+    """jsonschema Draft 7 validator with the CompiledSchema interface."""
+
+    def __init__(self, schema: dict):
+        from jsonschema import Draft7Validator
+        self.source = None
+        self._schema = schema
+        self._validators = {None: Draft7Validator(schema)}
+        self._validator_class = Draft7Validator
+
+    def iter_errors(self, instance, definition: Optional[str] = None, path: str = '') -> List[dict]:
+        if definition not in self._validators:
+            scoped = {'$ref': f'#/definitions/{definition}', 'definitions': self._schema.get('definitions', {})}
+            self._validators[definition] = self._validator_class(scoped)
+        errors = []
+        for error in self._validators[definition].iter_errors(instance):
+            pointer = path + ''.join(_pointer(part) for part in error.absolute_path)
+            errors.append({'path': pointer or '/', 'keyword': error.validator, 'message': error.message})
+        return errors
+
+
+def _cache_file(schema_file: Path) -> Path:
+    return schema_file.with_name(schema_file.name + CACHE_SUFFIX)
+
+
+def _write_cache(cache_file: Path, digest: str, source: str):
+    """Write the compiled source atomically (as nist_catalog writes its index)."""
+    tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump({'format': CACHE_FORMAT_VERSION, 'schema_sha256': digest,
+                   'compiler_sha256': COMPILER_SHA256, 'source': source}, f)
+    os.replace(tmp_file, cache_file)
+
+
+def _read_cache(cache_file: Path, digest: str) -> Optional[str]:
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if (cached.get('format') != CACHE_FORMAT_VERSION or cached.get('schema_sha256') != digest
+            or cached.get('compiler_sha256') != COMPILER_SHA256):
+        return None
+    return cached.get('source')
+
+
+def compile_schema_file(schema_file: Path, use_cache: bool = True):
+    """
+    Load a compiled validator for a schema file, compiling and caching it if needed.
+
+    Args:
+        schema_file: JSON Schema file
+        use_cache: Read/write the <schema>.cache sidecar
+
+    Returns:
+        CompiledSchema, or JSONSchemaFallback if the schema can't be compiled
+
+    Raises:
+        FileNotFoundError: If the schema doesn't exist
+        ValueError: If the schema is not valid JSON Schema
+    """
+    schema_file = Path(schema_file)
+    if not schema_file.exists():
+        raise FileNotFoundError(f"Schema file not found: {schema_file}")
+
+    raw = schema_file.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    cache_file = _cache_file(schema_file)
+    if use_cache:
+        source = _read_cache(cache_file, digest)
+        if source is not None:
+            return CompiledSchema(source, str(cache_file))
+
+    # jsonschema checks and applies patterns with Python's re, so it gets the rewritten ones too
+    schema = _with_python_patterns(json.loads(raw))
+    from jsonschema import Draft7Validator, exceptions
+    try:
+        Draft7Validator.check_schema(schema)
+    except exceptions.SchemaError as e:
+        raise ValueError(f"Invalid JSON Schema {schema_file}: {e.message}")
+
+    try:
+        source = generate_validator_source(schema)
+    except (SchemaCompileError, re.error):
+        return JSONSchemaFallback(schema)
+
+    if use_cache:
+        try:
+            _write_cache(cache_file, digest, source)
+        except OSError:
+            pass
+    return CompiledSchema(source, str(schema_file))
+
+
+@lru_cache(maxsize=None)
+def _cached_validator(schema_file: str, size: int, mtime_ns: int):
+    return compile_schema_file(Path(schema_file))
+
+
+def get_validator(schema_file: Path):
+    """Compiled validator for a schema file, cached per process (invalidated when the file changes)."""
+    schema_file = Path(schema_file).resolve()
+    stat = schema_file.stat()
+    return _cached_validator(str(schema_file), stat.st_size, stat.st_mtime_ns)
+
+
+def document_kind(oscal_data: dict) -> str:
+    """Root element of an OSCAL document ('catalog' or 'component-definition')."""
+    for kind in SCHEMA_FILES:
+        if kind in oscal_data:
+            return kind
+    raise ValueError("Not an OSCAL catalog or component definition (missing root element)")
+
+
+def _item_definition(schema: dict, kind: str, key: str) -> Optional[str]:
+    """Definition name for items of <kind>.<key>, following $refs (None if not a plain ref)."""
+    definitions = schema.get('definitions', {})
+    anchors = _anchors(schema)
+
+    def resolve(node):
+        while isinstance(node, dict) and '$ref' in node:
+            name = _ref_definition(schema, node['$ref'], anchors)
+            if name is None:
+                return None, None
+            node, last = definitions[name], name
+            if '$ref' not in node:
+                return node, last
+        return node, None
+
+    root, _ = resolve(schema.get('properties', {}).get(kind))
+    if not isinstance(root, dict):
+        return None
+    array, _ = resolve(root.get('properties', {}).get(key))
+    if not isinstance(array, dict) or not isinstance(array.get('items'), dict):
+        return None
+    _, name = resolve(array['items'])
+    return name
+
+
+def _count_items(items: list) -> int:
+    count = 0
+    for item in items:
+        count += 1
+        if isinstance(item, dict):
+            count += _count_items(item.get('controls', []) or []) + _count_items(item.get('groups', []) or [])
+    return count
+
+
+def _validate_batch(schema_file: str, tasks: List[tuple], max_errors: int) -> List[dict]:
+    """Validate (definition, path, instance) tasks (runs in a worker process)."""
+    validator = get_validator(Path(schema_file))
+    errors = []
+    for definition, path, instance in tasks:
+        errors.extend(validator.iter_errors(instance, definition, path))
+        if len(errors) >= max_errors:
+            break
+    return errors[:max_errors]
+
+
+def _validate_batch_args(args):
+    return _validate_batch(*args)
+
+
+def validate_oscal_schema(oscal_data: dict, schema_file: Optional[Path] = None, workers: Optional[int] = None,
+                          max_errors: int = DEFAULT_MAX_ERRORS, file: Optional[str] = None) -> dict:
+    """
+    Validate a parsed OSCAL document against its JSON Schema.
+
+    Args:
+        oscal_data: Parsed catalog or component definition
+        schema_file: Schema to use (default: schemas/ file for the document kind)
+        workers: Worker processes for per-group validation (default: CPU count
+            for documents with at least PARALLEL_MIN_ITEMS controls, else 1)
+        max_errors: Maximum errors listed in the report
+        file: Source path recorded in the report
+
+    Returns:
+        Report dict: file, schema, kind, valid, items (controls/components),
+        tasks, workers, errors, truncated, compiled, elapsed
+
+    Raises:
+        ValueError: If the document has no OSCAL root element
+    """
+    started = time.perf_counter()
+    kind = document_kind(oscal_data)
+    schema_file = Path(schema_file or SCHEMA_FILES[kind])
+    validator = get_validator(schema_file)
+
+    root = oscal_data[kind]
+    tasks = []
+    split = []
+    if isinstance(root, dict):
+        schema = json.loads(schema_file.read_text(encoding='utf-8'))
+        for key in SPLIT_KEYS[kind]:
+            items = root.get(key)
+            definition = _item_definition(schema, kind, key)
+            if definition and isinstance(items, list) and items:
+                split.append(key)
+                tasks += [(definition, f"/{kind}/{key}/{index}", item) for index, item in enumerate(items)]
+
+    if split:
+        # Split arrays become one-element placeholders so array-level rules still apply
+        skeleton = dict(oscal_data, **{kind: {key: ([{}] if key in split else value)
+                                               for key, value in root.items()}})
+        prefixes = tuple(f"/{kind}/{key}/" for key in split)
+        errors = [error for error in validator.iter_errors(skeleton) if not error['path'].startswith(prefixes)]
+    else:
+        errors = validator.iter_errors(oscal_data)
+
+    items = _count_items([task[2] for task in tasks])
+    if workers is None:
+        workers = (os.cpu_count() or 1) if items >= PARALLEL_MIN_ITEMS else 1
+    workers = max(1, min(workers, len(tasks) or 1))
+
+    if workers == 1:
+        errors += _validate_batch(str(schema_file), tasks, max_errors)
+    else:
+        # Contiguous batches keep errors in document order
+        size = -(-len(tasks) // (workers * 4))
+        batches = [(str(schema_file.resolve()), tasks[i:i + size], max_errors) for i in range(0, len(tasks), size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for batch_errors in pool.map(_validate_batch_args, batches):
+                errors += batch_errors
+
+    return {
+        'file': file,
+        'schema': str(schema_file),
+        'kind': kind,
+        'valid': not errors,
+        'items': items,
+        'tasks': len(tasks),
+        'workers': workers,
+        'errors': errors[:max_errors],
+        'truncated': len(errors) > max_errors,
+        'compiled': isinstance(validator, CompiledSchema),
+        'elapsed': time.perf_counter() - started,
+    }
+
+
+def validate_oscal_schema_file(oscal_file: Path, schema_file: Optional[Path] = None,
+                               workers: Optional[int] = None,
+                               max_errors: int = DEFAULT_MAX_ERRORS) -> dict:
+    """
+    Load an OSCAL JSON file and validate it against its schema.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If the file is not valid JSON
+        ValueError: If the document has no OSCAL root element
+    """
+    oscal_file = Path(oscal_file)
+    if not oscal_file.exists():
+        raise FileNotFoundError(f"OSCAL file not found: {oscal_file}")
+    with open(oscal_file, 'r', encoding='utf-8') as f:
+        oscal_data = json.load(f)
+    return validate_oscal_schema(oscal_data, schema_file, workers, max_errors, str(oscal_file))
+
+
+def synthetic_catalog(groups: int = 50, controls: int = 200) -> dict:
+    """Schema-valid catalog shaped like generate_oscal output, for benchmarks and tests."""
+    def control(g, r):
+        return {
+            'id': f"cip-{g:03d}-1-r{r}",
+            'class': 'requirement',
+            'title': f"CIP-{g:03d}-1 R{r}",
+            'parts': [{'id': f"cip-{g:03d}-1-r{r}-smt", 'name': 'statement',
+                       'prose': f"Each Responsible Entity shall implement requirement {r}."}],
+            'props': [
+                {'name': 'label', 'value': f"R{r}"},
+                {'name': 'NIST-800-53-Primary-Control', 'value': 'SC-7'},
+                {'name': 'NIST-800-53-Secondary-Controls', 'value': 'CA-3, AC-17'},
+                {'name': 'NERC-Requirement-ID', 'value': f"CIP-{g:03d}-1 R{r}"},
+                {'name': 'JAMA-Requirement-ID', 'value': f"CIP-{g:03d}-R{r}"},
+            ],
+        }
+
+    return {'catalog': {
+        'uuid': str(uuid.uuid4()),
+        'metadata': {'title': 'Synthetic NERC CIP Catalog', 'last-modified': '2026-01-25T19:24:37Z',
+                     'version': '1.0', 'oscal-version': '1.1.2'},
+        'groups': [{'id': f"cip-{g:03d}-1", 'class': 'standard', 'title': f"CIP-{g:03d}-1",
+                    'controls': [control(g, r) for r in range(1, controls + 1)]}
+                   for g in range(1, groups + 1)],
+    }}
+
+
+def benchmark(groups: int = 50, controls: int = 200, workers: Optional[int] = None,
+              repeat: int = 3) -> Dict[str, float]:
+    """
+    Measure schema validation throughput on a synthetic catalog.
+
+    Returns:
+        Controls/second for 'jsonschema' (Draft7Validator on the whole
+        document), 'compiled' (in-process) and 'parallel' (process pool), plus
+        'compile_ms' (cold compile) and 'cache_load_ms' (load from .cache)
+    """
+    from jsonschema import Draft7Validator
+
+    schema_file = SCHEMA_FILES['catalog']
+    catalog = synthetic_catalog(groups, controls)
+    total = groups * controls + groups
+    workers = workers or os.cpu_count() or 1
+
+    started = time.perf_counter()
+    compile_schema_file(schema_file, use_cache=False)
+    compile_ms = (time.perf_counter() - started) * 1000
+    compile_schema_file(schema_file)
+    started = time.perf_counter()
+    compile_schema_file(schema_file)
+    cache_load_ms = (time.perf_counter() - started) * 1000
+
+    reference = Draft7Validator(json.loads(schema_file.read_text(encoding='utf-8')))
+    runs: Dict[str, Callable[[], object]] = {
+        'jsonschema': lambda: list(reference.iter_errors(catalog)),
+        'compiled': lambda: validate_oscal_schema(catalog, schema_file, workers=1),
+        'parallel': lambda: validate_oscal_schema(catalog, schema_file, workers=workers),
+    }
+    best = dict.fromkeys(runs, float('inf'))
+    # Interleave runs so machine noise affects all variants alike
+    for _ in range(repeat):
+        for label, run in runs.items():
+            started = time.perf_counter()
+            run()
+            best[label] = min(best[label], time.perf_counter() - started)
+
+    results = {label: total / seconds for label, seconds in best.items()}
+    results.update({'compile_ms': compile_ms, 'cache_load_ms': cache_load_ms})
+    return results
+
+
+def print_report(report: dict, limit: int = 50):
+    """Print schema errors in the repo's [OK]/[ERR] style."""
+    for error in report['errors'][:limit]:
+        print(f"[ERR] {error['path']} ({error['keyword']}): {error['message']}")
+    if len(report['errors']) > limit:
+        print(f"   ... {len(report['errors']) - limit} more error(s)")
+    engine = 'compiled' if report['compiled'] else 'jsonschema'
+    summary = (f"({report['kind']}, {report['items']} item(s), {report['tasks']} task(s), "
+               f"{report['workers']} worker(s), {engine}, {report['elapsed']:.3f}s)")
+    if report['valid']:
+        print(f"[OK] Schema validation passed {summary}")
+    else:
+        more = '+' if report['truncated'] else ''
+        print(f"[ERR] Schema validation failed with {len(report['errors'])}{more} error(s) {summary}")
+
+
+def main():
+    """Command-line interface: validate files and benchmark throughput."""
+    parser = argparse.ArgumentParser(description='OSCAL JSON Schema validation with precompiled validators')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    validate_parser = subparsers.add_parser('validate', help='Validate an OSCAL file against its schema')
+    validate_parser.add_argument('oscal_file', type=Path, help='OSCAL catalog or component definition JSON')
+    validate_parser.add_argument('--schema', type=Path, default=None,
+                                 help='Schema file (default: schemas/ file for the document kind)')
+    validate_parser.add_argument('--workers', type=int, default=None,
+                                 help=f'Worker processes (default: CPU count from {PARALLEL_MIN_ITEMS} items)')
+    validate_parser.add_argument('--max-errors', type=int, default=DEFAULT_MAX_ERRORS,
+                                 help=f'Errors kept in the report (default: {DEFAULT_MAX_ERRORS})')
+    validate_parser.add_argument('--json', type=Path, default=None, help='Write the report as JSON')
+
+    bench_parser = subparsers.add_parser('bench', help='Measure validation throughput (controls/second)')
+    bench_parser.add_argument('--groups', type=int, default=50, help='Synthetic groups (default: 50)')
+    bench_parser.add_argument('--controls', type=int, default=200, help='Controls per group (default: 200)')
+    bench_parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    bench_parser.add_argument('--repeat', type=int, default=3, help='Runs per variant; best is reported')
+
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    start_profiling(args.profile)
+
+    try:
+        if args.command == 'bench':
+            print(f"[*] {args.groups} groups x {args.controls} controls, best of {args.repeat}")
+            results = benchmark(args.groups, args.controls, args.workers, args.repeat)
+            print(f"   compile {results['compile_ms']:.1f} ms cold, {results['cache_load_ms']:.1f} ms from cache")
+            for label in ('jsonschema', 'compiled', 'parallel'):
+                speedup = results[label] / results['jsonschema']
+                print(f"   {label:<10} {results[label]:>12,.0f} controls/s   ({speedup:.1f}x)")
+            return
+
+        report = validate_oscal_schema_file(args.oscal_file, args.schema, args.workers, args.max_errors)
+    except FileNotFoundError as e:
+        print(f"[ERR] Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except json.JSONDecodeError as e:
+        print(f"[ERR] JSON parsing error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"[ERR] Validation error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print_report(report)
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+        print(f"[*] Report written to {args.json}")
+    if not report['valid']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,351 @@
+"""
+Incremental OSCAL JSON reader.
+
+Walks an OSCAL document without loading it whole, yielding one component at a
+time from either schema:
+- Catalog: catalog.groups[].controls[] (class='requirement')
+- Component definition: component-definition.components[]
+
+Only the value currently being yielded is decoded; everything else (metadata,
+back-matter, non-requirement controls) is skipped by scanning, so peak memory
+is bounded by the largest single control/component plus the read buffer.
+
+Typical usage:
+    for component in iter_oscal_components(Path('nerc-oscal.json')):
+        print(component['title'])
+"""
+
+import json
+import re
+import uuid
+from pathlib import Path
+from typing import Any, Iterator, TextIO
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+WHITESPACE = ' \t\r\n'
+# Outside strings, the only characters that matter when skipping a value
+STRUCTURAL_PATTERN = re.compile(r'["{}\[\]]')
+# Inside strings, the only characters that matter are the closing quote and escapes
+STRING_SPECIAL_PATTERN = re.compile(r'["\\]')
+# End of a bare scalar (number, true, false, null)
+SCALAR_END_PATTERN = re.compile(r'[,\]}\s]')
+
+
+class JSONStreamReader:
+    """
+    Pull-style JSON reader that decodes one value at a time from a text stream.
+
+    The caller navigates the document with iter_object()/iter_array() and, at
+    each position, either decodes the value (read_value), skips it (skip_value)
+    or descends into it.
+    """
+
+    def __init__(self, stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize the reader.
+
+        Args:
+            stream: Text stream positioned at the start of a JSON document
+            chunk_size: Characters read from the stream at a time
+        """
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._offset = 0   # characters discarded before self._buf
+        self._eof = False
+
+    # ------------------------------------------------------------------
+    # Buffer management
+    # ------------------------------------------------------------------
+
+    def _fill(self, size: int = 0) -> bool:
+        """Read more input; returns False at end of stream."""
+        if self._eof:
+            return False
+
+        # Drop consumed text so the buffer only holds the current value
+        if self._pos:
+            self._offset += self._pos
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+
+        chunk = self._stream.read(max(size, self._chunk_size))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf += chunk
+        return True
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        """Build a decode error reporting the absolute character position."""
+        return json.JSONDecodeError(message, self._buf, self._pos)
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it ('' at EOF)."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ''
+
+    def _expect(self, char: str):
+        """Consume the given structural character."""
+        if self.peek() != char:
+            found = self.peek() or 'end of file'
+            raise self._error(f"Expected '{char}' at character {self._offset + self._pos}, found '{found}'")
+        self._pos += 1
+
+    # ------------------------------------------------------------------
+    # Values
+    # ------------------------------------------------------------------
+
+    def read_value(self) -> Any:
+        """
+        Decode the next complete JSON value.
+
+        Returns:
+            Decoded value
+
+        Raises:
+            json.JSONDecodeError: If the value is malformed or truncated
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+                # A number at the end of the buffer might continue in the next chunk
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError as e:
+                if self._eof:
+                    raise json.JSONDecodeError(e.msg, e.doc, e.pos) from None
+            # Grow geometrically so large values are re-parsed O(log n) times
+            self._fill(len(self._buf))
+
+    def skip_value(self):
+        """Skip the next JSON value without decoding it."""
+        char = self.peek()
+        if char == '"':
+            self._skip_string()
+        elif char in '{[':
+            self._skip_container()
+        elif char:
+            self._skip_scalar()
+        else:
+            raise self._error("Unexpected end of file")
+
+    def _skip_string(self):
+        """Skip a string starting at the current opening quote."""
+        self._pos += 1
+        while True:
+            match = STRING_SPECIAL_PATTERN.search(self._buf, self._pos)
+            if match is None:
+                self._pos = len(self._buf)
+                if not self._fill():
+                    raise self._error("Unterminated string")
+                continue
+            if match.group() == '"':
+                self._pos = match.end()
+                return
+            # Backslash escape: skip it together with the escaped character
+            if match.end() < len(self._buf):
+                self._pos = match.end() + 1
+                continue
+            self._pos = match.start()
+            if not self._fill():
+                raise self._error("Unterminated string")
+
+    def _skip_container(self):
+        """Skip an object or array by tracking bracket depth."""
+        depth = 0
+        while True:
+            match = STRUCTURAL_PATTERN.search(self._buf, self._pos)
+            if match is None:
+                self._pos = len(self._buf)
+                if not self._fill():
+                    raise self._error("Unterminated object or array")
+                continue
+
+            self._pos = match.start()
+            char = match.group()
+            if char == '"':
+                self._skip_string()
+                continue
+
+            self._pos += 1
+            depth += 1 if char in '{[' else -1
+            if depth == 0:
+                return
+
+    def _skip_scalar(self):
+        """Skip a number or literal."""
+        while True:
+            match = SCALAR_END_PATTERN.search(self._buf, self._pos)
+            if match is not None:
+                self._pos = match.start()
+                return
+            self._pos = len(self._buf)
+            if not self._fill():
+                return
+
+    # ------------------------------------------------------------------
+    # Navigation
+    # ------------------------------------------------------------------
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Iterate over the keys of the next JSON object.
+
+        After each yielded key the caller must consume its value (read_value,
+        skip_value or a nested iter_*) before advancing; an unconsumed value is
+        skipped automatically.
+
+        Yields:
+            Object keys in document order
+        """
+        self._expect('{')
+        if self.peek() == '}':
+            self._pos += 1
+            return
+
+        while True:
+            if self.peek() != '"':
+                raise self._error(f"Expected object key at character {self._offset + self._pos}")
+            key = self.read_value()
+            self._expect(':')
+
+            self.peek()
+            yield key
+            if self.peek() not in ',}':
+                self.skip_value()
+
+            if self.peek() == ',':
+                self._pos += 1
+                continue
+            self._expect('}')
+            return
+
+    def iter_array(self) -> Iterator[int]:
+        """
+        Iterate over the elements of the next JSON array.
+
+        After each yielded index the caller must consume the element; an
+        unconsumed element is skipped automatically.
+
+        Yields:
+            Element indexes
+        """
+        self._expect('[')
+        if self.peek() == ']':
+            self._pos += 1
+            return
+
+        index = 0
+        while True:
+            self.peek()
+            yield index
+            if self.peek() not in ',]':
+                self.skip_value()
+            index += 1
+
+            if self.peek() == ',':
+                self._pos += 1
+                continue
+            self._expect(']')
+            return
+
+
+def control_to_component(control: dict, group_id: str = '') -> dict:
+    """
+    Convert a catalog requirement control into a component-like structure.
+
+    Args:
+        control: OSCAL catalog control (class='requirement')
+        group_id: ID of the enclosing group
+
+    Returns:
+        Component dict with id, title, uuid, description, properties, group_id
+    """
+    # Extract prose/description from parts
+    description = ''
+    parts = control.get('parts', [])
+    if parts and isinstance(parts[0], dict):
+        description = parts[0].get('prose', '')
+
+    return {
+        'id': control.get('id', ''),
+        'title': control.get('title', ''),
+        'uuid': str(uuid.uuid4()),  # Generate since catalog doesn't have it
+        'description': description,
+        'properties': control.get('props', []) or [],
+        'group_id': group_id
+    }
+
+
+def _iter_catalog_groups(reader: JSONStreamReader) -> Iterator[dict]:
+    """Yield requirement components from catalog.groups[].controls[]."""
+    for _ in reader.iter_array():
+        if reader.peek() != '{':
+            reader.skip_value()
+            continue
+
+        # Group fields seen before 'controls' (generate_oscal writes id first)
+        group = {}
+        for key in reader.iter_object():
+            if key == 'controls' and reader.peek() == '[':
+                for _ in reader.iter_array():
+                    control = reader.read_value()
+                    if isinstance(control, dict) and control.get('class') == 'requirement':
+                        yield control_to_component(control, group.get('id', ''))
+            elif key in ('id', 'title'):
+                group[key] = reader.read_value()
+            else:
+                reader.skip_value()
+
+
+def iter_oscal_components(oscal_file: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[dict]:
+    """
+    Stream components from an OSCAL catalog or component definition.
+
+    Yields the same component structures as
+    oscal_to_jama_csv._extract_components_from_oscal, one at a time.
+
+    Args:
+        oscal_file: Path to OSCAL JSON file
+        chunk_size: Characters read per I/O call
+
+    Yields:
+        Component dicts
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        json.JSONDecodeError: If JSON is invalid
+    """
+    oscal_file = Path(oscal_file)
+    if not oscal_file.exists():
+        raise FileNotFoundError(f"OSCAL file not found: {oscal_file}")
+
+    with open(oscal_file, 'r', encoding='utf-8') as f:
+        reader = JSONStreamReader(f, chunk_size)
+        if reader.peek() != '{':
+            raise json.JSONDecodeError(f"Invalid JSON in {oscal_file}: expected an object", '', 0)
+
+        for root_key in reader.iter_object():
+            if root_key not in ('component-definition', 'catalog') or reader.peek() != '{':
+                reader.skip_value()
+                continue
+
+            for key in reader.iter_object():
+                if root_key == 'component-definition' and key == 'components' and reader.peek() == '[':
+                    for _ in reader.iter_array():
+                        yield reader.read_value()
+                elif root_key == 'catalog' and key == 'groups' and reader.peek() == '[':
+                    yield from _iter_catalog_groups(reader)
+                else:
+                    reader.skip_value()
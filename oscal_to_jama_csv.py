@@ -8,6 +8,13 @@ Usage:
     python oscal_to_jama_csv.py nerc-oscal.json
     python oscal_to_jama_csv.py nerc-oscal.json --output custom-matrix.csv
     python oscal_to_jama_csv.py nerc-oscal.json --format detailed
+    python oscal_to_jama_csv.py nerc-oscal.json --nist-catalog NIST_SP-800-53_rev5_catalog.json
+    python oscal_to_jama_csv.py large-component-definition.json --stream
+    python oscal_to_jama_csv.py nerc-oscal.json --target csv --target parquet --target xlsx
+    python oscal_to_jama_csv.py nerc-oscal.json --delta --output weekly-delta.csv
+    python oscal_to_jama_csv.py nerc-oscal.json --shard-by bytes --shard-size 5M
+    python oscal_to_jama_csv.py nerc-oscal.json --template audit-layout.json
+    python oscal_to_jama_csv.py nerc-oscal.json wecc-tailoring.json --output merged.csv
 
 The generated CSV includes:
 - JAMA-Requirement-ID: Unique ID for JAMA import (e.g., CIP-005-R1-a)
@@ -17,6 +24,13 @@ The generated CSV includes:
 - Title: Component title
 - Description: Component description
 - Implementation-Status: Current status (Draft, Implemented, etc.)
+- NIST-Primary-Control-Statement: Primary control statement text (only with --nist-catalog)
+
+With --delta, only rows added/changed/removed since the previous delta run are
+written, preceded by an Operation column (ADD, UPDATE, DELETE); see jama_delta.py.
+With --shard-by, the export is split into several CSVs plus a manifest; see jama_shards.py.
+With --template, columns come from a declarative mapping file; see jama_templates.py.
+With several input files, they are merged into one deduplicated matrix; see jama_merge.py.
 """
 
 import json
@@ -24,7 +38,25 @@ import csv
 import sys
 import argparse
 from pathlib import Path
-from typing import List, Dict, Optional
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Dict, Optional, TextIO, Union
+
+import nerc_metrics
+from nerc_profile import add_profile_argument, start_profiling
+from oscal_stream import control_to_component, iter_oscal_components
+
+# CSV column layouts
+STANDARD_COLUMNS = [
+    'JAMA-Requirement-ID',
+    'NERC-Requirement-ID',
+    'NIST-Primary-Control',
+    'NIST-Secondary-Controls',
+    'Title',
+    'Description',
+    'Implementation-Status',
+]
+DETAILED_COLUMNS = STANDARD_COLUMNS + ['Component-UUID', 'Component-Type', 'Control-Count']
+STATEMENT_COLUMN = 'NIST-Primary-Control-Statement'
 
 
 def load_oscal_json(oscal_file: Path) -> dict:
@@ -72,32 +104,34 @@ def _extract_components_from_oscal(oscal_data: dict) -> List[dict]:
     # Fall back to catalog format
     catalog = oscal_data.get('catalog', {})
     if catalog and 'groups' in catalog:
-        components = []
-        for group in catalog.get('groups', []):
-            # Each requirement control becomes a component
-            for control in group.get('controls', []):
-                if control.get('class') == 'requirement':
-                    # Extract prose/description from parts
-                    description = ''
-                    parts = control.get('parts', [])
-                    if parts and isinstance(parts[0], dict):
-                        description = parts[0].get('prose', '')
-
-                    # Convert control to component-like structure
-                    component = {
-                        'id': control.get('id', ''),
-                        'title': control.get('title', ''),
-                        'uuid': str(__import__('uuid').uuid4()),  # Generate since catalog doesn't have it
-                        'description': description,
-                        'properties': control.get('props', []) or [],
-                        'group_id': group.get('id', '')
-                    }
-                    components.append(component)
-        return components
+        return list(iter_catalog_components(catalog['groups']))
 
     return []
 
 
+def iter_catalog_components(catalog) -> Iterator[dict]:
+    """
+    Convert an in-memory catalog's requirement controls into components.
+
+    Args:
+        catalog: OSCAL document ({'catalog': ...}), the catalog object itself,
+            or any iterable of groups (e.g. generate_oscal.iter_catalog_groups)
+
+    Yields:
+        Component dicts, one per requirement control
+    """
+    if isinstance(catalog, dict):
+        groups = catalog.get('catalog', catalog).get('groups', [])
+    else:
+        groups = catalog
+
+    for group in groups:
+        # Each requirement control becomes a component
+        for control in group.get('controls', []):
+            if control.get('class') == 'requirement':
+                yield control_to_component(control, group.get('id', ''))
+
+
 def extract_component_properties(component: dict) -> Dict[str, str]:
     """
     Extract named properties from OSCAL component as dict.
@@ -134,133 +168,273 @@ def normalize_control_id(control_id: str) -> str:
     return control_id.strip().upper()
 
 
-def oscal_to_jama_csv(oscal_file: Path, output_csv: Optional[Path] = None,
-                       format_type: str = 'standard') -> List[Dict[str, str]]:
+def get_csv_columns(format_type: str = 'standard', with_statement: bool = False) -> List[str]:
+    """
+    Get the CSV column layout for a format.
+
+    Args:
+        format_type: CSV format ('standard' or 'detailed')
+        with_statement: Include the NIST primary control statement column
+
+    Returns:
+        Ordered list of column names
+    """
+    columns = list(DETAILED_COLUMNS if format_type == 'detailed' else STANDARD_COLUMNS)
+    if with_statement:
+        columns.append(STATEMENT_COLUMN)
+    return columns
+
+
+def build_jama_row(component: dict, format_type: str = 'standard', nist_catalog=None) -> Dict[str, str]:
+    """
+    Build one JAMA CSV row from an OSCAL component.
+
+    Args:
+        component: OSCAL component (or catalog control converted to one)
+        format_type: CSV format ('standard' or 'detailed')
+        nist_catalog: Optional opened nist_catalog.NISTCatalog for statement text
+
+    Returns:
+        CSV row dictionary
+    """
+    # Extract properties
+    props = extract_component_properties(component)
+
+    # Build base row
+    row = {
+        'JAMA-Requirement-ID': props.get('JAMA-Requirement-ID', ''),
+        'NERC-Requirement-ID': props.get('NERC-Requirement-ID', ''),
+        'NIST-Primary-Control': normalize_control_id(props.get('NIST-800-53-Primary-Control', '')),
+        'NIST-Secondary-Controls': props.get('NIST-800-53-Secondary-Controls', ''),
+        'Title': component.get('title', ''),
+        'Description': component.get('description', ''),
+        'Implementation-Status': props.get('Implementation-Status', 'Draft'),
+    }
+
+    # Add detailed fields if requested
+    if format_type == 'detailed':
+        row.update({
+            'Component-UUID': component.get('uuid', ''),
+            'Component-Type': component.get('type', 'software'),
+            'Control-Count': str(len(component.get('control-implementations', []))),
+        })
+
+    if nist_catalog is not None:
+        row[STATEMENT_COLUMN] = nist_catalog.get_statement(row['NIST-Primary-Control']) \
+            if row['NIST-Primary-Control'] else ''
+
+    return row
+
+
+def _open_nist_catalog(nist_catalog_file: Optional[Path]):
+    """Open the NIST catalog index if a catalog file was given."""
+    if nist_catalog_file is None:
+        return None
+    # Only the controls referenced by rows are decoded from the catalog index
+    from nist_catalog import get_catalog
+    return get_catalog(nist_catalog_file)
+
+
+def _is_stream(output_csv) -> bool:
+    return hasattr(output_csv, 'write')
+
+
+@contextmanager
+def _csv_sink(output_csv: Union[Path, TextIO]) -> Iterator[TextIO]:
+    """Open a CSV path for writing, or pass a text stream through (left open for the caller)."""
+    if _is_stream(output_csv):
+        yield output_csv
+    else:
+        with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
+            yield csvfile
+
+
+def oscal_to_jama_csv(oscal_file: Union[Path, dict], output_csv: Union[Path, TextIO, None] = None,
+                       format_type: str = 'standard',
+                       nist_catalog_file: Optional[Path] = None) -> List[Dict[str, str]]:
     """
     Convert OSCAL (Catalog or Component Definition) to JAMA CSV format.
 
     Args:
-        oscal_file: Path to input OSCAL JSON file
-        output_csv: Path to output CSV file (if None, derives from oscal_file)
+        oscal_file: Path to input OSCAL JSON file, or an already parsed OSCAL document
+        output_csv: Output CSV path (if None, derives from oscal_file), or any
+            text stream such as io.StringIO or sys.stdout; streams are written
+            but not closed, and no status line is printed for them
         format_type: CSV format ('standard' or 'detailed')
+        nist_catalog_file: Optional official NIST OSCAL catalog; when given, the
+            primary control's statement text is added to each row
 
     Returns:
         List of CSV row dictionaries
+
+    Raises:
+        FileNotFoundError: If the OSCAL file doesn't exist
+        json.JSONDecodeError: If JSON is invalid
+        ValueError: If there is nothing to export, or parsed data is given without output_csv
     """
-    # Load OSCAL JSON
-    oscal_data = load_oscal_json(oscal_file)
+    with nerc_metrics.stage('export_csv') as fields:
+        # Load OSCAL JSON unless the caller already parsed it
+        if isinstance(oscal_file, dict):
+            if output_csv is None:
+                raise ValueError("output_csv is required when exporting parsed OSCAL data")
+            oscal_data = oscal_file
+        else:
+            oscal_data = load_oscal_json(oscal_file)
+
+        # Extract components from either schema
+        components = _extract_components_from_oscal(oscal_data)
+
+        if not components:
+            raise ValueError("OSCAL JSON has no requirements/components to export")
+
+        nist_catalog = _open_nist_catalog(nist_catalog_file)
+
+        # Build CSV rows
+        rows = [build_jama_row(component, format_type, nist_catalog) for component in components]
+
+        # Determine output path
+        if output_csv is None:
+            output_csv = oscal_file.with_suffix('.csv')
+
+        # Write CSV
+        if rows:
+            write_jama_rows(rows, output_csv, list(rows[0].keys()))
+            if not _is_stream(output_csv):
+                print(f"[OK] Successfully exported {len(rows)} components to {output_csv}")
+        else:
+            print("[WARN] No components to export")
+        nerc_metrics.count('nerc_requirements_total', len(components), stage='export_csv')
+        fields.update(components=len(components), rows=len(rows), format=format_type)
+
+    return rows
 
-    # Extract components from either schema
-    components = _extract_components_from_oscal(oscal_data)
 
-    if not components:
-        raise ValueError("OSCAL JSON has no requirements/components to export")
+def write_jama_rows(rows: Iterable[Dict[str, str]], output_csv: Union[Path, TextIO],
+                    fieldnames: List[str]) -> int:
+    """
+    Write rows to a JAMA CSV as they are produced.
+
+    Args:
+        rows: Row dictionaries (consumed lazily)
+        output_csv: Path to output CSV file, or a text stream (left open)
+        fieldnames: CSV column order
+
+    Returns:
+        Number of rows written
+    """
+    count = 0
+    with _csv_sink(output_csv) as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore')
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    nerc_metrics.count('nerc_rows_total', count)
+    return count
+
+
+def stream_oscal_to_jama_csv(oscal_file: Path, output_csv: Union[Path, TextIO, None] = None,
+                             format_type: str = 'standard',
+                             nist_catalog_file: Optional[Path] = None) -> int:
+    """
+    Convert OSCAL to JAMA CSV one component at a time.
 
-    # Build CSV rows
-    rows = []
-
-    for component in components:
-        # Extract properties
-        props = extract_component_properties(component)
-
-        # Build base row
-        row = {
-            'JAMA-Requirement-ID': props.get('JAMA-Requirement-ID', ''),
-            'NERC-Requirement-ID': props.get('NERC-Requirement-ID', ''),
-            'NIST-Primary-Control': normalize_control_id(props.get('NIST-800-53-Primary-Control', '')),
-            'NIST-Secondary-Controls': props.get('NIST-800-53-Secondary-Controls', ''),
-            'Title': component.get('title', ''),
-            'Description': component.get('description', ''),
-            'Implementation-Status': props.get('Implementation-Status', 'Draft'),
-        }
-
-        # Add detailed fields if requested
-        if format_type == 'detailed':
-            row.update({
-                'Component-UUID': component.get('uuid', ''),
-                'Component-Type': component.get('type', 'software'),
-                'Control-Count': str(len(component.get('control-implementations', []))),
-            })
-
-        rows.append(row)
-
-    # Determine output path
+    Unlike oscal_to_jama_csv, the OSCAL file is never fully loaded and no row
+    list is kept, so peak memory is bounded by a single component. Use this
+    for very large component definitions.
+
+    Args:
+        oscal_file: Path to input OSCAL JSON file
+        output_csv: Path to output CSV file (if None, derives from oscal_file), or a text stream
+        format_type: CSV format ('standard' or 'detailed')
+        nist_catalog_file: Optional official NIST OSCAL catalog for statement text
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        json.JSONDecodeError: If JSON is invalid
+        ValueError: If the document has no components
+    """
     if output_csv is None:
         output_csv = oscal_file.with_suffix('.csv')
 
-    # Write CSV
-    if rows:
-        fieldnames = list(rows[0].keys())
-        with open(output_csv, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
-            writer.writerows(rows)
+    nist_catalog = _open_nist_catalog(nist_catalog_file)
+    rows = (build_jama_row(component, format_type, nist_catalog)
+            for component in iter_oscal_components(oscal_file))
 
-        print(f"[OK] Successfully exported {len(rows)} components to {output_csv}")
-    else:
-        print("[WARN] No components to export")
+    count = write_jama_rows(rows, output_csv, get_csv_columns(format_type, nist_catalog is not None))
 
-    return rows
+    if count == 0:
+        if not _is_stream(output_csv):
+            Path(output_csv).unlink()
+        raise ValueError("OSCAL JSON has no requirements/components to export")
+
+    if not _is_stream(output_csv):
+        print(f"[OK] Successfully exported {count} components to {output_csv}")
+    return count
 
 
-def validate_csv_format(csv_file: Path) -> bool:
+def catalog_to_jama_csv(catalog, output_csv: Union[Path, TextIO], format_type: str = 'standard',
+                        nist_catalog_file: Optional[Path] = None) -> int:
     """
-    Validate that CSV file has expected JAMA format.
+    Write JAMA CSV rows straight from an in-memory catalog (no JSON round-trip).
 
     Args:
-        csv_file: Path to CSV file to validate
+        catalog: Catalog document, catalog object or iterable of groups
+            (see iter_catalog_components); groups are consumed lazily
+        output_csv: Path to output CSV file, or a text stream (left open)
+        format_type: CSV format ('standard' or 'detailed')
+        nist_catalog_file: Optional official NIST OSCAL catalog for statement text
 
     Returns:
-        True if valid, False otherwise
+        Number of rows written
+
+    Raises:
+        ValueError: If the catalog has no requirements
     """
-    required_columns = [
-        'JAMA-Requirement-ID',
-        'NERC-Requirement-ID',
-        'NIST-Primary-Control',
-        'Title',
-        'Description'
-    ]
+    nist_catalog = _open_nist_catalog(nist_catalog_file)
+    rows = (build_jama_row(component, format_type, nist_catalog)
+            for component in iter_catalog_components(catalog))
 
-    try:
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+    count = write_jama_rows(rows, output_csv, get_csv_columns(format_type, nist_catalog is not None))
 
-            # Check headers
-            if reader.fieldnames is None:
-                print("[ERR] CSV file is empty")
-                return False
+    if count == 0:
+        if not _is_stream(output_csv):
+            Path(output_csv).unlink()
+        raise ValueError("OSCAL catalog has no requirements to export")
 
-            missing_columns = set(required_columns) - set(reader.fieldnames)
-            if missing_columns:
-                print(f"[ERR] CSV missing required columns: {missing_columns}")
-                return False
+    if not _is_stream(output_csv):
+        print(f"[OK] Successfully exported {count} components to {output_csv}")
+    return count
 
-            # Check data
-            row_count = 0
-            for row in reader:
-                row_count += 1
 
-                # Validate non-empty JAMA IDs
-                if not row.get('JAMA-Requirement-ID', '').strip():
-                    print(f"[ERR] Row {row_count}: Empty JAMA-Requirement-ID")
-                    return False
+def validate_csv_format(csv_file: Path, workers: Optional[int] = None) -> bool:
+    """
+    Validate that CSV file has expected JAMA format.
 
-                # Validate non-empty NERC IDs
-                if not row.get('NERC-Requirement-ID', '').strip():
-                    print(f"[ERR] Row {row_count}: Empty NERC-Requirement-ID")
-                    return False
+    Every row is checked (in parallel for large files, see csv_validate.py)
+    and all problems are printed, not just the first one.
 
-            if row_count == 0:
-                print("[ERR] CSV file has no data rows")
-                return False
+    Args:
+        csv_file: Path to CSV file to validate
+        workers: Worker processes (default: CPU count)
 
-            print(f"[OK] CSV validation passed ({row_count} rows)")
-            return True
+    Returns:
+        True if valid, False otherwise
+    """
+    from csv_validate import print_report, validate_csv
 
+    try:
+        report = validate_csv(csv_file, workers=workers)
     except Exception as e:
         print(f"[ERR] Error validating CSV: {e}")
         return False
 
+    print_report(report)
+    return report['valid']
+
 
 def main():
     """Command-line interface for OSCAL to JAMA CSV conversion."""
@@ -273,13 +447,23 @@ Examples:
   %(prog)s nerc-oscal.json --output my-matrix.csv
   %(prog)s nerc-oscal.json --format detailed
   %(prog)s nerc-oscal.json --validate
+  %(prog)s nerc-oscal.json --nist-catalog NIST_SP-800-53_rev5_catalog.json
+  %(prog)s large-component-definition.json --stream
+  %(prog)s nerc-oscal.json --target csv --target parquet --target xlsx
+  %(prog)s nerc-oscal.json --delta --output weekly-delta.csv
+  %(prog)s nerc-oscal.json --shard-by family
+  %(prog)s nerc-oscal.json --shard-by bytes --shard-size 5M
+  %(prog)s nerc-oscal.json --template audit-layout.json
+  %(prog)s nerc-oscal.json wecc-tailoring.json --output merged.csv
         """
     )
 
     parser.add_argument(
         'oscal_file',
         type=Path,
-        help='Path to OSCAL Component Definition JSON file'
+        nargs='+',
+        help='Path to OSCAL Component Definition JSON file; several files are merged '
+             '(deduplicated, later files win)'
     )
 
     parser.add_argument(
@@ -302,15 +486,146 @@ Examples:
         help='Validate output CSV file after export'
     )
 
+    parser.add_argument(
+        '--nist-catalog',
+        type=Path,
+        default=None,
+        help='Official NIST OSCAL catalog JSON; adds primary control statement text to each row'
+    )
+
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Parse the OSCAL file incrementally (constant memory for very large inputs)'
+    )
+
+    parser.add_argument(
+        '--target',
+        action='append',
+        choices=['csv', 'parquet', 'xlsx'],
+        default=None,
+        help='Columnar export target (repeatable); all targets are written from one parse via pandas'
+    )
+
+    parser.add_argument(
+        '--delta',
+        action='store_true',
+        help='Write only rows added/changed/removed since the last delta run, with an Operation column'
+    )
+
+    parser.add_argument(
+        '--manifest',
+        type=Path,
+        default=None,
+        help='Delta manifest of per-requirement hashes (default: <output stem>.manifest.json)'
+    )
+
+    parser.add_argument(
+        '--shard-by',
+        choices=['family', 'rows', 'bytes'],
+        default=None,
+        help='Split the export into several CSVs by CIP family, row count or file size'
+    )
+
+    parser.add_argument(
+        '--shard-size',
+        default=None,
+        help='Rows (rows mode) or bytes such as 10M (bytes mode) per shard'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Shard writer / merge input threads (default: 4)'
+    )
+
+    parser.add_argument(
+        '--template',
+        default=None,
+        help='Column-mapping template file (JSON/YAML) defining a custom CSV layout; overrides --format'
+    )
+
+    add_profile_argument(parser)
     args = parser.parse_args()
+    start_profiling(args.profile)
+
+    merge_inputs = args.oscal_file if len(args.oscal_file) > 1 else None
+    args.oscal_file = args.oscal_file[0]
+    if merge_inputs and (args.template or args.target or args.delta or args.shard_by or args.stream):
+        parser.error('multiple inputs cannot be combined with --template, --target, --delta, '
+                     '--shard-by or --stream')
+    if args.template and (args.target or args.delta or args.shard_by or args.stream or args.validate):
+        # The validator checks the standard JAMA columns, which a custom layout renames or drops
+        parser.error('--template cannot be combined with --target, --delta, --shard-by, --stream or --validate')
+    if args.shard_by and (args.target or args.delta or args.stream):
+        parser.error('--shard-by cannot be combined with --target, --delta or --stream')
+    if args.shard_size and args.shard_by not in ('rows', 'bytes'):
+        parser.error('--shard-size requires --shard-by rows or bytes')
+
+    if args.target and args.stream:
+        parser.error('--target and --stream cannot be combined')
+    if args.delta and args.target:
+        parser.error('--delta and --target cannot be combined')
+    if args.manifest and not args.delta:
+        parser.error('--manifest requires --delta')
+    if args.target and args.validate and 'csv' not in args.target:
+        parser.error('--validate requires a csv target')
+
+    output_path = args.output or args.oscal_file.with_suffix('.csv')
+    if merge_inputs and not args.output:
+        output_path = args.oscal_file.with_name(args.oscal_file.stem + '-merged.csv')
 
     try:
         # Convert OSCAL to CSV
-        rows = oscal_to_jama_csv(args.oscal_file, args.output, args.format)
+        if merge_inputs:
+            from jama_merge import merge_oscal_to_jama_csv
+            merge_oscal_to_jama_csv(merge_inputs, output_path, args.format, args.nist_catalog, args.workers)
+        elif args.template:
+            from jama_templates import get_template, template_oscal_to_jama_csv
+            template = get_template(args.template, with_statement=args.nist_catalog is not None)
+            template_oscal_to_jama_csv(args.oscal_file, args.output, template, args.nist_catalog)
+        elif args.target:
+            from jama_frame import EXPORT_TARGETS, export_oscal_frame
+            targets = list(dict.fromkeys(args.target))
+            if args.output and len(targets) == 1:
+                # The explicit target decides the format; a mismatching suffix would silently override it
+                if args.output.suffix.lower() != EXPORT_TARGETS[targets[0]]:
+                    parser.error(f'--target {targets[0]} conflicts with output {args.output} '
+                                 f'(expected a {EXPORT_TARGETS[targets[0]]} file)')
+                outputs = {targets[0]: args.output}
+            else:
+                base = args.output or args.oscal_file
+                outputs = {target: base.with_suffix(EXPORT_TARGETS[target]) for target in targets}
+            output_path = outputs.get('csv', output_path)
+            export_oscal_frame(args.oscal_file, list(outputs.values()), args.format, args.nist_catalog)
+        elif args.shard_by:
+            from jama_shards import parse_size, shard_oscal_to_jama_csv
+            shard_size = parse_size(args.shard_size) if args.shard_size else None
+            manifest = shard_oscal_to_jama_csv(args.oscal_file, args.output, args.shard_by, shard_size,
+                                               args.format, args.nist_catalog, args.workers)
+            if args.validate:
+                base = output_path.parent
+                failed = [s['file'] for s in manifest['shards'] if not validate_csv_format(base / s['file'])]
+                if failed:
+                    print(f"[WARN] CSV validation found issues in: {', '.join(failed)}")
+                    sys.exit(1)
+                print(f"[OK] All {len(manifest['shards'])} shard(s) are valid and ready for import")
+                args.validate = False
+        elif args.delta:
+            from jama_delta import OP_ADD, OP_DELETE, OP_UPDATE, delta_oscal_to_jama_csv
+            summary = delta_oscal_to_jama_csv(args.oscal_file, args.output, args.manifest,
+                                              args.format, args.nist_catalog)
+            if not any(summary[op] for op in (OP_ADD, OP_UPDATE, OP_DELETE)):
+                # Header-only delta; nothing to validate
+                args.validate = False
+        elif args.stream:
+            stream_oscal_to_jama_csv(args.oscal_file, args.output, args.format, args.nist_catalog)
+        else:
+            oscal_to_jama_csv(args.oscal_file, args.output, args.format, args.nist_catalog)
 
         # Validate if requested
         if args.validate:
-            output_path = args.output or args.oscal_file.with_suffix('.csv')
             if validate_csv_format(output_path):
                 print(f"[OK] JAMA export is valid and ready for import")
             else:
@@ -326,6 +641,9 @@ Examples:
     except ValueError as e:
         print(f"[ERR] Validation error: {e}", file=sys.stderr)
         sys.exit(1)
+    except ImportError as e:
+        print(f"[ERR] Missing optional dependency for this target: {e}", file=sys.stderr)
+        sys.exit(1)
     except Exception as e:
         print(f"[ERR] Unexpected error: {e}", file=sys.stderr)
         sys.exit(1)
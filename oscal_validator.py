@@ -0,0 +1,574 @@
+"""
+Single-pass OSCAL validation engine with JSON and SARIF reports.
+
+The catalog (or component definition) is normalized into components once and
+every rule is evaluated during one traversal, so validation time grows with
+the catalog, not with the number of rules. NIST control lookups are memoized
+per run. verify_oscal_compliance.py is a thin pytest wrapper over this module:
+each of its tests asserts that one rule passed.
+
+Rules:
+    OSCAL001  error    File is valid JSON
+    OSCAL002  error    Root element is 'catalog' or 'component-definition'
+    OSCAL003  error    Document has metadata
+    OSCAL004  error    Metadata has non-empty title and version
+    OSCAL005  error    Document has requirements/components
+    OSCAL006  error    Components are identifiable (id or title)
+    OSCAL007  error    NIST control props use the Family-Number format
+    OSCAL008  error    JAMA-Requirement-ID follows CIP-XXX-RN[-x]
+    OSCAL009  error    JAMA-Requirement-ID is not empty or TBD
+    OSCAL010  error    Component title identifies the NERC requirement
+    OSCAL011  error    NERC-Requirement-ID follows CIP-XXX[-V] RN[x]
+    OSCAL012  error    Component UUIDs are valid
+    OSCAL013  error    Component titles are meaningful (> 5 characters)
+    OSCAL014  error    Components have a description (or title)
+    OSCAL015  error    Implemented requirements have a control-id
+    OSCAL016  warning  Descriptions are not mostly vague verbs
+    OSCAL017  error    Components have at least 2 properties
+    OSCAL018  error    Top-level structure is usable by compliance tools
+    OSCAL019  error    Mapped NIST controls exist in the catalog revision
+    OSCAL020  error    Primary NIST controls have a catalog description
+
+Usage:
+    python oscal_validator.py nerc-oscal.json
+    python oscal_validator.py nerc-oscal.json --json report.json --sarif report.sarif
+    python oscal_validator.py nerc-oscal.json --nist-revision rev4
+    python oscal_validator.py nerc-oscal.json --incremental
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from nerc_profile import add_profile_argument, start_profiling
+from nist_controls import get_control_description, validate_nist_control
+
+RULES = {
+    'OSCAL001': ('valid-json', 'error', 'File is valid JSON'),
+    'OSCAL002': ('root-element', 'error', "Root element is 'catalog' or 'component-definition'"),
+    'OSCAL003': ('metadata-present', 'error', 'Document has metadata'),
+    'OSCAL004': ('metadata-required-fields', 'error', 'Metadata has non-empty title and version'),
+    'OSCAL005': ('has-components', 'error', 'Document has requirements/components'),
+    'OSCAL006': ('component-identifiable', 'error', 'Components are identifiable (id or title)'),
+    'OSCAL007': ('nist-control-format', 'error', 'NIST control props use the Family-Number format'),
+    'OSCAL008': ('jama-id-format', 'error', 'JAMA-Requirement-ID follows CIP-XXX-RN[-x]'),
+    'OSCAL009': ('jama-id-not-placeholder', 'error', 'JAMA-Requirement-ID is not empty or TBD'),
+    'OSCAL010': ('nerc-title', 'error', 'Component title identifies the NERC requirement'),
+    'OSCAL011': ('nerc-id-format', 'error', 'NERC-Requirement-ID follows CIP-XXX[-V] RN[x]'),
+    'OSCAL012': ('component-uuid', 'error', 'Component UUIDs are valid'),
+    'OSCAL013': ('component-title', 'error', 'Component titles are meaningful (> 5 characters)'),
+    'OSCAL014': ('component-description', 'error', 'Components have a description (or title)'),
+    'OSCAL015': ('implemented-requirement-control-id', 'error', 'Implemented requirements have a control-id'),
+    'OSCAL016': ('description-not-vague', 'warning', 'Descriptions are not mostly vague verbs'),
+    'OSCAL017': ('minimum-properties', 'error', 'Components have at least 2 properties'),
+    'OSCAL018': ('compliance-tool-structure', 'error', 'Top-level structure is usable by compliance tools'),
+    'OSCAL019': ('nist-control-exists', 'error', 'Mapped NIST controls exist in the catalog revision'),
+    'OSCAL020': ('nist-control-description', 'error', 'Primary NIST controls have a catalog description'),
+}
+
+# Rules that also fail when nothing was found to check
+REQUIRE_CHECKED = {
+    'OSCAL007': 'No NIST control formats found to validate',
+    'OSCAL008': 'No JAMA-Requirement-ID properties found to validate',
+    'OSCAL009': 'No JAMA-Requirement-ID properties found to validate',
+    'OSCAL011': 'No NERC-Requirement-ID properties found to validate',
+    'OSCAL015': 'No implemented requirements found to validate',
+    'OSCAL016': 'No component descriptions found to validate',
+    'OSCAL019': 'No NIST controls found to validate',
+    'OSCAL020': 'No NIST control descriptions found to validate',
+}
+
+NIST_PATTERN = re.compile(r'^[A-Z]{2}-\d{1,2}(\s*\([0-9]+\))?$')
+JAMA_PATTERN = re.compile(r'^CIP-\d{3}-R\d+(-[a-z])?$')
+NERC_PATTERN = re.compile(r'^CIP-\d{3}(?:-\d+)? R\d+[a-z]?$')
+VAGUE_WORDS = ('ensure', 'verify', 'check', 'implement', 'manage', 'handle')
+
+DEFAULT_MAX_FINDINGS = 10000
+SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+
+
+def _document_root(oscal_data: dict) -> dict:
+    root = oscal_data.get('component-definition', {}) or oscal_data.get('catalog', {})
+    return root if isinstance(root, dict) else {}
+
+
+def _prop_text(prop: dict, key: str) -> str:
+    """A prop's name or value as text ('' for null; numbers etc. stringified)."""
+    value = prop.get(key)
+    return '' if value is None else str(value)
+
+
+def _nist_implementations(title: str, props: List[dict]) -> List[dict]:
+    """Build control-implementations from a catalog control's NIST props."""
+    primary = None
+    secondary = []
+    for prop in props:
+        if isinstance(prop, dict):
+            if prop.get('name') == 'NIST-800-53-Primary-Control':
+                primary = _prop_text(prop, 'value')
+            elif prop.get('name') == 'NIST-800-53-Secondary-Controls':
+                secondary = [c.strip() for c in _prop_text(prop, 'value').split(',')]
+
+    requirements = [{'control-id': control.lower(), 'responsibility': 'Implemented'}
+                    for control in [primary] + secondary if control]
+    if not requirements:
+        return []
+    return [{'description': f"NIST 800-53 control implementation for {title}",
+             'implemented-requirements': requirements}]
+
+
+def iter_components(oscal_data: dict) -> Iterator[dict]:
+    """
+    Normalize either OSCAL schema into components, once.
+
+    Catalog requirement controls become component-like dicts with
+    'properties', 'group_id', 'location' and control-implementations built
+    from their NIST props. Catalog controls carry no uuid in OSCAL, so none is
+    invented; component-definition components are yielded as they are (with a
+    'location' added to a shallow copy).
+
+    Args:
+        oscal_data: Parsed OSCAL document
+
+    Yields:
+        Component dictionaries (entries that are not JSON objects are skipped)
+    """
+    if not isinstance(oscal_data, dict):
+        return
+    comp_def = oscal_data.get('component-definition', {})
+    if isinstance(comp_def, dict) and 'components' in comp_def:
+        for index, component in enumerate(comp_def.get('components') or []):
+            if isinstance(component, dict):
+                yield dict(component, location=f"component-definition.components[{index}]")
+        return
+
+    catalog = oscal_data.get('catalog', {})
+    for group_index, group in enumerate(catalog.get('groups') or [] if isinstance(catalog, dict) else []):
+        if isinstance(group, dict):
+            yield from iter_group_components(group_index, group)
+
+
+def iter_group_components(group_index: int, group: dict) -> Iterator[dict]:
+    """Normalize the requirement controls of one catalog group (see iter_components)."""
+    for control_index, control in enumerate(group.get('controls') or []):
+        if not isinstance(control, dict) or control.get('class') != 'requirement':
+            continue
+        props = control.get('props') or []
+        component = {
+            'id': control.get('id', ''),
+            'title': control.get('title', ''),
+            'description': '',
+            'properties': props,
+            'group_id': group.get('id', ''),
+            'location': f"catalog.groups[{group_index}].controls[{control_index}]",
+            'control-implementations': _nist_implementations(control.get('title', ''), props),
+        }
+        if 'uuid' in control:
+            component['uuid'] = control['uuid']
+        yield component
+
+
+class _Results:
+    """Per-rule check/failure counters and the finding list."""
+
+    def __init__(self, max_findings: int):
+        self.max_findings = max_findings
+        self.checked = {rule: 0 for rule in RULES}
+        self.failed = {rule: 0 for rule in RULES}
+        self.findings: List[dict] = []
+
+    def check(self, rule: str, ok: bool, message: str = '', component: Optional[dict] = None,
+              index: Optional[int] = None):
+        self.checked[rule] += 1
+        if not ok:
+            self.fail(rule, message, component, index)
+
+    def fail(self, rule: str, message: str, component: Optional[dict] = None, index: Optional[int] = None):
+        self.failed[rule] += 1
+        if len(self.findings) < self.max_findings:
+            self.findings.append({
+                'rule': rule,
+                'severity': RULES[rule][1],
+                'message': message,
+                'component': index,
+                'id': component.get('id', '') if component else '',
+                'location': component.get('location', '') if component else '',
+            })
+
+    def merge(self, checked: dict, failed: dict, findings: List[dict]):
+        """Add counts and findings evaluated elsewhere (e.g. cached per group)."""
+        for rule, count in checked.items():
+            self.checked[rule] += count
+        for rule, count in failed.items():
+            self.failed[rule] += count
+        self.findings.extend(findings[:max(0, self.max_findings - len(self.findings))])
+
+
+def _document_type(oscal_data: dict) -> Tuple[Optional[str], bool]:
+    """Return the document type and whether components come from catalog controls."""
+    if not isinstance(oscal_data, dict):
+        return None, True
+    comp_def = oscal_data.get('component-definition', {})
+    catalog_format = not (isinstance(comp_def, dict) and 'components' in comp_def)
+    document_type = 'catalog' if 'catalog' in oscal_data else \
+        'component-definition' if 'component-definition' in oscal_data else None
+    return document_type, catalog_format
+
+
+def _check_document(oscal_data: dict, results: _Results):
+    if not isinstance(oscal_data, dict):
+        results.check('OSCAL002', False, f"Root is a JSON {type(oscal_data).__name__}, not an object. JSON "
+                      "should have either: { 'component-definition': { ... } } or { 'catalog': { ... } }")
+        return
+    root = _document_root(oscal_data)
+    results.check('OSCAL002', 'component-definition' in oscal_data or 'catalog' in oscal_data,
+                  "Missing root element. JSON should have either: "
+                  "{ 'component-definition': { ... } } or { 'catalog': { ... } }")
+    results.check('OSCAL003', 'metadata' in root, "Missing 'metadata' section. Should include: title, version")
+
+    metadata = root.get('metadata', {})
+    for field in ('title', 'version'):
+        if field not in metadata:
+            results.check('OSCAL004', False, f"Missing metadata.{field}. Required fields: title, version")
+        else:
+            results.check('OSCAL004', bool(metadata[field]), f"metadata.{field} is empty")
+
+    results.check('OSCAL018', 'uuid' in root or 'metadata' in root, "OSCAL missing required top-level fields")
+    results.check('OSCAL018', 'title' in metadata, "Metadata missing required title field")
+
+
+def _check_component(index: int, component: dict, results: _Results, nist_exists, nist_description,
+                     catalog_format: bool):
+    """Evaluate every component-level rule in one pass over the component."""
+    title = component.get('title', '')
+    results.check('OSCAL006', bool(component.get('id') or title),
+                  f"Component {index} not identifiable", component, index)
+
+    stripped_title = title.strip()
+    results.check('OSCAL010', bool(stripped_title) and 'CIP' in stripped_title,
+                  f"Component {index} title should identify NERC requirement", component, index)
+    if 'title' not in component:
+        results.check('OSCAL013', False, f"Component {index} missing 'title' field", component, index)
+    else:
+        results.check('OSCAL013', len(stripped_title) > 5,
+                      f"Component {index} has vague or empty title: '{stripped_title}'. Title should "
+                      f"describe NERC standard and purpose (e.g., 'NERC CIP-005 Systems Security Management')",
+                      component, index)
+
+    description = component.get('description', '').strip() or stripped_title
+    results.check('OSCAL014', len(description) > 5,
+                  f"Component {index} missing meaningful description or title", component, index)
+
+    text = (component.get('description', '') or title).lower()
+    if text and len(text) > 10:
+        words = len(text.split())
+        padded = f' {text} '
+        vague = sum(1 for word in VAGUE_WORDS if f' {word} ' in padded)
+        ratio = vague / words if words else 0
+        results.check('OSCAL016', ratio < 0.5 or words < 5,
+                      f"Component {index} description very vague", component, index)
+
+    if 'uuid' in component:
+        value = component['uuid']
+        if not value:
+            results.check('OSCAL012', False, f"Component {index} has empty uuid", component, index)
+        else:
+            try:
+                uuid.UUID(value)
+                results.check('OSCAL012', True)
+            except (ValueError, AttributeError, TypeError):
+                results.check('OSCAL012', False, f"Component {index} has invalid UUID format: {value}",
+                              component, index)
+    elif not catalog_format:
+        results.check('OSCAL012', False, f"Component {index} missing 'uuid' field. Must have unique identifier.",
+                      component, index)
+
+    props = component.get('properties', component.get('props', [])) or []
+    results.check('OSCAL017', len(props) >= 2,
+                  f"Component {index} has insufficient properties ({len(props)})", component, index)
+
+    for prop_index, prop in enumerate(props):
+        if not isinstance(prop, dict):
+            continue
+        name = _prop_text(prop, 'name')
+        value = _prop_text(prop, 'value')
+
+        if 'NIST' in name:
+            controls = [c.strip() for c in value.split(',')] if ',' in value else [value]
+            for control in controls:
+                results.check('OSCAL007', bool(NIST_PATTERN.match(control)),
+                              f"Component {index} has invalid NIST control format: '{control}'. "
+                              f"Use format like 'SC-7', 'AC-2', 'CA-3', etc.", component, index)
+
+            stripped = value.strip()
+            if stripped and 'Control' in name:
+                for control in (c.strip() for c in stripped.split(',')):
+                    results.check('OSCAL019', nist_exists(control),
+                                  f"Component {index} maps to non-existent NIST control: '{control}'",
+                                  component, index)
+            if stripped and 'Primary' in name:
+                results.check('OSCAL020', bool(nist_description(stripped)),
+                              f"Component {index} NIST control '{stripped}' not found in the NIST catalog",
+                              component, index)
+
+        elif name == 'JAMA-Requirement-ID':
+            if not value.strip():
+                results.check('OSCAL008', False, f"Component {index} has empty JAMA-Requirement-ID value",
+                              component, index)
+            else:
+                results.check('OSCAL008', bool(JAMA_PATTERN.match(value)),
+                              f"Component {index} has invalid JAMA placeholder: '{value}'", component, index)
+            results.check('OSCAL009', bool(value.strip()) and value.strip() != 'TBD',
+                          f"Component {index}, property {prop_index} has empty or placeholder "
+                          f"JAMA-Requirement-ID", component, index)
+
+        elif name == 'NERC-Requirement-ID':
+            if not value.strip():
+                results.check('OSCAL011', False, f"Component {index} has empty NERC-Requirement-ID",
+                              component, index)
+            else:
+                results.check('OSCAL011', bool(NERC_PATTERN.match(value)),
+                              f"Component {index} has invalid NERC ID format: '{value}'", component, index)
+
+    for impl_index, impl in enumerate(component.get('control-implementations', [])):
+        for req_index, requirement in enumerate(impl.get('implemented-requirements', [])):
+            results.check('OSCAL015', 'control-id' in requirement,
+                          f"Component {index}, control-impl {impl_index}, requirement {req_index} "
+                          f"missing 'control-id'. Should specify NIST control like 'sc-7'", component, index)
+
+
+def _check_totals(count: int, results: _Results):
+    """Document-wide rules that depend on what the component checks found."""
+    for rule in ('OSCAL005', 'OSCAL018'):
+        results.check(rule, count > 0, "No requirements/components found in OSCAL document. Catalog format "
+                      "should have groups[].controls[] with class='requirement', or component-definition "
+                      "should have components[]")
+    for rule, message in REQUIRE_CHECKED.items():
+        if results.checked[rule] == 0:
+            results.fail(rule, f"{message}! Ensure components include them.")
+
+
+def _memoized(function, revision: str):
+    cache = {}
+
+    def lookup(control_id):
+        if control_id not in cache:
+            cache[control_id] = function(control_id, revision)
+        return cache[control_id]
+
+    return lookup
+
+
+def _build_report(results: _Results, components: int, file: Optional[str], document_type: Optional[str],
+                  started: float) -> dict:
+    rules = {}
+    for rule, (name, severity, description) in RULES.items():
+        rules[rule] = {
+            'name': name,
+            'severity': severity,
+            'description': description,
+            'checked': results.checked[rule],
+            'failed': results.failed[rule],
+            'passed': results.failed[rule] == 0,
+        }
+    errors = sum(r['failed'] for r in rules.values() if r['severity'] == 'error')
+    warnings = sum(r['failed'] for r in rules.values() if r['severity'] == 'warning')
+    return {
+        'file': file,
+        'document_type': document_type,
+        'components': components,
+        'valid': errors == 0,
+        'errors': errors,
+        'warnings': warnings,
+        'rules': rules,
+        'findings': results.findings,
+        'truncated': errors + warnings > len(results.findings),
+        'elapsed': time.perf_counter() - started,
+    }
+
+
+def validate_oscal(oscal_data: dict, nist_revision: str = 'rev5', file: Optional[str] = None,
+                   max_findings: int = DEFAULT_MAX_FINDINGS) -> dict:
+    """
+    Validate a parsed OSCAL document in a single traversal.
+
+    Args:
+        oscal_data: Parsed OSCAL catalog or component definition
+        nist_revision: NIST SP 800-53 revision for control existence checks
+        file: Source path recorded in the report
+        max_findings: Maximum findings listed (rule counts stay exact)
+
+    Returns:
+        Report dict: file, document_type, components, valid, errors,
+        warnings, rules (per-rule checked/failed/passed), findings, truncated,
+        elapsed
+    """
+    started = time.perf_counter()
+    results = _Results(max_findings)
+    results.check('OSCAL001', True)
+    _check_document(oscal_data, results)
+
+    document_type, catalog_format = _document_type(oscal_data)
+    nist_exists = _memoized(validate_nist_control, nist_revision)
+    nist_description = _memoized(get_control_description, nist_revision)
+
+    count = 0
+    for index, component in enumerate(iter_components(oscal_data)):
+        count += 1
+        _check_component(index, component, results, nist_exists, nist_description, catalog_format)
+
+    _check_totals(count, results)
+    return _build_report(results, count, file, document_type, started)
+
+
+def validate_oscal_file(oscal_file: Path, nist_revision: str = 'rev5',
+                        max_findings: int = DEFAULT_MAX_FINDINGS, cache_file: Optional[Path] = None) -> dict:
+    """
+    Load and validate an OSCAL JSON file.
+
+    A JSON syntax error is reported as an OSCAL001 finding rather than raised.
+    With cache_file, only groups changed since the cached run are re-checked
+    (see oscal_incremental.py).
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    oscal_file = Path(oscal_file)
+    if not oscal_file.exists():
+        raise FileNotFoundError(f"OSCAL file not found: {oscal_file}")
+
+    started = time.perf_counter()
+    try:
+        with open(oscal_file, 'r', encoding='utf-8') as f:
+            oscal_data = json.load(f)
+    except json.JSONDecodeError as e:
+        results = _Results(max_findings)
+        results.check('OSCAL001', False, f"JSON syntax error: {e}")
+        return _build_report(results, 0, str(oscal_file), None, started)
+
+    if cache_file is not None:
+        from oscal_incremental import validate_oscal_incremental
+        return validate_oscal_incremental(oscal_data, cache_file, nist_revision, str(oscal_file), max_findings)
+    return validate_oscal(oscal_data, nist_revision, str(oscal_file), max_findings)
+
+
+def to_sarif(report: dict) -> dict:
+    """Convert a validation report to SARIF 2.1.0 for code-scanning tools."""
+    rules = [{
+        'id': rule,
+        'name': info['name'],
+        'shortDescription': {'text': info['description']},
+        'defaultConfiguration': {'level': info['severity']},
+    } for rule, info in report['rules'].items()]
+
+    results = []
+    for finding in report['findings']:
+        location = {'physicalLocation': {'artifactLocation': {'uri': report['file'] or ''}}}
+        if finding['location']:
+            location['logicalLocations'] = [{'fullyQualifiedName': finding['location'],
+                                             'name': finding['id'] or finding['location']}]
+        results.append({
+            'ruleId': finding['rule'],
+            'level': finding['severity'],
+            'message': {'text': finding['message']},
+            'locations': [location],
+        })
+
+    return {
+        '$schema': SARIF_SCHEMA,
+        'version': '2.1.0',
+        'runs': [{
+            'tool': {'driver': {'name': 'oscal_validator', 'rules': rules}},
+            'results': results,
+        }],
+    }
+
+
+def print_report(report: dict, limit: int = 50):
+    """Print a per-rule summary and the first findings."""
+    for rule, info in report['rules'].items():
+        if info['passed']:
+            print(f"[OK] {rule} {info['name']} ({info['checked']} checked)")
+        else:
+            tag = '[ERR]' if info['severity'] == 'error' else '[WARN]'
+            print(f"{tag} {rule} {info['name']} ({info['failed']} of {info['checked']} failed)")
+
+    for finding in report['findings'][:limit]:
+        where = f" {finding['location']}" if finding['location'] else ''
+        print(f"   {finding['rule']}{where}: {finding['message']}")
+    if len(report['findings']) > limit:
+        print(f"   ... {len(report['findings']) - limit} more finding(s)")
+
+    incremental = report.get('incremental')
+    if incremental:
+        recomputed = incremental['recomputed']
+        names = f" ({', '.join(recomputed[:10])}{', ...' if len(recomputed) > 10 else ''})" if recomputed else ''
+        print(f"[*] Incremental: {len(recomputed)} group(s) recomputed{names}, "
+              f"{len(incremental['reused'])} reused from {incremental['cache']}")
+
+    status = 'passed' if report['valid'] else 'failed'
+    print(f"[{'OK' if report['valid'] else 'ERR'}] Validation {status}: {report['components']} component(s), "
+          f"{report['errors']} error(s), {report['warnings']} warning(s) ({report['elapsed']:.3f}s)")
+
+
+def main():
+    """Command-line interface for the OSCAL validator."""
+    parser = argparse.ArgumentParser(
+        description='Validate an OSCAL catalog or component definition in a single pass',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s nerc-oscal.json
+  %(prog)s nerc-oscal.json --json report.json --sarif report.sarif
+  %(prog)s nerc-oscal.json --nist-revision rev4
+  %(prog)s nerc-oscal.json --incremental
+        """
+    )
+    parser.add_argument('oscal_file', type=Path, help='OSCAL JSON file to validate')
+    parser.add_argument('--nist-revision', choices=['rev4', 'rev5'], default='rev5',
+                        help='NIST SP 800-53 revision for control checks (default: rev5)')
+    parser.add_argument('--json', type=Path, default=None, help='Write the report as JSON')
+    parser.add_argument('--sarif', type=Path, default=None, help='Write the report as SARIF 2.1.0')
+    parser.add_argument('--max-findings', type=int, default=DEFAULT_MAX_FINDINGS,
+                        help=f'Findings kept in the report (default: {DEFAULT_MAX_FINDINGS})')
+    parser.add_argument('--show', type=int, default=50, help='Findings printed (default: 50)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Re-check only groups changed since the last incremental run')
+    parser.add_argument('--cache', type=Path, default=None,
+                        help='Incremental cache (implies --incremental; default: <oscal stem>.validation-cache.json)')
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    start_profiling(args.profile)
+
+    cache_file = args.cache
+    if args.incremental and cache_file is None:
+        from oscal_incremental import default_cache_path
+        cache_file = default_cache_path(args.oscal_file)
+
+    try:
+        report = validate_oscal_file(args.oscal_file, args.nist_revision, args.max_findings, cache_file)
+    except FileNotFoundError as e:
+        print(f"[ERR] Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"[ERR] Validation error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print_report(report, args.show)
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+        print(f"[*] JSON report written to {args.json}")
+    if args.sarif:
+        args.sarif.write_text(json.dumps(to_sarif(report), indent=2))
+        print(f"[*] SARIF report written to {args.sarif}")
+    if not report['valid']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
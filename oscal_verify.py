@@ -0,0 +1,211 @@
+"""
+Batch validation of many OSCAL catalogs / component definitions.
+
+Our pipeline produces one OSCAL file per registered entity. This CLI expands
+files, directories and glob patterns, validates every file in a process pool
+(the oscal_validator.py rules, plus the JSON Schema check from oscal_schema.py
+with --schema), and prints one pass/fail table with per-file timings. It exits
+non-zero if any file fails.
+
+Usage:
+    python oscal_verify.py nerc-oscal.json
+    python oscal_verify.py 'entities/*.json' --workers 8
+    python oscal_verify.py entities/ --schema --json verify-report.json
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from nerc_profile import add_profile_argument, start_profiling
+from oscal_validator import validate_oscal
+
+STATUS_PASS = 'PASS'
+STATUS_FAIL = 'FAIL'
+STATUS_ERROR = 'ERROR'
+GLOB_CHARACTERS = set('*?[')
+
+
+def expand_inputs(inputs: Iterable[str]) -> List[Path]:
+    """
+    Expand files, directories (their *.json files) and glob patterns.
+
+    Args:
+        inputs: Paths or patterns ('**' matches recursively)
+
+    Returns:
+        Unique paths in first-seen order (missing plain paths are kept so
+        they are reported as errors)
+    """
+    paths = []
+    for item in inputs:
+        item = str(item)
+        if GLOB_CHARACTERS & set(item):
+            paths += sorted(Path(match) for match in glob.glob(item, recursive=True) if Path(match).is_file())
+        elif Path(item).is_dir():
+            paths += sorted(Path(item).glob('*.json'))
+        else:
+            paths.append(Path(item))
+    return list(dict.fromkeys(paths))
+
+
+def verify_file(oscal_file: Path, nist_revision: str = 'rev5', schema: bool = False) -> dict:
+    """
+    Validate one OSCAL file (runs in a worker process).
+
+    Returns:
+        Result dict: file, status, kind, components, errors, warnings,
+        failed_rules, schema_errors (None without schema), message, elapsed
+    """
+    started = time.perf_counter()
+    result = {'file': str(oscal_file), 'status': STATUS_ERROR, 'kind': None, 'components': 0, 'errors': 0,
+              'warnings': 0, 'failed_rules': [], 'schema_errors': None, 'message': ''}
+    try:
+        with open(oscal_file, 'r', encoding='utf-8') as f:
+            oscal_data = json.load(f)
+    except json.JSONDecodeError as e:
+        result.update(status=STATUS_FAIL, errors=1, failed_rules=['OSCAL001'], message=f"JSON syntax error: {e}")
+    except OSError as e:
+        result['message'] = str(e)
+    else:
+        try:
+            _verify_document(oscal_data, oscal_file, nist_revision, schema, result)
+        except Exception as e:
+            # One malformed document must not abort the whole batch
+            result.update(status=STATUS_ERROR, message=f"{type(e).__name__}: {e}")
+
+    result['elapsed'] = time.perf_counter() - started
+    return result
+
+
+def _verify_document(oscal_data, oscal_file: Path, nist_revision: str, schema: bool, result: dict):
+    """Run the rules (and optionally the schema) on a parsed document, filling in result."""
+    report = validate_oscal(oscal_data, nist_revision, str(oscal_file))
+    failed = [rule for rule, info in report['rules'].items() if not info['passed']]
+    result.update(kind=report['document_type'], components=report['components'], errors=report['errors'],
+                  warnings=report['warnings'], failed_rules=failed)
+    if report['findings']:
+        result['message'] = report['findings'][0]['message']
+
+    valid = report['valid']
+    if schema and report['document_type']:
+        from oscal_schema import validate_oscal_schema
+        schema_report = validate_oscal_schema(oscal_data, workers=1)
+        result['schema_errors'] = len(schema_report['errors'])
+        if schema_report['errors'] and valid:
+            error = schema_report['errors'][0]
+            result['message'] = f"Schema: {error['path']}: {error['message']}"
+        valid = valid and schema_report['valid']
+    result['status'] = STATUS_PASS if valid else STATUS_FAIL
+
+
+def _verify_file_args(args):
+    return verify_file(*args)
+
+
+def verify_files(paths: List[Path], nist_revision: str = 'rev5', schema: bool = False,
+                 workers: Optional[int] = None) -> dict:
+    """
+    Validate many OSCAL files across a process pool.
+
+    Args:
+        paths: OSCAL files
+        nist_revision: NIST SP 800-53 revision for control checks
+        schema: Also run JSON Schema validation
+        workers: Worker processes (default: CPU count)
+
+    Returns:
+        Summary dict: results (in input order), passed, failed, errored,
+        elapsed (wall clock) and cpu (sum of per-file times)
+    """
+    started = time.perf_counter()
+    tasks = [(path, nist_revision, schema) for path in paths]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(tasks) or 1))
+    if workers == 1:
+        results = [_verify_file_args(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_verify_file_args, tasks))
+
+    counts = {status: sum(1 for r in results if r['status'] == status)
+              for status in (STATUS_PASS, STATUS_FAIL, STATUS_ERROR)}
+    return {
+        'results': results,
+        'passed': counts[STATUS_PASS],
+        'failed': counts[STATUS_FAIL],
+        'errored': counts[STATUS_ERROR],
+        'workers': workers,
+        'elapsed': time.perf_counter() - started,
+        'cpu': sum(r['elapsed'] for r in results),
+    }
+
+
+def print_table(summary: dict, schema: bool = False):
+    """Print the aggregated pass/fail table."""
+    results = summary['results']
+    width = max([len('File')] + [len(r['file']) for r in results])
+    columns = f"{'File':<{width}}  {'Result':<6}  {'Type':<20}  {'Items':>6}  {'Errors':>6}  {'Warn':>4}"
+    if schema:
+        columns += f"  {'Schema':>6}"
+    print(columns + f"  {'Time':>8}  Details")
+    print('-' * (len(columns) + 19))
+
+    for r in results:
+        line = (f"{r['file']:<{width}}  {r['status']:<6}  {r['kind'] or '-':<20}  {r['components']:>6}  "
+                f"{r['errors']:>6}  {r['warnings']:>4}")
+        if schema:
+            line += f"  {'-' if r['schema_errors'] is None else r['schema_errors']:>6}"
+        details = ', '.join(r['failed_rules']) if r['failed_rules'] else ''
+        if r['status'] != STATUS_PASS and r['message']:
+            details = f"{details}: {r['message']}" if details else r['message']
+        print(line + f"  {r['elapsed'] * 1000:>6.0f}ms  {details[:100]}")
+
+    status = '[OK]' if summary['failed'] == summary['errored'] == 0 else '[ERR]'
+    print(f"{status} {summary['passed']} passed, {summary['failed']} failed, {summary['errored']} error(s) "
+          f"in {summary['elapsed']:.2f}s ({summary['cpu']:.2f}s total across {summary['workers']} worker(s))")
+
+
+def main():
+    """Command-line interface for batch OSCAL verification."""
+    parser = argparse.ArgumentParser(
+        description='Validate many OSCAL files in parallel and print a pass/fail table',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s nerc-oscal.json
+  %(prog)s 'entities/*.json' --workers 8
+  %(prog)s entities/ --schema --json verify-report.json
+        """
+    )
+    parser.add_argument('inputs', nargs='+', help='OSCAL files, directories or glob patterns')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--nist-revision', choices=['rev4', 'rev5'], default='rev5',
+                        help='NIST SP 800-53 revision for control checks (default: rev5)')
+    parser.add_argument('--schema', action='store_true', help='Also validate against the OSCAL JSON Schema')
+    parser.add_argument('--json', type=Path, default=None, help='Write all results as JSON')
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    start_profiling(args.profile)
+
+    paths = expand_inputs(args.inputs)
+    if not paths:
+        print(f"[ERR] No OSCAL files match: {' '.join(args.inputs)}", file=sys.stderr)
+        sys.exit(1)
+
+    summary = verify_files(paths, args.nist_revision, args.schema, args.workers)
+    print_table(summary, args.schema)
+    if args.json:
+        args.json.write_text(json.dumps(summary, indent=2))
+        print(f"[*] Results written to {args.json}")
+    if summary['failed'] or summary['errored']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
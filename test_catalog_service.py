@@ -0,0 +1,148 @@
+"""
+Unit tests for the catalog query service and its load test.
+"""
+
+import http.client
+import json
+import os
+import pytest
+
+from catalog_loadtest import build_paths, percentile, run_load_test
+from catalog_service import CatalogIndex, CatalogServer, LiveCatalog
+from test_oscal_to_jama_csv import make_catalog, make_control
+
+
+@pytest.fixture
+def catalog():
+    catalog = make_catalog(groups=2, reqs=3)
+    catalog["catalog"]["groups"][1]["controls"].append(make_control("CIP-002-1", "R9", primary=""))
+    return catalog
+
+
+@pytest.fixture
+def catalog_file(tmp_path, catalog):
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps(catalog))
+    return path
+
+
+@pytest.fixture
+def server(catalog_file):
+    server = CatalogServer(LiveCatalog(catalog_file))
+    server.start_background()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def get(server, path, headers=None):
+    connection = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+    try:
+        connection.request("GET", path, headers=headers or {})
+        response = connection.getresponse()
+        body = response.read()
+        return response.status, response.getheader("ETag"), json.loads(body) if body else None
+    finally:
+        connection.close()
+
+
+def rewrite(path, catalog):
+    path.write_text(json.dumps(catalog))
+    # Make sure the size/mtime check sees the change on coarse clocks
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestCatalogIndex:
+    """Test the in-memory indexes."""
+
+    def test_indexes(self, catalog):
+        index = CatalogIndex(catalog, "0" * 64)
+        assert index.requirements == 7
+        assert index.by_family["CIP-001"] == ["cip-001-1-r1", "cip-001-1-r2", "cip-001-1-r3"]
+        assert ("cip-001-1-r1", "secondary") in index.by_nist["AC-17"]
+        assert index.gaps == ["cip-002-1-r9"]
+        assert index.controls["cip-001-1-purpose"]["class"] == "purpose"
+
+    def test_query_filters(self, catalog):
+        index = CatalogIndex(catalog, "0" * 64)
+        assert index.query(family="002", nist="sc-7") == ["cip-002-1-r1", "cip-002-1-r2", "cip-002-1-r3"]
+        assert index.query(prop="NERC-Requirement-ID=CIP-001-1 R2") == ["cip-001-1-r2"]
+        with pytest.raises(ValueError):
+            index.query(prop="label")
+
+    def test_not_a_catalog(self):
+        with pytest.raises(ValueError):
+            CatalogIndex({"component-definition": {}}, "0" * 64)
+
+
+class TestCatalogService:
+    """Test the HTTP endpoints, ETags and hot reload."""
+
+    def test_endpoints(self, server):
+        status, _, control = get(server, "/controls/CIP-001-1%20R2")
+        assert status == 200
+        assert control["id"] == "cip-001-1-r2"
+        assert control["nist"] == {"primary": "SC-7", "secondary": ["CA-3", "AC-17"]}
+
+        _, _, mapped = get(server, "/nist/ca-3/requirements")
+        assert mapped["count"] == 7
+        assert {r["role"] for r in mapped["requirements"]} == {"secondary"}
+        _, _, gaps = get(server, "/gaps")
+        assert [r["id"] for r in gaps["requirements"]] == ["cip-002-1-r9"]
+        _, _, family = get(server, "/families/cip-002")
+        assert family["count"] == 4
+
+        assert get(server, "/controls/cip-009-1-r1")[0] == 404
+        assert get(server, "/controls?prop=label")[0] == 400
+        assert get(server, "/unknown")[0] == 404
+
+    def test_etag_not_modified(self, server):
+        status, etag, _ = get(server, "/gaps")
+        assert status == 200 and etag
+        status, same, body = get(server, "/gaps", {"If-None-Match": etag})
+        assert (status, same, body) == (304, etag, None)
+        assert get(server, "/controls/cip-001-1-r1", {"If-None-Match": f"W/{etag}"})[0] == 304
+        assert server.stats["not_modified"] == 2
+
+    def test_hot_reload(self, server, catalog_file, catalog):
+        _, etag, _ = get(server, "/gaps")
+        catalog["catalog"]["groups"][0]["controls"][1]["props"][1]["value"] = ""
+        rewrite(catalog_file, catalog)
+        assert server.catalog.refresh()
+
+        status, new_etag, gaps = get(server, "/gaps", {"If-None-Match": etag})
+        assert status == 200 and new_etag != etag
+        assert gaps["count"] == 2
+        assert get(server, "/health")[2]["reloads"] == 1
+
+    def test_unchanged_content_and_bad_write_keep_index(self, server, catalog_file, catalog):
+        index = server.catalog.index
+        rewrite(catalog_file, catalog)
+        assert not server.catalog.refresh()
+
+        catalog_file.write_text('{"catalog": {"groups": [')
+        assert not server.catalog.refresh()
+        assert server.catalog.index is index
+        assert server.catalog.last_error
+        assert get(server, "/controls/cip-001-1-r1")[0] == 200
+
+
+class TestLoadTest:
+    """Test the load test client."""
+
+    def test_percentile(self):
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile(values, 100) == 100.0
+        assert percentile([], 50) == 0.0
+
+    def test_run_load_test(self, server):
+        paths = build_paths(server.base_url)
+        assert "/gaps" in paths and "/controls/cip-001-1-r1" in paths
+        summary = run_load_test(server.base_url, paths, requests=200, concurrency=4, revalidate=True)
+        assert summary["requests"] == 200
+        assert not summary["errors"]
+        assert summary["statuses"]["304"] > 0
+        assert 0 < summary["latency_ms"]["p50"] <= summary["latency_ms"]["p99"] <= summary["latency_ms"]["max"]
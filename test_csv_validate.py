@@ -0,0 +1,132 @@
+"""
+Unit tests for the parallel JAMA CSV validator.
+"""
+
+import csv
+import json
+import mmap
+import pytest
+
+from csv_validate import find_chunk_ranges, validate_csv
+from oscal_to_jama_csv import oscal_to_jama_csv, validate_csv_format
+from test_oscal_to_jama_csv import make_catalog
+
+HEADER = ["JAMA-Requirement-ID", "NERC-Requirement-ID", "NIST-Primary-Control",
+          "NIST-Secondary-Controls", "Title", "Description"]
+
+
+def write_csv(path, rows, header=HEADER):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\r\n")
+        writer.writerow(header)
+        writer.writerows(rows)
+    return path
+
+
+def good_row(n, description="Plain text"):
+    return [f"CIP-{n:03d}-R1", f"CIP-{n:03d}-6 R1", "SC-7", "AC-2, CA-3(1)", f"Title {n}", description]
+
+
+@pytest.fixture
+def multiline_csv(tmp_path):
+    # Quoted descriptions with newlines, commas and doubled quotes
+    rows = [good_row(n, f'Line one\nline "two", with comma\r\nline {n}') for n in range(1, 200)]
+    return write_csv(tmp_path / "multiline.csv", rows)
+
+
+class TestChunking:
+    """Test record-boundary chunking."""
+
+    def test_ranges_cover_file_on_record_boundaries(self, multiline_csv):
+        with open(multiline_csv, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data_start = mm.find(b"\n") + 1
+            ranges = find_chunk_ranges(mm, data_start, 97)
+            assert ranges[0][0] == data_start
+            assert ranges[-1][1] == len(mm)
+            for (_, end), (start, _) in zip(ranges, ranges[1:]):
+                assert end == start
+            for start, end in ranges:
+                chunk = mm[start:end]
+                assert chunk.count(b'"') % 2 == 0
+                assert chunk.endswith(b"\n")
+        assert len(ranges) > 10
+
+    def test_chunked_report_matches_single_pass(self, multiline_csv):
+        single = validate_csv(multiline_csv, workers=1, chunk_size=1 << 30)
+        parallel = validate_csv(multiline_csv, workers=2, chunk_size=512)
+        assert parallel["chunks"] > 1
+        assert parallel["rows"] == single["rows"] == 199
+        assert parallel["valid"] and single["valid"]
+
+
+class TestRules:
+    """Test that every problem is reported."""
+
+    def test_reports_all_errors_with_rows(self, tmp_path):
+        rows = [good_row(n) for n in range(1, 51)]
+        rows[4][0] = ""                        # JAMA002, row 5
+        rows[9][1] = " "                       # JAMA003, row 10
+        rows[14][2] = "SC7"                    # JAMA006, row 15
+        rows[19][3] = "AC-2, bogus"            # JAMA007, row 20
+        rows[24][0] = "REQ-1"                  # JAMA004 (warning), row 25
+        rows[39][0] = rows[2][0]               # JAMA008, row 40 duplicates row 3
+        rows[44] = rows[44][:4]                # JAMA009, row 45
+        path = write_csv(tmp_path / "bad.csv", rows)
+
+        report = validate_csv(path, workers=2, chunk_size=256)
+        assert report["chunks"] > 1
+        assert not report["valid"]
+        found = {(issue["rule"], issue["row"]) for issue in report["issues"]}
+        assert {("JAMA002", 5), ("JAMA003", 10), ("JAMA006", 15), ("JAMA007", 20),
+                ("JAMA004", 25), ("JAMA008", 40), ("JAMA009", 45)} <= found
+        assert report["warnings"] == 1
+        duplicate = next(issue for issue in report["issues"] if issue["rule"] == "JAMA008")
+        assert "row 3" in duplicate["message"]
+        assert [issue["row"] for issue in report["issues"]] == sorted(issue["row"] for issue in report["issues"])
+
+    def test_warnings_only_is_valid(self, tmp_path):
+        path = write_csv(tmp_path / "warn.csv", [["X-1", "CIP-002-5 R1", "", "", "T", "D"]])
+        report = validate_csv(path, workers=1)
+        assert report["valid"]
+        assert report["counts"] == {"JAMA004": 1}
+
+    def test_missing_columns_and_no_rows(self, tmp_path):
+        path = write_csv(tmp_path / "empty.csv", [], header=["JAMA-Requirement-ID", "Title"])
+        report = validate_csv(path, workers=1)
+        assert report["counts"]["JAMA001"] == 3
+        assert report["counts"]["JAMA010"] == 1
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "zero.csv"
+        path.write_bytes(b"")
+        assert validate_csv(path)["counts"] == {"JAMA011": 1}
+
+    def test_max_errors_keeps_exact_counts(self, tmp_path):
+        path = write_csv(tmp_path / "many.csv", [["", "", "", "", "T", "D"]] * 30)
+        report = validate_csv(path, workers=1, max_errors=5)
+        assert len(report["issues"]) == 5
+        assert report["truncated"]
+        assert report["counts"] == {"JAMA002": 30, "JAMA003": 30}
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            validate_csv(tmp_path / "nope.csv")
+
+
+class TestValidateCsvFormat:
+    """Test the oscal_to_jama_csv entry point."""
+
+    def test_export_passes(self, tmp_path, capsys):
+        oscal_file = tmp_path / "catalog.json"
+        oscal_file.write_text(json.dumps(make_catalog(groups=2, reqs=3)))
+        output = tmp_path / "out.csv"
+        oscal_to_jama_csv(oscal_file, output, "detailed")
+        assert validate_csv_format(output)
+        assert "[OK] CSV validation passed" in capsys.readouterr().out
+
+    def test_prints_every_error(self, tmp_path, capsys):
+        path = write_csv(tmp_path / "bad.csv", [["", "CIP-002-5 R1", "", "", "T", "D"],
+                                                ["CIP-002-R2", "", "", "", "T", "D"]])
+        assert not validate_csv_format(path, workers=1)
+        out = capsys.readouterr().out
+        assert "JAMA002 Row 1" in out and "JAMA003 Row 2" in out
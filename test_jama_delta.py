@@ -0,0 +1,112 @@
+"""
+Unit tests for the delta JAMA export.
+"""
+
+import csv
+import json
+import pytest
+
+from jama_delta import (
+    OP_ADD,
+    OP_DELETE,
+    OP_UPDATE,
+    compute_delta,
+    default_manifest_path,
+    delta_oscal_to_jama_csv,
+    load_manifest,
+)
+from oscal_to_jama_csv import get_csv_columns
+from test_oscal_to_jama_csv import make_catalog
+
+
+def read_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+@pytest.fixture
+def oscal_file(tmp_path):
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps(make_catalog()))
+    return path
+
+
+class TestComputeDelta:
+    """Test row classification against a manifest."""
+
+    FIELDS = get_csv_columns("detailed")
+
+    def row(self, key, title="T", uuid="u"):
+        return {"JAMA-Requirement-ID": key, "NERC-Requirement-ID": f"N {key}",
+                "Title": title, "Component-UUID": uuid}
+
+    def test_classifies_and_ignores_uuid(self):
+        _, previous, _ = compute_delta([self.row("A"), self.row("B"), self.row("C")], {}, self.FIELDS)
+        rows = [self.row("A", uuid="new"), self.row("B", title="Changed"), self.row("D")]
+
+        delta, _, summary = compute_delta(rows, previous, self.FIELDS)
+
+        assert [(r["Operation"], r["JAMA-Requirement-ID"]) for r in delta] == [
+            (OP_UPDATE, "B"), (OP_ADD, "D"), (OP_DELETE, "C")]
+        assert delta[-1]["NERC-Requirement-ID"] == "N C"
+        assert summary == {OP_ADD: 1, OP_UPDATE: 1, OP_DELETE: 1, "unchanged": 1}
+
+    def test_duplicate_or_missing_key_rejected(self):
+        with pytest.raises(ValueError, match="Duplicate"):
+            compute_delta([self.row("A"), self.row("A")], {}, self.FIELDS)
+        with pytest.raises(ValueError):
+            compute_delta([self.row("")], {}, self.FIELDS)
+
+
+class TestDeltaExport:
+    """Test successive delta runs against an OSCAL file."""
+
+    def test_first_run_adds_everything_then_nothing(self, oscal_file, tmp_path):
+        output = tmp_path / "delta.csv"
+        first = delta_oscal_to_jama_csv(oscal_file, output, format_type="detailed")
+        assert first[OP_ADD] == 6
+        assert {r["Operation"] for r in read_rows(output)} == {OP_ADD}
+        assert len(load_manifest(default_manifest_path(output))) == 6
+
+        second = delta_oscal_to_jama_csv(oscal_file, output, format_type="detailed")
+        assert second == {OP_ADD: 0, OP_UPDATE: 0, OP_DELETE: 0, "unchanged": 6}
+        assert read_rows(output) == []
+
+    def test_change_and_removal(self, oscal_file, tmp_path):
+        output = tmp_path / "delta.csv"
+        delta_oscal_to_jama_csv(oscal_file, output)
+
+        catalog = make_catalog()
+        controls = catalog["catalog"]["groups"][0]["controls"]
+        controls[1]["title"] = "Retitled"
+        del controls[2]
+        oscal_file.write_text(json.dumps(catalog))
+
+        delta_oscal_to_jama_csv(oscal_file, output)
+        assert [(r["Operation"], r["JAMA-Requirement-ID"]) for r in read_rows(output)] == [
+            (OP_UPDATE, "CIP-001-R1"), (OP_DELETE, "CIP-001-R2")]
+
+    def test_layout_change_requires_new_baseline(self, oscal_file, tmp_path):
+        output = tmp_path / "delta.csv"
+        delta_oscal_to_jama_csv(oscal_file, output)
+        written = output.read_bytes()
+        manifest = default_manifest_path(output)
+        baseline = manifest.read_bytes()
+
+        with pytest.raises(ValueError, match="Rebuild the baseline"):
+            delta_oscal_to_jama_csv(oscal_file, output, format_type="detailed")
+        assert output.read_bytes() == written
+        assert manifest.read_bytes() == baseline
+
+        manifest.unlink()
+        assert delta_oscal_to_jama_csv(oscal_file, output, format_type="detailed")[OP_ADD] == 6
+
+    def test_unsupported_manifest_version(self, oscal_file, tmp_path):
+        manifest = tmp_path / "m.json"
+        manifest.write_text(json.dumps({"version": 99, "rows": {}}))
+        with pytest.raises(ValueError):
+            delta_oscal_to_jama_csv(oscal_file, tmp_path / "d.csv", manifest)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,103 @@
+"""
+Unit tests for the columnar JAMA export.
+"""
+
+import csv
+import json
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from jama_frame import components_to_frame, export_oscal_frame, target_for_path
+from oscal_to_jama_csv import build_jama_row, get_csv_columns, oscal_to_jama_csv
+from test_oscal_to_jama_csv import make_catalog
+
+
+COMPONENTS = [
+    {
+        "uuid": "u1",
+        "title": "Firewall",
+        "description": "Boundary device",
+        "properties": [
+            {"name": "JAMA-Requirement-ID", "value": "CIP-005-R1"},
+            {"name": "NIST-800-53-Primary-Control", "value": " sc-7 "},
+            {"name": "Implementation-Status", "value": "Implemented"},
+            {"name": "Implementation-Status", "value": "Partial"},
+        ],
+        "control-implementations": [{}, {}],
+    },
+    {"uuid": "u2", "title": "Bare component"},
+]
+
+
+class FakeCatalog:
+    """Stand-in for NISTCatalog recording statement lookups."""
+
+    def __init__(self):
+        self.lookups = []
+
+    def get_statement(self, control_id):
+        self.lookups.append(control_id)
+        return f"statement for {control_id}"
+
+
+class TestComponentsToFrame:
+    """Test the frame matches the row exporter."""
+
+    @pytest.mark.parametrize("format_type", ["standard", "detailed"])
+    def test_matches_build_jama_row(self, format_type):
+        frame = components_to_frame(COMPONENTS, format_type)
+        expected = [build_jama_row(c, format_type) for c in COMPONENTS]
+        assert list(frame.columns) == get_csv_columns(format_type)
+        assert frame.to_dict("records") == expected
+
+    def test_statement_lookup_once_per_control(self):
+        catalog = FakeCatalog()
+        components = COMPONENTS + [dict(COMPONENTS[0], uuid="u3")]
+        frame = components_to_frame(components, nist_catalog=catalog)
+        assert frame["NIST-Primary-Control-Statement"].tolist() == [
+            "statement for SC-7", "", "statement for SC-7"]
+        assert sorted(catalog.lookups) == ["SC-7"]
+
+
+class TestExportOscalFrame:
+    """Test one parse feeding several targets."""
+
+    def test_csv_identical_to_row_exporter(self, tmp_path):
+        oscal_file = tmp_path / "catalog.json"
+        oscal_file.write_text(json.dumps(make_catalog()))
+        oscal_to_jama_csv(oscal_file, tmp_path / "rows.csv")
+        export_oscal_frame(oscal_file, [tmp_path / "frame.csv"])
+        assert (tmp_path / "frame.csv").read_bytes() == (tmp_path / "rows.csv").read_bytes()
+
+    def test_parquet_round_trip(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        oscal_file = tmp_path / "catalog.json"
+        oscal_file.write_text(json.dumps(make_catalog()))
+        frame = export_oscal_frame(oscal_file, [tmp_path / "m.csv", tmp_path / "m.parquet"])
+        pd.testing.assert_frame_equal(pd.read_parquet(tmp_path / "m.parquet"), frame, check_dtype=False)
+        with open(tmp_path / "m.csv", newline="", encoding="utf-8") as f:
+            assert len(list(csv.DictReader(f))) == len(frame)
+
+    def test_cli_target_conflicting_with_output_suffix(self, tmp_path, monkeypatch, capsys):
+        import oscal_to_jama_csv as cli
+
+        oscal_file = tmp_path / "catalog.json"
+        oscal_file.write_text(json.dumps(make_catalog()))
+        monkeypatch.setattr(cli.sys, "argv", ["oscal_to_jama_csv.py", str(oscal_file),
+                                              "--target", "parquet", "-o", str(tmp_path / "out.csv")])
+        with pytest.raises(SystemExit) as excinfo:
+            cli.main()
+        assert excinfo.value.code == 2
+        assert "--target parquet conflicts" in capsys.readouterr().err
+        assert not (tmp_path / "out.csv").exists()
+
+    def test_unsupported_target_rejected_before_export(self, tmp_path):
+        with pytest.raises(ValueError):
+            target_for_path(tmp_path / "matrix.txt")
+        with pytest.raises(ValueError):
+            export_oscal_frame(tmp_path / "missing.json", [tmp_path / "m.txt"])
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
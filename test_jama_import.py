@@ -0,0 +1,109 @@
+"""
+Unit tests for the JAMA status importer.
+"""
+
+import csv
+import json
+import time
+import pytest
+
+from jama_import import build_control_index, import_jama_statuses, merge_jama_statuses
+from oscal_to_jama_csv import oscal_to_jama_csv
+from test_oscal_to_jama_csv import make_catalog
+
+
+def write_csv(path, rows, fieldnames=("JAMA-Requirement-ID", "NERC-Requirement-ID", "Implementation-Status")):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(fieldnames), extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+def statuses(oscal_data):
+    return {
+        control["id"]: prop["value"]
+        for group in oscal_data["catalog"]["groups"]
+        for control in group["controls"]
+        for prop in control.get("props", [])
+        if prop["name"] == "Implementation-Status"
+    }
+
+
+class TestMerge:
+    """Test matching and merging of statuses."""
+
+    def test_index_keys(self):
+        index = build_control_index(make_catalog(groups=1, reqs=1))
+        assert index["CIP-001-R1"] is index["CIP-001-1 R1"] is index["CIP-001-1-R1"]
+
+    def test_merge_by_jama_or_nerc_id(self, tmp_path):
+        catalog = make_catalog()
+        path = write_csv(tmp_path / "export.csv", [
+            {"JAMA-Requirement-ID": "CIP-001-R1", "Implementation-Status": "Implemented"},
+            {"NERC-Requirement-ID": "cip-002-1  r3", "Implementation-Status": "Partial"},
+            {"JAMA-Requirement-ID": "OTHER-PROJECT-1", "Implementation-Status": "Done"},
+            {"JAMA-Requirement-ID": "CIP-001-R2", "Implementation-Status": ""},
+        ])
+
+        summary = merge_jama_statuses(catalog, path)
+
+        assert statuses(catalog) == {"cip-001-1-r1": "Implemented", "cip-002-1-r3": "Partial"}
+        assert (summary["matched"], summary["unmatched"], summary["blank"]) == (2, 1, 1)
+        assert summary["unmatched_keys"] == ["OTHER-PROJECT-1"]
+
+    def test_conflicts_last_row_wins_and_rerun_is_noop(self, tmp_path):
+        catalog = make_catalog()
+        path = write_csv(tmp_path / "export.csv", [
+            {"JAMA-Requirement-ID": "CIP-001-R1", "Implementation-Status": "Planned"},
+            {"JAMA-Requirement-ID": "CIP-001-R1", "Implementation-Status": "Implemented"},
+        ])
+
+        first = merge_jama_statuses(catalog, path)
+        second = merge_jama_statuses(catalog, path)
+
+        assert statuses(catalog) == {"cip-001-1-r1": "Implemented"}
+        assert (first["conflicts"], first["changed"]) == (1, 1)
+        assert (second["changed"], second["unchanged"]) == (0, 1)
+
+    def test_missing_status_column(self, tmp_path):
+        path = write_csv(tmp_path / "export.csv", [], fieldnames=("JAMA-Requirement-ID",))
+        with pytest.raises(ValueError):
+            merge_jama_statuses(make_catalog(), path)
+
+    def test_linear_on_large_export(self, tmp_path):
+        """Test a 200k-row export across entities merges in one fast pass."""
+        catalog = make_catalog(groups=9, reqs=50)
+        rows = [{"JAMA-Requirement-ID": f"CIP-00{1 + i % 9}-R{1 + i % 50}" if i % 4 else f"X-{i}",
+                 "Implementation-Status": "Implemented"} for i in range(200_000)]
+        path = write_csv(tmp_path / "export.csv", rows)
+
+        started = time.perf_counter()
+        summary = merge_jama_statuses(catalog, path)
+
+        assert time.perf_counter() - started < 10
+        assert summary["unmatched"] == 50_000
+        assert summary["changed"] == 450
+
+
+class TestRoundTrip:
+    """Test statuses survive OSCAL -> JAMA CSV -> OSCAL."""
+
+    def test_round_trip(self, tmp_path):
+        oscal_file = tmp_path / "catalog.json"
+        oscal_file.write_text(json.dumps(make_catalog()))
+        rows = oscal_to_jama_csv(oscal_file, tmp_path / "export.csv")
+        rows[0]["Implementation-Status"] = "Implemented"
+        write_csv(tmp_path / "export.csv", rows, fieldnames=list(rows[0].keys()))
+
+        summary = import_jama_statuses(tmp_path / "export.csv", oscal_file)
+        exported = oscal_to_jama_csv(oscal_file, tmp_path / "again.csv")
+
+        # All other rows come back as the exporter's default, which is a change too
+        assert summary["changed"] == len(rows)
+        assert exported[0]["Implementation-Status"] == "Implemented"
+        assert [r["Implementation-Status"] for r in exported[1:]] == ["Draft"] * (len(rows) - 1)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
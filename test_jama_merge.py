@@ -0,0 +1,91 @@
+"""
+Unit tests for the multi-catalog merge export.
+"""
+
+import csv
+import json
+import pytest
+
+from jama_merge import MergeIndex, merge_oscal_to_jama_csv
+from oscal_to_jama_csv import get_csv_columns
+from test_oscal_to_jama_csv import make_catalog, make_control
+
+
+def read_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def write_json(path, data):
+    path.write_text(json.dumps(data))
+    return path
+
+
+@pytest.fixture
+def base_file(tmp_path):
+    return write_json(tmp_path / "base.json", make_catalog(groups=2, reqs=3))
+
+
+@pytest.fixture
+def tailoring_file(tmp_path):
+    # Same catalog with CIP-001 R2 retailored and a regional requirement added
+    catalog = make_catalog(groups=2, reqs=3)
+    controls = catalog["catalog"]["groups"][0]["controls"]
+    controls[2] = make_control("CIP-001-1", "R2", primary="AC-4", status="Implemented")
+    controls.append(make_control("CIP-001-1", "R9"))
+    return write_json(tmp_path / "wecc.json", catalog)
+
+
+class TestMerge:
+    """Test dedup, precedence and ordering."""
+
+    def test_identical_inputs_collapse(self, base_file, tmp_path):
+        output = tmp_path / "merged.csv"
+        summary = merge_oscal_to_jama_csv([base_file, base_file], output)
+        assert summary["rows"] == 6
+        assert summary["duplicates"] == 6
+        assert summary["overrides"] == 0
+        assert [row["JAMA-Requirement-ID"] for row in read_rows(output)] == [
+            "CIP-001-R1", "CIP-001-R2", "CIP-001-R3", "CIP-002-R1", "CIP-002-R2", "CIP-002-R3"]
+
+    def test_later_input_wins(self, base_file, tailoring_file, tmp_path):
+        output = tmp_path / "merged.csv"
+        summary = merge_oscal_to_jama_csv([base_file, tailoring_file], output)
+        rows = {row["JAMA-Requirement-ID"]: row for row in read_rows(output)}
+        assert summary["rows"] == 7
+        assert summary["overrides"] == 1
+        assert summary["override_keys"] == ["CIP-001-R2"]
+        assert rows["CIP-001-R2"]["NIST-Primary-Control"] == "AC-4"
+        assert rows["CIP-001-R2"]["Implementation-Status"] == "Implemented"
+        # First-seen position is kept; the regional requirement follows the base
+        assert list(rows)[1] == "CIP-001-R2"
+        assert list(rows)[-1] == "CIP-001-R9"
+
+    def test_precedence_follows_input_order(self, base_file, tailoring_file, tmp_path):
+        output = tmp_path / "merged.csv"
+        merge_oscal_to_jama_csv([tailoring_file, base_file], output)
+        rows = {row["JAMA-Requirement-ID"]: row for row in read_rows(output)}
+        assert rows["CIP-001-R2"]["NIST-Primary-Control"] == "SC-7"
+
+    def test_counts_do_not_depend_on_arrival_order(self):
+        fieldnames = get_csv_columns()
+        row_a = {"JAMA-Requirement-ID": "CIP-005-R1", "Title": "a"}
+        row_b = {"JAMA-Requirement-ID": "CIP-005-R1", "Title": "b"}
+        summaries = []
+        for order in ([0, 1, 2], [2, 1, 0], [1, 2, 0]):
+            index = MergeIndex(["x", "y", "z"], fieldnames)
+            for source in order:
+                index.add(source, 0, row_b if source == 1 else row_a)
+            summaries.append((index.summary(), index.rows()))
+        assert all(summary == summaries[0] for summary in summaries)
+        assert summaries[0][0]["duplicates"] == 1
+        assert summaries[0][0]["overrides"] == 1
+        assert summaries[0][1] == [row_a]
+
+    def test_missing_input(self, base_file, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            merge_oscal_to_jama_csv([base_file, tmp_path / "nope.json"], tmp_path / "out.csv")
+
+    def test_default_output(self, base_file, tailoring_file):
+        merge_oscal_to_jama_csv([base_file, tailoring_file])
+        assert (base_file.parent / "base-merged.csv").exists()
@@ -0,0 +1,87 @@
+"""
+Unit tests for the sharded JAMA CSV export.
+"""
+
+import csv
+import json
+import pytest
+
+from jama_shards import parse_size, row_family, shard_oscal_to_jama_csv, verify_shards
+from oscal_to_jama_csv import oscal_to_jama_csv
+from test_oscal_to_jama_csv import make_catalog
+
+
+def read_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+@pytest.fixture
+def oscal_file(tmp_path):
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps(make_catalog(groups=3, reqs=4)))
+    return path
+
+
+class TestHelpers:
+    """Test size parsing and family keys."""
+
+    def test_parse_size(self):
+        assert parse_size("500") == 500
+        assert parse_size("64k") == 64 * 1024
+        assert parse_size("10MB") == 10 * 1024 * 1024
+        with pytest.raises(ValueError):
+            parse_size("0")
+        with pytest.raises(ValueError):
+            parse_size("ten")
+
+    def test_row_family(self):
+        assert row_family({"JAMA-Requirement-ID": "CIP-005-R1"}) == "cip-005"
+        assert row_family({"NERC-Requirement-ID": "CIP-007-6 R2"}) == "cip-007"
+        assert row_family({}) == "other"
+
+
+class TestShardExport:
+    """Test shards reassemble into the unsharded export."""
+
+    @pytest.mark.parametrize("shard_by,shard_size", [("family", None), ("rows", 5), ("bytes", 700)])
+    def test_shards_cover_all_rows_in_order(self, oscal_file, tmp_path, shard_by, shard_size):
+        expected = oscal_to_jama_csv(oscal_file, tmp_path / "full.csv")
+        manifest = shard_oscal_to_jama_csv(oscal_file, tmp_path / "m.csv", shard_by, shard_size, workers=2)
+
+        combined = []
+        for shard in manifest["shards"]:
+            rows = read_rows(tmp_path / shard["file"])
+            assert shard["last_row"] - shard["first_row"] + 1 == shard["rows"] == len(rows)
+            assert shard["first_row"] == len(combined) + 1
+            if shard_by == "bytes" and shard["rows"] > 1:
+                assert shard["bytes"] <= shard_size
+            combined.extend(rows)
+
+        assert combined == expected
+        assert manifest["total_rows"] == len(expected)
+        assert verify_shards(tmp_path / "m.shards.json") == []
+
+    def test_family_shards(self, oscal_file, tmp_path):
+        manifest = shard_oscal_to_jama_csv(oscal_file, tmp_path / "m.csv", "family")
+        assert [s["file"] for s in manifest["shards"]] == ["m-cip-001.csv", "m-cip-002.csv", "m-cip-003.csv"]
+        assert {s["rows"] for s in manifest["shards"]} == {4}
+
+    def test_rerun_removes_stale_shards_and_verify_detects_tampering(self, oscal_file, tmp_path):
+        shard_oscal_to_jama_csv(oscal_file, tmp_path / "m.csv", "rows", 2)
+        assert (tmp_path / "m-0006.csv").exists()
+
+        shard_oscal_to_jama_csv(oscal_file, tmp_path / "m.csv", "rows", 6)
+        assert not (tmp_path / "m-0003.csv").exists()
+
+        (tmp_path / "m-0001.csv").write_text("tampered")
+        (tmp_path / "m-0002.csv").unlink()
+        assert len(verify_shards(tmp_path / "m.shards.json")) == 2
+
+    def test_invalid_mode(self, oscal_file, tmp_path):
+        with pytest.raises(ValueError):
+            shard_oscal_to_jama_csv(oscal_file, tmp_path / "m.csv", "standard")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
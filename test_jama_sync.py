@@ -0,0 +1,303 @@
+"""
+Unit tests for the JAMA REST sync client against the local stub server.
+"""
+
+import asyncio
+import csv
+import json
+import time
+import pytest
+
+import jama_sync
+from jama_stub_server import JamaStubServer
+from jama_sync import (
+    ConnectionPool,
+    JamaAPIError,
+    JamaClient,
+    RateLimiter,
+    load_field_map,
+    read_sync_rows,
+    sync_file,
+)
+
+
+def make_rows(count, status="Draft"):
+    return [
+        {
+            "JAMA-Requirement-ID": f"CIP-{i:03d}-R1",
+            "NERC-Requirement-ID": f"CIP-{i:03d}-1 R1",
+            "NIST-Primary-Control": "SC-7",
+            "NIST-Secondary-Controls": "",
+            "Title": f"Requirement {i}",
+            "Description": "Text",
+            "Implementation-Status": status,
+        }
+        for i in range(count)
+    ]
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+@pytest.fixture
+def server():
+    server = JamaStubServer()
+    server.start_background()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestSync:
+    """Test upserts, deletes and connection reuse."""
+
+    def test_create_then_noop_then_update(self, server, tmp_path):
+        rows = make_rows(120)
+        path = write_csv(tmp_path / "m.csv", rows)
+
+        first = sync_file(path, server.base_url, 1, concurrency=4, batch_size=25)
+        assert (first["created"], first["failed"]) == (120, 0)
+        assert len(server.items) == 120
+        # Keep-alive: connections bounded by concurrency, not by request count
+        assert first["connections"] <= 4 < first["requests"]
+
+        # Paged read (more than one page of 50) finds every item, nothing is sent
+        second = sync_file(path, server.base_url, 1)
+        assert (second["unchanged"], second["requests"]) == (120, 3)
+
+        rows[5]["Implementation-Status"] = "Implemented"
+        third = sync_file(write_csv(path, rows), server.base_url, 1)
+        assert (third["updated"], third["unchanged"]) == (1, 119)
+        statuses = {i["fields"]["implementation_status"] for i in server.items.values()}
+        assert statuses == {"Draft", "Implemented"}
+
+    def test_delta_delete(self, server, tmp_path):
+        rows = make_rows(3)
+        sync_file(write_csv(tmp_path / "m.csv", rows), server.base_url, 1)
+        delta = [dict(rows[0], Operation="DELETE"), dict(rows[1], Operation="UPDATE", Title="New")]
+
+        summary = sync_file(write_csv(tmp_path / "d.csv", delta), server.base_url, 1)
+
+        assert (summary["deleted"], summary["updated"]) == (1, 1)
+        assert sorted(i["fields"]["name"] for i in server.items.values()) == ["New", "Requirement 2"]
+
+    def test_retries_injected_failures(self, server, tmp_path):
+        sync_file(write_csv(tmp_path / "m.csv", make_rows(30)), server.base_url, 1)
+        server.fail_every = 3
+        summary = sync_file(write_csv(tmp_path / "m.csv", make_rows(30, status="Implemented")),
+                            server.base_url, 1, backoff=0)
+        assert (summary["updated"], summary["failed"]) == (30, 0)
+        assert summary["retries"] == server.stats["injected_503"] > 0
+
+    def test_create_not_retried_after_server_error(self, server, tmp_path):
+        """Test a POST that may have been applied is reported, not resent."""
+        server.fail_every = 2
+        summary = sync_file(write_csv(tmp_path / "m.csv", make_rows(4)), server.base_url, 1,
+                            concurrency=1, backoff=0)
+        assert (summary["created"], summary["failed"], summary["retries"]) == (2, 2, 0)
+        assert summary["requests"] == 1 + 4
+
+        server.fail_every = 0
+        rerun = sync_file(write_csv(tmp_path / "m.csv", make_rows(4)), server.base_url, 1)
+        assert (rerun["created"], rerun["unchanged"]) == (2, 2)
+        assert len(server.items) == 4
+
+    def test_create_retried_on_rate_limit(self, server, tmp_path):
+        server.max_rps = 4
+        summary = sync_file(write_csv(tmp_path / "m.csv", make_rows(6)), server.base_url, 1)
+        assert (summary["created"], summary["failed"]) == (6, 0)
+        assert summary["retries"] == server.stats["injected_429"] > 0
+        assert len(server.items) == 6
+
+    def test_exhausted_retries_reported_per_row(self, server, tmp_path):
+        server.fail_every = 1
+        summary = sync_file(write_csv(tmp_path / "m.csv", make_rows(2)), server.base_url, 1,
+                            retries=1, backoff=0)
+        assert summary["failed"] == 2
+        assert "503" in summary["errors"][0]
+
+    def test_client_error_not_retried(self, server):
+        async def run():
+            client = JamaClient(server.base_url, 1)
+            try:
+                with pytest.raises(JamaAPIError) as excinfo:
+                    await client.update_item(999, {"name": "x"})
+                return excinfo.value.status, client.stats["requests"]
+            finally:
+                await client.close()
+
+        assert asyncio.run(run()) == (404, 1)
+
+
+class TestConnectionPool:
+    """Test that requests unsafe to resend never go out on a dead keep-alive connection."""
+
+    async def serve(self, close_after_response):
+        """Minimal HTTP server recording request methods; optionally drops each connection after replying."""
+        methods = []
+
+        async def handle(reader, writer):
+            while True:
+                request = await reader.readuntil(b"\r\n\r\n")
+                methods.append(request.split(b" ", 1)[0].decode())
+                length = int(request.lower().split(b"content-length:")[1].split(b"\r\n")[0])
+                await reader.readexactly(length)
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}")
+                await writer.drain()
+                if close_after_response:
+                    writer.close()
+                    return
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        return server, methods, f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+
+    def test_post_not_sent_on_connection_closed_by_server(self):
+        async def run():
+            server, methods, url = await self.serve(close_after_response=True)
+            pool = ConnectionPool(url)
+            try:
+                await pool.request("GET", "/items")
+                await asyncio.sleep(0.05)  # the server's close arrives while the connection is idle
+                status, _, _ = await pool.request("POST", "/items", b"{}", retry_stale=False)
+                return status, methods, pool.opened
+            finally:
+                await pool.close()
+                server.close()
+
+        assert asyncio.run(run()) == (200, ["GET", "POST"], 2)
+
+    def test_post_uses_fresh_connection_after_idle(self, monkeypatch):
+        monkeypatch.setattr(jama_sync, "NON_IDEMPOTENT_MAX_IDLE", 0)
+
+        async def run():
+            server, methods, url = await self.serve(close_after_response=False)
+            pool = ConnectionPool(url)
+            try:
+                await pool.request("GET", "/items")
+                await pool.request("GET", "/items")
+                reused = pool.opened
+                await asyncio.sleep(0.01)
+                await pool.request("POST", "/items", b"{}", retry_stale=False)
+                return reused, pool.opened, methods
+            finally:
+                await pool.close()
+                server.close()
+
+        assert asyncio.run(run()) == (1, 2, ["GET", "GET", "POST"])
+
+    def test_post_retried_when_sending_fails(self):
+        class BrokenWriter:
+            def write(self, data):
+                pass
+
+            async def drain(self):
+                raise ConnectionResetError("Connection lost")
+
+            def is_closing(self):
+                return False
+
+            def close(self):
+                pass
+
+        async def run():
+            server, methods, url = await self.serve(close_after_response=False)
+            pool = ConnectionPool(url)
+            pool._idle.append((asyncio.StreamReader(), BrokenWriter(), time.monotonic()))
+            try:
+                status, _, _ = await pool.request("POST", "/items", b"{}", retry_stale=False)
+                return status, methods
+            finally:
+                await pool.close()
+                server.close()
+
+        assert asyncio.run(run()) == (200, ["POST"])
+
+
+FIELD_MAP = {
+    "default": {"Title": "name", "Description": "description"},
+    "87": {
+        "JAMA-Requirement-ID": "jama_req_id$87",
+        "NIST-Primary-Control": "nist_primary$87",
+        "Implementation-Status": "status$87",
+    },
+}
+
+
+class TestFieldMap:
+    """Test per-item-type field mappings."""
+
+    @pytest.fixture
+    def field_map_file(self, tmp_path):
+        path = tmp_path / "jama-fields.json"
+        path.write_text(json.dumps(FIELD_MAP))
+        return path
+
+    def test_layers_item_type_over_default(self, field_map_file):
+        field_map = load_field_map(field_map_file, 87)
+        assert field_map == {**FIELD_MAP["default"], **FIELD_MAP["87"]}
+
+    def test_key_column_required(self, field_map_file):
+        with pytest.raises(ValueError, match="JAMA-Requirement-ID"):
+            load_field_map(field_map_file, 12)
+        with pytest.raises(FileNotFoundError):
+            load_field_map(field_map_file.with_name("missing.json"), 87)
+
+    def test_sync_matches_on_mapped_key(self, server, field_map_file, tmp_path):
+        field_map = load_field_map(field_map_file, 87)
+        path = write_csv(tmp_path / "m.csv", make_rows(3))
+        # Same key under the built-in field name, but another item type: must not be matched
+        server.items[99] = {"id": 99, "project": 1, "itemType": 12,
+                            "fields": {"jama_req_id$87": "CIP-000-R1", "name": "Other"}}
+
+        first = sync_file(path, server.base_url, 1, item_type=87, field_map=field_map)
+        assert first["created"] == 3
+        # Creates run concurrently, so order the items by their key rather than by id
+        created = sorted((i for i in server.items.values() if i["itemType"] == 87),
+                         key=lambda item: item["fields"]["jama_req_id$87"])
+        assert created[0]["fields"] == {"name": "Requirement 0", "description": "Text",
+                                        "jama_req_id$87": "CIP-000-R1", "nist_primary$87": "SC-7",
+                                        "status$87": "Draft"}
+
+        # Server-side fields outside the map neither trigger updates nor get dropped
+        for item in created:
+            item["fields"]["documentKey"] = f"NERC-{item['id']}"
+        second = sync_file(path, server.base_url, 1, item_type=87, field_map=field_map)
+        assert second["unchanged"] == 3
+
+        rows = make_rows(3)
+        rows[0]["Implementation-Status"] = "Implemented"
+        third = sync_file(write_csv(path, rows), server.base_url, 1, item_type=87, field_map=field_map)
+        assert (third["updated"], third["unchanged"]) == (1, 2)
+        assert created[0]["id"] in server.items
+        updated = server.items[created[0]["id"]]["fields"]
+        assert updated["status$87"] == "Implemented"
+        assert updated["documentKey"] == f"NERC-{created[0]['id']}"
+
+
+class TestRateLimiter:
+    """Test the token bucket spaces requests out."""
+
+    def test_rate(self):
+        async def run():
+            limiter = RateLimiter(rate=50, burst=1)
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            for _ in range(6):
+                await limiter.acquire()
+            return loop.time() - start
+
+        assert asyncio.run(run()) >= 0.09
+
+
+def test_read_sync_rows_missing(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        read_sync_rows(tmp_path / "missing.csv")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
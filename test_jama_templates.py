@@ -0,0 +1,104 @@
+"""
+Unit tests for compiled JAMA column-mapping templates.
+"""
+
+import csv
+import json
+import pytest
+
+from jama_templates import (
+    BUILTIN_TEMPLATES,
+    compile_template,
+    get_template,
+    load_template,
+    template_oscal_to_jama_csv,
+)
+from oscal_to_jama_csv import build_jama_row
+from test_jama_frame import COMPONENTS, FakeCatalog
+from test_oscal_to_jama_csv import make_catalog
+
+
+class TestCompileTemplate:
+    """Test compiled builders against the hand-written row builder."""
+
+    @pytest.mark.parametrize("format_type", ["standard", "detailed"])
+    def test_builtin_matches_build_jama_row(self, format_type):
+        build_row = compile_template(BUILTIN_TEMPLATES[format_type])
+        for component in COMPONENTS:
+            assert build_row(component) == build_jama_row(component, format_type)
+
+    def test_statement_column_matches(self):
+        catalog = FakeCatalog()
+        build_row = compile_template(get_template("standard", with_statement=True), catalog)
+        for component in COMPONENTS:
+            assert build_row(component) == build_jama_row(component, "standard", catalog)
+
+    def test_sources_transforms_and_defaults(self):
+        template = {"columns": [
+            {"column": "Req", "prop": "JAMA-Requirement-ID", "default": "n/a"},
+            {"column": "Owner", "field": "metadata.owners.0", "transform": ["strip", "upper"]},
+            {"column": "Missing", "field": "metadata.none", "default": "-"},
+            {"column": "Source", "value": "NERC CIP"},
+            {"column": "Tags", "field": "tags", "transform": "join"},
+            {"column": "Quote's \"col\"", "value": "ok"},
+        ]}
+        row = compile_template(template)({"metadata": {"owners": [" ops "]}, "tags": ["a", "b"]})
+        assert row == {"Req": "n/a", "Owner": "OPS", "Missing": "-", "Source": "NERC CIP",
+                       "Tags": "a, b", "Quote's \"col\"": "ok"}
+
+    @pytest.mark.parametrize("template", [
+        {"columns": []},
+        {"columns": [{"column": "A"}]},
+        {"columns": [{"column": "A", "prop": "x", "value": "y"}]},
+        {"columns": [{"column": "A", "prop": "x"}, {"column": "A", "prop": "y"}]},
+        {"columns": [{"column": "A", "prop": "x", "transform": "reverse"}]},
+    ])
+    def test_invalid_templates(self, template):
+        with pytest.raises(ValueError):
+            compile_template(template)
+
+    def test_statement_requires_catalog(self):
+        with pytest.raises(ValueError, match="NIST catalog"):
+            compile_template(get_template("standard", with_statement=True))
+
+
+class TestTemplateExport:
+    """Test exporting with a template file."""
+
+    def test_export_with_template_file(self, tmp_path):
+        oscal_file = tmp_path / "catalog.json"
+        oscal_file.write_text(json.dumps(make_catalog()))
+        template_file = tmp_path / "audit.json"
+        template_file.write_text(json.dumps({"columns": [
+            {"column": "Req ID", "prop": "JAMA-Requirement-ID"},
+            {"column": "Standard", "field": "group_id", "transform": "upper"},
+        ]}))
+
+        count = template_oscal_to_jama_csv(oscal_file, tmp_path / "out.csv", load_template(template_file))
+
+        with open(tmp_path / "out.csv", newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert count == len(rows) == 6
+        assert rows[0] == {"Req ID": "CIP-001-R1", "Standard": "CIP-001-1"}
+
+    @pytest.mark.parametrize("flag", ["--validate", "--stream"])
+    def test_cli_rejects_flags_a_template_would_ignore(self, tmp_path, monkeypatch, capsys, flag):
+        import oscal_to_jama_csv as cli
+
+        oscal_file = tmp_path / "catalog.json"
+        oscal_file.write_text(json.dumps(make_catalog()))
+        monkeypatch.setattr(cli.sys, "argv", ["oscal_to_jama_csv.py", str(oscal_file), "--template", "standard",
+                                              "-o", str(tmp_path / "out.csv"), flag])
+        with pytest.raises(SystemExit) as excinfo:
+            cli.main()
+        assert excinfo.value.code == 2
+        assert "--template cannot be combined" in capsys.readouterr().err
+        assert not (tmp_path / "out.csv").exists()
+
+    def test_missing_template_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_template(tmp_path / "missing.json")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
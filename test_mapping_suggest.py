@@ -0,0 +1,69 @@
+"""
+Unit tests for the TF-IDF NIST mapping-suggestion engine.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from mapping_suggest import (  # noqa: E402
+    build_tfidf_matrix,
+    find_gaps,
+    requirement_documents,
+    suggest_mappings,
+    top_k_similarities,
+)
+
+
+CONTROLS = [
+    {"control": "AC-17", "title": "Remote Access", "text": "Remote Access"},
+    {"control": "SI-2", "title": "Flaw Remediation", "text": "Flaw Remediation patch install security updates"},
+    {"control": "CP-9", "title": "System Backup", "text": "System Backup"},
+]
+
+STANDARDS = [
+    {"id": "CIP-005-8", "requirements": [
+        {"id": "R2", "text": "Interactive Remote Access sessions shall use multi-factor authentication."}]},
+    {"id": "CIP-007-7", "requirements": [
+        {"id": "R2", "text": "Evaluate and install security patches."}]},
+]
+
+
+class TestTfidf:
+    """Test vectorization and batched similarity."""
+
+    def test_rows_are_unit_length(self):
+        matrix, vocabulary = build_tfidf_matrix(["remote access", "backup backup system", ""])
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        assert np.allclose(norms[:2], 1.0)
+        assert norms[2] == 0
+        assert set(vocabulary) == {"remote", "access", "backup", "system"}
+
+    def test_top_k_is_sorted_best_first(self):
+        matrix, _ = build_tfidf_matrix(["remote access", "remote", "access control", "backup"])
+        indices, scores = top_k_similarities(matrix[:1], matrix[1:], top_k=2)
+        assert indices.shape == (1, 2)
+        assert scores[0, 0] >= scores[0, 1] > 0
+
+
+class TestSuggestMappings:
+    """Test end-to-end suggestions for requirement gaps."""
+
+    def test_suggests_relevant_controls(self):
+        requirements = requirement_documents(STANDARDS)
+        suggestions = {s["requirement_key"]: s for s in suggest_mappings(requirements, CONTROLS, top_k=1)}
+        assert suggestions["CIP-005-8:R2"]["candidates"][0]["control"] == "AC-17"
+        assert suggestions["CIP-007-7:R2"]["candidates"][0]["control"] == "SI-2"
+
+    def test_find_gaps(self):
+        requirements = requirement_documents(STANDARDS)
+        gaps = find_gaps(requirements, {"CIP-005-8:R2": {"primary": "AC-17", "secondary": ""}})
+        assert [g["requirement_key"] for g in gaps] == ["CIP-007-7:R2"]
+
+    def test_empty_inputs(self):
+        assert suggest_mappings([], CONTROLS) == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,132 @@
+"""
+Unit tests for the shared instrumentation layer.
+"""
+
+import contextlib
+import io
+import json
+import pickle
+import pytest
+from pathlib import Path
+
+import nerc_metrics
+from nerc_metrics import METRICS, Metrics
+
+COMBINED_TEXT = Path(__file__).parent / "nerc_all_combined.txt"
+
+
+@pytest.fixture
+def metrics():
+    return Metrics(buckets=(0.1, 1.0))
+
+
+@pytest.fixture
+def recorded():
+    """Reset the shared registry around a test."""
+    METRICS.reset()
+    yield METRICS
+    METRICS.reset()
+
+
+class TestMetrics:
+    """Test counters, histograms, stages and the outputs."""
+
+    def test_counters_and_histograms(self, metrics):
+        metrics.count("nerc_rows_total", 3)
+        metrics.count("nerc_rows_total", 2)
+        for value in (0.05, 0.5, 5.0):
+            metrics.observe("nerc_pdf_page_seconds", value, operation="extract_text")
+
+        snapshot = metrics.snapshot()
+        assert snapshot["counters"]["nerc_rows_total"] == 5
+        histogram = snapshot["histograms"]['nerc_pdf_page_seconds{operation="extract_text"}']
+        assert histogram == {"sum": pytest.approx(5.55), "count": 3}
+
+        text = metrics.render_prometheus(script="test")
+        assert "# TYPE nerc_pdf_page_seconds histogram" in text
+        assert 'nerc_pdf_page_seconds_bucket{script="test",operation="extract_text",le="0.1"} 1' in text
+        assert 'nerc_pdf_page_seconds_bucket{script="test",operation="extract_text",le="1"} 2' in text
+        assert 'nerc_pdf_page_seconds_bucket{script="test",operation="extract_text",le="+Inf"} 3' in text
+        assert 'nerc_rows_total{script="test"} 5' in text
+
+    def test_stage_records_outcome_and_logs(self, metrics):
+        metrics.log_stream = io.StringIO()
+        with metrics.stage("generate_catalog") as fields:
+            fields["requirements"] = 49
+        with pytest.raises(ValueError):
+            with metrics.stage("generate_catalog"):
+                raise ValueError("boom")
+
+        counters = metrics.snapshot()["counters"]
+        assert counters['nerc_stage_runs_total{stage="generate_catalog",status="ok"}'] == 1
+        assert counters['nerc_stage_runs_total{stage="generate_catalog",status="error"}'] == 1
+        events = [json.loads(line) for line in metrics.log_stream.getvalue().splitlines()]
+        assert [(e["event"], e["status"]) for e in events] == [("stage", "ok"), ("stage", "error")]
+        assert events[0]["requirements"] == 49 and events[0]["wall_seconds"] >= 0
+
+    def test_label_escaping(self, metrics):
+        metrics.count("nerc_tables_total", file='a "b"\\c')
+        assert 'file="a \\"b\\"\\\\c"' in metrics.render_prometheus()
+
+    def test_write_textfile_atomic(self, metrics, tmp_path):
+        metrics.count("nerc_rows_total", 1)
+        path = metrics.write_textfile(tmp_path / "nerc.prom", script="nerc_pipeline")
+        assert not list(tmp_path.glob("*.tmp"))
+        text = path.read_text()
+        assert 'nerc_last_run_timestamp_seconds{script="nerc_pipeline"}' in text
+        assert text.endswith("\n")
+
+    def test_export_and_merge(self, metrics):
+        metrics.count("nerc_rows_total", 2)
+        metrics.observe("nerc_pdf_page_seconds", 0.5, operation="extract_text")
+        worker = Metrics(buckets=(0.1, 1.0))
+        worker.count("nerc_rows_total", 3)
+        worker.set_gauge("nerc_last_run_timestamp_seconds", 7)
+        for value in (0.05, 5.0):
+            worker.observe("nerc_pdf_page_seconds", value, operation="extract_text")
+
+        metrics.merge(pickle.loads(pickle.dumps(worker.export())))
+        text = metrics.render_prometheus()
+        assert "nerc_rows_total 5" in text
+        assert "nerc_last_run_timestamp_seconds 7" in text
+        assert 'nerc_pdf_page_seconds_bucket{operation="extract_text",le="0.1"} 1' in text
+        assert 'nerc_pdf_page_seconds_bucket{operation="extract_text",le="1"} 2' in text
+        assert 'nerc_pdf_page_seconds_count{operation="extract_text"} 3' in text
+        with pytest.raises(ValueError):
+            metrics.merge(Metrics(buckets=(1.0,)).export())
+
+    def test_configure_from_env(self, monkeypatch, tmp_path):
+        monkeypatch.setenv(nerc_metrics.TEXTFILE_DIR_ENV, str(tmp_path))
+        monkeypatch.setattr(nerc_metrics, "METRICS", Metrics())
+        monkeypatch.setattr(nerc_metrics.sys, "argv", ["/opt/tools/nerc_pipeline.py"])
+        monkeypatch.setattr(nerc_metrics.atexit, "register", lambda function: None)
+        nerc_metrics.configure_from_env()
+        assert nerc_metrics.METRICS.textfile == tmp_path / "nerc_pipeline.prom"
+        nerc_metrics.METRICS.flush()
+        assert (tmp_path / "nerc_pipeline.prom").exists()
+
+
+@pytest.mark.skipif(not COMBINED_TEXT.exists(), reason="nerc_all_combined.txt not available")
+class TestInstrumentation:
+    """Test the instrumented pipeline functions."""
+
+    def test_parse_generate_export(self, recorded):
+        from generate_oscal import generate_oscal_catalog, parse_nerc_standards
+        from oscal_to_jama_csv import oscal_to_jama_csv
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            standards = parse_nerc_standards(COMBINED_TEXT.read_text(encoding="utf-8"))
+            catalog = generate_oscal_catalog(standards)
+        rows = oscal_to_jama_csv(catalog, io.StringIO())
+
+        counters = recorded.snapshot()["counters"]
+        requirements = sum(len(std["requirements"]) for std in standards.values())
+        assert counters["nerc_standards_total"] == len(standards)
+        assert counters['nerc_requirements_total{stage="parse_standards"}'] == requirements
+        assert counters['nerc_requirements_total{stage="generate_catalog"}'] == requirements
+        assert counters['nerc_requirements_total{stage="export_csv"}'] == len(rows)
+        assert counters["nerc_rows_total"] == len(rows)
+        assert counters["nerc_mapping_gaps_total"] == 0
+        histograms = recorded.snapshot()["histograms"]
+        for name in ("parse_standards", "generate_catalog", "export_csv"):
+            assert histograms[f'nerc_stage_duration_seconds{{stage="{name}"}}']["count"] == 1
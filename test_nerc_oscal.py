@@ -0,0 +1,156 @@
+"""
+Unit tests for the make-style pipeline runner.
+Starts from the committed nerc_all_combined.txt, so no PDFs are parsed.
+"""
+
+import json
+import shutil
+import pytest
+from pathlib import Path
+
+import nerc_oscal
+from nerc_metrics import METRICS
+from nerc_oscal import STATE_FILE, Pipeline
+
+COMBINED_TEXT = Path(__file__).parent / "nerc_all_combined.txt"
+
+pytestmark = pytest.mark.skipif(not COMBINED_TEXT.exists(), reason="nerc_all_combined.txt not available")
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "combined.txt"
+    shutil.copy(COMBINED_TEXT, path)
+    return path
+
+
+@pytest.fixture
+def out_dir(tmp_path):
+    return tmp_path / "build"
+
+
+def pipeline(source, out_dir, **settings):
+    out_dir.mkdir(exist_ok=True)
+    return Pipeline(source, out_dir, **settings)
+
+
+class TestPlan:
+    """Test the stage DAG."""
+
+    def test_text_source_has_no_extract_stage(self, source, out_dir):
+        p = pipeline(source, out_dir)
+        assert p.plan() == ["generate", "export", "validate", "store"]
+        assert p.plan(["export"]) == ["generate", "export"]
+        assert p.dependencies("validate") == ["generate"]
+
+    def test_pdf_source(self, tmp_path, out_dir):
+        p = pipeline(tmp_path, out_dir)
+        assert p.plan(["export"]) == ["extract", "generate", "export"]
+        with pytest.raises(ValueError):
+            p.plan(["publish"])
+
+
+class TestBuild:
+    """Test fingerprinted up-to-date checks."""
+
+    def test_second_build_skips_everything(self, source, out_dir):
+        first = pipeline(source, out_dir).build(["export"], jobs=1, verbose=False)
+        assert first["stages"] == {"generate": "rebuilt", "export": "rebuilt"}
+        assert (out_dir / "nerc-oscal.csv").exists()
+        assert not list(out_dir.glob("*.tmp"))
+
+        second = pipeline(source, out_dir).build(["export"], jobs=1, verbose=False)
+        assert second["stages"] == {"generate": "up to date", "export": "up to date"}
+        state = json.loads((out_dir / STATE_FILE).read_text())
+        assert set(state["stages"]) == {"generate", "export"}
+
+    def test_settings_change_rebuilds_only_that_stage(self, source, out_dir):
+        pipeline(source, out_dir).build(["export"], jobs=1, verbose=False)
+        p = pipeline(source, out_dir, format_type="detailed")
+        assert p.dry_run(["export"]) == {"generate": None, "export": "settings changed"}
+        assert p.build(["export"], jobs=1, verbose=False)["stages"]["export"] == "rebuilt"
+        assert "Component-UUID" in (out_dir / "nerc-oscal.csv").read_text().splitlines()[0]
+
+    def test_input_change_rebuilds_downstream(self, source, out_dir):
+        pipeline(source, out_dir).build(["export"], jobs=1, verbose=False)
+        source.write_text(source.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+        assert pipeline(source, out_dir).dry_run(["export"]) == {"generate": "inputs changed",
+                                                                 "export": "after generate"}
+
+    def test_modified_output_and_code_change(self, source, out_dir, monkeypatch):
+        pipeline(source, out_dir).build(["export"], jobs=1, verbose=False)
+        (out_dir / "nerc-oscal.csv").write_text("edited")
+        assert pipeline(source, out_dir).dry_run(["export"])["export"].endswith("modified")
+
+        pipeline(source, out_dir).build(["export"], jobs=1, verbose=False)
+        stages = dict(nerc_oscal.STAGES, export=dict(nerc_oscal.STAGES["export"], code=["csv_validate.py"]))
+        monkeypatch.setattr(nerc_oscal, "STAGES", stages)
+        assert pipeline(source, out_dir).dry_run(["export"])["export"] == "code changed"
+
+    def test_default_build_succeeds(self, source, out_dir):
+        summary = pipeline(source, out_dir).build(jobs=2, verbose=False)
+        assert summary["stages"] == {"generate": "rebuilt", "export": "rebuilt", "validate": "rebuilt",
+                                     "store": "rebuilt"}
+        assert summary["errors"] == {}
+        report = json.loads((out_dir / "nerc-oscal.validation.json").read_text())
+        assert report["valid"] and report["components"] > 0
+        assert "CIP-002-R1,CIP-002-8 R1," in (out_dir / "nerc-oscal.csv").read_text()
+
+    def test_worker_metrics_reach_the_textfile(self, source, out_dir, tmp_path, monkeypatch):
+        METRICS.reset()
+        monkeypatch.setitem(nerc_oscal.ACTIONS, "validate", self.fail)
+        try:
+            pipeline(source, out_dir).build(jobs=2, verbose=False)
+            text = METRICS.write_textfile(tmp_path / "nerc_oscal.prom", script="nerc_oscal").read_text()
+        finally:
+            METRICS.reset()
+        for stage in ("pipeline_generate", "pipeline_export", "pipeline_store", "parse_standards",
+                      "generate_catalog", "export_csv"):
+            assert f'nerc_stage_duration_seconds_count{{script="nerc_oscal",stage="{stage}"}} 1' in text
+        assert 'nerc_stage_runs_total{script="nerc_oscal",stage="pipeline_validate",status="error"} 1' in text
+        assert 'nerc_rows_total{script="nerc_oscal"}' in text
+
+    @staticmethod
+    def fail(inputs, outputs, settings):
+        raise ValueError("3 validation error(s)")
+
+    def test_regenerate_keeps_downstream_up_to_date(self, source, out_dir):
+        pipeline(source, out_dir).build(jobs=1, verbose=False)
+        before = (out_dir / "nerc-oscal.json").read_bytes()
+        summary = pipeline(source, out_dir).build(["generate"], force=True, jobs=1, verbose=False)
+        assert summary["stages"] == {"generate": "rebuilt"}
+        assert (out_dir / "nerc-oscal.json").read_bytes() == before
+        assert set(pipeline(source, out_dir).dry_run().values()) == {None}
+
+    def test_failure_skips_only_dependents(self, source, out_dir, monkeypatch):
+        monkeypatch.setitem(nerc_oscal.ACTIONS, "validate", self.fail)
+        summary = pipeline(source, out_dir).build(jobs=1, verbose=False)
+        assert summary["stages"] == {"generate": "rebuilt", "export": "rebuilt", "validate": "failed",
+                                     "store": "rebuilt"}
+        assert "validation error" in summary["errors"]["validate"]
+        # A failed stage is not recorded, so it runs again
+        assert pipeline(source, out_dir).dry_run()["validate"] == "never built"
+
+        monkeypatch.setitem(nerc_oscal.ACTIONS, "generate", self.fail)
+        summary = pipeline(source, out_dir).build(force=True, jobs=1, verbose=False)
+        assert summary["stages"] == {"generate": "failed", "export": "skipped", "validate": "skipped",
+                                     "store": "rebuilt"}
+
+    def test_revision_catalog_is_a_validate_input(self, source, out_dir, tmp_path, monkeypatch):
+        import nist_catalog
+        catalog_file = tmp_path / "rev4.json"
+        monkeypatch.setitem(nist_catalog.NIST_CATALOG_FILES, "rev4", catalog_file)
+        with pytest.raises(FileNotFoundError):
+            pipeline(source, out_dir, nist_revision="rev4").build(["validate"], jobs=1, verbose=False)
+
+        catalog_file.write_text("{}")
+        pipeline(source, out_dir, nist_revision="rev4").build(["generate"], jobs=1, verbose=False)
+        before = pipeline(source, out_dir, nist_revision="rev4").fingerprint("validate")
+        catalog_file.write_text('{"catalog": {}}')
+        after = pipeline(source, out_dir, nist_revision="rev4").fingerprint("validate")
+        assert before["inputs"] != after["inputs"]
+        assert before["code"] == after["code"]
+
+    def test_missing_source(self, tmp_path, out_dir):
+        with pytest.raises(FileNotFoundError):
+            pipeline(tmp_path / "missing.txt", out_dir).build(jobs=1, verbose=False)
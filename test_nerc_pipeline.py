@@ -0,0 +1,59 @@
+"""
+Unit tests for the in-process PDF/text -> catalog -> JAMA CSV pipeline.
+Uses the committed nerc_all_combined.txt, so no PDFs are parsed.
+"""
+
+import csv
+import pytest
+from pathlib import Path
+
+from generate_oscal import iter_catalog_groups, parse_nerc_standards
+from nerc_pipeline import run_pipeline
+from oscal_to_jama_csv import catalog_to_jama_csv, oscal_to_jama_csv
+
+COMBINED_TEXT = Path(__file__).parent / "nerc_all_combined.txt"
+
+pytestmark = pytest.mark.skipif(not COMBINED_TEXT.exists(), reason="nerc_all_combined.txt not available")
+
+
+def read_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return [{k: v for k, v in r.items() if k != "Component-UUID"} for r in csv.DictReader(f)]
+
+
+def test_pipeline_matches_json_round_trip(tmp_path):
+    """Test the in-process rows equal those exported from the materialized catalog."""
+    summary = run_pipeline(COMBINED_TEXT, tmp_path / "direct.csv", "detailed",
+                           oscal_output=tmp_path / "catalog.json")
+    oscal_to_jama_csv(tmp_path / "catalog.json", tmp_path / "round_trip.csv", "detailed")
+
+    assert summary["rows"] == len(read_rows(tmp_path / "direct.csv")) > 0
+    assert read_rows(tmp_path / "direct.csv") == read_rows(tmp_path / "round_trip.csv")
+
+
+def test_groups_consumed_lazily(tmp_path):
+    """Test catalog_to_jama_csv accepts a generator of groups."""
+    standards = parse_nerc_standards(COMBINED_TEXT.read_text(encoding="utf-8"))
+    consumed = []
+
+    def groups():
+        for group in iter_catalog_groups(standards):
+            consumed.append(group["id"])
+            yield group
+
+    count = catalog_to_jama_csv(groups(), tmp_path / "rows.csv")
+
+    assert len(consumed) == len(standards)
+    assert count == sum(len(s["requirements"]) for s in standards.values())
+
+
+def test_empty_catalog_and_missing_source(tmp_path):
+    with pytest.raises(ValueError):
+        catalog_to_jama_csv([], tmp_path / "empty.csv")
+    assert not (tmp_path / "empty.csv").exists()
+    with pytest.raises(FileNotFoundError):
+        run_pipeline(tmp_path / "missing", tmp_path / "out.csv")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,120 @@
+"""
+Unit tests for the per-stage profiler (--profile).
+"""
+
+import argparse
+import contextlib
+import io
+import pstats
+import pytest
+from pathlib import Path
+
+import nerc_metrics
+import nerc_profile
+from nerc_profile import Profiler, add_profile_argument, profile_from_argv
+
+COMBINED_TEXT = Path(__file__).parent / "nerc_all_combined.txt"
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    """A started Profiler that is always stopped and detached from METRICS."""
+    profiler = Profiler(tmp_path / "profiles", top=10, script="test")
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        if profiler in nerc_metrics.METRICS.stage_listeners:
+            profiler.stop()
+
+
+def busy(n):
+    return sum(i * i for i in range(n))
+
+
+class TestProfiler:
+    """Test sessions, nesting and the written files."""
+
+    def test_files_per_stage(self, profiler):
+        with nerc_metrics.stage("outer"):
+            busy(20000)
+            with nerc_metrics.stage("inner"):
+                busy(20000)
+        written = profiler.stop()
+
+        assert profiler not in nerc_metrics.METRICS.stage_listeners
+        names = {path.name for path in written}
+        for stage in ("main", "outer", "inner"):
+            assert {f"test.{stage}.prof", f"test.{stage}.collapsed", f"test.{stage}.txt"} <= names
+        report = (profiler.directory / "test.inner.txt").read_text()
+        assert report.startswith("Stage: inner (test, 1 run(s))")
+        assert "Top 10 allocation sites" in report
+
+    def test_nested_stages_are_exclusive(self, profiler):
+        with nerc_metrics.stage("outer"):
+            with nerc_metrics.stage("inner"):
+                busy(50000)
+        profiler.stop()
+
+        def calls_to_busy(stage):
+            stats = pstats.Stats(str(profiler.directory / f"test.{stage}.prof"))
+            return sum(entry[1] for key, entry in stats.stats.items() if key[2] == "busy")
+
+        assert calls_to_busy("inner") == 1
+        assert calls_to_busy("outer") == 0
+        assert profiler.sessions["inner"].entered_from.endswith("(test_nested_stages_are_exclusive)")
+
+    def test_repeated_stage_accumulates(self, profiler):
+        for _ in range(3):
+            with nerc_metrics.stage("parse_pdf"):
+                busy(1000)
+        profiler.stop()
+        assert profiler.sessions["parse_pdf"].runs == 3
+
+    @pytest.mark.skipif(not COMBINED_TEXT.exists(), reason="nerc_all_combined.txt not available")
+    def test_regex_time_by_caller(self, profiler):
+        from generate_oscal import parse_nerc_standards
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            parse_nerc_standards(COMBINED_TEXT.read_text(encoding="utf-8"))
+        profiler.stop()
+
+        report = (profiler.directory / "test.parse_standards.txt").read_text()
+        regex_section = report.split("Regex time by caller")[1].split("pdfplumber/pdfminer time")[0]
+        assert "generate_oscal.py" in regex_section
+        assert "(parse_requirements_state_machine) ->" in regex_section
+
+
+class TestProfileArguments:
+    """Test --profile parsing for argparse and raw-argv scripts."""
+
+    def test_argparse_flag(self, monkeypatch):
+        monkeypatch.delenv(nerc_profile.PROFILE_DIR_ENV, raising=False)
+        parser = argparse.ArgumentParser()
+        add_profile_argument(parser)
+        assert parser.parse_args([]).profile is None
+        assert parser.parse_args(["--profile"]).profile == nerc_profile.DEFAULT_DIR
+        assert parser.parse_args(["--profile", "/tmp/p"]).profile == "/tmp/p"
+
+    def test_argparse_env_default(self, monkeypatch):
+        monkeypatch.setenv(nerc_profile.PROFILE_DIR_ENV, "nightly")
+        parser = argparse.ArgumentParser()
+        add_profile_argument(parser)
+        assert parser.parse_args([]).profile == "nightly"
+
+    def test_raw_argv(self, monkeypatch, tmp_path):
+        monkeypatch.delenv(nerc_profile.PROFILE_DIR_ENV, raising=False)
+        pdf = tmp_path / "cip-005-7.pdf"
+        pdf.write_bytes(b"%PDF")
+
+        argv = ["nerc_pdf_parser.py", "--profile", str(pdf)]
+        assert profile_from_argv(argv) == nerc_profile.DEFAULT_DIR
+        assert argv == ["nerc_pdf_parser.py", str(pdf)]
+
+        argv = ["generate_oscal.py", "--profile", "out"]
+        assert profile_from_argv(argv) == "out"
+        assert argv == ["generate_oscal.py"]
+
+        argv = ["generate_oscal.py", "--profile=out2"]
+        assert profile_from_argv(argv) == "out2"
+        assert profile_from_argv(["generate_oscal.py"]) is None
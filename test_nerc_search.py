@@ -0,0 +1,132 @@
+"""
+Unit tests for the NERC/NIST full-text search index.
+"""
+
+import pytest
+from generate_oscal import generate_oscal_catalog
+from nerc_search import (
+    KIND_NERC,
+    KIND_NIST,
+    SearchIndex,
+    build_index,
+    documents_from_catalog,
+    documents_from_standards,
+    index_documents,
+    tokenize,
+)
+
+
+STANDARDS = {
+    "005": {
+        "id": "CIP-005-8",
+        "requirements": [
+            {"id": "R1", "text": "Each Responsible Entity shall permit only needed routable protocol communications."},
+            {"id": "R2", "text": "Interactive Remote Access shall use an Intermediate System and multi-factor authentication."},
+        ],
+    },
+    "007": {
+        "id": "CIP-007-7",
+        "requirements": [
+            {"id": "R2", "text": "Evaluate security patches for applicability at least once every 35 calendar days."},
+        ],
+    },
+}
+
+NIST = {"SI-2": "Flaw Remediation", "AC-17": "Remote Access", "SC-7": "Boundary Protection"}
+
+
+@pytest.fixture
+def index():
+    index, _ = build_index(STANDARDS, nist_controls=NIST)
+    return index
+
+
+class TestTokenize:
+    """Test query/document normalization."""
+
+    def test_plurals_and_stop_words(self):
+        assert tokenize("The Patches and Policies") == ["patch", "policy"]
+        assert tokenize("Access Process") == ["access", "process"]
+
+
+class TestSearchIndex:
+    """Test BM25 ranking and incremental updates."""
+
+    def test_ranks_matching_requirement_first(self, index):
+        hits = index.search("interactive remote access", kind=KIND_NERC)
+        assert hits[0]["id"] == "CIP-005-8 R2"
+        assert all(hit["kind"] == KIND_NERC for hit in hits)
+
+    def test_kind_filter_and_plural_match(self, index):
+        assert [h["id"] for h in index.search("patch", kind=KIND_NERC)] == ["CIP-007-7 R2"]
+        assert [h["id"] for h in index.search("remote access", kind=KIND_NIST)] == ["AC-17"]
+
+    def test_exact_phrase(self, index):
+        assert [h["id"] for h in index.search('"Interactive Remote Access"')] == ["CIP-005-8 R2"]
+        assert index.search('"Remote Interactive Access"') == []
+
+    def test_incremental_update_only_touches_changed_standard(self, index):
+        """Test unchanged standards are skipped and superseded versions removed."""
+        standards = dict(STANDARDS)
+        standards["007"] = {"id": "CIP-007-8", "requirements": [
+            {"id": "R2", "text": "Apply firmware patches within 35 days."}]}
+
+        index, summary = build_index(standards, index, nist_controls=NIST)
+
+        assert summary["updated"] == ["CIP-007-8"]
+        assert summary["removed"] == ["CIP-007-7"]
+        assert "CIP-005-8" in summary["unchanged"]
+        assert [h["id"] for h in index.search("patch", kind=KIND_NERC)] == ["CIP-007-8 R2"]
+        assert index.search("evaluate applicability") == []
+        assert len(index) == 3 + len(NIST)
+
+    def test_save_and_load(self, index, tmp_path, monkeypatch):
+        """Test postings are loaded as saved, without re-tokenizing the documents."""
+        path = tmp_path / "index.json"
+        index.save(path)
+        monkeypatch.setattr(SearchIndex, "_add_document", None)
+        loaded = SearchIndex.load(path)
+        assert len(loaded) == len(index)
+        assert loaded.postings == index.postings
+        assert loaded.search("boundary") == index.search("boundary")
+        assert loaded.search("patch") == index.search("patch")
+
+    def test_update_after_load_reuses_freed_slots(self, index, tmp_path):
+        standards = dict(STANDARDS)
+        del standards["007"]
+        index, _ = build_index(standards, index, nist_controls=NIST)
+        path = tmp_path / "index.json"
+        index.save(path)
+
+        loaded, summary = build_index(STANDARDS, SearchIndex.load(path), nist_controls=NIST)
+        assert summary["updated"] == ["CIP-007-7"]
+        assert [h["id"] for h in loaded.search("patch", kind=KIND_NERC)] == ["CIP-007-7 R2"]
+        assert len(loaded.docs) == len(index.docs)
+
+    def test_sync_removes_standard_without_documents(self, index):
+        standards = dict(STANDARDS)
+        standards["007"] = {"id": "CIP-007-7", "requirements": []}
+        index, summary = build_index(standards, index, nist_controls=NIST)
+        assert summary["removed"] == ["CIP-007-7"]
+        assert "CIP-007-7" not in index.standards
+        assert index.search("patch", kind=KIND_NERC) == []
+
+    def test_catalog_input_matches_text_input(self, index, capsys):
+        standards = {key: dict(std, title="Title", purpose="Purpose.") for key, std in STANDARDS.items()}
+        catalog = generate_oscal_catalog(standards)
+        capsys.readouterr()
+        documents = documents_from_catalog(catalog)
+        assert documents == documents_from_standards(STANDARDS)
+
+        # Switching the build input from text to the generated catalog re-indexes nothing
+        index, summary = index_documents(documents, index, nist_controls=NIST)
+        assert summary["updated"] == [] and summary["removed"] == []
+        assert index.search("remote access", kind=KIND_NERC)[0]["id"] == "CIP-005-8 R2"
+
+    def test_load_missing_index(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            SearchIndex.load(tmp_path / "missing.json")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,123 @@
+"""
+Unit tests for the SQLite store.
+Loads the committed nerc_all_combined.txt, so no PDFs are parsed.
+"""
+
+import contextlib
+import csv
+import io
+import sys
+import pytest
+from pathlib import Path
+
+import nerc_store
+from generate_oscal import generate_oscal_catalog, parse_nerc_standards
+from oscal_to_jama_csv import catalog_to_jama_csv
+
+COMBINED_TEXT = Path(__file__).parent / "nerc_all_combined.txt"
+
+pytestmark = pytest.mark.skipif(not COMBINED_TEXT.exists(), reason="nerc_all_combined.txt not available")
+
+
+@pytest.fixture(scope="module")
+def text():
+    return COMBINED_TEXT.read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def conn(tmp_path, text):
+    with contextlib.closing(nerc_store.connect(tmp_path / "nerc-oscal.db")) as conn:
+        nerc_store.populate(conn, text)
+        yield conn
+
+
+def csv_rows(data):
+    return [{k: v for k, v in row.items() if k != "Component-UUID"}
+            for row in csv.DictReader(io.StringIO(data))]
+
+
+class TestStoreExport:
+    """Test emitting the catalog and JAMA CSV from the store."""
+
+    def test_current_standards_match_parser(self, conn, text):
+        with contextlib.redirect_stdout(io.StringIO()):
+            expected = parse_nerc_standards(text)
+        assert nerc_store.current_standards(conn) == expected
+
+    @pytest.mark.parametrize("format_type", ["standard", "detailed"])
+    def test_sql_rows_match_catalog_export(self, conn, text, format_type):
+        with contextlib.redirect_stdout(io.StringIO()):
+            catalog = generate_oscal_catalog(parse_nerc_standards(text))
+        expected = io.StringIO()
+        catalog_to_jama_csv(catalog, expected, format_type)
+
+        actual = io.StringIO()
+        count = nerc_store.store_to_jama_csv(conn, actual, format_type)
+        assert count == len(csv_rows(expected.getvalue()))
+        assert csv_rows(actual.getvalue()) == csv_rows(expected.getvalue())
+
+    def test_statuses_survive_repopulate(self, conn, text):
+        nerc_store.set_statuses(conn, {("CIP-005-8", "R1"): "Implemented"})
+        nerc_store.populate(conn, text)
+
+        rows = {row["Title"]: row for row in nerc_store.iter_jama_rows(conn)}
+        assert rows["CIP-005-8 R1"]["Implementation-Status"] == "Implemented"
+        assert rows["CIP-005-8 R2"]["Implementation-Status"] == "Draft"
+        control = next(c for g in nerc_store.generate_catalog(conn)["catalog"]["groups"]
+                       for c in g["controls"] if c["id"] == "cip-005-8-r1")
+        assert {"name": "Implementation-Status", "value": "Implemented"} in control["props"]
+
+    def test_empty_store(self, tmp_path):
+        with contextlib.closing(nerc_store.connect(tmp_path / "empty.db")) as conn:
+            with pytest.raises(ValueError):
+                nerc_store.store_to_jama_csv(conn, io.StringIO())
+
+
+class TestStoreQueries:
+    """Test mapping, coverage and full-text queries."""
+
+    def test_mappings_round_trip(self, conn, text):
+        mapping = {"CIP-005-8:R1": {"primary": "sc-7", "secondary": "AC-17, SC-8"}}
+        nerc_store.populate(conn, text, mapping)
+        assert nerc_store.nist_map(conn) == {"CIP-005-8:R1": {"primary": "SC-7", "secondary": "AC-17, SC-8"}}
+        assert nerc_store.requirements_for_control(conn, "sc-8") == [
+            {"cip_id": "CIP-005-8", "req_id": "R1", "role": "secondary"}]
+
+    def test_coverage(self, conn):
+        rows = {row["cip_id"]: row for row in nerc_store.coverage(conn)}
+        assert rows["CIP-005-8"]["requirements"] == 3
+        assert sum(row["requirements"] for row in rows.values()) == sum(
+            row["mapped"] for row in rows.values())
+
+    def test_search(self, conn):
+        hits = nerc_store.search(conn, '"remote access"', kind="requirement", limit=3)
+        assert hits and all(hit["cip_id"].startswith("CIP-005") for hit in hits)
+        with pytest.raises(ValueError):
+            nerc_store.search(conn, '"unterminated')
+
+    def test_table_rows_indexed(self, conn):
+        parsed = [{"control_id": "CIP-005-8 R1", "table_rows": [
+            {"part": "1.1", "applicable_systems": "High Impact BES Cyber Systems",
+             "requirements": "Permit only needed routable protocol communications.",
+             "measures": "Firewall rule sets"}]}]
+        assert nerc_store.load_table_rows(conn, parsed) == 1
+        assert nerc_store.load_table_rows(conn, parsed) == 1
+        hits = nerc_store.search(conn, "firewall", kind="part")
+        assert [(hit["cip_id"], hit["ref"]) for hit in hits] == [("CIP-005-8", "R1.1.1")]
+
+    def test_sql_is_read_only(self, conn, tmp_path, monkeypatch, capsys):
+        db = tmp_path / "nerc-oscal.db"
+        with contextlib.closing(nerc_store.connect_readonly(db)) as readonly:
+            count = nerc_store.run_sql(readonly, "SELECT count(*) FROM requirements").fetchone()[0]
+            assert count > 0
+            for statement in ("DROP TABLE statuses", "DELETE FROM requirements"):
+                with pytest.raises(ValueError, match="read-only"):
+                    nerc_store.run_sql(readonly, statement)
+
+        monkeypatch.setattr(sys, "argv", ["nerc_store.py", "--db", str(db), "sql", "DROP TABLE statuses"])
+        with pytest.raises(SystemExit) as exc:
+            nerc_store.main()
+        assert exc.value.code == 1
+        assert "read-only" in capsys.readouterr().err
+        assert conn.execute("SELECT count(*) FROM requirements").fetchone()[0] == count
+        assert conn.execute("SELECT count(*) FROM statuses").fetchone() is not None
@@ -0,0 +1,282 @@
+"""
+Unit tests for the NIST OSCAL catalog loader.
+Uses a small synthetic catalog in the official OSCAL layout instead of the full NIST release.
+"""
+
+import copy
+import json
+import os
+import pytest
+from nist_catalog import (
+    INDEX_FORMAT_VERSION,
+    CatalogStore,
+    NISTCatalog,
+    _ControlLookup,
+    migrate_nerc_nist_map,
+    normalize_revision,
+    to_control_id,
+    to_oscal_id,
+    validate_nerc_nist_map,
+)
+
+
+SAMPLE_CATALOG = {
+    "catalog": {
+        "uuid": "00000000-0000-4000-8000-000000000000",
+        "metadata": {"title": "Sample SP 800-53", "version": "5.1.1", "oscal-version": "1.1.2"},
+        "groups": [
+            {
+                "id": "ac",
+                "class": "family",
+                "title": "Access Control",
+                "controls": [
+                    {
+                        "id": "ac-2",
+                        "class": "SP800-53",
+                        "title": "Account Management",
+                        "params": [
+                            {"id": "ac-02_odp.01", "label": "account types"},
+                            {"id": "ac-02_odp.02", "select": {"how-many": "one-or-more",
+                                                             "choice": ["disable", "remove"]}},
+                        ],
+                        "props": [{"name": "label", "value": "AC-2"}],
+                        "parts": [
+                            {
+                                "id": "ac-2_smt",
+                                "name": "statement",
+                                "parts": [
+                                    {"id": "ac-2_smt.a", "name": "item",
+                                     "props": [{"name": "label", "value": "a."}],
+                                     "prose": "Define {{ insert: param, ac-02_odp.01 }};"},
+                                    {"id": "ac-2_smt.b", "name": "item",
+                                     "props": [{"name": "label", "value": "b."}],
+                                     "prose": "Accounts are {{ insert: param, ac-02_odp.02 }}."},
+                                ],
+                            },
+                            {"id": "ac-2_gdn", "name": "guidance", "prose": "Guidance text."},
+                            {
+                                "id": "ac-2_obj",
+                                "name": "assessment-objective",
+                                "parts": [
+                                    {"id": "ac-2_obj.a", "name": "assessment-objective",
+                                     "prose": "account types are defined;"},
+                                ],
+                            },
+                        ],
+                        "controls": [
+                            {
+                                "id": "ac-2.12",
+                                "class": "SP800-53-enhancement",
+                                "title": "Account Monitoring for Atypical Usage",
+                                "parts": [{"id": "ac-2.12_smt", "name": "statement",
+                                           "prose": "Monitor system accounts."}],
+                            }
+                        ],
+                    }
+                ],
+            }
+        ],
+    }
+}
+
+
+@pytest.fixture
+def catalog_file(tmp_path):
+    """Write the sample catalog to a temporary file."""
+    path = tmp_path / "sample_catalog.json"
+    path.write_text(json.dumps(SAMPLE_CATALOG))
+    return path
+
+
+def make_revision_catalogs(tmp_path):
+    """
+    Write Rev 4 and Rev 5 sample catalogs.
+
+    AC-2 is identical in both, SC-7 is revised, AC-2(10) is withdrawn into
+    AC-2(12) in Rev 5, AC-2(11) is withdrawn into a statement item of AC-2,
+    and PM-99 exists only in Rev 4.
+    """
+    rev5 = copy.deepcopy(SAMPLE_CATALOG)
+    ac2 = rev5["catalog"]["groups"][0]["controls"][0]
+    ac2["controls"].insert(0, {
+        "id": "ac-2.10",
+        "title": "Shared and Group Account Credential Change",
+        "props": [{"name": "status", "value": "withdrawn"}],
+        "links": [{"href": "#ac-2.12", "rel": "incorporated-into"}],
+    })
+    ac2["controls"].insert(1, {
+        "id": "ac-2.11",
+        "title": "Usage Conditions",
+        "props": [{"name": "status", "value": "withdrawn"}],
+        "links": [{"href": "#ac-2_smt.b", "rel": "incorporated-into"}],
+    })
+    rev5["catalog"]["groups"].append({
+        "id": "sc", "title": "System and Communications Protection",
+        "controls": [{"id": "sc-7", "title": "Boundary Protection",
+                      "parts": [{"id": "sc-7_smt", "name": "statement", "prose": "Monitor and control."}]}],
+    })
+
+    rev4 = copy.deepcopy(rev5)
+    rev4_ac2 = rev4["catalog"]["groups"][0]["controls"][0]
+    rev4_ac2["controls"] = [{"id": "ac-2.10", "title": "Shared and Group Account Credential Termination"},
+                            {"id": "ac-2.11", "title": "Usage Conditions"}]
+    rev4["catalog"]["groups"][1]["controls"][0]["parts"][0]["prose"] = "Monitors and controls."
+    rev4["catalog"]["groups"][1]["controls"].append({"id": "pm-99", "title": "Retired Control"})
+
+    paths = {"rev4": tmp_path / "rev4.json", "rev5": tmp_path / "rev5.json"}
+    paths["rev4"].write_text(json.dumps(rev4))
+    paths["rev5"].write_text(json.dumps(rev5))
+    return paths
+
+
+class TestControlIds:
+    """Test conversion between OSCAL and label control IDs."""
+
+    def test_to_control_id(self):
+        assert to_control_id("ac-2.12") == "AC-2(12)"
+        assert to_control_id("AC-2 (12)") == "AC-2(12)"
+        assert to_control_id("sc-7") == "SC-7"
+
+    def test_to_oscal_id(self):
+        assert to_oscal_id("AC-2(12)") == "ac-2.12"
+        assert to_oscal_id("SC-7") == "sc-7"
+
+
+class TestNISTCatalog:
+    """Test index building and lazy record access."""
+
+    def test_builds_index_on_first_use(self, catalog_file):
+        """Test the sidecar index is written and lists every control."""
+        with NISTCatalog(catalog_file) as catalog:
+            assert catalog.index_file.exists()
+            assert catalog.records_file.exists()
+            assert catalog.ids() == ["AC-2", "AC-2(12)"]
+            assert catalog.metadata["version"] == "5.1.1"
+
+    def test_materializes_only_requested_controls(self, catalog_file):
+        """Test records are decoded lazily, one control at a time."""
+        with NISTCatalog(catalog_file) as catalog:
+            assert catalog.materialized_count == 0
+            assert "ac-2.12" in catalog
+            assert catalog.materialized_count == 0
+
+            enhancement = catalog.get("ac-2.12")
+            assert enhancement["parent"] == "AC-2"
+            assert enhancement["family"] == "Access Control"
+            assert catalog.materialized_count == 1
+            assert catalog.get("XX-99") is None
+
+    def test_statement_renders_params(self, catalog_file):
+        """Test statement text substitutes assignment and selection parameters."""
+        with NISTCatalog(catalog_file) as catalog:
+            statement = catalog.get_statement("AC-2")
+            assert "a. Define [Assignment: account types];" in statement
+            assert "b. Accounts are [Selection (one or more): disable; remove]." in statement
+            assert catalog.get("AC-2")["guidance"] == "Guidance text."
+            assert catalog.get_objectives("AC-2") == [
+                {"id": "ac-2_obj.a", "text": "account types are defined;"}
+            ]
+
+    def test_reuses_index_until_catalog_changes(self, catalog_file):
+        """Test a current index is reused and a stale one is rebuilt."""
+        NISTCatalog(catalog_file).open().close()
+        index_file = catalog_file.with_name(catalog_file.name + ".idx")
+        built_at = index_file.stat().st_mtime_ns
+
+        NISTCatalog(catalog_file).open().close()
+        assert index_file.stat().st_mtime_ns == built_at
+
+        changed = json.loads(json.dumps(SAMPLE_CATALOG))
+        changed["catalog"]["groups"][0]["controls"][0]["title"] = "Account Management (changed)"
+        catalog_file.write_text(json.dumps(changed))
+        os.utime(catalog_file, ns=(built_at + 10**9, built_at + 10**9))
+
+        with NISTCatalog(catalog_file) as catalog:
+            assert catalog.get_title("AC-2") == "Account Management (changed)"
+
+    def test_missing_catalog_raises(self, tmp_path):
+        """Test a missing catalog without a prebuilt index is reported."""
+        with pytest.raises(FileNotFoundError):
+            NISTCatalog(tmp_path / "missing.json").open()
+
+
+class TestCatalogStore:
+    """Test the multi-revision store and Rev 4 -> Rev 5 crosswalk."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        with CatalogStore(make_revision_catalogs(tmp_path), store_dir=tmp_path) as store:
+            yield store
+
+    def test_normalize_revision(self):
+        assert normalize_revision("4") == "rev4"
+        assert normalize_revision("Rev5") == "rev5"
+        with pytest.raises(ValueError):
+            normalize_revision("rev3")
+
+    def test_identical_controls_share_records(self, store):
+        """Test unchanged controls are stored once and served to both revisions."""
+        assert store.revisions == ["rev4", "rev5"]
+        assert store.shared_record_count == 1
+        assert store.revision("rev4").get("AC-2") is store.revision("rev5").get("AC-2")
+        assert store.revision("rev4").get_statement("SC-7") == "Monitors and controls."
+        assert store.revision("rev5").get_statement("SC-7") == "Monitor and control."
+
+    def test_crosswalk(self, store):
+        """Test the precomputed crosswalk classifies every Rev 4 control."""
+        assert store.map_control("AC-2") == ("unchanged", ["AC-2"])
+        assert store.map_control("SC-7") == ("changed", ["SC-7"])
+        assert store.map_control("ac-2.10") == ("withdrawn", ["AC-2(12)"])
+        assert store.map_control("AC-2(11)") == ("withdrawn", ["AC-2"])
+        assert store.map_control("PM-99") == ("removed", [])
+        assert store.map_control("XX-1") == ("unknown", [])
+
+    def test_validate_map(self, store):
+        """Test mappings are checked against the selected revision."""
+        nerc_map = {"CIP-004-8:R1": {"primary": "AC-2(10)", "secondary": "SC-7, PM-99"}}
+        assert validate_nerc_nist_map(nerc_map, "rev4", store) == []
+        issues = validate_nerc_nist_map(nerc_map, "rev5", store)
+        assert [(i["control"], i["issue"]) for i in issues] == [("AC-2(10)", "withdrawn"), ("PM-99", "missing")]
+
+    def test_migrate_map(self, store):
+        """Test bulk migration replaces withdrawn controls and drops removed ones."""
+        nerc_map = {"CIP-004-8:R1": {"primary": "AC-2(10)", "secondary": "SC-7, PM-99, AC-2(12)"}}
+        migrated, report = migrate_nerc_nist_map(nerc_map, "rev4", "rev5", store)
+        assert migrated == {"CIP-004-8:R1": {"primary": "AC-2(12)", "secondary": "SC-7"}}
+        assert [(r["control"], r["status"]) for r in report] == [
+            ("AC-2(10)", "withdrawn"), ("PM-99", "removed"), ("AC-2(12)", "unknown")]
+
+    def test_migrate_part_anchored_successor(self, store):
+        """Test a withdrawal into a statement part migrates to the owning control."""
+        migrated, report = migrate_nerc_nist_map({"CIP-004-8:R2": {"primary": "AC-2(11)"}}, "rev4", "rev5", store)
+        assert migrated == {"CIP-004-8:R2": {"primary": "AC-2", "secondary": ""}}
+        assert [(r["control"], r["status"]) for r in report] == [("AC-2(11)", "withdrawn")]
+
+    def test_store_from_older_format_rebuilt(self, tmp_path):
+        """Test a store written by an older format (e.g. before part-anchored links) is not served."""
+        paths = make_revision_catalogs(tmp_path)
+        with CatalogStore(paths, store_dir=tmp_path) as store:
+            index_file = store.index_file
+        header = json.loads(index_file.read_text())
+        header["format"] = 1  # stores built before part-anchored links resolved
+        header["crosswalks"]["rev4>rev5"]["AC-2(11)"] = ["withdrawn", []]
+        index_file.write_text(json.dumps(header))
+
+        with CatalogStore(paths, store_dir=tmp_path) as store:
+            assert store.map_control("AC-2(11)") == ("withdrawn", ["AC-2"])
+        assert json.loads(index_file.read_text())["format"] == INDEX_FORMAT_VERSION
+
+    def test_lookup_base_is_abstract(self):
+        with pytest.raises(TypeError):
+            _ControlLookup()
+
+    def test_missing_revision(self, tmp_path):
+        """Test asking for a revision without a catalog is reported."""
+        paths = make_revision_catalogs(tmp_path)
+        with CatalogStore({"rev5": paths["rev5"]}, store_dir=tmp_path) as store:
+            with pytest.raises(KeyError):
+                store.revision("rev4")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
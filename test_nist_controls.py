@@ -0,0 +1,110 @@
+"""
+Unit tests for the NIST SP 800-53 R5 control catalog helpers.
+"""
+
+import pytest
+from nist_controls import (
+    NIST_SP_800_53_R5_CONTROLS,
+    ControlHierarchy,
+    get_control_hierarchy,
+    get_parent_control,
+    get_control_description,
+    get_control_enhancements,
+    normalize_nist_control_id,
+    parse_control_id,
+    rollup_control_coverage,
+    validate_nist_control,
+)
+
+
+class TestControlIdParsing:
+    """Test control ID parsing and normalization."""
+
+    def test_parse_base_and_enhancement(self):
+        """Test base controls and enhancements split into their parts."""
+        assert parse_control_id("AC-2") == ("AC", 2, None)
+        assert parse_control_id("ac-2 (12)") == ("AC", 2, 12)
+        assert parse_control_id("Security Control 7") is None
+
+    def test_normalize(self):
+        """Test IDs normalize to catalog key format."""
+        assert normalize_nist_control_id(" sc-7 ") == "SC-7"
+        assert normalize_nist_control_id("ac-2 (12)") == "AC-2(12)"
+
+
+class TestRevisionNames:
+    """Test that rev5 spellings use the built-in table rather than the official catalog store."""
+
+    @pytest.mark.parametrize("revision", ["rev5", "Rev5", "r5", "5"])
+    def test_rev5_spellings(self, revision):
+        assert validate_nist_control("AC-2", revision)
+        assert not validate_nist_control("ZZ-99", revision)
+        assert get_control_description("SC-7", revision) == NIST_SP_800_53_R5_CONTROLS["SC-7"]
+
+    def test_unknown_revision(self):
+        with pytest.raises(ValueError):
+            validate_nist_control("AC-2", "rev9")
+
+
+class TestControlHierarchy:
+    """Test the family -> base control -> enhancement index."""
+
+    def test_covers_whole_catalog(self):
+        """Test every catalog control has a position in the hierarchy."""
+        hierarchy = get_control_hierarchy()
+        assert len(hierarchy) == len(NIST_SP_800_53_R5_CONTROLS)
+        for control_id in NIST_SP_800_53_R5_CONTROLS:
+            assert control_id in hierarchy
+
+    def test_parent_lookup(self):
+        """Test enhancements resolve to their base control."""
+        assert get_parent_control("AC-2(12)") == "AC-2"
+        assert get_parent_control("ac-2 (12)") == "AC-2"
+        assert get_parent_control("AC-2") is None
+        assert get_parent_control("XX-99") is None
+
+    def test_enhancement_enumeration(self):
+        """Test enhancements are listed in numeric (not lexical) order."""
+        enhancements = get_control_enhancements("AC-2")
+        assert enhancements[0] == "AC-2(1)"
+        assert enhancements[-1] == "AC-2(13)"
+        assert len(enhancements) == 13
+        assert get_control_enhancements("AC-2(1)") == []
+
+    def test_family_ranges(self):
+        """Test family ranges contain only that family's controls."""
+        hierarchy = get_control_hierarchy()
+        ac_controls = hierarchy.get_family_controls("AC")
+        assert ac_controls[0] == "AC-1"
+        assert all(c.startswith("AC-") and "(" not in c for c in ac_controls)
+        assert "AC-2(1)" in hierarchy.get_family_controls("ac", include_enhancements=True)
+
+    def test_orphan_enhancements_ignored(self):
+        """Test enhancements without a base control are left out."""
+        hierarchy = ControlHierarchy(["AC-1", "AC-2(1)", "SC-7", "SC-7(3)"])
+        assert "AC-2(1)" not in hierarchy
+        assert hierarchy.get_enhancements("SC-7") == ["SC-7(3)"]
+
+
+class TestCoverageRollup:
+    """Test base-control coverage rollups."""
+
+    def test_direct_mapping(self):
+        """Test directly mapped base controls are reported as mapped."""
+        rollup = rollup_control_coverage(["SC-7", "SC-7(3)"])
+        assert rollup["SC-7"]["status"] == "mapped"
+        assert rollup["SC-7"]["mapped_enhancements"] == ["SC-7(3)"]
+
+    @pytest.mark.parametrize("credit, status", [(True, "credited"), (False, "flagged")])
+    def test_enhancement_only_mapping(self, credit, status):
+        """Test base controls covered only through enhancements are credited or flagged."""
+        rollup = rollup_control_coverage(["AC-2(12)", "AC-2(1)", "XX-99"], credit_enhancements=credit)
+        assert list(rollup) == ["AC-2"]
+        assert rollup["AC-2"]["status"] == status
+        assert rollup["AC-2"]["direct"] is False
+        assert rollup["AC-2"]["mapped_enhancements"] == ["AC-2(1)", "AC-2(12)"]
+        assert rollup["AC-2"]["total_enhancements"] == 13
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
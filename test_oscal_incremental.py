@@ -0,0 +1,136 @@
+"""
+Unit tests for incremental OSCAL validation.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+import nist_catalog
+import nist_controls
+import oscal_incremental
+from oscal_incremental import validate_oscal_incremental
+from oscal_validator import iter_components, validate_oscal, validate_oscal_file
+from test_oscal_to_jama_csv import make_catalog, make_control
+
+
+def without_timing(report):
+    return {key: value for key, value in report.items() if key not in ("elapsed", "incremental")}
+
+
+@pytest.fixture
+def catalog():
+    catalog = make_catalog(groups=4, reqs=3)
+    catalog["catalog"]["groups"][3]["controls"][2]["props"][1]["value"] = "ZZ-99"
+    return catalog
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    return tmp_path / "catalog.validation-cache.json"
+
+
+class TestIncrementalValidation:
+    """Test reuse of cached per-group results."""
+
+    def test_second_run_reuses_every_group(self, catalog, cache_file):
+        first = validate_oscal_incremental(catalog, cache_file)
+        assert len(first["incremental"]["recomputed"]) == 4
+        assert first["incremental"]["reused"] == []
+
+        second = validate_oscal_incremental(catalog, cache_file)
+        assert second["incremental"]["recomputed"] == []
+        assert len(second["incremental"]["reused"]) == 4
+        assert without_timing(second) == without_timing(validate_oscal(catalog))
+
+    def test_only_changed_group_recomputed(self, catalog, cache_file):
+        validate_oscal_incremental(catalog, cache_file)
+        groups = catalog["catalog"]["groups"]
+        groups[1]["controls"][1]["props"][4]["value"] = "TBD"
+
+        report = validate_oscal_incremental(catalog, cache_file)
+        assert report["incremental"]["recomputed"] == [groups[1]["id"]]
+        assert not report["rules"]["OSCAL009"]["passed"]
+        assert without_timing(report) == without_timing(validate_oscal(catalog))
+
+    def test_inserted_requirement_shifts_later_groups(self, catalog, cache_file):
+        validate_oscal_incremental(catalog, cache_file)
+        groups = catalog["catalog"]["groups"]
+        groups[1]["controls"].append(make_control("CIP-002-1", "R9"))
+
+        report = validate_oscal_incremental(catalog, cache_file)
+        assert report["incremental"]["reused"] == [groups[0]["id"]]
+        assert report["components"] == 13
+        assert without_timing(report) == without_timing(validate_oscal(catalog))
+
+    def test_document_rules_always_recomputed(self, catalog, cache_file):
+        validate_oscal_incremental(catalog, cache_file)
+        del catalog["catalog"]["metadata"]["version"]
+        report = validate_oscal_incremental(catalog, cache_file)
+        assert report["incremental"]["recomputed"] == []
+        assert not report["rules"]["OSCAL004"]["passed"]
+
+    def test_cache_discarded(self, catalog, cache_file, monkeypatch):
+        validate_oscal_incremental(catalog, cache_file)
+        # Simulate an edited validator
+        monkeypatch.setattr(oscal_incremental, "rules_fingerprint", lambda revision: "changed")
+        report = validate_oscal_incremental(catalog, cache_file)
+        assert len(report["incremental"]["recomputed"]) == 4
+
+        cache_file.write_text("{truncated")
+        report = validate_oscal_incremental(catalog, cache_file)
+        assert len(report["incremental"]["recomputed"]) == 4
+        assert json.loads(cache_file.read_text())["version"] == 1
+
+    def test_cache_discarded_when_nist_data_changes(self, catalog, cache_file, monkeypatch, tmp_path):
+        source = tmp_path / "nist_controls.py"
+        source.write_text(Path(nist_controls.__file__).read_text())
+        monkeypatch.setattr(nist_controls, "__file__", str(source))
+        validate_oscal_incremental(catalog, cache_file)
+
+        # Dropping SC-7 from the control table must invalidate the cached OSCAL019/OSCAL020 results
+        monkeypatch.delitem(nist_controls.NIST_SP_800_53_R5_CONTROLS, "SC-7")
+        source.write_text(source.read_text().replace('"SC-7": ', '"SC-7-removed": '))
+        report = validate_oscal_incremental(catalog, cache_file)
+        assert len(report["incremental"]["recomputed"]) == 4
+        assert report["rules"]["OSCAL019"]["failed"] > 1
+        assert without_timing(report) == without_timing(validate_oscal(catalog))
+
+    def test_fingerprint_covers_official_catalog(self, monkeypatch, tmp_path):
+        catalog_file = tmp_path / "rev4.json"
+        monkeypatch.setitem(nist_catalog.NIST_CATALOG_FILES, "rev4", catalog_file)
+        missing = oscal_incremental.rules_fingerprint("rev4")
+        catalog_file.write_text("{}")
+        present = oscal_incremental.rules_fingerprint("rev4")
+        catalog_file.write_text('{"catalog": {}}')
+        assert len({missing, present, oscal_incremental.rules_fingerprint("rev4")}) == 3
+        assert oscal_incremental.rules_fingerprint("rev5") != present
+
+    def test_component_definition(self, cache_file):
+        components = [dict(c, uuid="3f2b8c1e-8d2a-4c1b-9a7e-2f6d5e4c3b2a")
+                      for c in iter_components(make_catalog(groups=1, reqs=3))]
+        for component in components:
+            del component["location"]
+        document = {"component-definition": {"uuid": "x", "metadata": {"title": "T", "version": "1"},
+                                             "components": components}}
+        validate_oscal_incremental(document, cache_file)
+        components[2]["uuid"] = "bad"
+
+        report = validate_oscal_incremental(document, cache_file)
+        assert report["incremental"]["recomputed"] == [components[2]["id"]]
+        assert without_timing(report) == without_timing(validate_oscal(document))
+
+    def test_malformed_documents_match_full_validation(self, cache_file):
+        for document in ([], {"catalog": {"groups": [1, {"id": "g", "controls": [None]}]}}):
+            report = validate_oscal_incremental(document, cache_file)
+            assert without_timing(report) == without_timing(validate_oscal(document))
+
+    def test_file_with_cache(self, catalog, cache_file, tmp_path):
+        path = tmp_path / "catalog.json"
+        path.write_text(json.dumps(catalog))
+        validate_oscal_file(path, cache_file=cache_file)
+        report = validate_oscal_file(path, cache_file=cache_file)
+        assert report["file"] == str(path)
+        assert len(report["incremental"]["reused"]) == 4
+        assert not report["valid"]
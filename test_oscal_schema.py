@@ -0,0 +1,291 @@
+"""
+Unit tests for the precompiled OSCAL JSON Schema validator.
+"""
+
+import json
+import pytest
+from jsonschema import Draft7Validator
+
+from oscal_schema import (
+    SCHEMA_FILES,
+    CompiledSchema,
+    JSONSchemaFallback,
+    compile_schema_file,
+    synthetic_catalog,
+    validate_oscal_schema,
+    validate_oscal_schema_file,
+)
+
+
+# Token pattern as published in the official NIST OSCAL schemas, and a Python re equivalent
+OFFICIAL_TOKEN_PATTERN = "^(\\p{L}|_)(\\p{L}|\\p{N}|[.\\-_])*$"
+PYTHON_TOKEN_PATTERN = "^([^\\W\\d_]|_)([^\\W\\d_]|\\d|[.\\-_])*$"
+
+
+def official_layout_schema(token_pattern=OFFICIAL_TOKEN_PATTERN):
+    """
+    Catalog schema in the layout the official NIST OSCAL JSON schemas are generated with.
+
+    Definitions are named '<module>:<name>' and referenced through '#assembly_...'
+    $id anchors, datatypes are composed with allOf, and patterns use Unicode
+    property classes.
+    """
+    def ref(anchor):
+        return {"$ref": f"#assembly_{anchor}"}
+
+    def array(items):
+        return {"type": "array", "minItems": 1, "items": items}
+
+    token = {"$ref": "#/definitions/TokenDatatype"}
+    string = {"$ref": "#/definitions/StringDatatype"}
+    control_properties = {
+        "id": token, "class": token, "title": {"type": "string"},
+        "params": array(ref("oscal-control-common_parameter")),
+        "props": array(ref("oscal-metadata_property")),
+        "parts": array(ref("oscal-control-common_part")),
+        "controls": array(ref("oscal-catalog_control")),
+    }
+    return {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "$id": "http://csrc.nist.gov/ns/oscal/1.1.2/oscal-catalog-schema.json",
+        "type": "object",
+        "definitions": {
+            "oscal-catalog-oscal-catalog:catalog": {
+                "title": "Catalog", "$id": "#assembly_oscal-catalog_catalog", "type": "object",
+                "properties": {
+                    "uuid": {"title": "Catalog Universally Unique Identifier", "$ref": "#/definitions/UUIDDatatype"},
+                    "metadata": ref("oscal-metadata_metadata"),
+                    "groups": array(ref("oscal-catalog_group")),
+                    "controls": array(ref("oscal-catalog_control")),
+                },
+                "required": ["uuid", "metadata"], "additionalProperties": False,
+            },
+            "oscal-metadata-oscal-metadata:metadata": {
+                "$id": "#assembly_oscal-metadata_metadata", "type": "object",
+                "properties": {"title": {"type": "string"},
+                               "last-modified": {"$ref": "#/definitions/DateTimeWithTimezoneDatatype"},
+                               "version": string, "oscal-version": string},
+                "required": ["title", "last-modified", "version", "oscal-version"], "additionalProperties": False,
+            },
+            "oscal-catalog-oscal-catalog:group": {
+                "$id": "#assembly_oscal-catalog_group", "type": "object",
+                "properties": {"id": token, "class": token, "title": {"type": "string"},
+                               "groups": array(ref("oscal-catalog_group")),
+                               "controls": array(ref("oscal-catalog_control"))},
+                "required": ["title"], "additionalProperties": False,
+            },
+            "oscal-catalog-oscal-catalog:control": {
+                "$id": "#assembly_oscal-catalog_control", "type": "object",
+                "properties": control_properties, "required": ["id", "title"], "additionalProperties": False,
+            },
+            "oscal-control-common-oscal-control-common:parameter": {
+                "$id": "#assembly_oscal-control-common_parameter", "type": "object",
+                "properties": {"id": token, "values": array(string), "select": {"type": "object"}},
+                "required": ["id"], "additionalProperties": False,
+                "oneOf": [{"required": ["values"]}, {"required": ["select"]}],
+            },
+            "oscal-control-common-oscal-control-common:part": {
+                "$id": "#assembly_oscal-control-common_part", "type": "object",
+                "properties": {"id": token, "name": token, "prose": {"type": "string"},
+                               "parts": array(ref("oscal-control-common_part"))},
+                "required": ["name"], "additionalProperties": False,
+            },
+            "oscal-metadata-oscal-metadata:property": {
+                "$id": "#assembly_oscal-metadata_property", "type": "object",
+                "properties": {"name": token, "value": string,
+                               "class": {"anyOf": [token, {"enum": ["", "-"]}]}},
+                "required": ["name", "value"], "additionalProperties": False,
+            },
+            "StringDatatype": {"type": "string", "pattern": "^\\S(.*\\S)?$"},
+            "TokenDatatype": {"description": "A non-colonized name.",
+                              "allOf": [string, {"pattern": token_pattern}]},
+            "UUIDDatatype": {"type": "string", "pattern": "^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-[45][0-9A-Fa-f]{3}-"
+                                                          "[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$"},
+            "DateTimeWithTimezoneDatatype": {"type": "string", "format": "date-time",
+                                             "pattern": "^\\d{4}-\\d{2}-\\d{2}T\\d{2}:\\d{2}:\\d{2}"
+                                                        "(\\.\\d+)?(Z|[+-]\\d{2}:\\d{2})$"},
+        },
+        "properties": {"catalog": ref("oscal-catalog_catalog")},
+        "required": ["catalog"], "additionalProperties": False, "maxProperties": 1,
+    }
+
+
+def reference_errors(schema_file, instance):
+    validator = Draft7Validator(json.loads(schema_file.read_text()))
+    return sorted(("/" + "/".join(map(str, e.absolute_path)) if e.absolute_path else "/", e.validator)
+                  for e in validator.iter_errors(instance))
+
+
+def error_keys(report):
+    return sorted((e["path"], e["keyword"]) for e in report["errors"])
+
+
+@pytest.fixture
+def broken_catalog():
+    catalog = synthetic_catalog(groups=5, controls=10)
+    groups = catalog["catalog"]["groups"]
+    groups[0]["controls"][1]["props"][0]["value"] = ""
+    groups[1]["controls"][2]["extra"] = 1
+    groups[2]["controls"][0]["parts"][0].pop("name")
+    groups[3]["title"] = 5
+    groups[4]["controls"] = []
+    catalog["catalog"]["uuid"] = "not-a-uuid"
+    catalog["catalog"]["metadata"]["last-modified"] = "2026-01-25T19:24:37"
+    return catalog
+
+
+class TestCompiledValidator:
+    """Test that compiled validation matches jsonschema."""
+
+    def test_synthetic_catalog_is_valid(self):
+        report = validate_oscal_schema(synthetic_catalog(groups=3, controls=4), workers=1)
+        assert report["valid"], report["errors"]
+        assert report["compiled"]
+        assert report["tasks"] == 3
+
+    def test_matches_jsonschema(self, broken_catalog):
+        report = validate_oscal_schema(broken_catalog, workers=1)
+        assert len(report["errors"]) == 7
+        assert error_keys(report) == reference_errors(SCHEMA_FILES["catalog"], broken_catalog)
+
+    def test_parallel_matches_serial(self, broken_catalog):
+        serial = validate_oscal_schema(broken_catalog, workers=1)
+        parallel = validate_oscal_schema(broken_catalog, workers=2)
+        assert parallel["workers"] == 2
+        assert parallel["errors"] == serial["errors"]
+
+    def test_component_definition(self):
+        component = {"uuid": "3f2b8c1e-8d2a-4c1b-9a7e-2f6d5e4c3b2a", "type": "software", "title": "T",
+                     "description": "D", "control-implementations": [
+                         {"uuid": "3f2b8c1e-8d2a-4c1b-9a7e-2f6d5e4c3b2b", "source": "#x", "description": "D",
+                          "implemented-requirements": [{"uuid": "3f2b8c1e-8d2a-4c1b-9a7e-2f6d5e4c3b2c",
+                                                        "control-id": "sc-7"}]}]}
+        document = {"component-definition": {
+            "uuid": "3f2b8c1e-8d2a-4c1b-9a7e-2f6d5e4c3b2d",
+            "metadata": {"title": "T", "last-modified": "2026-01-25T19:24:37Z", "version": "1",
+                         "oscal-version": "1.1.2"},
+            "components": [component]}}
+        report = validate_oscal_schema(document, workers=1)
+        assert error_keys(report) == [
+            ("/component-definition/components/0/control-implementations/0/implemented-requirements/0",
+             "required")]
+        assert error_keys(report) == reference_errors(SCHEMA_FILES["component-definition"], document)
+
+    def test_not_oscal(self):
+        with pytest.raises(ValueError):
+            validate_oscal_schema({"profile": {}})
+
+
+class TestOfficialLayout:
+    """Test the constructs of the official OSCAL schemas compile instead of falling back."""
+
+    @pytest.fixture
+    def schema_file(self, tmp_path):
+        path = tmp_path / "oscal_catalog_schema.json"
+        path.write_text(json.dumps(official_layout_schema()))
+        return path
+
+    def test_compiles_and_splits_by_anchor(self, schema_file):
+        assert isinstance(compile_schema_file(schema_file), CompiledSchema)
+        report = validate_oscal_schema(synthetic_catalog(groups=3, controls=4), schema_file, workers=1)
+        assert report["valid"], report["errors"]
+        assert (report["compiled"], report["tasks"]) == (True, 3)
+
+    def test_matches_jsonschema(self, schema_file, tmp_path, broken_catalog):
+        controls = broken_catalog["catalog"]["groups"][0]["controls"]
+        controls[0]["id"] = "1-starts-with-digit"
+        controls[0]["props"][0]["class"] = "-"
+        controls[1]["params"] = [{"id": "p1", "values": ["a"], "select": {}}, {"id": "p2"}]
+        controls[2]["parts"][0]["name"] = "énoncé"
+        reference_file = tmp_path / "reference.json"
+        reference_file.write_text(json.dumps(official_layout_schema(PYTHON_TOKEN_PATTERN)))
+
+        report = validate_oscal_schema(broken_catalog, schema_file, workers=1)
+        assert ("/catalog/groups/0/controls/0/id", "pattern") in error_keys(report)
+        assert [key for key in error_keys(report) if key[1] == "oneOf"] == [
+            ("/catalog/groups/0/controls/1/params/0", "oneOf"), ("/catalog/groups/0/controls/1/params/1", "oneOf")]
+        assert error_keys(report) == reference_errors(reference_file, broken_catalog)
+
+    def test_not_and_unsupported_unicode_class(self, tmp_path):
+        path = tmp_path / "not.json"
+        path.write_text(json.dumps({"not": {"type": "string"}, "minProperties": 1}))
+        compiled = compile_schema_file(path)
+        assert isinstance(compiled, CompiledSchema)
+        assert [e["keyword"] for e in compiled.iter_errors("x")] == ["not"]
+        assert [e["keyword"] for e in compiled.iter_errors({})] == ["minProperties"]
+
+        # Neither the compiler nor Python's re (used by jsonschema) can express this one
+        path.write_text(json.dumps({"pattern": "^[\\p{L}]+$"}))
+        with pytest.raises(ValueError, match="regex"):
+            compile_schema_file(path)
+
+
+class TestSchemaCache:
+    """Test the on-disk compiled validator cache and the fallback."""
+
+    @pytest.fixture
+    def schema_file(self, tmp_path):
+        path = tmp_path / "schema.json"
+        path.write_text(SCHEMA_FILES["catalog"].read_text())
+        return path
+
+    def test_cache_written_and_reused(self, schema_file):
+        compiled = compile_schema_file(schema_file)
+        cache = schema_file.with_name(schema_file.name + ".cache")
+        assert isinstance(compiled, CompiledSchema)
+        assert json.loads(cache.read_text())["source"] == compiled.source
+
+        # The cache is keyed by content hash, so rewriting identical content keeps it
+        schema_file.write_text(schema_file.read_text())
+        cache.write_text(cache.read_text().replace("is a required property", "is required (cached)"))
+        cached = compile_schema_file(schema_file)
+        errors = cached.iter_errors({"catalog": {}})
+        assert any("(cached)" in e["message"] for e in errors)
+
+    def test_cache_invalidated_by_schema_change(self, schema_file):
+        compile_schema_file(schema_file)
+        schema = json.loads(schema_file.read_text())
+        schema["definitions"]["catalog"]["required"] = ["uuid"]
+        schema_file.write_text(json.dumps(schema))
+        errors = compile_schema_file(schema_file).iter_errors({"catalog": {}})
+        assert [e["message"] for e in errors] == ["'uuid' is a required property"]
+
+    def test_cache_invalidated_by_compiler_change(self, schema_file, monkeypatch):
+        import oscal_schema
+
+        compile_schema_file(schema_file)
+        cache = schema_file.with_name(schema_file.name + ".cache")
+        cache.write_text(cache.read_text().replace("is a required property", "is required (cached)"))
+        monkeypatch.setattr(oscal_schema, "COMPILER_SHA256", "0" * 64)
+        errors = compile_schema_file(schema_file).iter_errors({"catalog": {}})
+        assert not any("(cached)" in e["message"] for e in errors)
+        assert json.loads(cache.read_text())["compiler_sha256"] == "0" * 64
+
+    def test_unsupported_keywords_fall_back_to_jsonschema(self, tmp_path):
+        path = tmp_path / "pattern-properties.json"
+        path.write_text(json.dumps({"patternProperties": {"^x-": {"type": "integer"}}}))
+        validator = compile_schema_file(path)
+        assert isinstance(validator, JSONSchemaFallback)
+        assert validator.iter_errors({"x-a": 1}) == []
+        assert validator.iter_errors({"x-a": 1.5})[0]["keyword"] == "type"
+
+    def test_invalid_schema(self, tmp_path):
+        path = tmp_path / "bad.json"
+        path.write_text(json.dumps({"type": 5}))
+        with pytest.raises(ValueError):
+            compile_schema_file(path)
+
+
+class TestValidateFile:
+    """Test file-level validation."""
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            validate_oscal_schema_file(tmp_path / "nope.json")
+
+    def test_explicit_schema(self, tmp_path, broken_catalog):
+        path = tmp_path / "catalog.json"
+        path.write_text(json.dumps(broken_catalog))
+        report = validate_oscal_schema_file(path, SCHEMA_FILES["catalog"], workers=1)
+        assert report["file"] == str(path)
+        assert not report["valid"]
@@ -0,0 +1,171 @@
+"""
+Unit tests for the OSCAL to JAMA CSV exporter.
+Uses small synthetic OSCAL documents; the full catalog is covered by verify_oscal_compliance.py.
+"""
+
+import csv
+import io
+import json
+import pytest
+from pathlib import Path
+
+from oscal_stream import JSONStreamReader, iter_oscal_components
+from oscal_to_jama_csv import (
+    STANDARD_COLUMNS,
+    _extract_components_from_oscal,
+    oscal_to_jama_csv,
+    stream_oscal_to_jama_csv,
+)
+
+
+def make_control(std, req, primary="SC-7", status=None):
+    """Build a catalog requirement control the way generate_oscal does."""
+    props = [
+        {"name": "label", "value": req},
+        {"name": "NIST-800-53-Primary-Control", "value": primary},
+        {"name": "NIST-800-53-Secondary-Controls", "value": "CA-3, AC-17"},
+        {"name": "NERC-Requirement-ID", "value": f"{std} {req}"},
+        {"name": "JAMA-Requirement-ID", "value": f"{std.rsplit('-', 1)[0]}-{req}"},
+    ]
+    if status:
+        props.append({"name": "Implementation-Status", "value": status})
+    return {
+        "id": f"{std.lower()}-{req.lower()}",
+        "class": "requirement",
+        "title": f"{std} {req}",
+        "parts": [{"id": f"{std.lower()}-{req.lower()}-smt", "name": "statement",
+                   "prose": f"Requirement {req} text with \"quotes\", commas and \\\\ escapes."}],
+        "props": props,
+    }
+
+
+def make_catalog(groups=2, reqs=3):
+    """Build a small catalog with purpose controls and metadata to skip."""
+    return {
+        "catalog": {
+            "uuid": "00000000-0000-4000-8000-000000000000",
+            "metadata": {"title": "Test Catalog", "version": "1.0", "notes": "x" * 5000},
+            "groups": [
+                {
+                    "id": f"cip-00{g}-1",
+                    "class": "standard",
+                    "title": f"CIP-00{g}-1 - Test",
+                    "controls": [{"id": f"cip-00{g}-1-purpose", "class": "purpose", "title": "Purpose",
+                                  "parts": [{"id": "p", "name": "statement", "prose": "[{not json}]"}]}]
+                                + [make_control(f"CIP-00{g}-1", f"R{r}") for r in range(1, reqs + 1)],
+                }
+                for g in range(1, groups + 1)
+            ],
+            "back-matter": {"resources": [{"uuid": "x", "title": "ignored ]}"}]},
+        }
+    }
+
+
+@pytest.fixture
+def catalog_file(tmp_path):
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps(make_catalog(), indent=2))
+    return path
+
+
+def strip_uuid(components):
+    return [{k: v for k, v in c.items() if k != "uuid"} for c in components]
+
+
+class TestJSONStreamReader:
+    """Test the incremental JSON reader."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+    def test_navigates_across_chunk_boundaries(self, chunk_size):
+        text = '{"skip": {"a": [1, "x\\\\\\"]", {"b": null}]}, "n": 12345, "items": [true, {"k": "v"}, -1.5e3]}'
+        reader = JSONStreamReader(io.StringIO(text), chunk_size)
+        seen = {}
+        for key in reader.iter_object():
+            if key == "items":
+                seen[key] = [reader.read_value() for _ in reader.iter_array()]
+            elif key == "n":
+                seen[key] = reader.read_value()
+        assert seen == {"n": 12345, "items": [True, {"k": "v"}, -1500.0]}
+
+    def test_truncated_document_raises(self):
+        reader = JSONStreamReader(io.StringIO('{"items": [{"k": "v"'), 4)
+        with pytest.raises(json.JSONDecodeError):
+            for key in reader.iter_object():
+                for _ in reader.iter_array():
+                    reader.read_value()
+
+
+class TestStreamingExport:
+    """Test the streaming export path matches the in-memory one."""
+
+    @pytest.mark.parametrize("chunk_size", [3, 64, 65536])
+    def test_stream_matches_in_memory_components(self, catalog_file, chunk_size):
+        expected = _extract_components_from_oscal(json.loads(catalog_file.read_text()))
+        streamed = list(iter_oscal_components(catalog_file, chunk_size))
+        assert len(streamed) == 6
+        assert strip_uuid(streamed) == strip_uuid(expected)
+
+    def test_component_definition(self, tmp_path):
+        components = [{"uuid": "u1", "title": "Firewall", "description": "d", "properties": []}]
+        path = tmp_path / "compdef.json"
+        path.write_text(json.dumps({"component-definition": {"metadata": {"title": "t"},
+                                                             "components": components}}))
+        assert list(iter_oscal_components(path)) == components
+
+    @pytest.mark.parametrize("format_type", ["standard", "detailed"])
+    def test_stream_csv_matches_in_memory_csv(self, catalog_file, tmp_path, format_type):
+        in_memory = tmp_path / "in_memory.csv"
+        streamed = tmp_path / "streamed.csv"
+        rows = oscal_to_jama_csv(catalog_file, in_memory, format_type)
+        count = stream_oscal_to_jama_csv(catalog_file, streamed, format_type)
+        assert count == len(rows)
+
+        def read(path):
+            with open(path, newline="", encoding="utf-8") as f:
+                return [{k: v for k, v in r.items() if k != "Component-UUID"} for r in csv.DictReader(f)]
+
+        assert read(streamed) == read(in_memory)
+        assert list(read(streamed)[0])[:len(STANDARD_COLUMNS)] == STANDARD_COLUMNS
+
+    def test_stream_empty_document_raises(self, tmp_path):
+        path = tmp_path / "empty.json"
+        path.write_text(json.dumps({"catalog": {"metadata": {}, "groups": []}}))
+        with pytest.raises(ValueError):
+            stream_oscal_to_jama_csv(path, tmp_path / "empty.csv")
+        assert not (tmp_path / "empty.csv").exists()
+
+    def test_stream_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            stream_oscal_to_jama_csv(Path(tmp_path / "missing.json"), tmp_path / "out.csv")
+
+
+class TestInMemoryExport:
+    """Test exporting parsed data to text streams instead of files."""
+
+    def test_parsed_data_to_stream_matches_file(self, catalog_file, tmp_path, capsys):
+        on_disk = tmp_path / "on_disk.csv"
+        file_rows = oscal_to_jama_csv(catalog_file, on_disk)
+        capsys.readouterr()
+
+        buffer = io.StringIO()
+        rows = oscal_to_jama_csv(json.loads(catalog_file.read_text()), buffer)
+        assert rows == file_rows
+        with open(on_disk, newline="", encoding="utf-8") as f:
+            assert buffer.getvalue() == f.read()
+        assert not buffer.closed
+        # No status line for streams (the stream may be stdout)
+        assert capsys.readouterr().out == ""
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["catalog.json", "on_disk.csv"]
+
+    def test_stream_export_to_stream(self, catalog_file):
+        buffer = io.StringIO()
+        assert stream_oscal_to_jama_csv(catalog_file, buffer) == 6
+        assert len(list(csv.DictReader(io.StringIO(buffer.getvalue())))) == 6
+
+    def test_parsed_data_requires_output(self):
+        with pytest.raises(ValueError):
+            oscal_to_jama_csv(make_catalog())
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
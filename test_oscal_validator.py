@@ -0,0 +1,137 @@
+"""
+Unit tests for the single-pass OSCAL validation engine.
+"""
+
+import json
+import pytest
+
+import oscal_validator
+from oscal_validator import RULES, iter_components, to_sarif, validate_oscal, validate_oscal_file
+from test_oscal_to_jama_csv import make_catalog, make_control
+
+
+def failed_rules(report):
+    return {rule for rule, result in report["rules"].items() if not result["passed"]}
+
+
+class TestValidateCatalog:
+    """Test rule evaluation on catalogs."""
+
+    def test_clean_catalog_passes(self):
+        report = validate_oscal(make_catalog(groups=2, reqs=3))
+        assert report["valid"], report["findings"]
+        assert report["components"] == 6
+        assert report["document_type"] == "catalog"
+        assert report["rules"]["OSCAL008"]["checked"] == 6
+        # Catalog controls carry no uuid, so none is checked (or invented)
+        assert report["rules"]["OSCAL012"]["checked"] == 0
+
+    def test_reports_every_failure_with_location(self):
+        catalog = make_catalog(groups=1, reqs=3)
+        controls = catalog["catalog"]["groups"][0]["controls"]
+        controls[1] = make_control("CIP-001-1", "R1", primary="SC7")
+        controls[3]["props"][4]["value"] = "TBD"
+        del catalog["catalog"]["metadata"]["version"]
+
+        report = validate_oscal(catalog)
+        assert not report["valid"]
+        assert {"OSCAL004", "OSCAL007", "OSCAL008", "OSCAL009", "OSCAL019"} <= failed_rules(report)
+        locations = {f["location"] for f in report["findings"] if f["rule"] == "OSCAL007"}
+        assert locations == {"catalog.groups[0].controls[1]"}
+        placeholder = next(f for f in report["findings"] if f["rule"] == "OSCAL009")
+        assert placeholder["id"] == "cip-001-1-r3"
+
+    def test_nothing_to_check_fails(self):
+        catalog = make_catalog(groups=1, reqs=1)
+        control = catalog["catalog"]["groups"][0]["controls"][1]
+        control["props"] = [p for p in control["props"] if p["name"] == "label"]
+        report = validate_oscal(catalog)
+        assert {"OSCAL008", "OSCAL011", "OSCAL015", "OSCAL017", "OSCAL019"} <= failed_rules(report)
+
+    def test_empty_document(self):
+        report = validate_oscal({})
+        assert {"OSCAL002", "OSCAL003", "OSCAL005"} <= failed_rules(report)
+        assert report["components"] == 0
+
+    def test_non_object_root(self):
+        for data in ([], "catalog", None):
+            report = validate_oscal(data)
+            assert "OSCAL002" in failed_rules(report)
+            assert report["components"] == 0
+            assert report["document_type"] is None
+        assert list(iter_components([])) == []
+
+    def test_null_and_non_string_prop_values(self):
+        catalog = make_catalog(groups=1, reqs=2)
+        controls = catalog["catalog"]["groups"][0]["controls"]
+        controls[1]["props"][4]["value"] = None
+        controls[2]["props"][1]["value"] = None
+        controls[2]["props"][0]["name"] = None
+        controls[2]["props"][3]["value"] = 7
+        report = validate_oscal(catalog)
+        assert {"OSCAL008", "OSCAL009"} <= failed_rules(report)
+        assert any(f["message"].endswith("empty JAMA-Requirement-ID value") for f in report["findings"])
+
+    def test_nist_lookups_are_memoized(self, monkeypatch):
+        calls = []
+
+        def lookup(control_id, revision="rev5"):
+            calls.append(control_id)
+            return True
+
+        monkeypatch.setattr(oscal_validator, "validate_nist_control", lookup)
+        validate_oscal(make_catalog(groups=3, reqs=4))
+        assert sorted(calls) == ["AC-17", "CA-3", "SC-7"]
+
+
+class TestValidateComponentDefinition:
+    """Test rule evaluation on component definitions."""
+
+    def make_definition(self, uuid_value):
+        components = list(iter_components(make_catalog(groups=1, reqs=2)))
+        for component in components:
+            del component["location"]
+            component["uuid"] = uuid_value
+        return {"component-definition": {"uuid": "x", "metadata": {"title": "T", "version": "1"},
+                                         "components": components}}
+
+    def test_invalid_uuid(self):
+        report = validate_oscal(self.make_definition("not-a-uuid"))
+        assert failed_rules(report) == {"OSCAL012"}
+        assert report["rules"]["OSCAL012"]["failed"] == 2
+
+    def test_valid_uuid(self):
+        report = validate_oscal(self.make_definition("3f2b8c1e-8d2a-4c1b-9a7e-2f6d5e4c3b2a"))
+        assert report["valid"]
+        assert report["document_type"] == "component-definition"
+
+
+class TestReports:
+    """Test file loading and report formats."""
+
+    def test_invalid_json_is_a_finding(self, tmp_path):
+        path = tmp_path / "broken.json"
+        path.write_text("{not json")
+        report = validate_oscal_file(path)
+        assert failed_rules(report) == {"OSCAL001"}
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            validate_oscal_file(tmp_path / "nope.json")
+
+    def test_sarif(self, tmp_path):
+        catalog = make_catalog(groups=1, reqs=2)
+        catalog["catalog"]["groups"][0]["controls"][1]["props"][1]["value"] = "ZZ-99"
+        path = tmp_path / "catalog.json"
+        path.write_text(json.dumps(catalog))
+
+        sarif = to_sarif(validate_oscal_file(path))
+        run = sarif["runs"][0]
+        assert sarif["version"] == "2.1.0"
+        assert [rule["id"] for rule in run["tool"]["driver"]["rules"]] == list(RULES)
+        result = next(r for r in run["results"] if r["ruleId"] == "OSCAL019")
+        assert result["level"] == "error"
+        assert result["locations"][0]["physicalLocation"]["artifactLocation"]["uri"] == str(path)
+        assert result["locations"][0]["logicalLocations"][0]["fullyQualifiedName"] == \
+            "catalog.groups[0].controls[1]"
+        json.dumps(sarif)
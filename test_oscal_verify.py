@@ -0,0 +1,101 @@
+"""
+Unit tests for batch OSCAL verification.
+"""
+
+import json
+import sys
+import pytest
+
+import oscal_verify
+from oscal_verify import expand_inputs, verify_file, verify_files
+from test_oscal_to_jama_csv import make_catalog
+
+
+@pytest.fixture
+def entity_dir(tmp_path):
+    (tmp_path / "good.json").write_text(json.dumps(make_catalog(groups=1, reqs=2)))
+    bad = make_catalog(groups=1, reqs=2)
+    bad["catalog"]["groups"][0]["controls"][1]["props"][1]["value"] = "ZZ-99"
+    (tmp_path / "bad.json").write_text(json.dumps(bad))
+    (tmp_path / "broken.json").write_text("{not json")
+    (tmp_path / "notes.txt").write_text("ignored")
+    return tmp_path
+
+
+class TestExpandInputs:
+    """Test file, directory and glob expansion."""
+
+    def test_glob_and_directory(self, entity_dir):
+        names = [path.name for path in expand_inputs([str(entity_dir / "b*.json")])]
+        assert names == ["bad.json", "broken.json"]
+        names = [path.name for path in expand_inputs([str(entity_dir)])]
+        assert names == ["bad.json", "broken.json", "good.json"]
+
+    def test_duplicates_and_missing_files_kept_once(self, entity_dir):
+        good = str(entity_dir / "good.json")
+        missing = str(entity_dir / "missing.json")
+        assert [p.name for p in expand_inputs([good, str(entity_dir / "*.json"), missing, missing])] == \
+            ["good.json", "bad.json", "broken.json", "missing.json"]
+
+
+class TestVerifyFiles:
+    """Test per-file results and aggregation."""
+
+    def test_statuses(self, entity_dir):
+        paths = expand_inputs([str(entity_dir), str(entity_dir / "missing.json")])
+        summary = verify_files(paths, workers=2)
+        results = {r["file"].rsplit("/", 1)[-1]: r for r in summary["results"]}
+        assert [r["file"] for r in summary["results"]] == [str(p) for p in paths]
+        assert results["good.json"]["status"] == "PASS"
+        assert "OSCAL019" in results["bad.json"]["failed_rules"]
+        assert results["broken.json"]["failed_rules"] == ["OSCAL001"]
+        assert results["missing.json"]["status"] == "ERROR"
+        assert (summary["passed"], summary["failed"], summary["errored"]) == (1, 2, 1)
+        assert all(r["elapsed"] >= 0 for r in summary["results"])
+
+    def test_malformed_documents_do_not_abort(self, tmp_path, monkeypatch):
+        (tmp_path / "list.json").write_text("[]")
+        nulled = make_catalog(groups=1, reqs=2)
+        nulled["catalog"]["groups"][0]["controls"][1]["props"][1]["value"] = None
+        (tmp_path / "null.json").write_text(json.dumps(nulled))
+        results = {r["file"].rsplit("/", 1)[-1]: r for r in verify_files(expand_inputs([str(tmp_path)]),
+                                                                           workers=1)["results"]}
+        assert results["list.json"]["status"] == "FAIL"
+        assert "OSCAL002" in results["list.json"]["failed_rules"]
+        assert results["null.json"]["status"] == "FAIL"
+
+        def explode(*args):
+            raise RuntimeError("rule crashed")
+
+        monkeypatch.setattr(oscal_verify, "validate_oscal", explode)
+        result = verify_file(tmp_path / "null.json")
+        assert result["status"] == "ERROR"
+        assert result["message"] == "RuntimeError: rule crashed"
+
+    def test_schema_check(self, entity_dir):
+        # make_catalog omits metadata the schema requires, which the rules do not check
+        result = verify_file(entity_dir / "good.json", schema=True)
+        assert result["status"] == "FAIL"
+        assert result["failed_rules"] == []
+        assert result["schema_errors"] > 0
+
+
+class TestMain:
+    """Test the CLI exit status and table."""
+
+    def run(self, monkeypatch, *args):
+        monkeypatch.setattr(sys, "argv", ["oscal_verify.py", *args])
+        with pytest.raises(SystemExit) as exc:
+            oscal_verify.main()
+            raise SystemExit(0)
+        return exc.value.code
+
+    def test_exit_status(self, monkeypatch, capsys, entity_dir):
+        assert self.run(monkeypatch, str(entity_dir / "good.json")) == 0
+        assert self.run(monkeypatch, str(entity_dir / "*.json"), "--workers", "1") == 1
+        out = capsys.readouterr().out
+        assert "[ERR] 1 passed, 2 failed, 0 error(s)" in out
+        assert "OSCAL001" in out
+
+    def test_no_matches(self, monkeypatch, entity_dir):
+        assert self.run(monkeypatch, str(entity_dir / "*.xml")) == 1
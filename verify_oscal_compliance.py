@@ -17,565 +17,234 @@ To run with detailed output:
 
 To run specific test:
     pytest verify_oscal_compliance.py::TestOSCALCompliance::test_is_valid_json -v
+
+To validate NIST mappings against Rev 4 (requires the official Rev 4 OSCAL catalog, see nist_catalog.py):
+    pytest verify_oscal_compliance.py --nist-revision rev4
+
+The rules themselves live in oscal_validator.py, which validates the file in a
+single pass once per test module; each test below asserts one rule's result.
+For a JSON or SARIF report without pytest, run oscal_validator.py directly.
 """
 
 import pytest
-import json
-import re
-import uuid
 import csv
+import io
 from pathlib import Path
-from nist_controls import validate_nist_control, get_control_description
+from oscal_validator import validate_oscal_file
+
+MAX_REPORTED_FINDINGS = 5
+
+
+@pytest.fixture(scope='session')
+def oscal_file():
+    """Find the OSCAL JSON file in working directory."""
+    oscal_path = Path(__file__).parent / "nerc-oscal.json"
+    if not oscal_path.exists():
+        pytest.skip(f"OSCAL file not found: {oscal_path}")
+    return oscal_path
+
+
+@pytest.fixture(scope='module')
+def nist_revision(request):
+    """NIST SP 800-53 revision to validate mappings against (--nist-revision, default rev5)."""
+    return request.config.getoption('--nist-revision', default='rev5')
+
+
+@pytest.fixture(scope='module')
+def validation_report(oscal_file, nist_revision):
+    """Validate the OSCAL file once; every rule test reads this report."""
+    return validate_oscal_file(oscal_file, nist_revision)
+
+
+@pytest.fixture(scope='session')
+def jama_export(oscal_file):
+    """Export the OSCAL file to JAMA CSV once, in memory; the CSV export tests share it."""
+    from oscal_to_jama_csv import load_oscal_json, oscal_to_jama_csv
+
+    buffer = io.StringIO()
+    try:
+        rows = oscal_to_jama_csv(load_oscal_json(oscal_file), buffer, format_type='standard')
+    except Exception as e:
+        pytest.fail(f"CSV export failed: {e}")
+    return {'rows': rows, 'csv': buffer.getvalue()}
 
 
 class TestOSCALCompliance:
     """Test suite for validating OSCAL JSON Catalogs and Component Definitions."""
 
     @staticmethod
-    def get_components_from_oscal(oscal_data):
-        """
-        Extract components from OSCAL data (handles both catalog and component-definition schemas).
-
-        Catalog format: groups[].controls[] where class='requirement' becomes components
-        Component-definition format: components[]
-        """
-        # Try component-definition first (new format)
-        comp_def = oscal_data.get('component-definition', {})
-        if comp_def and 'components' in comp_def:
-            return comp_def.get('components', [])
-
-        # Fall back to catalog format (current format)
-        catalog = oscal_data.get('catalog', {})
-        if catalog and 'groups' in catalog:
-            # Convert catalog format to component-like structure
-            components = []
-            for group in catalog.get('groups', []):
-                # Each requirement control becomes a component
-                for control in group.get('controls', []):
-                    if control.get('class') == 'requirement':
-                        # Convert control to component-like structure
-                        component = {
-                            'id': control.get('id', ''),
-                            'title': control.get('title', ''),
-                            'uuid': control.get('uuid', str(__import__('uuid').uuid4())),  # Generate if missing
-                            'description': '',
-                            'properties': control.get('props', []),
-                            'group_id': group.get('id', '')
-                        }
-
-                        # Generate control-implementations from NIST properties
-                        props = control.get('props', [])
-                        nist_primary = None
-                        nist_secondary = []
-
-                        for prop in props:
-                            if isinstance(prop, dict):
-                                if prop.get('name') == 'NIST-800-53-Primary-Control':
-                                    nist_primary = prop.get('value', '')
-                                elif prop.get('name') == 'NIST-800-53-Secondary-Controls':
-                                    nist_secondary = [c.strip() for c in prop.get('value', '').split(',')]
-
-                        # Build control-implementations array
-                        control_impls = []
-                        if nist_primary or nist_secondary:
-                            impl = {
-                                'description': f"NIST 800-53 control implementation for {control.get('title', '')}",
-                                'implemented-requirements': []
-                            }
-
-                            # Add primary control
-                            if nist_primary:
-                                impl['implemented-requirements'].append({
-                                    'control-id': nist_primary.lower(),
-                                    'responsibility': 'Implemented'
-                                })
-
-                            # Add secondary controls
-                            for ctrl in nist_secondary:
-                                if ctrl:
-                                    impl['implemented-requirements'].append({
-                                        'control-id': ctrl.lower(),
-                                        'responsibility': 'Implemented'
-                                    })
-
-                            if impl['implemented-requirements']:
-                                control_impls.append(impl)
-
-                        component['control-implementations'] = control_impls
-                        components.append(component)
-            return components
-
-        return []
-
-    @pytest.fixture
-    def oscal_file(self):
-        """Find the OSCAL JSON file in working directory."""
-        oscal_path = Path(__file__).parent / "nerc-oscal.json"
-        if not oscal_path.exists():
-            pytest.skip(f"OSCAL file not found: {oscal_path}")
-        return oscal_path
-
-    @pytest.fixture
-    def oscal_data(self, oscal_file):
-        """Load and parse the OSCAL JSON file."""
-        with open(oscal_file, 'r') as f:
-            try:
-                data = json.load(f)
-                return data
-            except json.JSONDecodeError as e:
-                pytest.fail(f"JSON syntax error in OSCAL file: {e}")
+    def assert_rules(report, *rules):
+        """Fail with the rule's first findings if any of the given rules failed."""
+        for rule in rules:
+            result = report['rules'][rule]
+            messages = [f['message'] for f in report['findings'] if f['rule'] == rule]
+            shown = '; '.join(messages[:MAX_REPORTED_FINDINGS])
+            more = f" (+{len(messages) - MAX_REPORTED_FINDINGS} more)" if len(messages) > MAX_REPORTED_FINDINGS else ''
+            assert result['passed'], f"{rule} {result['name']}: {shown}{more}"
 
     # ========================================================================
     # BASIC VALIDATION TESTS
     # ========================================================================
 
-    def test_is_valid_json(self, oscal_file):
+    def test_is_valid_json(self, validation_report):
         """Test 1: File is valid JSON."""
-        try:
-            with open(oscal_file, 'r') as f:
-                json.load(f)
-            assert True, "JSON syntax is valid"
-        except json.JSONDecodeError as e:
-            pytest.fail(f"JSON syntax error: {e}")
-
-    def test_has_component_definition_root(self, oscal_data):
+        self.assert_rules(validation_report, 'OSCAL001')
+
+    def test_has_component_definition_root(self, validation_report):
         """Test 2: Root element is 'component-definition' or 'catalog'."""
-        has_valid_root = 'component-definition' in oscal_data or 'catalog' in oscal_data
-        assert has_valid_root, \
-            "Missing root element. JSON should have either: " \
-            "{ 'component-definition': { ... } } or { 'catalog': { ... } }"
+        self.assert_rules(validation_report, 'OSCAL002')
 
-    def test_component_def_has_metadata(self, oscal_data):
+    def test_component_def_has_metadata(self, validation_report):
         """Test 3: OSCAL document includes metadata section."""
-        comp_def = oscal_data.get('component-definition', {}) or oscal_data.get('catalog', {})
-        assert 'metadata' in comp_def, \
-            "Missing 'metadata' section. Should include: title, version"
+        self.assert_rules(validation_report, 'OSCAL003')
 
-    def test_metadata_has_required_fields(self, oscal_data):
+    def test_metadata_has_required_fields(self, validation_report):
         """Test 4: Metadata includes required fields."""
-        comp_def = oscal_data.get('component-definition', {}) or oscal_data.get('catalog', {})
-        metadata = comp_def.get('metadata', {})
+        self.assert_rules(validation_report, 'OSCAL004')
 
-        # Both schemas require title and version
-        required_fields = ['title', 'version']
-        for field in required_fields:
-            assert field in metadata, \
-                f"Missing metadata.{field}. Required fields: title, version"
-            assert metadata[field], f"metadata.{field} is empty"
-
-    def test_has_components_array(self, oscal_data):
+    def test_has_components_array(self, validation_report):
         """Test 5: OSCAL includes components (from either schema)."""
-        components = self.get_components_from_oscal(oscal_data)
-        assert len(components) > 0, \
-            "No components found in OSCAL document. " \
-            "Catalog format should have groups[].controls[] with class='requirement', " \
-            "or component-definition should have components[]"
+        self.assert_rules(validation_report, 'OSCAL005')
 
     # ========================================================================
     # NIST MAPPING TESTS
     # ========================================================================
 
-    def test_has_nist_mapping(self, oscal_data):
+    def test_has_nist_mapping(self, validation_report):
         """Test 6: OSCAL includes identifiable requirements (NIST mapping optional for catalog format)."""
-        components = self.get_components_from_oscal(oscal_data)
-
-        # Catalog format from PDF extraction may not include NIST mappings yet
-        # Just verify components are identifiable
-        for i, component in enumerate(components):
-            assert component.get('id') or component.get('title'), \
-                f"Component {i} not identifiable"
+        self.assert_rules(validation_report, 'OSCAL006')
 
-    def test_nist_controls_are_valid_format(self, oscal_data):
+    def test_nist_controls_are_valid_format(self, validation_report):
         """Test 7: NIST control IDs follow proper format (e.g., 'SC-7', 'AC-2')."""
-        components = self.get_components_from_oscal(oscal_data)
-
-        # NIST 800-53 control format: Family-Number (e.g., SC-7, AC-2)
-        nist_pattern = re.compile(r'^[A-Z]{2}-\d{1,2}(\s*\([0-9]+\))?$')
-        formats_validated = 0
-
-        for i, component in enumerate(components):
-            props = component.get('properties', [])
-
-            for prop in props:
-                if 'NIST' in prop.get('name', ''):
-                    value = prop.get('value', '')
-                    # Skip if it's a list of controls (secondary controls)
-                    if ',' in value:
-                        controls = [c.strip() for c in value.split(',')]
-                        for ctrl in controls:
-                            assert nist_pattern.match(ctrl), \
-                                f"Component {i} has invalid NIST control format: '{ctrl}'. " \
-                                f"Use format like 'SC-7', 'AC-2', 'CA-3', etc."
-                            formats_validated += 1
-                    else:
-                        assert nist_pattern.match(value), \
-                            f"Component {i} has invalid NIST control format: '{value}'. " \
-                            f"Use format like 'SC-7', 'AC-2', 'CA-3', etc."
-                        formats_validated += 1
-
-        assert formats_validated > 0, \
-            "No NIST control formats found to validate! Ensure components include NIST control properties."
-
-    def test_minimum_nist_controls_per_component(self, oscal_data):
-        """Test 8: Each component is properly formatted."""
-        components = self.get_components_from_oscal(oscal_data)
+        self.assert_rules(validation_report, 'OSCAL007')
 
-        # For catalog format from PDF extraction, just verify basic structure
-        for i, component in enumerate(components):
-            assert component.get('id') or component.get('title'), \
-                f"Component {i} missing id or title"
+    def test_minimum_nist_controls_per_component(self, validation_report):
+        """Test 8: Each component is properly formatted."""
+        self.assert_rules(validation_report, 'OSCAL006')
 
     # ========================================================================
     # JAMA PLACEHOLDER TESTS
     # ========================================================================
 
-    def test_jama_props_exist(self, oscal_data):
+    def test_jama_props_exist(self, validation_report):
         """Test 9: OSCAL format supports JAMA export (properties may be empty for catalog)."""
-        components = self.get_components_from_oscal(oscal_data)
+        self.assert_rules(validation_report, 'OSCAL005')
 
-        # Catalog format may not have JAMA properties yet
-        # Just verify structure is compatible
-        assert len(components) > 0, "No components found"
-
-    def test_jama_placeholders_follow_format(self, oscal_data):
+    def test_jama_placeholders_follow_format(self, validation_report):
         """Test 10: JAMA-Requirement-ID values follow naming convention."""
-        components = self.get_components_from_oscal(oscal_data)
-        jama_pattern = re.compile(r'^CIP-\d{3}-R\d+(-[a-z])?$')
-        jama_validated = 0
-
-        for i, component in enumerate(components):
-            props = component.get('properties', [])
-
-            for prop in props:
-                if isinstance(prop, dict) and prop.get('name') == 'JAMA-Requirement-ID':
-                    value = prop.get('value', '')
-                    assert value.strip(), \
-                        f"Component {i} has empty JAMA-Requirement-ID value"
-                    assert jama_pattern.match(value), \
-                        f"Component {i} has invalid JAMA placeholder: '{value}'"
-                    jama_validated += 1
-
-        assert jama_validated > 0, \
-            "No JAMA-Requirement-ID properties found to validate! Ensure components include JAMA IDs."
-
-    def test_jama_placeholders_not_empty(self, oscal_data):
-        """Test 11: No empty JAMA placeholder values."""
-        components = self.get_components_from_oscal(oscal_data)
-        jama_empty_validated = 0
-
-        for i, component in enumerate(components):
-            props = component.get('properties', [])
+        self.assert_rules(validation_report, 'OSCAL008')
 
-            for j, prop in enumerate(props):
-                if isinstance(prop, dict) and prop.get('name') == 'JAMA-Requirement-ID':
-                    value = prop.get('value', '').strip()
-                    assert value and value != 'TBD', \
-                        f"Component {i}, property {j} has empty or placeholder JAMA-Requirement-ID"
-                    jama_empty_validated += 1
-
-        assert jama_empty_validated > 0, \
-            "No JAMA-Requirement-ID properties found to validate! Ensure components include JAMA IDs."
+    def test_jama_placeholders_not_empty(self, validation_report):
+        """Test 11: No empty JAMA placeholder values."""
+        self.assert_rules(validation_report, 'OSCAL009')
 
     # ========================================================================
     # NERC REQUIREMENT MAPPING TESTS
     # ========================================================================
 
-    def test_nerc_req_ids_exist(self, oscal_data):
+    def test_nerc_req_ids_exist(self, validation_report):
         """Test 12: Components are identifiable (NERC properties optional for catalog)."""
-        components = self.get_components_from_oscal(oscal_data)
+        self.assert_rules(validation_report, 'OSCAL010')
 
-        # Catalog format has title with NERC ID embedded
-        for i, component in enumerate(components):
-            title = component.get('title', '').strip()
-            assert title and 'CIP' in title, \
-                f"Component {i} title should identify NERC requirement"
-
-    def test_nerc_requirement_format(self, oscal_data):
+    def test_nerc_requirement_format(self, validation_report):
         """Test 13: NERC-Requirement-ID values follow proper format."""
-        components = self.get_components_from_oscal(oscal_data)
-        nerc_pattern = re.compile(r'^CIP-\d{3}(?:-\d+)? R\d+[a-z]?$')
-        nerc_format_validated = 0
-
-        for i, component in enumerate(components):
-            props = component.get('properties', [])
-
-            for prop in props:
-                if isinstance(prop, dict) and prop.get('name') == 'NERC-Requirement-ID':
-                    value = prop.get('value', '')
-                    assert value.strip(), \
-                        f"Component {i} has empty NERC-Requirement-ID"
-                    assert nerc_pattern.match(value), \
-                        f"Component {i} has invalid NERC ID format: '{value}'"
-                    nerc_format_validated += 1
-
-        assert nerc_format_validated > 0, \
-            "No NERC-Requirement-ID properties found to validate! Ensure components include NERC IDs."
+        self.assert_rules(validation_report, 'OSCAL011')
 
     # ========================================================================
     # OSCAL STRUCTURE TESTS
     # ========================================================================
 
-    def test_components_have_uuid(self, oscal_data):
-        """Test 14: Each component has a UUID."""
-        components = self.get_components_from_oscal(oscal_data)
+    def test_components_have_uuid(self, validation_report):
+        """Test 14: Each component has a UUID (catalog controls carry none)."""
+        self.assert_rules(validation_report, 'OSCAL012')
 
-        for i, component in enumerate(components):
-            assert 'uuid' in component, \
-                f"Component {i} missing 'uuid' field. Must have unique identifier."
-            assert component['uuid'], f"Component {i} has empty uuid"
-
-            # Validate UUID format (roughly)
-            uuid_val = component['uuid']
-            try:
-                uuid.UUID(uuid_val)
-            except ValueError:
-                pytest.fail(f"Component {i} has invalid UUID format: {uuid_val}")
-
-    def test_components_have_title(self, oscal_data):
+    def test_components_have_title(self, validation_report):
         """Test 15: Each component has a meaningful title."""
-        components = self.get_components_from_oscal(oscal_data)
+        self.assert_rules(validation_report, 'OSCAL013')
 
-        for i, component in enumerate(components):
-            assert 'title' in component, \
-                f"Component {i} missing 'title' field"
-            title = component.get('title', '').strip()
-            assert title and len(title) > 5, \
-                f"Component {i} has vague or empty title: '{title}'. " \
-                f"Title should describe NERC standard and purpose (e.g., 'NERC CIP-005 Systems Security Management')"
-
-    def test_components_have_description(self, oscal_data):
+    def test_components_have_description(self, validation_report):
         """Test 16: Each component has a description summarizing NERC requirement."""
-        components = self.get_components_from_oscal(oscal_data)
-
-        for i, component in enumerate(components):
-            # Description may come from title or parts in catalog format
-            desc = component.get('description', '').strip() or component.get('title', '').strip()
-            assert desc and len(desc) > 5, \
-                f"Component {i} missing meaningful description or title"
+        self.assert_rules(validation_report, 'OSCAL014')
 
     # ========================================================================
     # CONTROL IMPLEMENTATION TESTS
     # ========================================================================
 
-    def test_has_control_implementations(self, oscal_data):
+    def test_has_control_implementations(self, validation_report):
         """Test 17: Components have identifiable content."""
-        components = self.get_components_from_oscal(oscal_data)
+        self.assert_rules(validation_report, 'OSCAL005', 'OSCAL006')
 
-        # For catalog format, just verify components exist and are non-empty
-        assert len(components) > 0, "No components found"
-        for component in components:
-            assert component.get('id') or component.get('title'), \
-                "Component missing identifiers"
-
-    def test_implemented_requirements_have_control_id(self, oscal_data):
+    def test_implemented_requirements_have_control_id(self, validation_report):
         """Test 18: Implemented requirements specify control-id (component-definition format)."""
-        components = self.get_components_from_oscal(oscal_data)
-        control_ids_validated = 0
-
-        for i, component in enumerate(components):
-            impls = component.get('control-implementations', [])
-            for impl_idx, impl in enumerate(impls):
-                req_list = impl.get('implemented-requirements', [])
-                for req_idx, req in enumerate(req_list):
-                    assert 'control-id' in req, \
-                        f"Component {i}, control-impl {impl_idx}, requirement {req_idx} " \
-                        f"missing 'control-id'. Should specify NIST control like 'sc-7'"
-                    control_ids_validated += 1
-
-        assert control_ids_validated > 0, \
-            "No implemented requirements found to validate! Ensure components include control-implementations with requirements."
+        self.assert_rules(validation_report, 'OSCAL015')
 
     # ========================================================================
     # QUALITY VALIDATION TESTS
     # ========================================================================
 
-    def test_no_vague_descriptions(self, oscal_data):
+    def test_no_vague_descriptions(self, validation_report):
         """Test 19: Component descriptions are reasonably detailed."""
-        components = self.get_components_from_oscal(oscal_data)
-
-        vague_words = ['ensure', 'verify', 'check', 'implement', 'manage', 'handle']
-        descriptions_validated = 0
-
-        for i, component in enumerate(components):
-            # Get description from either description field or title
-            desc = (component.get('description', '') or component.get('title', '')).lower()
-
-            if desc and len(desc) > 10:
-                # Only check vague language if description is present and meaningful
-                vague_count = sum(1 for word in vague_words if f' {word} ' in f' {desc} ')
-                desc_length = len(desc.split())
-                vague_ratio = vague_count / desc_length if desc_length > 0 else 0
-                # Be lenient with catalog format which may not have separate descriptions
-                assert vague_ratio < 0.5 or desc_length < 5, \
-                    f"Component {i} description very vague"
-                descriptions_validated += 1
+        self.assert_rules(validation_report, 'OSCAL016')
 
-        assert descriptions_validated > 0, \
-            "No component descriptions found to validate! Ensure components have descriptions."
-
-    def test_minimum_properties_per_component(self, oscal_data):
+    def test_minimum_properties_per_component(self, validation_report):
         """Test 20: Each component has at least 2 identifying properties."""
-        components = self.get_components_from_oscal(oscal_data)
-
-        for i, component in enumerate(components):
-            props = component.get('properties', [])
-            assert len(props) >= 2, \
-                f"Component {i} has insufficient properties ({len(props)})"
+        self.assert_rules(validation_report, 'OSCAL017')
 
-    def test_json_is_parseable_by_compliance_tools(self, oscal_data):
+    def test_json_is_parseable_by_compliance_tools(self, validation_report):
         """Test 21: JSON structure matches OSCAL schema expectations."""
-        comp_def = oscal_data.get('component-definition', {}) or oscal_data.get('catalog', {})
-
-        # Verify top-level structure
-        assert 'uuid' in comp_def or 'metadata' in comp_def, \
-            "OSCAL missing required top-level fields"
-
-        metadata = comp_def.get('metadata', {})
-        assert 'title' in metadata, \
-            "Metadata missing required title field"
-
-        # Components/groups present
-        components = self.get_components_from_oscal(oscal_data)
-        assert len(components) > 0, "No requirements/components found"
+        self.assert_rules(validation_report, 'OSCAL018')
 
     # ========================================================================
     # NIST CONTROL EXISTENCE VALIDATION TESTS
     # ========================================================================
 
-    def test_nist_controls_exist_in_catalog(self, oscal_data):
+    def test_nist_controls_exist_in_catalog(self, validation_report):
         """Test 23: All mapped NIST controls exist in NIST SP 800-53 R5 catalog."""
-        components = self.get_components_from_oscal(oscal_data)
-        controls_validated = 0
-
-        for i, component in enumerate(components):
-            props = component.get('properties', [])
-
-            for prop in props:
-                prop_name = prop.get('name', '')
-                if 'NIST' in prop_name and 'Control' in prop_name:
-                    value = prop.get('value', '').strip()
-
-                    if not value:
-                        continue
-
-                    # Handle comma-separated lists of controls
-                    controls = [c.strip() for c in value.split(',')]
+        self.assert_rules(validation_report, 'OSCAL019')
 
-                    for ctrl in controls:
-                        assert validate_nist_control(ctrl), \
-                            f"Component {i} maps to non-existent NIST control: '{ctrl}'. " \
-                            f"Verify control ID exists in NIST SP 800-53 R5 catalog. " \
-                            f"Valid format: Family-Number (e.g., 'SC-7', 'AC-2', 'CA-3')"
-                        controls_validated += 1
-
-        assert controls_validated > 0, \
-            "No NIST controls found to validate! Ensure components include NIST control mappings."
-
-    def test_nist_controls_have_descriptions(self, oscal_data):
+    def test_nist_controls_have_descriptions(self, validation_report):
         """Test 24: All mapped NIST controls have valid descriptions in catalog."""
-        components = self.get_components_from_oscal(oscal_data)
-        descriptions_validated = 0
-
-        for i, component in enumerate(components):
-            props = component.get('properties', [])
-
-            for prop in props:
-                prop_name = prop.get('name', '')
-                if 'NIST' in prop_name and 'Primary' in prop_name:
-                    value = prop.get('value', '').strip()
-
-                    if not value:
-                        continue
-
-                    description = get_control_description(value)
-                    assert description, \
-                        f"Component {i} NIST control '{value}' not found in NIST SP 800-53 R5 catalog. " \
-                        f"Verify the control ID is correct and exists in the official NIST catalog."
-                    descriptions_validated += 1
-
-        assert descriptions_validated > 0, \
-            "No NIST control descriptions found to validate! Ensure components include Primary NIST controls."
+        self.assert_rules(validation_report, 'OSCAL020')
 
     # ========================================================================
     # JAMA CSV EXPORT VALIDATION TESTS
     # ========================================================================
 
-    def test_csv_export_format_valid(self, oscal_file):
+    def test_csv_export_format_valid(self, jama_export):
         """Test 25: OSCAL data can be exported to CSV format."""
-        from oscal_to_jama_csv import oscal_to_jama_csv
-
-        try:
-            # Export to CSV
-            output_csv = oscal_file.with_stem(oscal_file.stem + '_test_export')
-            rows = oscal_to_jama_csv(oscal_file, output_csv, format_type='standard')
-
-            # Clean up
-            if output_csv.exists():
-                output_csv.unlink()
-
-            assert len(rows) > 0, "CSV export produced no rows"
-            # Catalog format may have empty ID columns, that's OK
-            assert isinstance(rows[0], dict), "CSV rows should be dictionaries"
-
-        except Exception as e:
-            pytest.fail(f"CSV export failed: {e}")
-
-    def test_csv_export_required_columns(self, oscal_file):
+        rows = jama_export['rows']
+        assert len(rows) > 0, "CSV export produced no rows"
+        # Catalog format may have empty ID columns, that's OK
+        assert isinstance(rows[0], dict), "CSV rows should be dictionaries"
+        parsed = list(csv.DictReader(io.StringIO(jama_export['csv'])))
+        assert len(parsed) == len(rows), "Exported CSV does not parse back to the exported rows"
+
+    def test_csv_export_required_columns(self, jama_export):
         """Test 26: CSV export includes expected column structure."""
-        from oscal_to_jama_csv import oscal_to_jama_csv
-
-        try:
-            output_csv = oscal_file.with_stem(oscal_file.stem + '_test_export')
-            rows = oscal_to_jama_csv(oscal_file, output_csv, format_type='standard')
-
-            if output_csv.exists():
-                output_csv.unlink()
-
-            if not rows:
-                pytest.skip("No components to export")
-
-            # Check for core columns (JAMA-specific columns may be empty for catalog)
-            expected_columns = ['Title', 'Description']
-            first_row = rows[0]
-            for column in expected_columns:
-                assert column in first_row, \
-                    f"CSV export missing expected column: {column}"
-
-        except Exception as e:
-            pytest.fail(f"CSV export validation failed: {e}")
-
-    def test_csv_export_no_empty_ids(self, oscal_file):
+        rows = jama_export['rows']
+        if not rows:
+            pytest.skip("No components to export")
+
+        # Check for core columns (JAMA-specific columns may be empty for catalog)
+        expected_columns = ['Title', 'Description']
+        first_row = rows[0]
+        for column in expected_columns:
+            assert column in first_row, \
+                f"CSV export missing expected column: {column}"
+
+    def test_csv_export_no_empty_ids(self, jama_export):
         """Test 27: CSV export successfully exports all components."""
-        from oscal_to_jama_csv import oscal_to_jama_csv
-
-        try:
-            output_csv = oscal_file.with_stem(oscal_file.stem + '_test_export')
-            rows = oscal_to_jama_csv(oscal_file, output_csv, format_type='standard')
-
-            if output_csv.exists():
-                output_csv.unlink()
-
-            # Catalog format may have empty ID columns
-            # Just verify rows were created
-            assert len(rows) > 0, "CSV export produced no rows"
-
-        except Exception as e:
-            pytest.fail(f"CSV export failed: {e}")
+        # Catalog format may have empty ID columns
+        # Just verify rows were created
+        assert len(jama_export['rows']) > 0, "CSV export produced no rows"
 
     # ========================================================================
     # COMPREHENSIVE VALIDATION TEST
     # ========================================================================
 
-    def test_oscal_is_jama_ready(self, oscal_data):
+    def test_oscal_is_jama_ready(self, validation_report):
         """Test 22: OSCAL can be exported to JAMA CSV format."""
-        components = self.get_components_from_oscal(oscal_data)
-
-        assert len(components) > 0, "No components to export"
-
-        # For catalog format, just verify exportable structure exists
-        # JAMA properties can be added as post-processing step
-        assert all(c.get('id') or c.get('title') for c in components), \
-            "All components must be identifiable"
+        self.assert_rules(validation_report, 'OSCAL005', 'OSCAL006')
 
 
 # ============================================================================